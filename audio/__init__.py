@@ -1,6 +1,9 @@
 """Audio-Modul für PulseScribe.
 
-Bietet Funktionen für die Mikrofon-Aufnahme.
+Bietet Funktionen für die Mikrofon-Aufnahme sowie den gemeinsamen
+Sample-Puffer, die Streaming-VAD, den Streaming-Resampler, den
+optionalen Disk-Spool und das austauschbare Input-Backend (Mikrofon oder
+Datei-Replay) der Capture-Pfade.
 
 Usage:
     from audio import record_audio, AudioRecorder
@@ -15,6 +18,12 @@ Usage:
     path = recorder.stop()
 """
 
+from .buffer import SampleBuffer
+from .input_stream import ReplayBackend, get_sounddevice, set_audio_backend
+from .progressive import ProgressiveTranscriber
+from .resample import StreamingResampler, resample_audio
+from .spool import RecordingSpool, find_orphaned_spools, report_orphaned_spools
+from .vad import SpeechSegment, StreamingVAD
 from .recording import (
     record_audio,
     AudioRecorder,
@@ -26,6 +35,18 @@ from .recording import (
 __all__ = [
     "record_audio",
     "AudioRecorder",
+    "RecordingSpool",
+    "find_orphaned_spools",
+    "report_orphaned_spools",
+    "SampleBuffer",
+    "ReplayBackend",
+    "get_sounddevice",
+    "set_audio_backend",
+    "ProgressiveTranscriber",
+    "StreamingResampler",
+    "resample_audio",
+    "SpeechSegment",
+    "StreamingVAD",
     "WHISPER_SAMPLE_RATE",
     "WHISPER_CHANNELS",
     "WHISPER_BLOCKSIZE",
@@ -0,0 +1,191 @@
+"""Block-Arena für Mikrofon-Aufnahmen.
+
+Die Capture-Pfade (CLI, macOS-Daemon, Windows-Daemon) haben früher pro
+Audio-Callback eine Kopie (`indata.copy()`) in eine Liste gehängt und beim
+Stop alles per `np.concatenate` zusammengefügt. Das verdoppelt den Speicher
+genau im Moment des Stops und macht die Stop-Latenz abhängig von der
+Diktatlänge.
+
+`SampleBuffer` schreibt die Samples stattdessen direkt in Blöcke fester
+Größe. Ist ein Block voll, kommt ein neuer dazu – bereits aufgenommenes
+Audio wird im Audio-Callback nie umkopiert, die Kosten pro Callback sind
+unabhängig von der Aufnahmedauer. Zusammengefügt wird erst beim Lesen
+(``read()``/``take()``) im Thread des Lesers – beim Stop bleibt das eine
+O(n)-Kopie, aber ohne Lock und mit blockweiser Freigabe (siehe ``take()``).
+"""
+
+from __future__ import annotations
+
+import threading
+
+# Blockgröße: eine Sekunde pro Block hält die Allokation im Callback klein
+# (64 KB bei 16 kHz mono) und die Blockliste auch bei langen Diktaten kurz.
+DEFAULT_BLOCK_SECONDS = 1.0
+
+
+class SampleBuffer:
+    """float32-Arena aus Blöcken fester Größe mit O(1)-Append.
+
+    Thread-safe: Append (Audio-Callback) und Read/Take (Worker) dürfen aus
+    unterschiedlichen Threads aufgerufen werden. Unter dem Lock werden nur
+    Blockreferenzen kopiert; das Zusammenfügen läuft außerhalb, da volle
+    Blöcke unveränderlich sind und der letzte nur hinter ``len()`` wächst.
+
+    Usage:
+        buffer = SampleBuffer(sample_rate=16000)
+        buffer.append(indata)             # im Audio-Callback
+        window = buffer.read(start, end)  # Ausschnitt während der Aufnahme
+        audio = buffer.take()             # beim Stop, einmal zusammengefügt
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_rate: int,
+        channels: int = 1,
+        block_seconds: float = DEFAULT_BLOCK_SECONDS,
+    ) -> None:
+        if channels < 1:
+            raise ValueError("channels muss >= 1 sein")
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.block_frames = max(1, int(sample_rate * max(0.0, block_seconds)))
+        self._blocks: list = []
+        self._frames = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Anzahl aufgenommener Frames (Samples pro Kanal)."""
+        return self._frames
+
+    @property
+    def duration(self) -> float:
+        """Aufgenommene Dauer in Sekunden."""
+        if self.sample_rate <= 0:
+            return 0.0
+        return self._frames / self.sample_rate
+
+    @property
+    def capacity(self) -> int:
+        """Aktuell allokierte Kapazität in Frames (0 vor dem ersten Append)."""
+        return len(self._blocks) * self.block_frames
+
+    def _allocate(self, frames: int):
+        import numpy as np
+
+        return np.empty((frames, self.channels), dtype=np.float32)
+
+    def append(self, chunk, *, scale: float | None = None) -> None:
+        """Hängt einen Audio-Block an.
+
+        Args:
+            chunk: Array mit Shape (frames,) oder (frames, channels). Beliebiger
+                numerischer dtype; die Konvertierung nach float32 passiert
+                direkt beim Schreiben in den Puffer (ohne Zwischen-Array).
+            scale: Optionaler Divisor, z.B. ``INT16_MAX`` für int16-Blöcke.
+        """
+        import numpy as np
+
+        samples = np.asarray(chunk)
+        if samples.size == 0:
+            return
+        samples = samples.reshape(-1, self.channels)
+        frame_count = samples.shape[0]
+        factor = 1.0 / scale if scale else None
+
+        with self._lock:
+            written = 0
+            while written < frame_count:
+                offset = self._frames % self.block_frames
+                if offset == 0 and self._frames == self.capacity:
+                    self._blocks.append(self._allocate(self.block_frames))
+                block = self._blocks[-1]
+                count = min(self.block_frames - offset, frame_count - written)
+                target = block[offset : offset + count]
+                source = samples[written : written + count]
+                if factor is not None:
+                    np.multiply(source, factor, out=target, casting="unsafe")
+                else:
+                    target[...] = source
+                written += count
+                self._frames += count
+
+    def append_bytes(self, raw: bytes, *, dtype: str = "int16", scale: float | None = None) -> None:
+        """Hängt einen rohen PCM-Block an (z.B. aus einer Warm-Stream-Queue)."""
+        import numpy as np
+
+        self.append(np.frombuffer(raw, dtype=dtype), scale=scale)
+
+    def _snapshot(self) -> tuple[list, int]:
+        with self._lock:
+            return list(self._blocks), self._frames
+
+    def _join(self, blocks: list, start: int, end: int):
+        """Fügt Frames ``start:end`` aus ``blocks`` zu einem Array zusammen."""
+        if end <= start:
+            return self._allocate(0)
+        first, last = start // self.block_frames, (end - 1) // self.block_frames
+        if first == last:
+            base = first * self.block_frames
+            return blocks[first][start - base : end - base]  # ein Block: ohne Kopie
+        result = self._allocate(end - start)
+        position = 0
+        for index in range(first, last + 1):
+            base = index * self.block_frames
+            part = blocks[index][max(start, base) - base : min(end, base + self.block_frames) - base]
+            result[position : position + part.shape[0]] = part
+            position += part.shape[0]
+        return result
+
+    def read(self, start: int = 0, end: int | None = None):
+        """Frames ``start:end`` als zusammenhängendes Array.
+
+        Shape ist (frames, channels) – identisch zu ``np.concatenate`` über
+        sounddevice-Callback-Blöcke. Kopiert nur die betroffenen Blöcke; das
+        Ergebnis bleibt gültig, auch wenn danach weiter angehängt wird.
+        """
+        blocks, frames = self._snapshot()
+        end = frames if end is None else min(end, frames)
+        return self._join(blocks, max(0, start), end)
+
+    def take(self, start: int = 0, end: int | None = None, *, pad_frames: int = 0):
+        """Gibt Frames ``start:end`` zurück und leert den Puffer.
+
+        Beim Stop wird genau einmal in ein zusammenhängendes Array kopiert,
+        außerhalb des Locks (der Audio-Callback wartet nie darauf). Das ist
+        eine O(n)-Kopie; jeder Block wird direkt danach freigegeben, sodass
+        das Audio nie vollständig doppelt referenziert ist (Ergebnis plus
+        höchstens ein Block). ``pad_frames`` hängt Stille an (Tail-Padding
+        für Whisper), ohne zweite ``np.concatenate``-Kopie.
+        """
+        with self._lock:
+            blocks, frames = self._blocks, self._frames
+            self._blocks = []
+            self._frames = 0
+        end = frames if end is None else min(end, frames)
+        start = max(0, start)
+        count = max(0, end - start)
+        pad = max(0, pad_frames)
+        if not pad and len(blocks) == 1:
+            return blocks[0][start : start + count]  # ein Block: ohne Kopie
+
+        result = self._allocate(count + pad)
+        position = 0
+        for index in range(len(blocks)):
+            block, blocks[index] = blocks[index], None
+            base = index * self.block_frames
+            low, high = max(start, base), min(end, base + self.block_frames)
+            if low < high:
+                result[position : position + high - low] = block[low - base : high - base]
+                position += high - low
+        result[count:] = 0
+        return result
+
+    def clear(self) -> None:
+        """Verwirft alle Samples (der Speicher wird freigegeben)."""
+        with self._lock:
+            self._blocks = []
+            self._frames = 0
+
+
+__all__ = ["SampleBuffer", "DEFAULT_BLOCK_SECONDS"]
@@ -0,0 +1,25 @@
+"""Synthetische Audio-Fixtures für Benchmarks und Autotuning.
+
+Deterministisch (fester Seed) und ohne Dateien im Repository: ein
+sprachähnliches Signal mit Grundfrequenz-Verlauf, Silbenhüllkurve und Pausen.
+"""
+
+from __future__ import annotations
+
+
+def synthetic_speech(duration_s: float, sample_rate: int, seed: int = 0):
+    """Sprachähnliches Signal: Harmonische mit Silbenhüllkurve, Pausen und Rauschen."""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(duration_s * sample_rate), dtype=np.float32) / sample_rate
+    pitch = 140 + 30 * np.sin(2 * np.pi * 0.7 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / sample_rate
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 8))
+    syllables = np.clip(np.sin(2 * np.pi * 4 * t), 0, None)
+    pauses = (np.sin(2 * np.pi * 0.25 * t) > -0.6).astype(np.float32)
+    noise = rng.normal(0, 0.01, t.shape)
+    return (0.2 * voiced * syllables * pauses + noise).astype(np.float32)
+
+
+__all__ = ["synthetic_speech"]
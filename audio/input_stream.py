@@ -0,0 +1,366 @@
+"""Austauschbares Audio-Backend: Mikrofon (sounddevice) oder Datei-Replay.
+
+Die Capture-Pfade (CLI-Recorder, beide Daemons, Deepgram-Streaming) holen
+sich ``sd`` über `get_sounddevice()` statt ``import sounddevice``. Ohne
+Konfiguration ist das unverändert das echte sounddevice-Modul.
+
+Mit ``PULSESCRIBE_AUDIO_REPLAY=<datei.wav>`` (oder `set_audio_backend()`)
+liefert `get_sounddevice()` ein `ReplayBackend`: dieselbe Schnittstelle
+(``InputStream``, ``sleep``, ``query_devices``, ``CallbackAbort``…), aber die
+Blöcke kommen aus einer WAV-Datei – in Echtzeit oder beschleunigt, mit
+konfigurierbarer Blockgröße und Jitter. Damit lässt sich Hotkey-zu-Text-Latenz
+ohne Mikrofon messen (``python -m benchmarks.latency``), auch auf einer
+Linux-CI-Maschine ohne PortAudio.
+
+Nach dem Dateiende liefert der Stream Stille weiter (wie ein Mikrofon, solange
+der Hotkey gehalten wird); ``stream.exhausted`` signalisiert das Dateiende.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+logger = logging.getLogger("pulsescribe")
+
+_DEFAULT_BLOCK_SECONDS = 0.064  # ~WHISPER_BLOCKSIZE bei 16 kHz
+_INT16_SCALE = 32767
+
+_installed_backend: ReplayBackend | None = None
+_env_backend: ReplayBackend | None = None
+_env_backend_key: tuple | None = None
+_backend_lock = threading.Lock()
+
+
+class CallbackStop(Exception):
+    """Wie ``sounddevice.CallbackStop``: Stream nach diesem Block beenden."""
+
+
+class CallbackAbort(Exception):
+    """Wie ``sounddevice.CallbackAbort``: Stream sofort beenden."""
+
+
+class _CallbackFlags:
+    """Leere Status-Flags (kein Over-/Underflow) wie ``sd.CallbackFlags``."""
+
+    input_overflow = False
+    input_underflow = False
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __str__(self) -> str:
+        return ""
+
+
+class ReplayInputStream:
+    """``sd.InputStream``-kompatibler Stream, der Samples aus dem Speicher liefert.
+
+    Ein Hintergrund-Thread ruft den Callback im Takt ``blocksize /
+    samplerate / speed`` auf (``speed=0``: so schnell wie möglich). Jitter
+    verzögert einzelne Blöcke zufällig, ohne die mittlere Rate zu ändern.
+    """
+
+    def __init__(
+        self,
+        samples,
+        *,
+        samplerate: int,
+        channels: int = 1,
+        dtype: Any = "float32",
+        blocksize: int | None = None,
+        callback=None,
+        finished_callback=None,
+        speed: float = 1.0,
+        jitter_ms: float = 0.0,
+        seed: int | None = None,
+        **_ignored: Any,
+    ) -> None:
+        import numpy as np
+
+        self.samplerate = samplerate
+        self.channels = channels
+        self.dtype = np.dtype(dtype)
+        self.blocksize = blocksize or max(1, int(samplerate * _DEFAULT_BLOCK_SECONDS))
+        self._samples = samples
+        self._callback = callback
+        self._finished_callback = finished_callback
+        self._speed = speed
+        self._jitter_s = jitter_ms / 1000
+        self._random = random.Random(seed)
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._finished = False
+        self._finish_lock = threading.Lock()
+        self.exhausted = threading.Event()
+        self.first_block_at: float | None = None
+        self.frames_delivered = 0
+
+    @property
+    def active(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def stopped(self) -> bool:
+        return not self.active
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, daemon=True, name="ReplayInputStream"
+        )
+        self._thread.start()
+
+    def _next_block(self, position: int):
+        import numpy as np
+
+        block = self._samples[position : position + self.blocksize]
+        if block.shape[0] < self.blocksize:
+            self.exhausted.set()
+            padding = np.zeros(
+                (self.blocksize - block.shape[0], self.channels), dtype=np.float32
+            )
+            block = np.concatenate([block, padding])
+        if self.dtype.kind == "i":
+            return np.clip(block * _INT16_SCALE, -_INT16_SCALE, _INT16_SCALE).astype(
+                self.dtype
+            )
+        return block.astype(self.dtype, copy=False)
+
+    def _run(self) -> None:
+        start = time.perf_counter()
+        block_seconds = self.blocksize / self.samplerate
+        position = 0
+        try:
+            while not self._stop_event.is_set():
+                if self._speed > 0:
+                    due = start + (position / self.blocksize + 1) * block_seconds / self._speed
+                    if self._jitter_s:
+                        due += self._random.uniform(0, self._jitter_s)
+                    delay = due - time.perf_counter()
+                    if delay > 0 and self._stop_event.wait(delay):
+                        break
+                elif position >= self._samples.shape[0]:
+                    # Unbegrenzte Geschwindigkeit: nach Dateiende nicht busy-loopen
+                    self.exhausted.set()
+                    if self._stop_event.wait(block_seconds):
+                        break
+                indata = self._next_block(position)
+                if self.first_block_at is None:
+                    self.first_block_at = time.perf_counter()
+                position += self.blocksize
+                self.frames_delivered = position
+                if self._callback is None:
+                    continue
+                time_info = SimpleNamespace(
+                    inputBufferAdcTime=position / self.samplerate,
+                    currentTime=time.perf_counter() - start,
+                )
+                try:
+                    self._callback(indata, self.blocksize, time_info, _CallbackFlags())
+                except Exception as exc:
+                    # sounddevice-Semantik: CallbackStop/CallbackAbort (auch die
+                    # echten Klassen aus sounddevice) beenden den Stream.
+                    if type(exc).__name__ in ("CallbackStop", "CallbackAbort"):
+                        break
+                    logger.warning(f"Replay-Callback fehlgeschlagen: {exc}")
+                    break
+        finally:
+            self._finish()
+
+    def _finish(self) -> None:
+        with self._finish_lock:
+            if self._finished:
+                return
+            self._finished = True
+        if self._finished_callback is not None:
+            self._finished_callback()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=2.0)
+        if thread is None:
+            self._finish()
+
+    abort = stop
+
+    def close(self) -> None:
+        self.stop()
+
+    def __enter__(self) -> ReplayInputStream:
+        self.start()
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+
+class ReplayBackend:
+    """sounddevice-kompatibles Modul-Objekt, das eine Aufnahme abspielt.
+
+    Usage:
+        backend = ReplayBackend.from_file("diktat.wav", speed=4.0)
+        set_audio_backend(backend)
+        ...                               # Capture-Code unverändert
+        backend.last_stream.exhausted.wait()
+    """
+
+    CallbackStop = CallbackStop
+    CallbackAbort = CallbackAbort
+
+    def __init__(
+        self,
+        samples,
+        samplerate: int,
+        *,
+        speed: float = 1.0,
+        jitter_ms: float = 0.0,
+        blocksize: int = 0,
+        seed: int | None = None,
+    ) -> None:
+        import numpy as np
+
+        audio = np.asarray(samples, dtype=np.float32)
+        if audio.ndim == 1:
+            audio = audio.reshape(-1, 1)
+        self._source = audio
+        self.default_samplerate = int(samplerate)
+        self.speed = speed
+        self.jitter_ms = jitter_ms
+        self.blocksize = blocksize
+        self._seed = seed
+        self._converted: dict[tuple[int, int], Any] = {}
+        self._lock = threading.Lock()
+        self.last_stream: ReplayInputStream | None = None
+        self.default = SimpleNamespace(device=[0, None])
+
+    @classmethod
+    def from_file(cls, path: Path | str, **kwargs: Any) -> ReplayBackend:
+        import soundfile as sf
+
+        audio, samplerate = sf.read(str(path), dtype="float32", always_2d=True)
+        return cls(audio, samplerate, **kwargs)
+
+    @property
+    def duration(self) -> float:
+        """Dauer der Quelle in Sekunden."""
+        return self._source.shape[0] / self.default_samplerate
+
+    def _samples_for(self, samplerate: int, channels: int):
+        """Quelle in gewünschter Rate/Kanalzahl (einmal konvertiert, gecacht)."""
+        import numpy as np
+
+        from .resample import resample_audio
+
+        key = (samplerate, channels)
+        with self._lock:
+            cached = self._converted.get(key)
+            if cached is not None:
+                return cached
+            mono = self._source.mean(axis=1)
+            if samplerate != self.default_samplerate:
+                mono = resample_audio(mono, self.default_samplerate, samplerate)
+            converted = np.repeat(mono.reshape(-1, 1), channels, axis=1)
+            self._converted[key] = converted
+            return converted
+
+    def InputStream(self, **kwargs: Any) -> ReplayInputStream:  # noqa: N802 - sd-API
+        samplerate = int(kwargs.pop("samplerate", None) or self.default_samplerate)
+        channels = int(kwargs.pop("channels", None) or 1)
+        requested_blocksize = kwargs.pop("blocksize", None)
+        blocksize = self.blocksize or requested_blocksize
+        stream = ReplayInputStream(
+            self._samples_for(samplerate, channels),
+            samplerate=samplerate,
+            channels=channels,
+            blocksize=blocksize,
+            speed=self.speed,
+            jitter_ms=self.jitter_ms,
+            seed=self._seed,
+            **kwargs,
+        )
+        self.last_stream = stream
+        return stream
+
+    @staticmethod
+    def sleep(msec: float) -> None:
+        time.sleep(msec / 1000)
+
+    def query_devices(self, device: Any = None, kind: str | None = None):
+        info = {
+            "name": "PulseScribe Replay",
+            "index": 0,
+            "max_input_channels": self._source.shape[1],
+            "max_output_channels": 0,
+            "default_samplerate": float(self.default_samplerate),
+        }
+        if device is None and kind is None:
+            return [info]
+        return info
+
+
+def set_audio_backend(backend: ReplayBackend | None) -> None:
+    """Installiert ein Replay-Backend programmatisch (None = wieder Mikrofon)."""
+    global _installed_backend
+    _installed_backend = backend
+
+
+def get_replay_backend() -> ReplayBackend | None:
+    """Aktives Replay-Backend (programmatisch oder per ENV), sonst None."""
+    global _env_backend, _env_backend_key
+    if _installed_backend is not None:
+        return _installed_backend
+
+    from config import (
+        get_audio_replay_blocksize,
+        get_audio_replay_file,
+        get_audio_replay_jitter_ms,
+        get_audio_replay_speed,
+    )
+
+    path = get_audio_replay_file()
+    if path is None:
+        return None
+    key = (
+        str(path),
+        get_audio_replay_speed(),
+        get_audio_replay_jitter_ms(),
+        get_audio_replay_blocksize(),
+    )
+    with _backend_lock:
+        if _env_backend is None or _env_backend_key != key:
+            _env_backend = ReplayBackend.from_file(
+                path, speed=key[1], jitter_ms=key[2], blocksize=key[3]
+            )
+            _env_backend_key = key
+            logger.info(f"Audio-Replay aktiv: {path} (speed={key[1]:g}x)")
+        return _env_backend
+
+
+def get_sounddevice():
+    """sounddevice-Modul bzw. das aktive Replay-Backend."""
+    backend = get_replay_backend()
+    if backend is not None:
+        return backend
+    import sounddevice as sd
+
+    return sd
+
+
+__all__ = [
+    "CallbackAbort",
+    "CallbackStop",
+    "ReplayBackend",
+    "ReplayInputStream",
+    "get_replay_backend",
+    "get_sounddevice",
+    "set_audio_backend",
+]
@@ -0,0 +1,171 @@
+"""Progressive Transkription: Segmente schon während der Aufnahme verarbeiten.
+
+Ohne diesen Modus startet die Transkription (local, openai, groq) erst nach
+dem Hotkey-Release – ein 2-Minuten-Diktat wartet auf die komplette Aufnahme.
+`ProgressiveTranscriber` schneidet den laufenden Puffer an VAD-Pausen
+(abgeschlossene Segmente der `StreamingVAD`) und reicht fertige Abschnitte an
+einen Worker-Pool weiter, während weiter aufgenommen wird. Beim Stop wird nur
+noch der Rest transkribiert; die Ergebnisse werden in Reihenfolge
+zusammengesetzt. Die Latenz nach dem Stop hängt damit am letzten Segment,
+nicht an der Gesamtlänge.
+
+Usage:
+    progressive = ProgressiveTranscriber(
+        transcribe_segment, sample_rate=16000, min_segment_seconds=8
+    )
+    progressive.poll(buffer, vad)       # periodisch in der Capture-Schleife
+    ...
+    tail = audio[progressive.cut_frame:]
+    transcript = progressive.finish(tail)
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+logger = logging.getLogger("pulsescribe")
+
+# Schnitt liegt etwas hinter dem Sprachende (innerhalb der Hangover-Stille),
+# damit auslaufende Phoneme im vorderen Segment bleiben.
+_CUT_PAD_SECONDS = 0.15
+
+
+class ProgressiveTranscriber:
+    """Schneidet an Sprechpausen und transkribiert Segmente im Hintergrund.
+
+    ``poll`` wird aus genau einem Thread (Capture-Schleife) aufgerufen;
+    ``transcribe_segment`` läuft auf dem Worker-Pool.
+    """
+
+    def __init__(
+        self,
+        transcribe_segment: Callable[[Any], str],
+        *,
+        sample_rate: int,
+        min_segment_seconds: float,
+        max_workers: int = 1,
+    ) -> None:
+        self._transcribe_segment = transcribe_segment
+        self.sample_rate = sample_rate
+        self.min_segment_seconds = min_segment_seconds
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers),
+            thread_name_prefix="ProgressiveSegment",
+        )
+        self._futures: list[Future[str]] = []
+        self._cut_seconds = 0.0
+        self.cut_frame = 0  # Puffer-Frame, ab dem noch nicht submitted wurde
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @property
+    def has_segments(self) -> bool:
+        """True, sobald mindestens ein Segment abgeschickt wurde."""
+        return bool(self._futures)
+
+    @property
+    def segment_count(self) -> int:
+        """Anzahl bisher abgeschickter Segmente."""
+        return len(self._futures)
+
+    def poll(self, buffer, vad) -> bool:
+        """Schickt ein neues Segment ab, falls eine passende Pause vorliegt.
+
+        Args:
+            buffer: `SampleBuffer` der laufenden Aufnahme.
+            vad: `StreamingVAD`, die mit derselben Aufnahme gefüttert wird
+                (darf eine andere Sample-Rate haben, z.B. vor dem Resampling).
+
+        Returns:
+            True, wenn ein Segment abgeschickt wurde.
+        """
+        if self._closed:
+            return False
+        segments = vad.closed_segments
+        if not segments:
+            return False
+        speech_end = segments[-1].end / vad.sample_rate
+        heard = vad.total_samples / vad.sample_rate
+        cut_seconds = min(speech_end + _CUT_PAD_SECONDS, heard)
+        if cut_seconds - self._cut_seconds < self.min_segment_seconds:
+            return False
+
+        cut_frame = int(cut_seconds * self.sample_rate)
+        # Resampler-Latenz: der Puffer kann der VAD ein paar ms hinterherhängen
+        if cut_frame > len(buffer):
+            return False
+        segment = buffer.read(self.cut_frame, cut_frame).reshape(-1)
+        self._submit(segment, start_seconds=self._cut_seconds)
+        self._cut_seconds = cut_seconds
+        self.cut_frame = cut_frame
+        return True
+
+    def _submit(self, segment, *, start_seconds: float) -> None:
+        index = len(self._futures) + 1
+        duration = segment.shape[0] / self.sample_rate
+
+        def run() -> str:
+            t0 = time.perf_counter()
+            text = self._transcribe_segment(segment)
+            logger.info(
+                f"Progressive: Segment {index} (ab {start_seconds:.1f}s, "
+                f"{duration:.1f}s) in {time.perf_counter() - t0:.2f}s transkribiert"
+            )
+            return text
+
+        with self._lock:
+            self._futures.append(self._executor.submit(run))
+        logger.debug(f"Progressive: Segment {index} ab {start_seconds:.1f}s abgeschickt")
+
+    def tail_after_cut(self, audio, vad, *, pad_s: float = 0.25):
+        """Rest der Aufnahme nach dem letzten Schnitt (Ende getrimmt).
+
+        Returns:
+            Zero-Copy-Slice von ``audio`` oder None, wenn nach dem Schnitt
+            keine Sprache mehr kam (Stille nicht transkribieren – Whisper
+            halluziniert sonst gern).
+        """
+        if not any(
+            segment.end / vad.sample_rate > self._cut_seconds
+            for segment in vad.segments
+        ):
+            return None
+        bounds = vad.trim_bounds(pad_s=pad_s)
+        end = len(audio)
+        if bounds is not None:
+            end = min(end, int(bounds[1] / vad.sample_rate * self.sample_rate))
+        if end <= self.cut_frame:
+            return None
+        return audio[self.cut_frame : end]
+
+    def finish(self, tail=None, *, timeout: float | None = None) -> str:
+        """Transkribiert den Rest und setzt alle Segmente in Reihenfolge zusammen.
+
+        Args:
+            tail: Audio ab ``cut_frame`` (bereits getrimmt/gepaddet); leer oder
+                None, wenn nach dem letzten Schnitt nichts mehr kam.
+            timeout: Max. Wartezeit pro Segment.
+
+        Raises:
+            Die Exception des ersten fehlgeschlagenen Segments.
+        """
+        try:
+            if tail is not None and len(tail):
+                self._submit(tail, start_seconds=self._cut_seconds)
+            parts = [future.result(timeout=timeout) for future in self._futures]
+        finally:
+            self.close()
+        return " ".join(part.strip() for part in parts if part and part.strip())
+
+    def close(self) -> None:
+        """Beendet den Pool; noch nicht gestartete Segmente werden verworfen."""
+        self._closed = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+__all__ = ["ProgressiveTranscriber"]
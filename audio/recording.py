@@ -17,10 +17,15 @@ from config import (
     WHISPER_BLOCKSIZE,
     TEMP_RECORDING_FILENAME,
     get_input_device,
+    get_recording_spool_enabled,
     reset_input_device_cache,
 )
 from utils.logging import get_session_id
 
+from .buffer import SampleBuffer
+from .input_stream import get_sounddevice
+from .spool import RecordingSpool
+
 logger = logging.getLogger("pulsescribe")
 
 
@@ -119,10 +124,39 @@ def _stop_and_close_stream(stream) -> Exception | None:
     return stream_error
 
 
+def _start_spool(sample_rate: int, channels: int) -> RecordingSpool | None:
+    """Startet einen Recording-Spool; bei Fehlern wird im RAM aufgenommen."""
+    spool = RecordingSpool(sample_rate=sample_rate, channels=channels)
+    try:
+        spool.start()
+    except Exception as e:
+        logger.warning(f"Recording-Spool nicht verfügbar, nutze RAM-Puffer: {e}")
+        spool.discard()
+        return None
+    return spool
+
+
+def _finalize_spool(spool: RecordingSpool, output_path: Path | None) -> Path:
+    """Schließt den Spool ab und verschiebt die Datei optional an ihr Ziel."""
+    spool_path = spool.finalize()
+    if spool.frames_written <= 0:
+        spool.discard()
+        raise ValueError("Keine Audiodaten aufgenommen.")
+    if output_path is None or Path(output_path) == spool_path:
+        return spool_path
+
+    import shutil
+
+    shutil.move(str(spool_path), str(output_path))
+    return Path(output_path)
+
+
 class AudioRecorder:
     """Wiederverwendbare Audio-Aufnahme Klasse.
 
-    Kann für CLI verwendet werden.
+    Kann für CLI verwendet werden. Mit ``spool=True`` (oder
+    ``PULSESCRIBE_SPOOL_RECORDINGS=true``) wird schon während der Aufnahme auf
+    die Platte geschrieben; ``stop()`` schließt dann nur noch den Header ab.
 
     Usage:
         recorder = AudioRecorder()
@@ -137,14 +171,17 @@ class AudioRecorder:
         channels: int = WHISPER_CHANNELS,
         blocksize: int = WHISPER_BLOCKSIZE,
         device: int | None = None,
+        spool: bool | None = None,
     ):
         self.sample_rate = sample_rate
         self.channels = channels
         self.blocksize = blocksize
         self.device = device
+        self.spool = spool
 
-        self._recorded_chunks: list = []
-        self._chunks_lock = threading.Lock()  # Thread-safety für Audio-Chunks
+        # Block-Puffer (thread-safe): kein indata.copy() pro Callback
+        self._buffer = SampleBuffer(sample_rate=sample_rate, channels=channels)
+        self._spool: RecordingSpool | None = None
         self._stream = None
         self._recording_start: float = 0
         self._stop_event = threading.Event()
@@ -152,9 +189,26 @@ class AudioRecorder:
         self._session_active = False
 
     def _audio_callback(self, indata, _frames, _time_info, _status):
-        """Callback: Sammelt Audio-Chunks während der Aufnahme."""
-        with self._chunks_lock:
-            self._recorded_chunks.append(indata.copy())
+        """Callback: Schreibt Audio-Blöcke in den Spool bzw. den RAM-Puffer."""
+        spool = self._spool
+        if spool is not None:
+            spool.write(indata)
+            return
+        self._buffer.append(indata)
+
+    def _open_capture_sinks(self, sample_rate: int) -> None:
+        """Bereitet RAM-Puffer und optionalen Spool für eine Aufnahme vor."""
+        self._discard_spool()
+        self._buffer = SampleBuffer(sample_rate=sample_rate, channels=self.channels)
+        use_spool = get_recording_spool_enabled() if self.spool is None else self.spool
+        if use_spool:
+            self._spool = _start_spool(sample_rate, self.channels)
+
+    def _discard_spool(self) -> None:
+        spool = self._spool
+        self._spool = None
+        if spool is not None:
+            spool.discard()
 
     def start(self, play_ready_sound: bool = True) -> None:
         """Startet die Aufnahme.
@@ -162,10 +216,8 @@ class AudioRecorder:
         Args:
             play_ready_sound: Wenn True, wird Ready-Sound abgespielt
         """
-        import sounddevice as sd
+        sd = get_sounddevice()
 
-        with self._chunks_lock:
-            self._recorded_chunks = []
         self._stop_event.clear()
         self._recording_start = 0
         self._session_active = False
@@ -181,6 +233,7 @@ class AudioRecorder:
 
         while True:
             stream = None
+            self._open_capture_sinks(active_sample_rate)
             try:
                 stream = sd.InputStream(
                     device=input_device,
@@ -199,6 +252,7 @@ class AudioRecorder:
                 if stream is not None:
                     _close_stream_quietly(stream)
                 self._stream = None
+                self._discard_spool()
                 if should_retry_with_fresh_device:
                     should_retry_with_fresh_device = False
                     refreshed_config = _reprobe_input_stream_config(
@@ -238,7 +292,6 @@ class AudioRecorder:
         if not self._session_active:
             raise RuntimeError("Keine aktive Aufnahme.")
 
-        import numpy as np
         import soundfile as sf
 
         self._session_active = False
@@ -247,8 +300,12 @@ class AudioRecorder:
         stream_error = _stop_and_close_stream(stream) if stream else None
 
         self._stop_event.set()
+        spool = self._spool
+        self._spool = None
         if stream_error is not None:
             self._recording_start = 0
+            if spool is not None:
+                spool.discard()
             raise stream_error
 
         recording_duration = time.perf_counter() - self._recording_start
@@ -256,21 +313,28 @@ class AudioRecorder:
 
         _play_sound("stop")
 
-        with self._chunks_lock:
-            if not self._recorded_chunks:
-                self._recording_start = 0
+        if spool is not None:
+            # Spool-Modus: Audio liegt bereits auf der Platte
+            try:
+                return _finalize_spool(spool, output_path)
+            except ValueError:
                 logger.error(f"[{get_session_id()}] Keine Audiodaten aufgenommen")
-                raise ValueError("Keine Audiodaten aufgenommen.")
+                raise
+            finally:
+                self._recording_start = 0
 
-            audio_data = np.concatenate(self._recorded_chunks)
+        # Eine Kopie beim Stop; der Puffer gibt seine Blöcke dabei frei
+        audio_data = self._buffer.take()
+        if not len(audio_data):
+            self._recording_start = 0
+            logger.error(f"[{get_session_id()}] Keine Audiodaten aufgenommen")
+            raise ValueError("Keine Audiodaten aufgenommen.")
 
         if output_path is None:
             output_path = Path(tempfile.gettempdir()) / TEMP_RECORDING_FILENAME
 
         sf.write(output_path, audio_data, self._active_sample_rate)
         self._recording_start = 0
-        with self._chunks_lock:
-            self._recorded_chunks = []
 
         return output_path
 
@@ -296,27 +360,42 @@ class AudioRecorder:
 
     @property
     def chunks(self) -> list:
-        """Gibt eine Kopie der bisher aufgenommenen Chunks zurück (thread-safe)."""
-        with self._chunks_lock:
-            return list(self._recorded_chunks)
+        """Gibt die bisher aufgenommenen Samples als Chunk-Liste zurück (thread-safe).
+
+        Die Liste enthält höchstens einen Eintrag: die zusammengefügten Blöcke
+        des Puffers (eine Kopie, damit spätere Appends sie nicht verändern).
+        """
+        audio_data = self._buffer.read()
+        return [audio_data.copy()] if len(audio_data) else []
+
+    @property
+    def buffer(self) -> SampleBuffer:
+        """Der aktive Sample-Puffer (z.B. für Live-Analyse während der Aufnahme)."""
+        return self._buffer
 
 
-def record_audio() -> Path:
+def record_audio(spool: bool | None = None) -> Path:
     """Nimmt Audio vom Mikrofon auf (Enter startet, Enter stoppt).
 
-    Gibt Pfad zur temporären WAV-Datei zurück.
+    Gibt Pfad zur temporären WAV-Datei zurück. Im Spool-Modus (Default aus
+    ``PULSESCRIBE_SPOOL_RECORDINGS``) ist das die bereits während der Aufnahme
+    geschriebene Spool-Datei.
     """
-    import numpy as np
-    import sounddevice as sd
+    sd = get_sounddevice()
     import soundfile as sf
 
-    recorded_chunks: list = []
+    use_spool = get_recording_spool_enabled() if spool is None else spool
     input_device, actual_sample_rate = _resolve_input_stream_config(
         WHISPER_SAMPLE_RATE
     )
+    recorded_audio = SampleBuffer(sample_rate=actual_sample_rate)
+    recording_spool: RecordingSpool | None = None
 
     def on_audio_chunk(indata, _frames, _time, _status):
-        recorded_chunks.append(indata.copy())
+        if recording_spool is not None:
+            recording_spool.write(indata)
+            return
+        recorded_audio.append(indata)
 
     _log("🎤 Drücke ENTER um die Aufnahme zu starten...")
     input()
@@ -326,6 +405,8 @@ def record_audio() -> Path:
         None,
     )
     while True:
+        if use_spool:
+            recording_spool = _start_spool(actual_sample_rate, 1)
         try:
             with sd.InputStream(
                 device=input_device,
@@ -339,6 +420,9 @@ def record_audio() -> Path:
                 input()
             break
         except Exception:
+            if recording_spool is not None:
+                recording_spool.discard()
+                recording_spool = None
             if should_retry_with_fresh_device:
                 should_retry_with_fresh_device = False
                 refreshed_config = _reprobe_input_stream_config(
@@ -349,16 +433,25 @@ def record_audio() -> Path:
                 )
                 if refreshed_config is not None:
                     input_device, actual_sample_rate = refreshed_config
+                    recorded_audio = SampleBuffer(sample_rate=actual_sample_rate)
                     continue
             raise
 
     _log("✅ Aufnahme beendet.")
     _play_sound("stop")
 
-    if not recorded_chunks:
+    if recording_spool is not None:
+        try:
+            return _finalize_spool(recording_spool, None)
+        except ValueError:
+            raise ValueError(
+                "Keine Audiodaten aufgenommen. Bitte länger aufnehmen."
+            ) from None
+
+    if not len(recorded_audio):
         raise ValueError("Keine Audiodaten aufgenommen. Bitte länger aufnehmen.")
 
-    audio_data = np.concatenate(recorded_chunks)
+    audio_data = recorded_audio.take()
     output_path = Path(tempfile.gettempdir()) / TEMP_RECORDING_FILENAME
     sf.write(output_path, audio_data, actual_sample_rate)
 
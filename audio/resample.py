@@ -0,0 +1,194 @@
+"""Streaming-Resampler (polyphase, windowed-sinc) für die Capture-Pfade.
+
+Läuft der Warm-Stream bzw. das Mikrofon nativ mit 48 kHz oder 44.1 kHz, hat
+der Windows-Daemon früher erst nach dem Stop die komplette Aufnahme
+resampled (``scipy.signal.resample`` = FFT über alles, sonst ``np.interp``
+ohne Anti-Aliasing). Die Kosten landeten genau zwischen Key-Release und
+Transkription und wuchsen mit der Diktatlänge.
+
+`StreamingResampler` konvertiert jeden Block schon während der Aufnahme:
+
+    - rationales Verhältnis L/M (z.B. 1/3 für 48k→16k, 160/441 für 44.1k→16k)
+    - Kaiser-gefensterter Sinc-Tiefpass, als Polyphasen-Tabelle (L × K)
+      vorberechnet; pro Ausgabe-Sample nur K Multiplikationen
+    - Zustand zwischen Blöcken (Historie + Phase), daher ist die Ausgabe
+      unabhängig von der Blockgröße
+    - Gruppenlaufzeit kompensiert: Ausgabe ist zeitlich deckungsgleich mit
+      dem Eingang, ``flush()`` liefert den Rest beim Stop
+
+Usage:
+    resampler = StreamingResampler(48000, 16000)
+    buffer.append(resampler.process(indata))   # im Audio-Callback
+    buffer.append(resampler.flush())           # beim Stop
+"""
+
+from __future__ import annotations
+
+from math import gcd
+
+# Nulldurchgänge des Sinc pro Seite, gemessen in Samples der niedrigeren Rate.
+# 16 → ~-80 dB Sperrdämpfung bei schmalem Übergangsband; für Sprache reichlich.
+DEFAULT_ZERO_CROSSINGS = 16
+# Grenzfrequenz relativ zur Ziel-Nyquist-Frequenz (Rest = Übergangsband)
+DEFAULT_ROLLOFF = 0.9
+_KAISER_BETA = 8.6
+
+
+def _design_polyphase_filter(up: int, down: int, zero_crossings: int, rolloff: float):
+    """Berechnet die Polyphasen-Tabelle (up × taps) des Tiefpasses."""
+    import numpy as np
+
+    ratio = max(up, down)
+    # Filterlänge in Eingangs-Samples (gerade → ganzzahlige Verzögerung taps/2)
+    taps = 2 * -(-zero_crossings * ratio // up)
+    length = up * taps
+    center = length / 2
+    cutoff = rolloff * 0.5 / ratio  # in Zyklen pro hochgetastetem Sample
+
+    offsets = np.arange(length, dtype=np.float64) - center
+    window = np.i0(_KAISER_BETA * np.sqrt(np.clip(1 - (offsets / center) ** 2, 0, None)))
+    window /= np.i0(_KAISER_BETA)
+    prototype = 2 * cutoff * np.sinc(2 * cutoff * offsets) * window * up
+    # Phase r, Tap k ↔ prototype[r + k * up] wirkt auf x[q - k]. Umgedreht
+    # (älteste zuerst), damit die Eingangsfenster zusammenhängende Slices sind.
+    table = prototype.reshape(taps, up).T[:, ::-1]
+    return np.ascontiguousarray(table, dtype=np.float32), taps
+
+
+class StreamingResampler:
+    """Zustandsbehafteter Polyphasen-Resampler für Mono-Blöcke.
+
+    Nicht thread-safe: ein Producer (Audio-Callback bzw. Warm-Stream-Collector)
+    ruft ``process`` unter demselben Lock wie den Puffer-Append auf.
+    """
+
+    def __init__(
+        self,
+        from_rate: int,
+        to_rate: int,
+        *,
+        zero_crossings: int = DEFAULT_ZERO_CROSSINGS,
+        rolloff: float = DEFAULT_ROLLOFF,
+    ) -> None:
+        import numpy as np
+
+        if from_rate <= 0 or to_rate <= 0:
+            raise ValueError("Sample-Raten müssen > 0 sein")
+        divisor = gcd(from_rate, to_rate)
+        self.from_rate = from_rate
+        self.to_rate = to_rate
+        self.up = to_rate // divisor
+        self.down = from_rate // divisor
+        self._filters, self.taps = _design_polyphase_filter(
+            self.up, self.down, zero_crossings, rolloff
+        )
+        self._delay = self.taps // 2
+        # Historie: taps Nullen vor Sample 0 → Indizes nie negativ
+        self._history = np.zeros(self.taps, dtype=np.float32)
+        self._history_start = -self.taps
+        self._samples_in = 0
+        self._samples_out = 0
+        self._flushed = False
+
+    @property
+    def latency_samples(self) -> int:
+        """Eingangs-Samples, die ``process`` vor der Ausgabe zurückhält."""
+        return self._delay
+
+    def _output_limit(self, available_input: int) -> int:
+        """Erster Ausgabe-Index, für den Eingang ``available_input`` nicht reicht."""
+        last_index = available_input - 1 - self._delay
+        if last_index < 0:
+            return 0
+        return -(-self.up * (last_index + 1) // self.down)
+
+    def _emit(self, end: int):
+        import numpy as np
+        from numpy.lib.stride_tricks import sliding_window_view
+
+        start = self._samples_out
+        if end <= start:
+            return np.zeros(0, dtype=np.float32)
+        positions = np.arange(start, end, dtype=np.int64) * self.down
+        phases = positions % self.up
+        oldest = positions // self.up + self._delay - self.taps + 1 - self._history_start
+        # Fenster x[q-taps+1 .. q] pro Ausgabe-Sample (Strided-View, nur der
+        # Gather kopiert)
+        windows = sliding_window_view(self._history, self.taps)[oldest]
+        out = np.einsum("nk,nk->n", windows, self._filters[phases])
+        self._samples_out = end
+
+        # Historie kürzen: ältester noch benötigter Eingang fürs nächste Sample
+        next_newest = (end * self.down) // self.up + self._delay
+        keep_from = next_newest - self.taps + 1 - self._history_start
+        if keep_from > 0:
+            self._history = self._history[keep_from:]
+            self._history_start += keep_from
+        return out.astype(np.float32, copy=False)
+
+    def process(self, chunk, *, scale: float | None = None):
+        """Resampled einen Block und gibt alle fertigen Ausgabe-Samples zurück.
+
+        Args:
+            chunk: Array (frames,) oder (frames, channels); mehrkanalig wird
+                gemittelt.
+            scale: Optionaler Divisor für Integer-Samples (z.B. ``INT16_MAX``).
+
+        Returns:
+            float32-Array (frames_out,). Die letzten ``latency_samples``
+            Eingangs-Samples werden zurückgehalten, bis Nachfolger oder
+            ``flush()`` kommen.
+        """
+        import numpy as np
+
+        if self._flushed:
+            raise RuntimeError("Resampler wurde bereits geflusht")
+        samples = np.asarray(chunk)
+        if samples.ndim > 1 and samples.shape[-1] > 1:
+            samples = samples.mean(axis=-1)
+        samples = samples.reshape(-1).astype(np.float32, copy=False)
+        if scale:
+            samples = samples * np.float32(1.0 / scale)
+        if samples.size == 0:
+            return np.zeros(0, dtype=np.float32)
+
+        self._history = np.concatenate([self._history, samples])
+        self._samples_in += int(samples.size)
+        return self._emit(self._output_limit(self._samples_in))
+
+    def process_bytes(self, raw: bytes, *, dtype: str = "int16", scale: float | None = None):
+        """Wie ``process`` für rohe PCM-Bytes (z.B. aus der Warm-Stream-Queue)."""
+        import numpy as np
+
+        return self.process(np.frombuffer(raw, dtype=dtype), scale=scale)
+
+    def flush(self):
+        """Liefert den zurückgehaltenen Rest (Eingang mit Nullen aufgefüllt).
+
+        Die Gesamtlänge entspricht ``int(samples_in * to_rate / from_rate)``.
+        """
+        import numpy as np
+
+        if self._flushed:
+            return np.zeros(0, dtype=np.float32)
+        self._flushed = True
+        self._history = np.concatenate(
+            [self._history, np.zeros(self._delay, dtype=np.float32)]
+        )
+        total = (self._samples_in * self.up) // self.down
+        return self._emit(total)
+
+
+def resample_audio(audio, from_rate: int, to_rate: int):
+    """Resampled ein komplettes Array in einem Schritt (gleicher Filter)."""
+    import numpy as np
+
+    samples = np.asarray(audio, dtype=np.float32).reshape(-1)
+    if from_rate == to_rate or samples.size == 0:
+        return samples
+    resampler = StreamingResampler(from_rate, to_rate)
+    head = resampler.process(samples)
+    return np.concatenate([head, resampler.flush()])
+
+
+__all__ = ["StreamingResampler", "resample_audio"]
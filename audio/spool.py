@@ -0,0 +1,356 @@
+"""Inkrementelles Spooling von Aufnahmen auf die Platte.
+
+`RecordingSpool` schreibt die Blöcke schon während der Aufnahme über einen
+Hintergrund-Thread (bounded Queue) in eine temporäre Datei. `finalize()` muss
+beim Stop nur noch den Rest-Queue leeren und den Header abschließen.
+
+Einsatz:
+    - CLI-Aufnahme: die Datei ist direkt das Ergebnis, der RAM-Bedarf sehr
+      langer Aufnahmen bleibt begrenzt.
+    - Daemons: reine Crash-Recovery. Hochgeladen wird weiterhin aus dem RAM
+      (VAD-Trim, Upload-Codec), der Spool wird danach verworfen. Beim Start
+      meldet `report_orphaned_spools` Aufnahmen, die ein Absturz
+      zurückgelassen hat; sie bleiben zum erneuten Transkribieren liegen.
+
+Spool-Dateien liegen in ``~/.pulsescribe/spool`` (das Temp-Verzeichnis wird
+beim Neustart geleert) und tragen die PID des schreibenden Prozesses im
+Namen, damit laufende Aufnahmen nicht als verwaist gelten.
+
+WAV-Header: libsndfile schreibt die Chunk-Größen erst beim Schließen. Der
+Writer patcht RIFF- und data-Größe daher selbst (einmal pro
+``flush_interval``), und `find_orphaned_spools` repariert nach einem Crash
+auch die zuletzt geschriebenen Blöcke. FLAC-Frames sind ohnehin
+selbstbeschreibend und bleiben ohne abgeschlossenen Header dekodierbar.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import struct
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from config import RECORDING_SPOOL_FLUSH_INTERVAL, RECORDING_SPOOL_QUEUE_SIZE
+
+logger = logging.getLogger("pulsescribe")
+
+SPOOL_FILE_PREFIX = "pulsescribe_spool_"
+_SPOOL_SUFFIXES = {"WAV": ".wav", "FLAC": ".flac"}
+_SPOOL_SUBTYPE = "PCM_16"  # Whisper-APIs brauchen nicht mehr als 16 Bit
+_STOP_SENTINEL = None
+_PCM_16_BYTES = 2
+
+
+def repair_wav_header(path: Path, *, channels: int = 1) -> bool:
+    """Setzt RIFF- und data-Chunk-Größe auf die tatsächliche Dateilänge.
+
+    Angebrochene Frames am Ende (Crash mitten im Schreiben) zählen nicht mit.
+
+    Returns:
+        True, wenn der Header angepasst wurde.
+    """
+    try:
+        with open(path, "r+b") as handle:
+            header = handle.read(12)
+            if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+                return False
+            file_size = handle.seek(0, 2)
+            position = 12
+            while position + 8 <= file_size:
+                handle.seek(position)
+                chunk_id, chunk_size = struct.unpack("<4sI", handle.read(8))
+                if chunk_id == b"data":
+                    frame_bytes = _PCM_16_BYTES * max(1, channels)
+                    data_size = file_size - position - 8
+                    data_size -= data_size % frame_bytes
+                    riff_size = position + data_size
+                    if chunk_size == data_size and struct.unpack(
+                        "<I", header[4:8]
+                    )[0] == riff_size:
+                        return False
+                    handle.seek(4)
+                    handle.write(struct.pack("<I", riff_size))
+                    handle.seek(position + 4)
+                    handle.write(struct.pack("<I", data_size))
+                    return True
+                position += 8 + chunk_size + (chunk_size & 1)
+    except OSError as exc:
+        logger.debug(f"WAV-Header nicht repariert ({path}): {exc}")
+    return False
+
+
+class RecordingSpool:
+    """Streamt Audio-Blöcke während der Aufnahme in eine WAV/FLAC-Datei.
+
+    Usage:
+        spool = RecordingSpool(sample_rate=16000)
+        spool.start()
+        spool.write(indata)          # im Audio-Callback (non-blocking)
+        path = spool.finalize()      # beim Stop: nur Header abschließen
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_rate: int,
+        channels: int = 1,
+        path: Path | None = None,
+        file_format: str = "WAV",
+        directory: Path | None = None,
+        queue_size: int = RECORDING_SPOOL_QUEUE_SIZE,
+        flush_interval: float = RECORDING_SPOOL_FLUSH_INTERVAL,
+    ) -> None:
+        normalized_format = file_format.strip().upper()
+        if normalized_format not in _SPOOL_SUFFIXES:
+            raise ValueError(f"Nicht unterstütztes Spool-Format: {file_format}")
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.file_format = normalized_format
+        self._requested_path = path
+        self._directory = directory
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+        self._flush_interval = flush_interval
+        self._path: Path | None = None
+        self._thread: threading.Thread | None = None
+        self._writer_error: BaseException | None = None
+        self._finalized = False
+        self._lock = threading.Lock()
+        self.frames_written = 0
+        self.dropped_blocks = 0
+
+    @property
+    def path(self) -> Path | None:
+        """Pfad der Spool-Datei (None vor ``start()``)."""
+        return self._path
+
+    @property
+    def duration(self) -> float:
+        """Bisher geschriebene Dauer in Sekunden."""
+        if self.sample_rate <= 0:
+            return 0.0
+        return self.frames_written / self.sample_rate
+
+    def _create_path(self) -> Path:
+        if self._requested_path is not None:
+            return Path(self._requested_path)
+        directory = self._directory or _default_spool_dir()
+        directory.mkdir(parents=True, exist_ok=True)
+        handle = tempfile.NamedTemporaryFile(
+            prefix=f"{SPOOL_FILE_PREFIX}{os.getpid()}_",
+            suffix=_SPOOL_SUFFIXES[self.file_format],
+            dir=directory,
+            delete=False,
+        )
+        handle.close()
+        return Path(handle.name)
+
+    def start(self) -> Path:
+        """Öffnet die Spool-Datei und startet den Writer-Thread."""
+        import soundfile as sf
+
+        with self._lock:
+            if self._thread is not None:
+                raise RuntimeError("Spool läuft bereits.")
+            self._path = self._create_path()
+            sound_file = sf.SoundFile(
+                str(self._path),
+                mode="w",
+                samplerate=self.sample_rate,
+                channels=self.channels,
+                format=self.file_format,
+                subtype=_SPOOL_SUBTYPE,
+            )
+            self._thread = threading.Thread(
+                target=self._writer_loop,
+                args=(sound_file,),
+                daemon=True,
+                name="RecordingSpool",
+            )
+            self._thread.start()
+        logger.debug(f"Recording-Spool gestartet: {self._path}")
+        return self._path
+
+    def write(self, chunk, *, copy: bool = True) -> bool:
+        """Reiht einen Audio-Block zum Schreiben ein (blockiert nie).
+
+        Args:
+            chunk: numpy-Array (float32 oder int16) mit Shape (frames,) oder
+                (frames, channels).
+            copy: False, wenn der Aufrufer garantiert, dass der Block danach
+                nicht mehr verändert wird (PortAudio recycelt ``indata``).
+
+        Returns:
+            False, wenn die Queue voll war und der Block verworfen wurde.
+        """
+        if self._thread is None or self._finalized:
+            return False
+        block = chunk.copy() if copy else chunk
+        try:
+            self._queue.put_nowait(block)
+            return True
+        except queue.Full:
+            self.dropped_blocks += 1
+            if self.dropped_blocks == 1:
+                logger.warning(
+                    "Recording-Spool Queue voll, Audio-Blöcke werden verworfen"
+                )
+            return False
+
+    def _writer_loop(self, sound_file) -> None:
+        last_flush = time.monotonic()
+        try:
+            while True:
+                try:
+                    block = self._queue.get(timeout=self._flush_interval)
+                except queue.Empty:
+                    self._sync_header(sound_file)
+                    last_flush = time.monotonic()
+                    continue
+                if block is _STOP_SENTINEL:
+                    break
+                frames = block.reshape(-1, self.channels)
+                sound_file.write(frames)
+                self.frames_written += int(frames.shape[0])
+                now = time.monotonic()
+                if now - last_flush >= self._flush_interval:
+                    self._sync_header(sound_file)
+                    last_flush = now
+        except BaseException as exc:
+            self._writer_error = exc
+            logger.warning(f"Recording-Spool Writer fehlgeschlagen: {exc}")
+        finally:
+            try:
+                sound_file.close()
+            except Exception as exc:
+                if self._writer_error is None:
+                    self._writer_error = exc
+
+    def _sync_header(self, sound_file) -> None:
+        """Macht die Datei crash-fest: Daten flushen, WAV-Größen patchen."""
+        sound_file.flush()
+        if self.file_format == "WAV" and self._path is not None:
+            repair_wav_header(self._path, channels=self.channels)
+
+    def finalize(self, timeout: float | None = 5.0) -> Path:
+        """Schreibt ausstehende Blöcke, schließt den Header und gibt den Pfad zurück.
+
+        Idempotent: weitere Aufrufe liefern denselben Pfad.
+
+        Raises:
+            RuntimeError: Wenn der Spool nie gestartet wurde oder der Writer
+                fehlgeschlagen ist.
+        """
+        with self._lock:
+            thread = self._thread
+            if thread is None or self._path is None:
+                raise RuntimeError("Spool wurde nicht gestartet.")
+            if not self._finalized:
+                self._finalized = True
+                self._queue.put(_STOP_SENTINEL)
+        thread.join(timeout=timeout)
+        if thread.is_alive():
+            raise RuntimeError("Recording-Spool Writer reagiert nicht (Timeout)")
+        if self._writer_error is not None:
+            raise RuntimeError(
+                f"Recording-Spool fehlgeschlagen: {self._writer_error}"
+            ) from self._writer_error
+        if self.dropped_blocks:
+            logger.warning(
+                f"Recording-Spool: {self.dropped_blocks} Blöcke verworfen"
+            )
+        return self._path
+
+    def discard(self) -> None:
+        """Beendet den Spool (falls aktiv) und löscht die Datei."""
+        if self._thread is not None:
+            try:
+                self.finalize()
+            except Exception as exc:
+                logger.debug(f"Recording-Spool Finalize beim Verwerfen: {exc}")
+        if self._path is not None:
+            self._path.unlink(missing_ok=True)
+
+
+def _default_spool_dir() -> Path:
+    import config
+
+    return config.RECORDING_SPOOL_DIR
+
+
+def _spool_owner_pid(path: Path) -> int | None:
+    """PID aus ``pulsescribe_spool_<pid>_…``; None bei fremdem Namensschema."""
+    owner = path.name[len(SPOOL_FILE_PREFIX):].split("_", 1)[0]
+    return int(owner) if owner.isdigit() else None
+
+
+def _process_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        return True
+    try:
+        from whisper_platform import get_daemon_controller
+
+        return get_daemon_controller().is_running(pid)
+    except NotImplementedError:
+        try:
+            os.kill(pid, 0)  # Signal 0 = Existenz-Check
+        except (ProcessLookupError, PermissionError):
+            return False
+        except OSError:
+            return True  # im Zweifel nicht anfassen
+        return True
+
+
+def find_orphaned_spools(directory: Path | None = None) -> list[Path]:
+    """Findet liegengebliebene Spool-Dateien (z.B. nach einem Crash).
+
+    Dateien eines noch laufenden Prozesses (laufende Aufnahme) werden
+    übersprungen. WAV-Header werden auf die tatsächliche Länge repariert; die
+    Dateien enthalten alles bis zum letzten geschriebenen Block und können
+    normal transkribiert werden. Sortiert: älteste zuerst.
+    """
+    search_dir = directory or _default_spool_dir()
+    try:
+        candidates = [
+            path
+            for suffix in _SPOOL_SUFFIXES.values()
+            for path in search_dir.glob(f"{SPOOL_FILE_PREFIX}*{suffix}")
+            if path.is_file()
+        ]
+    except OSError:
+        return []
+    candidates = [
+        path
+        for path in candidates
+        if (owner := _spool_owner_pid(path)) is None or not _process_alive(owner)
+    ]
+    for path in candidates:
+        if path.suffix == _SPOOL_SUFFIXES["WAV"]:
+            repair_wav_header(path)
+    return sorted(candidates, key=lambda path: path.stat().st_mtime)
+
+
+def report_orphaned_spools(directory: Path | None = None) -> list[Path]:
+    """Meldet beim Daemon-Start Aufnahmen, die ein Absturz hinterlassen hat.
+
+    Die Dateien bleiben liegen, damit sie erneut transkribiert werden können.
+    """
+    orphans = find_orphaned_spools(directory)
+    for path in orphans:
+        logger.warning(
+            f"Unvollständige Aufnahme nach Absturz gefunden: {path} – "
+            f"transkribieren mit: python transcribe.py \"{path}\", danach löschen"
+        )
+    return orphans
+
+
+__all__ = [
+    "RecordingSpool",
+    "find_orphaned_spools",
+    "report_orphaned_spools",
+    "repair_wav_header",
+    "SPOOL_FILE_PREFIX",
+]
@@ -0,0 +1,308 @@
+"""Streaming Voice Activity Detection für die Capture-Pfade.
+
+Früher gab es pro Audio-Callback nur einen RMS-Vergleich gegen
+``VAD_THRESHOLD`` und beim Stop einen zweiten O(n)-Durchlauf über die ganze
+Aufnahme (``_trim_silence`` mit stride_tricks). Windows hatte eigene Logik.
+
+`StreamingVAD` wird einmal pro Chunk gefüttert und hält alles inkrementell:
+
+    - Frame-Energie (10ms-Hops, 20ms-Analysefenster) und Zero-Crossing-Rate,
+      vektorisiert pro Chunk
+    - ``had_speech`` und Sprachsegmente mit Hangover
+    - Trim-Punkte: beim Stop wird nur noch über die Frame-Energien
+      (100 Werte pro Sekunde) gesucht, nicht mehr über die Samples
+    - optional adaptiver Noise-Floor (Schwelle folgt dem Grundrauschen)
+
+Usage:
+    vad = StreamingVAD(sample_rate=16000)
+    level = vad.feed(indata)            # im Audio-Callback (liefert Chunk-RMS)
+    if vad.had_speech:
+        start, end = vad.trim_bounds() or (0, vad.total_samples)
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from config import VAD_THRESHOLD
+
+DEFAULT_FRAME_MS = 10.0  # Hop zwischen Analysefenstern
+WINDOW_FRAMES = 2  # Analysefenster = 2 Hops (20ms)
+DEFAULT_HANGOVER_MS = 300.0  # Stille, nach der ein Segment als beendet gilt
+# Rauschen/Zischen hat hohe ZCR (weißes Rauschen ~0.5). Frames knapp über der
+# Schwelle mit hoher ZCR zählen nicht als Sprache; deutlich lautere Frames
+# (>= 2x Schwelle) immer – Frikative sollen keine Aufnahme verwerfen.
+DEFAULT_MAX_ZCR = 0.35
+_LOUD_FACTOR = 2.0
+# Noise-Floor-Adaption: Schwelle = max(threshold, floor * ratio)
+DEFAULT_NOISE_FLOOR_RATIO = 3.0
+_NOISE_FLOOR_ALPHA = 0.05
+# Trimming: VAD_THRESHOLD ist fürs Triggern optimiert und am Ende zu
+# aggressiv. Für Trimming ein konservativerer, dynamischer Wert.
+_TRIM_THRESHOLD_FACTOR = 0.5
+_TRIM_MAX_RMS_FACTOR = 0.03
+
+
+class SpeechSegment(NamedTuple):
+    """Sprachsegment in Samples (``end`` exklusiv)."""
+
+    start: int
+    end: int
+
+
+class StreamingVAD:
+    """Inkrementelle VAD (Energie + Zero-Crossing + Hangover).
+
+    Nicht thread-safe: genau ein Producer (Audio-Callback) füttert; gelesen
+    wird nach dem Ende der Aufnahme oder unter demselben Lock.
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_rate: int,
+        threshold: float = VAD_THRESHOLD,
+        frame_ms: float = DEFAULT_FRAME_MS,
+        hangover_ms: float = DEFAULT_HANGOVER_MS,
+        max_zcr: float = DEFAULT_MAX_ZCR,
+        adapt_noise_floor: bool = False,
+        noise_floor_ratio: float = DEFAULT_NOISE_FLOOR_RATIO,
+    ) -> None:
+        self.sample_rate = sample_rate
+        self.threshold = threshold
+        self.max_zcr = max_zcr
+        self.adapt_noise_floor = adapt_noise_floor
+        self.noise_floor_ratio = noise_floor_ratio
+        self.hop = max(1, int(sample_rate * frame_ms / 1000))
+        self.window = self.hop * WINDOW_FRAMES
+        self._hangover_frames = max(1, int(round(hangover_ms / frame_ms)))
+
+        self.total_samples = 0
+        self.max_rms = 0.0
+        self.had_speech = False
+        self.noise_floor: float | None = None
+
+        self._carry = None  # Rest-Samples < hop aus dem letzten Chunk
+        self._frame_count = 0
+        self._prev_mean_square: float | None = None
+        self._prev_zcr = 0.0
+        self._frame_energy_parts: list = []  # Mean-Square pro Hop
+        self._frame_energy_cache = None
+        self._closed_segments: list[SpeechSegment] = []
+        self._segment_start: int | None = None  # Fenster-Index
+        self._last_speech: int | None = None  # Fenster-Index
+
+    # ------------------------------------------------------------------
+    # Füttern
+    # ------------------------------------------------------------------
+
+    def feed(self, chunk, *, scale: float | None = None) -> float:
+        """Verarbeitet einen Audio-Block und gibt dessen RMS zurück.
+
+        Args:
+            chunk: Array (frames,) oder (frames, channels); mehrkanalig wird
+                gemittelt.
+            scale: Optionaler Divisor für Integer-Samples (z.B. ``INT16_MAX``).
+        """
+        import numpy as np
+
+        samples = np.asarray(chunk)
+        if samples.ndim > 1 and samples.shape[-1] > 1:
+            samples = samples.mean(axis=-1)
+        samples = samples.reshape(-1).astype(np.float32, copy=False)
+        if scale:
+            samples = samples * np.float32(1.0 / scale)
+        if samples.size == 0:
+            return 0.0
+
+        chunk_rms = float(np.sqrt(np.mean(np.square(samples))))
+        self.max_rms = max(self.max_rms, chunk_rms)
+        self.total_samples += int(samples.size)
+        # Eindeutig laute Blöcke zählen sofort, auch wenn sie kürzer als ein
+        # Hop sind und erst mit dem nächsten Block analysiert würden.
+        if chunk_rms >= self.effective_threshold * _LOUD_FACTOR:
+            self.had_speech = True
+
+        if self._carry is not None and self._carry.size:
+            samples = np.concatenate([self._carry, samples])
+        frame_count = samples.size // self.hop
+        self._carry = samples[frame_count * self.hop :].copy()
+        if frame_count:
+            self._process_frames(samples[: frame_count * self.hop].reshape(frame_count, self.hop))
+        return chunk_rms
+
+    def feed_bytes(self, raw: bytes, *, dtype: str = "int16", scale: float | None = None) -> float:
+        """Wie ``feed`` für rohe PCM-Bytes (z.B. aus der Warm-Stream-Queue)."""
+        import numpy as np
+
+        return self.feed(np.frombuffer(raw, dtype=dtype), scale=scale)
+
+    def _process_frames(self, frames) -> None:
+        import numpy as np
+
+        mean_square = np.mean(np.square(frames, dtype=np.float64), axis=1)
+        signs = np.signbit(frames)
+        zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / self.hop
+
+        self._frame_energy_parts.append(mean_square)
+        self._frame_energy_cache = None
+        first_index = self._frame_count
+        self._frame_count += int(mean_square.size)
+
+        # 20ms-Fenster k = Hops (k-1, k); das erste Fenster braucht den
+        # letzten Hop des vorherigen Chunks.
+        if self._prev_mean_square is None:
+            window_ms = (mean_square[:-1] + mean_square[1:]) / 2
+            window_zcr = (zcr[:-1] + zcr[1:]) / 2
+            first_window = first_index + 1
+        else:
+            window_ms = (np.concatenate([[self._prev_mean_square], mean_square[:-1]]) + mean_square) / 2
+            window_zcr = (np.concatenate([[self._prev_zcr], zcr[:-1]]) + zcr) / 2
+            first_window = first_index
+        self._prev_mean_square = float(mean_square[-1])
+        self._prev_zcr = float(zcr[-1])
+        if window_ms.size == 0:
+            return
+
+        window_rms = np.sqrt(window_ms)
+        threshold = self.effective_threshold
+        speech = (window_rms > threshold) & (
+            (window_zcr <= self.max_zcr) | (window_rms >= threshold * _LOUD_FACTOR)
+        )
+        if self.adapt_noise_floor:
+            self._update_noise_floor(window_rms[~speech])
+
+        speech_indices = np.flatnonzero(speech) + first_window
+        if speech_indices.size:
+            self.had_speech = True
+            self._update_segments(speech_indices)
+        self._close_segment_after_hangover()
+
+    def _update_noise_floor(self, silent_rms) -> None:
+        import numpy as np
+
+        if silent_rms.size == 0:
+            return
+        level = float(np.median(silent_rms))
+        if self.noise_floor is None:
+            self.noise_floor = level
+        else:
+            self.noise_floor += _NOISE_FLOOR_ALPHA * (level - self.noise_floor)
+
+    def _update_segments(self, speech_indices) -> None:
+        import numpy as np
+
+        gaps = np.flatnonzero(np.diff(speech_indices) > self._hangover_frames)
+        run_starts = np.concatenate([speech_indices[:1], speech_indices[gaps + 1]])
+        run_ends = np.concatenate([speech_indices[gaps], speech_indices[-1:]])
+        for run_start, run_end in zip(run_starts.tolist(), run_ends.tolist()):
+            if (
+                self._segment_start is not None
+                and self._last_speech is not None
+                and run_start - self._last_speech > self._hangover_frames
+            ):
+                self._close_segment()
+            if self._segment_start is None:
+                self._segment_start = run_start
+            self._last_speech = run_end
+
+    def _close_segment_after_hangover(self) -> None:
+        if self._last_speech is None or self._segment_start is None:
+            return
+        if self._frame_count - 1 - self._last_speech > self._hangover_frames:
+            self._close_segment()
+
+    def _close_segment(self) -> None:
+        if self._segment_start is None or self._last_speech is None:
+            return
+        self._closed_segments.append(
+            self._window_span(self._segment_start, self._last_speech)
+        )
+        self._segment_start = None
+
+    def _window_span(self, first_window: int, last_window: int) -> SpeechSegment:
+        # Fenster k deckt Hops (k-1, k) ab → Samples [(k-1)*hop, (k+1)*hop)
+        start = max(0, (first_window - 1) * self.hop)
+        end = min(self.total_samples, (last_window + 1) * self.hop)
+        return SpeechSegment(start, end)
+
+    # ------------------------------------------------------------------
+    # Ergebnisse
+    # ------------------------------------------------------------------
+
+    @property
+    def effective_threshold(self) -> float:
+        """Aktuelle Sprach-Schwelle (inkl. Noise-Floor-Adaption)."""
+        if self.adapt_noise_floor and self.noise_floor is not None:
+            return max(self.threshold, self.noise_floor * self.noise_floor_ratio)
+        return self.threshold
+
+    @property
+    def in_speech(self) -> bool:
+        """True, solange ein Segment offen ist (Sprache oder Hangover)."""
+        return self._segment_start is not None
+
+    @property
+    def closed_segments(self) -> list[SpeechSegment]:
+        """Abgeschlossene Segmente (Hangover abgelaufen)."""
+        return list(self._closed_segments)
+
+    @property
+    def segments(self) -> list[SpeechSegment]:
+        """Alle Segmente inkl. des aktuell offenen."""
+        segments = list(self._closed_segments)
+        if self._segment_start is not None and self._last_speech is not None:
+            segments.append(self._window_span(self._segment_start, self._last_speech))
+        return segments
+
+    def _frame_energy(self):
+        import numpy as np
+
+        if self._frame_energy_cache is None:
+            if self._frame_energy_parts:
+                self._frame_energy_cache = np.concatenate(self._frame_energy_parts)
+                self._frame_energy_parts = [self._frame_energy_cache]
+            else:
+                self._frame_energy_cache = np.zeros(0)
+        return self._frame_energy_cache
+
+    def default_trim_threshold(self) -> float:
+        """Konservative Trim-Schwelle: leise Auskling-Phoneme bleiben erhalten."""
+        trim_threshold = self.threshold * _TRIM_THRESHOLD_FACTOR
+        if self.max_rms > 0:
+            trim_threshold = min(trim_threshold, self.max_rms * _TRIM_MAX_RMS_FACTOR)
+        return trim_threshold
+
+    def trim_bounds(
+        self,
+        *,
+        pad_s: float = 0.15,
+        threshold: float | None = None,
+    ) -> tuple[int, int] | None:
+        """Trim-Punkte (start, end) in Samples; None = nichts zu trimmen.
+
+        Sucht nur über die gespeicherten Frame-Energien (O(Frames) statt
+        O(Samples)). Für Trimming gilt ``>=`` statt ``>``, um leise
+        Auskling-Phoneme nicht abzuschneiden.
+        """
+        import numpy as np
+
+        if self.total_samples <= self.window:
+            return None
+        energy = self._frame_energy()
+        if energy.size < WINDOW_FRAMES:
+            return None
+        window_rms = np.sqrt((energy[:-1] + energy[1:]) / 2)
+        limit = self.default_trim_threshold() if threshold is None else threshold
+        active = window_rms >= limit
+        if not np.any(active):
+            return None
+        first = int(np.argmax(active))
+        last = int(active.size - np.argmax(active[::-1]) - 1)
+        pad = int(pad_s * self.sample_rate)
+        start = max(0, first * self.hop - pad)
+        end = min(self.total_samples, last * self.hop + self.window + pad)
+        return start, end
+
+
+__all__ = ["StreamingVAD", "SpeechSegment"]
@@ -0,0 +1,7 @@
+"""Entwickler-Benchmarks für PulseScribe (nicht Teil des Pakets).
+
+Aufruf aus dem Repo-Root, z.B.:
+    python -m benchmarks.upload_codecs
+    python -m benchmarks.resample
+    python -m benchmarks.latency
+"""
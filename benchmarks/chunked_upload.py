@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Lange Datei als ein Request vs. parallel hochgeladene Chunks.
+
+Startet einen lokalen Stand-in-Server für ``POST /v1/audio/transcriptions``
+(OpenAI-kompatibel), der einen gemeinsamen Uplink (``--uplink-mbit``) und
+Verarbeitungszeit proportional zur Audiolänge (``--server-rtf``) simuliert.
+Der echte ``OpenAIProvider`` transkribiert dieselbe Datei einmal am Stück
+(``PULSESCRIBE_CHUNK_SECONDS=0``) und einmal in Chunks; ausgegeben wird die
+Wall-Clock-Zeit beider Läufe und der Speedup.
+
+Usage:
+    python -m benchmarks.chunked_upload                         # 30 min synthetisch
+    python -m benchmarks.chunked_upload --input meeting.flac
+    python -m benchmarks.chunked_upload --minutes 10 --workers 8 --server-rtf 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from audio.fixtures import synthetic_speech  # noqa: E402
+from config import WHISPER_SAMPLE_RATE  # noqa: E402
+
+
+class _SharedUplink:
+    """Serialisiert Uploads auf eine gemeinsame Bandbreite (wie ein echter Uplink)."""
+
+    def __init__(self, mbit: float) -> None:
+        self.bytes_per_s = mbit * 1_000_000 / 8
+        self._free_at = 0.0
+        self._lock = threading.Lock()
+
+    def transfer(self, size: int) -> None:
+        with self._lock:
+            start = max(time.monotonic(), self._free_at)
+            self._free_at = start + size / self.bytes_per_s
+            done = self._free_at
+        time.sleep(max(0.0, done - time.monotonic()))
+
+
+def _make_handler(uplink: _SharedUplink, server_rtf: float, latency_s: float):
+    import soundfile as sf
+
+    class Handler(BaseHTTPRequestHandler):
+        requests = 0
+
+        def log_message(self, *_args) -> None:  # kein Request-Log auf stderr
+            pass
+
+        def do_POST(self) -> None:  # noqa: N802 - http.server API
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            uplink.transfer(len(body))
+            header = f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode()
+            message = BytesParser(policy=HTTP).parsebytes(header + body)
+            fields = {
+                part.get_param("name", header="content-disposition"): part
+                for part in message.iter_parts()
+            }
+            audio = fields["file"].get_payload(decode=True)
+            response_format = fields["response_format"].get_content().strip()
+            audio_s = sf.info(BytesIO(audio)).duration
+            time.sleep(latency_s + audio_s * server_rtf)
+            type(self).requests += 1
+
+            text = f"Abschnitt von {audio_s:.0f} Sekunden."
+            if response_format == "text":
+                payload, content_type = text.encode(), "text/plain"
+            else:
+                payload = json.dumps({"text": text}).encode()
+                content_type = "application/json"
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+    return Handler
+
+
+def _transcribe(audio_path: Path, chunk_seconds: int) -> tuple[float, str]:
+    from providers.openai import OpenAIProvider
+
+    os.environ["PULSESCRIBE_CHUNK_SECONDS"] = str(chunk_seconds)
+    t0 = time.perf_counter()
+    text = OpenAIProvider().transcribe(audio_path, model="whisper-1", language="de")
+    return time.perf_counter() - t0, text
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Lange Datei: ein Request vs. parallele Chunks (lokaler Stand-in)",
+    )
+    parser.add_argument("--input", type=Path, help="Audiodatei statt Synthese")
+    parser.add_argument("--minutes", type=float, default=30.0)
+    parser.add_argument("--chunk-seconds", type=int, default=300)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--uplink-mbit", type=float, default=20.0)
+    parser.add_argument(
+        "--server-rtf",
+        type=float,
+        default=0.02,
+        help="Verarbeitungszeit des Servers pro Audiosekunde",
+    )
+    parser.add_argument("--latency-ms", type=float, default=300.0)
+    args = parser.parse_args(argv)
+
+    import soundfile as sf
+
+    uplink = _SharedUplink(args.uplink_mbit)
+    handler = _make_handler(uplink, args.server_rtf, args.latency_ms / 1000)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{server.server_port}/v1"
+    os.environ["OPENAI_API_KEY"] = "sk-benchmark"
+    os.environ["PULSESCRIBE_CHUNK_WORKERS"] = str(args.workers)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.input:
+            audio_path = args.input
+        else:
+            audio_path = Path(tmp) / "fixture.flac"
+            sf.write(
+                audio_path,
+                synthetic_speech(args.minutes * 60, WHISPER_SAMPLE_RATE),
+                WHISPER_SAMPLE_RATE,
+            )
+        duration = sf.info(str(audio_path)).duration
+        size_mb = audio_path.stat().st_size / 2**20
+        print(
+            f"Datei: {duration / 60:.1f} min, {size_mb:.1f} MB | Uplink "
+            f"{args.uplink_mbit:g} Mbit/s, Server-RTF {args.server_rtf:g}, "
+            f"Latenz {args.latency_ms:.0f}ms"
+        )
+
+        single_s, _ = _transcribe(audio_path, 0)
+        before = handler.requests
+        chunked_s, text = _transcribe(audio_path, args.chunk_seconds)
+        chunks = handler.requests - before
+    server.shutdown()
+
+    print(f"{'modus':>10} {'requests':>9} {'wall':>9}")
+    print(f"{'ein Request':>10} {1:>9} {single_s:>8.2f}s")
+    print(f"{'chunked':>10} {chunks:>9} {chunked_s:>8.2f}s")
+    print(
+        f"\nSpeedup {single_s / chunked_s:.2f}x "
+        f"({args.chunk_seconds}s-Chunks, {args.workers} parallel, "
+        f"{len(text.split())} Wörter zusammengesetzt)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
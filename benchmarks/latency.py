@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Hotkey-zu-Text-Latenz ohne Mikrofon (p50/p95 pro Phase).
+
+Spielt eine WAV-Datei (oder synthetische Sprache) über das `ReplayBackend`
+ab und treibt damit den echten Capture-Pfad. Der Hotkey-Release fällt auf
+das Dateiende (``stream.exhausted``); gemessen wird ab dort bis zum fertigen
+Text. Provider und Refine sind Stand-ins mit simulierter Latenz, damit der
+Lauf auf einer Linux-CI-Maschine ohne Netz und ohne Modelle reproduzierbar ist
+(``--provider openai`` o.ä. nutzt stattdessen den echten Provider).
+
+Treiber:
+    recorder  CLI-Pfad: ``AudioRecorder`` → WAV → ``provider.transcribe``
+    daemon    ``PulseScribeDaemon._recording_worker`` (VAD, Trimming,
+              In-Memory-Upload, optional progressive Transkription);
+              braucht die Daemon-Abhängigkeiten
+
+Phasen:
+    capture_start  Stream-Start → erster Audio-Block
+    stop           Release → Audio fertig (Stream zu, Puffer/WAV)
+    transcribe     Provider-Aufruf
+    refine         LLM-Nachbearbeitung
+    total          Release → Text
+
+Usage:
+    python -m benchmarks.latency
+    python -m benchmarks.latency --driver daemon --speed 4 --iterations 20
+    python -m benchmarks.latency --input diktat.wav --max-p95-ms 400
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import queue
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from audio.fixtures import synthetic_speech  # noqa: E402
+from audio.input_stream import ReplayBackend, set_audio_backend  # noqa: E402
+from config import WHISPER_SAMPLE_RATE  # noqa: E402
+from providers._audio_upload import EncodedAudio, audio_source_size  # noqa: E402
+from providers.base import EnvValidatedProvider  # noqa: E402
+
+PHASES = ("capture_start", "stop", "transcribe", "refine", "total")
+STANDIN_TRANSCRIPT = "das ist ein test"
+_RELEASE_TIMEOUT = 120.0
+
+
+class StandInRestProvider(EnvValidatedProvider):
+    """REST-Provider ohne Netz: echter Encode-Pfad, simulierte Upload-/Server-Zeit."""
+
+    name = "standin"
+
+    def __init__(self, *, rtt_ms: float, uplink_mbit: float, server_rtf: float) -> None:
+        super().__init__()
+        self.rtt_ms = rtt_ms
+        self.uplink_mbit = uplink_mbit
+        self.server_rtf = server_rtf
+
+    def _validate(self) -> None:
+        pass
+
+    def transcribe(self, audio_path, model=None, language=None) -> str:
+        size = audio_source_size(audio_path)
+        if isinstance(audio_path, EncodedAudio):
+            # Dauer aus der PCM_16-Vergleichsgröße (Mono, Whisper-Rate)
+            duration = max(0, audio_path.wav_size - 44) / (2 * WHISPER_SAMPLE_RATE)
+        else:
+            import soundfile as sf
+
+            duration = sf.info(str(audio_path)).duration
+        upload_s = size * 8 / (self.uplink_mbit * 1_000_000)
+        time.sleep(self.rtt_ms / 1000 + upload_s + self.server_rtf * duration)
+        return STANDIN_TRANSCRIPT
+
+
+class StandInLocalProvider:
+    """Lokaler Provider ohne Modell: Rechenzeit = RTF × Audiodauer."""
+
+    name = "local"
+
+    def __init__(self, *, rtf: float) -> None:
+        self.rtf = rtf
+
+    def supports_streaming(self) -> bool:
+        return False
+
+    def transcribe_audio(self, audio_data, model=None, language=None, *, sample_rate=None):
+        time.sleep(self.rtf * len(audio_data) / (sample_rate or WHISPER_SAMPLE_RATE))
+        return STANDIN_TRANSCRIPT
+
+    def transcribe(self, audio_path, model=None, language=None) -> str:
+        import soundfile as sf
+
+        time.sleep(self.rtf * sf.info(str(audio_path)).duration)
+        return STANDIN_TRANSCRIPT
+
+
+def make_provider(args):
+    if args.provider == "standin-rest":
+        return StandInRestProvider(
+            rtt_ms=args.rtt_ms, uplink_mbit=args.uplink_mbit, server_rtf=args.server_rtf
+        )
+    if args.provider == "standin-local":
+        return StandInLocalProvider(rtf=args.local_rtf)
+    from providers import get_provider
+
+    return get_provider(args.provider)
+
+
+def make_refine(args):
+    """Refine-Funktion mit der Signatur von ``maybe_refine_transcript``."""
+    if args.refine == "real":
+        from refine.llm import maybe_refine_transcript
+
+        return maybe_refine_transcript
+
+    def standin_refine(transcript: str, **_kwargs) -> str:
+        time.sleep(args.refine_ms / 1000)
+        return transcript
+
+    return standin_refine
+
+
+def load_fixture(args):
+    """Testaufnahme: Datei oder synthetische Sprache + Stille bis zum Release."""
+    import numpy as np
+
+    if args.input:
+        import soundfile as sf
+
+        audio, rate = sf.read(str(args.input), dtype="float32", always_2d=True)
+        return audio.mean(axis=1), rate
+    rate = args.sample_rate
+    speech = synthetic_speech(args.duration, rate)
+    silence = np.zeros(int(rate * args.trailing_silence), dtype=np.float32)
+    return np.concatenate([speech, silence]), rate
+
+
+def _wait_for_stream(backend: ReplayBackend, previous, worker=None) -> object:
+    deadline = time.perf_counter() + 10.0
+    while backend.last_stream is previous or backend.last_stream is None:
+        if time.perf_counter() > deadline or (worker and not worker.is_alive()):
+            raise RuntimeError("Capture-Pfad hat keinen Stream geöffnet")
+        time.sleep(0.001)
+    return backend.last_stream
+
+
+class _SilentSoundPlayer:
+    """Headless: kein Sound-Backend auf CI-Maschinen."""
+
+    def play(self, _name: str) -> None:
+        pass
+
+
+def run_recorder(backend: ReplayBackend, provider, refine, args) -> dict[str, float]:
+    """Ein Durchlauf über den CLI-Pfad (``AudioRecorder``)."""
+    from audio.recording import AudioRecorder
+
+    recorder = AudioRecorder(spool=args.spool)
+    previous = backend.last_stream
+    t_start = time.perf_counter()
+    recorder.start(play_ready_sound=False)
+    stream = _wait_for_stream(backend, previous)
+    if not stream.exhausted.wait(_RELEASE_TIMEOUT):
+        raise RuntimeError("Replay nicht beendet")
+    t_release = time.perf_counter()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = recorder.stop(output_path=Path(tmp) / "recording.wav")
+        t_stopped = time.perf_counter()
+        transcript = provider.transcribe(path, language=args.language)
+    t_transcribed = time.perf_counter()
+    refine(transcript, refine=True)
+    t_done = time.perf_counter()
+
+    return {
+        "capture_start": (stream.first_block_at or t_release) - t_start,
+        "stop": t_stopped - t_release,
+        "transcribe": t_transcribed - t_stopped,
+        "refine": t_done - t_transcribed,
+        "total": t_done - t_release,
+    }
+
+
+@contextmanager
+def _patched_refine(refine):
+    import refine.llm as refine_llm
+
+    original = refine_llm.maybe_refine_transcript
+    refine_llm.maybe_refine_transcript = refine
+    try:
+        yield
+    finally:
+        refine_llm.maybe_refine_transcript = original
+
+
+def run_daemon(backend: ReplayBackend, provider, refine, args) -> dict[str, float]:
+    """Ein Durchlauf über ``PulseScribeDaemon._recording_worker``."""
+    try:
+        import pulsescribe_daemon
+    except SystemExit as exc:
+        # Der Daemon beendet sich bei fehlenden UI-/Plattform-Imports selbst
+        raise ImportError("pulsescribe_daemon (UI-Abhängigkeiten)") from exc
+    from pulsescribe_daemon import MessageType, PulseScribeDaemon
+
+    pulsescribe_daemon.get_sound_player = _SilentSoundPlayer
+
+    mode = "local" if isinstance(provider, StandInLocalProvider) else "openai"
+    daemon = PulseScribeDaemon(mode=mode, language=args.language, refine=True)
+    daemon._get_provider = lambda _mode: provider
+
+    phase_times: dict[str, float] = {}
+    set_phase = daemon._set_worker_phase
+
+    def record_phase(phase: str, **kwargs) -> None:
+        phase_times.setdefault(phase, time.perf_counter())
+        set_phase(phase, **kwargs)
+
+    daemon._set_worker_phase = record_phase
+    results: queue.Queue = queue.Queue()
+    stop_event = threading.Event()
+    previous = backend.last_stream
+
+    with _patched_refine(refine):
+        worker = threading.Thread(
+            target=daemon._recording_worker,
+            kwargs={"result_queue_ref": results, "stop_event": stop_event},
+            daemon=True,
+        )
+        t_start = time.perf_counter()
+        worker.start()
+        try:
+            stream = _wait_for_stream(backend, previous, worker)
+        except RuntimeError:
+            failure = results.get_nowait() if not results.empty() else None
+            if isinstance(failure, Exception):
+                raise failure
+            raise
+        if not stream.exhausted.wait(_RELEASE_TIMEOUT):
+            raise RuntimeError("Replay nicht beendet")
+        t_release = time.perf_counter()
+        stop_event.set()
+        while True:
+            message = results.get(timeout=_RELEASE_TIMEOUT)
+            if isinstance(message, Exception):
+                raise message
+            if message.type == MessageType.TRANSCRIPT_RESULT:
+                break
+        t_done = time.perf_counter()
+        worker.join(timeout=5.0)
+
+    t_transcribing = phase_times.get("recording:transcribing", t_release)
+    t_refining = phase_times.get("recording:refining", t_done)
+    t_published = phase_times.get("recording:publishing-result", t_done)
+    return {
+        "capture_start": (stream.first_block_at or t_release) - t_start,
+        "stop": t_transcribing - t_release,
+        "transcribe": t_refining - t_transcribing,
+        "refine": t_published - t_refining,
+        "total": t_done - t_release,
+    }
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank-Perzentil (ohne Interpolation, auch für wenige Werte)."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Hotkey-zu-Text-Latenz mit Audio-Replay (p50/p95 pro Phase)",
+    )
+    parser.add_argument("--driver", choices=["recorder", "daemon"], default="recorder")
+    parser.add_argument("--input", type=Path, help="WAV-Datei statt synthetischer Sprache")
+    parser.add_argument("--duration", type=float, default=3.0)
+    parser.add_argument("--trailing-silence", type=float, default=0.5)
+    parser.add_argument("--sample-rate", type=int, default=48_000)
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--speed", type=float, default=4.0, help="0 = so schnell wie möglich")
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--blocksize", type=int, default=0)
+    parser.add_argument(
+        "--provider",
+        default="standin-rest",
+        help="standin-rest, standin-local oder ein echter Modus (openai, groq, local …)",
+    )
+    parser.add_argument("--rtt-ms", type=float, default=80.0)
+    parser.add_argument("--uplink-mbit", type=float, default=10.0)
+    parser.add_argument("--server-rtf", type=float, default=0.05)
+    parser.add_argument("--local-rtf", type=float, default=0.1)
+    parser.add_argument("--refine", choices=["standin", "real"], default="standin")
+    parser.add_argument("--refine-ms", type=float, default=150.0)
+    parser.add_argument("--language", default="de")
+    parser.add_argument("--spool", action="store_true", help="Recorder mit Disk-Spool")
+    parser.add_argument(
+        "--max-p95-ms",
+        type=float,
+        help="Exit-Code 1, wenn p95 von 'total' darüber liegt (CI-Gate)",
+    )
+    args = parser.parse_args(argv)
+
+    audio, rate = load_fixture(args)
+    backend = ReplayBackend(
+        audio, rate, speed=args.speed, jitter_ms=args.jitter_ms, blocksize=args.blocksize
+    )
+    provider = make_provider(args)
+    refine = make_refine(args)
+    run = run_daemon if args.driver == "daemon" else run_recorder
+
+    set_audio_backend(backend)
+    samples: dict[str, list[float]] = {phase: [] for phase in PHASES}
+    try:
+        for iteration in range(args.warmup + args.iterations):
+            timings = run(backend, provider, refine, args)
+            if iteration < args.warmup:
+                continue
+            for phase in PHASES:
+                samples[phase].append(timings[phase] * 1000)
+    except ImportError as exc:
+        print(f"Treiber '{args.driver}' nicht verfügbar: {exc}", file=sys.stderr)
+        return 2
+    finally:
+        set_audio_backend(None)
+
+    print(
+        f"{args.driver}, {args.provider}, {backend.duration:.1f}s @ {rate} Hz, "
+        f"speed={args.speed:g}x, jitter={args.jitter_ms:g}ms, n={args.iterations}"
+    )
+    print(f"{'phase':<14} {'p50':>9} {'p95':>9} {'max':>9}")
+    for phase in PHASES:
+        values = samples[phase]
+        print(
+            f"{phase:<14} {percentile(values, 50):>7.1f}ms "
+            f"{percentile(values, 95):>7.1f}ms {max(values):>7.1f}ms"
+        )
+
+    total_p95 = percentile(samples["total"], 95)
+    if args.max_p95_ms is not None and total_p95 > args.max_p95_ms:
+        print(
+            f"\np95 total {total_p95:.1f}ms > Budget {args.max_p95_ms:.1f}ms",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
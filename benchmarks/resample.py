@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Durchsatz des Streaming-Resamplers (48k→16k, 44.1k→16k).
+
+Misst, was ``StreamingResampler`` pro Capture-Block kostet (läuft im
+Audio-Callback bzw. Warm-Stream-Collector) und was beim Stop noch übrig
+bleibt (``flush``). Zum Vergleich der frühere Pfad: ein Durchlauf über die
+komplette Aufnahme nach dem Stop (``scipy.signal.resample`` falls installiert,
+sonst ``np.interp``).
+
+Usage:
+    python -m benchmarks.resample
+    python -m benchmarks.resample --durations 10 60 --block-ms 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from audio.fixtures import synthetic_speech  # noqa: E402
+from audio.resample import StreamingResampler  # noqa: E402
+from config import WHISPER_SAMPLE_RATE  # noqa: E402
+
+
+def bench_streaming(audio, source_rate: int, block_ms: float) -> dict:
+    """Blockweises Resampling wie im Capture-Pfad."""
+    block = max(1, int(source_rate * block_ms / 1000))
+    resampler = StreamingResampler(source_rate, WHISPER_SAMPLE_RATE)
+    block_times = []
+    for start in range(0, audio.size, block):
+        begin = time.perf_counter()
+        resampler.process(audio[start : start + block])
+        block_times.append((time.perf_counter() - begin) * 1000)
+    begin = time.perf_counter()
+    resampler.flush()
+    flush_ms = (time.perf_counter() - begin) * 1000
+    return {
+        "block_ms_median": statistics.median(block_times),
+        "block_ms_max": max(block_times),
+        "total_ms": sum(block_times) + flush_ms,
+        "flush_ms": flush_ms,
+    }
+
+
+def bench_batch(audio, source_rate: int) -> tuple[str, float]:
+    """Früherer Pfad: alles nach dem Stop in einem Durchlauf."""
+    import numpy as np
+
+    new_length = int(audio.size * WHISPER_SAMPLE_RATE / source_rate)
+    begin = time.perf_counter()
+    try:
+        from scipy.signal import resample
+
+        resample(audio, new_length)
+        method = "scipy"
+    except ImportError:
+        np.interp(
+            np.linspace(0, audio.size - 1, new_length),
+            np.arange(audio.size),
+            audio,
+        )
+        method = "interp"
+    return method, (time.perf_counter() - begin) * 1000
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Durchsatz des Streaming-Resamplers",
+    )
+    parser.add_argument(
+        "--rates", type=int, nargs="+", default=[48_000, 44_100]
+    )
+    parser.add_argument("--durations", type=float, nargs="+", default=[5.0, 30.0, 120.0])
+    parser.add_argument("--block-ms", type=float, default=20.0)
+    args = parser.parse_args(argv)
+
+    print(
+        f"{'rate':>6} {'dauer':>6} {'block':>9} {'max':>9} {'total':>9} "
+        f"{'x-echtzeit':>10} {'stop':>8} {'vorher (stop)':>16}"
+    )
+    for rate in args.rates:
+        for duration in args.durations:
+            audio = synthetic_speech(duration, rate)
+            result = bench_streaming(audio, rate, args.block_ms)
+            method, batch_ms = bench_batch(audio, rate)
+            realtime = duration * 1000 / max(result["total_ms"], 1e-9)
+            print(
+                f"{rate:>6} {duration:>5.0f}s "
+                f"{result['block_ms_median']:>7.3f}ms {result['block_ms_max']:>7.3f}ms "
+                f"{result['total_ms']:>7.1f}ms {realtime:>9.0f}x "
+                f"{result['flush_ms']:>6.2f}ms {batch_ms:>9.1f}ms ({method})"
+            )
+    print(
+        "\nstop = Restkosten nach dem Key-Release (flush);"
+        " vorher = kompletter Durchlauf nach dem Stop."
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Encode-Zeit vs. gesparte Bytes der REST-Upload-Codecs.
+
+Misst für WAV, FLAC und Opus/OGG, wie lange das In-Memory-Encoding dauert und
+wie viele Bytes gegenüber rohem PCM_16-WAV gespart werden. Daraus ergibt sich
+pro Uplink-Bandbreite, ab welcher Aufnahmelänge sich Kompression lohnt
+(Grundlage für ``_AUTO_UPLOAD_CODECS`` und
+``PULSESCRIBE_UPLOAD_COMPRESS_MIN_SECONDS``).
+
+Usage:
+    python -m benchmarks.upload_codecs                     # synthetisches Sprachsignal
+    python -m benchmarks.upload_codecs --input diktat.wav  # echte Aufnahme
+    python -m benchmarks.upload_codecs --durations 5 30 60 --uplink-mbit 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from audio.fixtures import synthetic_speech  # noqa: E402
+from config import WHISPER_SAMPLE_RATE  # noqa: E402
+from providers._audio_upload import UPLOAD_CODECS, encode_audio_for_upload  # noqa: E402
+
+
+def load_input(path: Path, duration_s: float, sample_rate: int):
+    """Liest eine Aufnahme (Mono) und wiederholt/kürzt sie auf ``duration_s``."""
+    import numpy as np
+    import soundfile as sf
+
+    audio, file_rate = sf.read(path, dtype="float32", always_2d=True)
+    audio = audio.mean(axis=1)
+    if file_rate != sample_rate:
+        raise SystemExit(
+            f"{path} hat {file_rate}Hz, erwartet {sample_rate}Hz (--sample-rate)"
+        )
+    target = int(duration_s * sample_rate)
+    repeats = -(-target // max(1, len(audio)))
+    return np.tile(audio, repeats)[:target]
+
+
+def bench_codec(audio, sample_rate: int, codec: str, repeats: int) -> dict:
+    timings = []
+    encoded = None
+    for _ in range(repeats):
+        encoded = encode_audio_for_upload(audio, sample_rate, codec=codec)
+        timings.append(encoded.encode_ms)
+    assert encoded is not None
+    return {
+        "codec": encoded.codec,
+        "bytes": encoded.size,
+        "wav_bytes": encoded.wav_size,
+        "encode_ms": statistics.median(timings),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Encode-Zeit vs. gesparte Bytes der Upload-Codecs",
+    )
+    parser.add_argument("--input", type=Path, help="WAV/FLAC-Aufnahme statt Synthese")
+    parser.add_argument(
+        "--durations", type=float, nargs="+", default=[5.0, 15.0, 30.0, 60.0]
+    )
+    parser.add_argument("--sample-rate", type=int, default=WHISPER_SAMPLE_RATE)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument(
+        "--uplink-mbit",
+        type=float,
+        default=5.0,
+        help="Uplink für die Netto-Abschätzung (Mbit/s)",
+    )
+    args = parser.parse_args(argv)
+
+    bytes_per_ms = args.uplink_mbit * 1_000_000 / 8 / 1000
+    print(
+        f"{'dauer':>6} {'codec':>6} {'KB':>8} {'gespart':>8} "
+        f"{'encode':>9} {'upload':>9} {'netto':>9}"
+    )
+    for duration in args.durations:
+        if args.input:
+            audio = load_input(args.input, duration, args.sample_rate)
+        else:
+            audio = synthetic_speech(duration, args.sample_rate)
+        baseline = None
+        for codec in UPLOAD_CODECS:
+            result = bench_codec(audio, args.sample_rate, codec, args.repeats)
+            upload_ms = result["bytes"] / bytes_per_ms
+            total_ms = result["encode_ms"] + upload_ms
+            if baseline is None:
+                baseline = total_ms
+            saved = 1 - result["bytes"] / max(1, result["wav_bytes"])
+            print(
+                f"{duration:>5.0f}s {result['codec']:>6} "
+                f"{result['bytes'] / 1024:>8.0f} {saved:>7.0%} "
+                f"{result['encode_ms']:>7.1f}ms {upload_ms:>7.0f}ms "
+                f"{total_ms - baseline:>+7.0f}ms"
+            )
+    print(
+        f"\nnetto = (encode + upload) relativ zu WAV bei {args.uplink_mbit:g} Mbit/s;"
+        " negativ = schneller."
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
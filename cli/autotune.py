@@ -0,0 +1,368 @@
+"""Autotuning der lokalen Transkription: Backend, Compute-Type und Threads.
+
+Misst jede Kandidaten-Kombination auf derselben Fixture (RTF und Peak-RSS)
+in einem eigenen Prozess – so verfälschen weder geladene Modelle noch der
+Peak-Speicher früherer Kandidaten die Messung. Der Gewinner wird als Profil
+gespeichert (``utils.local_profile``) und von ``LocalProvider`` übernommen,
+solange die Werte nicht explizit per ENV gesetzt sind.
+
+Usage:
+    candidates = candidate_configs(available_backends(), device="cpu")
+    result = run_autotune("turbo", fixture=audio, candidates=candidates)
+    save_local_profile(profile_from_trial(result.winner, "turbo"))
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+import sys
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from utils.local_profile import LocalRuntimeProfile
+
+# Länge der Mess-Fixture; Whisper dekodiert in 30-s-Fenstern
+AUTOTUNE_FIXTURE_SECONDS = 30.0
+# Kandidaten innerhalb dieser RTF-Toleranz gelten als gleich schnell –
+# dann gewinnt der mit dem kleineren Speicherbedarf
+AUTOTUNE_RTF_TOLERANCE = 0.05
+# Modell-Download beim ersten Laden kann dauern
+AUTOTUNE_TRIAL_TIMEOUT_SECONDS = 900.0
+
+_BACKEND_MODULES = {
+    "faster": "faster_whisper",
+    "whisper": "whisper",
+    "mlx": "mlx_whisper",
+    "lightning": "lightning_whisper_mlx",
+}
+_FASTER_CPU_COMPUTE_TYPES = ("int8", "float32")
+_FASTER_CUDA_COMPUTE_TYPES = ("float16", "int8_float16", "int8")
+
+
+@dataclass(frozen=True)
+class AutotuneCandidate:
+    """Eine zu messende Backend-Konfiguration."""
+
+    backend: str
+    device: str
+    compute_type: str | None = None
+    cpu_threads: int | None = None
+    num_workers: int | None = None
+
+    @property
+    def label(self) -> str:
+        parts = [f"{self.backend}/{self.device}"]
+        if self.compute_type:
+            parts.append(self.compute_type)
+        if self.cpu_threads is not None:
+            parts.append(f"threads={self.cpu_threads or 'auto'}")
+        return " ".join(parts)
+
+    def env(self) -> dict[str, str]:
+        """ENV-Overrides, mit denen ``LocalProvider`` genau diesen Kandidaten lädt."""
+        env = {
+            "PULSESCRIBE_LOCAL_BACKEND": self.backend,
+            "PULSESCRIBE_DEVICE": self.device,
+        }
+        if self.compute_type:
+            env["PULSESCRIBE_LOCAL_COMPUTE_TYPE"] = self.compute_type
+        if self.cpu_threads is not None:
+            env["PULSESCRIBE_LOCAL_CPU_THREADS"] = str(self.cpu_threads)
+        if self.num_workers is not None:
+            env["PULSESCRIBE_LOCAL_NUM_WORKERS"] = str(self.num_workers)
+        return env
+
+
+@dataclass(frozen=True)
+class AutotuneTrial:
+    """Messergebnis eines Kandidaten."""
+
+    candidate: AutotuneCandidate
+    rtf: float | None = None
+    peak_memory_mb: float | None = None
+    load_s: float | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.rtf is not None
+
+    def describe(self) -> str:
+        if not self.ok:
+            return f"{self.candidate.label}: fehlgeschlagen ({self.error})"
+        memory = f", {self.peak_memory_mb:.0f} MB" if self.peak_memory_mb else ""
+        return f"{self.candidate.label}: RTF {self.rtf:.3f}{memory}"
+
+
+@dataclass
+class AutotuneResult:
+    """Alle Messungen und der gewählte Kandidat."""
+
+    model: str
+    trials: list[AutotuneTrial] = field(default_factory=list)
+    winner: AutotuneTrial | None = None
+
+
+def available_backends() -> list[str]:
+    """Installierte lokale Backends (ohne Import der schweren Pakete)."""
+    return [
+        backend
+        for backend, module in _BACKEND_MODULES.items()
+        if importlib.util.find_spec(module) is not None
+    ]
+
+
+def _cpu_thread_options(cpu_count: int) -> list[int]:
+    """0 = CTranslate2-Default, dazu halbe und volle Kernzahl."""
+    options = [0]
+    for threads in (max(1, cpu_count // 2), cpu_count):
+        if threads not in options:
+            options.append(threads)
+    return options
+
+
+def candidate_configs(
+    backends: Sequence[str],
+    *,
+    device: str,
+    cpu_count: int | None = None,
+) -> list[AutotuneCandidate]:
+    """Kandidaten für die installierten Backends auf ``device``.
+
+    ``num_workers`` bleibt 1: mehr Worker helfen nur bei parallelen Anfragen
+    an dasselbe Modell und kosten sonst nur Speicher.
+    """
+    cpu_count = cpu_count or os.cpu_count() or 1
+    candidates: list[AutotuneCandidate] = []
+    if "faster" in backends:
+        if device == "cuda":
+            candidates.extend(
+                AutotuneCandidate("faster", "cuda", compute, num_workers=1)
+                for compute in _FASTER_CUDA_COMPUTE_TYPES
+            )
+        candidates.extend(
+            AutotuneCandidate("faster", "cpu", compute, threads, num_workers=1)
+            for compute in _FASTER_CPU_COMPUTE_TYPES
+            for threads in _cpu_thread_options(cpu_count)
+        )
+    for backend in ("whisper", "mlx", "lightning"):
+        if backend in backends and (backend == "whisper" or device == "mps"):
+            candidates.append(AutotuneCandidate(backend, device))
+    return candidates
+
+
+def detect_device() -> str:
+    """Device wie ``LocalProvider`` (PULSESCRIBE_DEVICE > MPS > CUDA > CPU)."""
+    from providers.local import _select_device
+
+    return _select_device()
+
+
+def resolve_autotune_model(model: str | None) -> str:
+    """CLI > PULSESCRIBE_LOCAL_MODEL > Default (wie ``LocalProvider``)."""
+    from config import DEFAULT_LOCAL_MODEL
+
+    return model or (os.getenv("PULSESCRIBE_LOCAL_MODEL") or "").strip() or DEFAULT_LOCAL_MODEL
+
+
+def load_autotune_fixture(path: Path | None = None):
+    """16-kHz-Mono-Fixture: eigene Aufnahme oder mitgelieferte Synthese."""
+    from config import WHISPER_SAMPLE_RATE
+
+    if path is None:
+        from audio.fixtures import synthetic_speech
+
+        return synthetic_speech(AUTOTUNE_FIXTURE_SECONDS, WHISPER_SAMPLE_RATE)
+
+    import soundfile as sf
+
+    from audio.resample import resample_audio
+
+    audio, rate = sf.read(
+        str(path),
+        dtype="float32",
+        always_2d=True,
+        frames=int(AUTOTUNE_FIXTURE_SECONDS * sf.info(str(path)).samplerate),
+    )
+    mono = audio.mean(axis=1)
+    if rate != WHISPER_SAMPLE_RATE:
+        mono = resample_audio(mono, rate, WHISPER_SAMPLE_RATE)
+    return mono
+
+
+def peak_memory_mb() -> float | None:
+    """Peak-RSS des aktuellen Prozesses (None, wenn nicht messbar)."""
+    try:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux meldet KB, macOS Bytes
+        return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+    except ImportError:
+        pass
+    try:
+        import psutil
+
+        return psutil.Process().memory_info().peak_wset / 2**20
+    except Exception:
+        return None
+
+
+def _run_trial(
+    candidate: AutotuneCandidate,
+    model: str,
+    language: str | None,
+    fixture,
+    repeats: int,
+) -> AutotuneTrial:
+    """Lädt den Kandidaten und misst die beste von ``repeats`` Transkriptionen."""
+    from config import WHISPER_SAMPLE_RATE
+
+    os.environ.update(candidate.env())
+    # Messung ohne Profil, Model-Server und VAD (sonst fällt Stille weg)
+    os.environ["PULSESCRIBE_LOCAL_PROFILE"] = "false"
+    os.environ["PULSESCRIBE_LOCAL_MODEL_SERVER"] = "false"
+    os.environ["PULSESCRIBE_LOCAL_VAD_FILTER"] = "false"
+
+    from providers.local import LocalProvider
+
+    provider = LocalProvider()
+    t0 = time.perf_counter()
+    provider.transcribe_audio(fixture[:WHISPER_SAMPLE_RATE], model=model, language=language)
+    load_s = time.perf_counter() - t0
+    if provider._device != candidate.device or (
+        candidate.compute_type and provider._compute_type != candidate.compute_type
+    ):
+        return AutotuneTrial(
+            candidate,
+            load_s=load_s,
+            error=f"Fallback auf {provider._device}/{provider._compute_type}",
+        )
+
+    timings = []
+    for _ in range(max(1, repeats)):
+        t0 = time.perf_counter()
+        provider.transcribe_audio(fixture, model=model, language=language)
+        timings.append(time.perf_counter() - t0)
+    audio_s = len(fixture) / WHISPER_SAMPLE_RATE
+    return AutotuneTrial(
+        candidate,
+        rtf=min(timings) / audio_s,
+        peak_memory_mb=peak_memory_mb(),
+        load_s=load_s,
+    )
+
+
+def measure_candidate(
+    candidate: AutotuneCandidate,
+    *,
+    model: str,
+    language: str | None,
+    fixture,
+    repeats: int = 2,
+) -> AutotuneTrial:
+    """Misst einen Kandidaten in einem frischen Prozess (spawn)."""
+    import multiprocessing
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            return pool.submit(
+                _run_trial, candidate, model, language, fixture, repeats
+            ).result(timeout=AUTOTUNE_TRIAL_TIMEOUT_SECONDS)
+    except Exception as e:
+        return AutotuneTrial(candidate, error=str(e) or type(e).__name__)
+
+
+def select_winner(
+    trials: Sequence[AutotuneTrial],
+    *,
+    tolerance: float = AUTOTUNE_RTF_TOLERANCE,
+    max_memory_mb: float | None = None,
+) -> AutotuneTrial | None:
+    """Schnellster Kandidat; bei nahezu gleicher RTF der sparsamere."""
+    usable = [
+        trial
+        for trial in trials
+        if trial.ok
+        and (
+            max_memory_mb is None
+            or trial.peak_memory_mb is None
+            or trial.peak_memory_mb <= max_memory_mb
+        )
+    ]
+    if not usable:
+        return None
+    best_rtf = min(trial.rtf for trial in usable if trial.rtf is not None)
+    near_best = [
+        trial for trial in usable if trial.rtf is not None and trial.rtf <= best_rtf * (1 + tolerance)
+    ]
+    return min(
+        near_best,
+        key=lambda trial: (
+            trial.peak_memory_mb if trial.peak_memory_mb is not None else float("inf"),
+            trial.rtf,
+        ),
+    )
+
+
+def run_autotune(
+    model: str,
+    *,
+    fixture,
+    candidates: Sequence[AutotuneCandidate],
+    language: str | None = None,
+    repeats: int = 2,
+    max_memory_mb: float | None = None,
+    measure: Callable[..., AutotuneTrial] = measure_candidate,
+    on_trial: Callable[[AutotuneTrial], None] | None = None,
+) -> AutotuneResult:
+    """Misst alle Kandidaten nacheinander und wählt den Gewinner."""
+    result = AutotuneResult(model=model)
+    for candidate in candidates:
+        trial = measure(
+            candidate, model=model, language=language, fixture=fixture, repeats=repeats
+        )
+        result.trials.append(trial)
+        if on_trial is not None:
+            on_trial(trial)
+    result.winner = select_winner(result.trials, max_memory_mb=max_memory_mb)
+    return result
+
+
+def profile_from_trial(trial: AutotuneTrial, model: str) -> LocalRuntimeProfile:
+    """Profil für ``save_local_profile`` aus einer Messung."""
+    candidate = trial.candidate
+    return LocalRuntimeProfile(
+        model=model,
+        backend=candidate.backend,
+        device=candidate.device,
+        compute_type=candidate.compute_type,
+        cpu_threads=candidate.cpu_threads,
+        num_workers=candidate.num_workers,
+        rtf=trial.rtf,
+        peak_memory_mb=trial.peak_memory_mb,
+    )
+
+
+__all__ = [
+    "AUTOTUNE_FIXTURE_SECONDS",
+    "AutotuneCandidate",
+    "AutotuneResult",
+    "AutotuneTrial",
+    "available_backends",
+    "candidate_configs",
+    "detect_device",
+    "load_autotune_fixture",
+    "measure_candidate",
+    "peak_memory_mb",
+    "profile_from_trial",
+    "resolve_autotune_model",
+    "run_autotune",
+    "select_winner",
+]
@@ -0,0 +1,245 @@
+"""Batch-Transkription für die CLI: mehrere Dateien, Ordner und Globs.
+
+Ein Provider-Objekt (und damit Client bzw. geladenes Modell) wird für alle
+Dateien wiederverwendet; REST-Provider laufen über einen begrenzten
+Thread-Pool, lokal nacheinander. Ergebnisse werden gemeldet, sobald eine
+Datei fertig ist (Reihenfolge = Fertigstellung).
+
+Usage:
+    files = expand_audio_inputs(["meetings/", "extra/*.m4a"])
+    summary = run_batch(files, transcribe_file, workers=4, on_result=emit)
+"""
+
+from __future__ import annotations
+
+import glob
+import json
+import time
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# Endungen, die beim Durchsuchen von Ordnern als Audio gelten
+AUDIO_EXTENSIONS = frozenset(
+    {
+        ".aac",
+        ".aif",
+        ".aiff",
+        ".flac",
+        ".m4a",
+        ".mp3",
+        ".mp4",
+        ".mpeg",
+        ".mpga",
+        ".oga",
+        ".ogg",
+        ".opus",
+        ".wav",
+        ".webm",
+        ".wma",
+    }
+)
+_GLOB_CHARS = frozenset("*?[")
+
+
+def _is_glob(value: str) -> bool:
+    return any(char in value for char in _GLOB_CHARS)
+
+
+def expand_audio_inputs(
+    inputs: Iterable[str | Path],
+    *,
+    extensions: frozenset[str] = AUDIO_EXTENSIONS,
+) -> list[Path]:
+    """Löst Dateien, Ordner (rekursiv) und Glob-Muster zu Audiodateien auf.
+
+    Reihenfolge bleibt erhalten, Duplikate werden entfernt. Explizit
+    angegebene Dateien werden unabhängig von ihrer Endung übernommen.
+
+    Raises:
+        FileNotFoundError: Pfad existiert nicht bzw. Glob ohne Treffer.
+    """
+    files: list[Path] = []
+    seen: set[Path] = set()
+
+    def add(path: Path) -> None:
+        key = path.resolve()
+        if key not in seen:
+            seen.add(key)
+            files.append(path)
+
+    for raw in inputs:
+        value = str(raw)
+        path = Path(value).expanduser()
+        if path.is_dir():
+            for candidate in sorted(path.rglob("*")):
+                if candidate.is_file() and candidate.suffix.lower() in extensions:
+                    add(candidate)
+        elif path.is_file():
+            add(path)
+        elif _is_glob(value):
+            matches = sorted(glob.glob(str(path), recursive=True))
+            audio_matches = [
+                Path(match)
+                for match in matches
+                if Path(match).is_file() and Path(match).suffix.lower() in extensions
+            ]
+            if not audio_matches:
+                raise FileNotFoundError(f"Keine Audiodateien für Muster: {value}")
+            for match in audio_matches:
+                add(match)
+        else:
+            raise FileNotFoundError(f"Datei nicht gefunden: {value}")
+    return files
+
+
+def is_batch_request(inputs: Sequence[str | Path]) -> bool:
+    """True für mehrere Eingaben, Ordner oder Glob-Muster."""
+    if len(inputs) != 1:
+        return True
+    value = str(inputs[0])
+    return Path(value).expanduser().is_dir() or (
+        _is_glob(value) and not Path(value).exists()
+    )
+
+
+def audio_duration_seconds(path: Path) -> float | None:
+    """Audiolänge aus dem Header (None, wenn soundfile das Format nicht kennt)."""
+    try:
+        import soundfile as sf
+
+        return float(sf.info(str(path)).duration)
+    except Exception:
+        return None
+
+
+@dataclass(frozen=True)
+class BatchItemResult:
+    """Ergebnis einer Datei im Batch."""
+
+    path: Path
+    text: str | None
+    elapsed_s: float
+    audio_s: float | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def to_json(self) -> str:
+        """Eine JSON-Lines-Zeile (stdout)."""
+        payload: dict[str, object] = {"file": str(self.path)}
+        if self.ok:
+            payload["text"] = self.text
+        else:
+            payload["error"] = self.error
+        payload["elapsed_s"] = round(self.elapsed_s, 3)
+        if self.audio_s is not None:
+            payload["audio_s"] = round(self.audio_s, 3)
+        return json.dumps(payload, ensure_ascii=False)
+
+
+@dataclass
+class BatchSummary:
+    """Aggregierter Durchsatz eines Batch-Laufs."""
+
+    workers: int
+    wall_s: float = 0.0
+    results: list[BatchItemResult] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for result in self.results if result.ok)
+
+    @property
+    def failed(self) -> int:
+        return len(self.results) - self.succeeded
+
+    @property
+    def audio_s(self) -> float:
+        return sum(result.audio_s or 0.0 for result in self.results if result.ok)
+
+    @property
+    def realtime_factor(self) -> float | None:
+        """Audio-Sekunden pro Wall-Clock-Sekunde (>1 = schneller als Echtzeit)."""
+        if self.wall_s <= 0 or self.audio_s <= 0:
+            return None
+        return self.audio_s / self.wall_s
+
+    def describe(self) -> str:
+        files_per_min = len(self.results) / self.wall_s * 60 if self.wall_s > 0 else 0.0
+        parts = [
+            f"{self.succeeded}/{len(self.results)} Dateien",
+            f"{self.wall_s:.1f}s",
+            f"{files_per_min:.1f} Dateien/min",
+            f"workers={self.workers}",
+        ]
+        if self.realtime_factor is not None:
+            parts.insert(2, f"Audio {self.audio_s:.0f}s ({self.realtime_factor:.1f}x Echtzeit)")
+        if self.failed:
+            parts.append(f"{self.failed} fehlgeschlagen")
+        return ", ".join(parts)
+
+
+def run_batch(
+    files: Sequence[Path],
+    transcribe_file: Callable[[Path], str],
+    *,
+    workers: int,
+    on_result: Callable[[BatchItemResult], None] | None = None,
+) -> BatchSummary:
+    """Transkribiert ``files`` mit höchstens ``workers`` gleichzeitigen Aufrufen.
+
+    Fehler einzelner Dateien brechen den Lauf nicht ab, sondern landen im
+    Ergebnis. ``on_result`` wird im aufrufenden Thread aufgerufen, sobald eine
+    Datei fertig ist.
+    """
+    workers = max(1, min(workers, len(files) or 1))
+    summary = BatchSummary(workers=workers)
+    t_start = time.perf_counter()
+
+    def run_one(path: Path) -> BatchItemResult:
+        t0 = time.perf_counter()
+        audio_s = audio_duration_seconds(path)
+        try:
+            text = transcribe_file(path)
+        except Exception as e:
+            return BatchItemResult(
+                path, None, time.perf_counter() - t0, audio_s, error=str(e) or type(e).__name__
+            )
+        return BatchItemResult(path, text, time.perf_counter() - t0, audio_s)
+
+    pending_files = iter(files)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="BatchWorker") as pool:
+        # Nur ``workers`` Aufträge gleichzeitig einreihen: bei tausenden
+        # Dateien keine riesige Future-Liste und sauberer Abbruch per Ctrl+C
+        running: set[Future[BatchItemResult]] = set()
+        for path in pending_files:
+            running.add(pool.submit(run_one, path))
+            if len(running) >= workers:
+                break
+        while running:
+            done, running = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                summary.results.append(result)
+                if on_result is not None:
+                    on_result(result)
+                next_path = next(pending_files, None)
+                if next_path is not None:
+                    running.add(pool.submit(run_one, next_path))
+    summary.wall_s = time.perf_counter() - t_start
+    return summary
+
+
+__all__ = [
+    "AUDIO_EXTENSIONS",
+    "BatchItemResult",
+    "BatchSummary",
+    "audio_duration_seconds",
+    "expand_audio_inputs",
+    "is_batch_request",
+    "run_batch",
+]
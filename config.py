@@ -13,6 +13,8 @@ from functools import partial
 from pathlib import Path
 from typing import Any, cast
 
+from utils.env import getenv
+
 logger = logging.getLogger("pulsescribe")
 
 
@@ -273,6 +275,13 @@ def get_input_device() -> tuple[int | None, int]:
         - device_index: int oder None für sounddevice-Default
         - sample_rate: Native Sample Rate des Geräts (oder WHISPER_SAMPLE_RATE als Default)
     """
+    from audio.input_stream import get_replay_backend
+
+    replay = get_replay_backend()
+    if replay is not None:
+        # Replay-Quelle: kein Device-Probing, nicht cachen
+        return None, replay.default_samplerate
+
     if _cached_input_device is not None:
         return _cached_input_device
 
@@ -317,7 +326,7 @@ DEEPGRAM_WS_URL = "wss://api.deepgram.com/v1/listen"
 
 def _get_float_env(name: str, default: float) -> float:
     """Liest Float-ENV mit Fallback auf Default bei ungültigen Werten."""
-    raw = os.getenv(name)
+    raw = getenv(name)
     if raw is None:
         return default
     try:
@@ -368,7 +377,7 @@ def get_windows_latency_preset() -> str:
     if os.name != "nt":
         return "safe"
 
-    raw_preset = os.getenv("PULSESCRIBE_WINDOWS_LATENCY_PRESET", "snappy")
+    raw_preset = getenv("PULSESCRIBE_WINDOWS_LATENCY_PRESET", "snappy")
     preset = raw_preset.strip().lower()
     if preset in _WINDOWS_LATENCY_PRESET_SNAPPY:
         return "snappy"
@@ -409,6 +418,12 @@ DEEPGRAM_KEEPALIVE_INTERVAL_SECONDS = _get_bounded_float_env(
     min_value=1.0,
     max_value=8.0,
 )  # Deepgram beendet Streams nach ~10s ohne Audio/KeepAlive.
+DEEPGRAM_WARM_POOL_IDLE_SECONDS = _get_bounded_float_env(
+    "PULSESCRIBE_DEEPGRAM_WARM_POOL_IDLE_SECONDS",
+    120.0,
+    min_value=10.0,
+    max_value=3600.0,
+)  # Ungenutzte Warm-Sockets danach schließen (Neuaufbau erst bei Nutzung)
 
 
 def get_windows_stop_grace_seconds() -> float:
@@ -435,7 +450,7 @@ def get_windows_adaptive_stop_tail_enabled() -> bool:
     """
     from utils.env import parse_bool
 
-    parsed = parse_bool(os.getenv("PULSESCRIBE_WINDOWS_ADAPTIVE_STOP_TAIL"))
+    parsed = parse_bool(getenv("PULSESCRIBE_WINDOWS_ADAPTIVE_STOP_TAIL"))
     return True if parsed is None else parsed
 
 
@@ -478,7 +493,7 @@ def _get_bounded_int_env(
     max_value: int,
 ) -> int:
     """Liest Integer-ENV und begrenzt auf sinnvollen Bereich. Fallback auf Default."""
-    raw = os.getenv(var_name)
+    raw = getenv(var_name)
     if raw is None:
         return default
     try:
@@ -494,6 +509,446 @@ CLI_BUFFER_LIMIT = _get_bounded_int_env(
 WARM_STREAM_QUEUE_SIZE = _get_bounded_int_env(
     "PULSESCRIBE_WARM_STREAM_QUEUE_SIZE", default=300, min_value=1, max_value=5000
 )  # Queue-Größe für Warm-Stream (~6s Audio bei 20ms Chunks)
+DEEPGRAM_SEND_FRAME_MS = _get_bounded_int_env(
+    "PULSESCRIBE_DEEPGRAM_SEND_FRAME_MS", default=80, min_value=0, max_value=250
+)  # Mikrofon-Blöcke zu ~80ms-WebSocket-Frames bündeln (0 = jeden Block einzeln)
+DEEPGRAM_QUEUE_SECONDS = _get_bounded_int_env(
+    "PULSESCRIBE_DEEPGRAM_QUEUE_SECONDS", default=30, min_value=1, max_value=300
+)  # Max. ungesendetes Audio in der Streaming-Queue (Sekunden)
+DEEPGRAM_WARM_POOL_SIZE = _get_bounded_int_env(
+    "PULSESCRIBE_DEEPGRAM_WARM_POOL_SIZE", default=2, min_value=1, max_value=4
+)  # Vorverbundene Deepgram-Sockets für direkt aufeinanderfolgende Diktate
+RECORDING_SPOOL_QUEUE_SIZE = _get_bounded_int_env(
+    "PULSESCRIBE_SPOOL_QUEUE_SIZE", default=500, min_value=1, max_value=5000
+)  # Max. ungeschriebene Blöcke für den Spool-Writer (~30s bei 64ms Blöcken)
+RECORDING_SPOOL_FLUSH_INTERVAL = 1.0  # WAV-Größen patchen für Crash-Recovery (Sekunden)
+
+
+DEEPGRAM_QUEUE_POLICIES = ("merge", "drop-oldest", "block")
+
+
+def get_deepgram_queue_policy() -> str:
+    """Return the overflow policy of the Deepgram audio queue.
+
+    ``merge`` (Default) hängt neues Audio bei voller Queue an den jüngsten
+    Frame an (verlustfrei bis zur doppelten Kapazität), ``drop-oldest``
+    verwirft das älteste Audio, ``block`` bremst den Warm-Stream-Forwarder kurz
+    aus (nie den Audio-Callback).
+    Ungültige Werte fallen auf ``merge`` zurück.
+    """
+    raw = getenv("PULSESCRIBE_DEEPGRAM_QUEUE_POLICY", "merge")
+    policy = raw.strip().lower().replace("_", "-")
+    if policy in DEEPGRAM_QUEUE_POLICIES:
+        return policy
+    logger.warning(
+        "Ungültiger Wert für PULSESCRIBE_DEEPGRAM_QUEUE_POLICY='%s', "
+        "verwende 'merge'. Unterstützt: %s",
+        raw,
+        ", ".join(DEEPGRAM_QUEUE_POLICIES),
+    )
+    return "merge"
+
+
+def get_recording_spool_enabled() -> bool:
+    """Return whether recordings are spooled to disk while capturing.
+
+    Im Spool-Modus streamt ein Hintergrund-Thread die Blöcke schon während
+    der Aufnahme in eine temporäre WAV-Datei (CLI: Ergebnisdatei, Daemons:
+    Crash-Recovery; hochgeladen wird dort weiterhin aus dem RAM).
+    Wird zum Aufnahme-Start gelesen und ist damit reload-fähig.
+    """
+    from utils.env import parse_bool
+
+    return bool(parse_bool(getenv("PULSESCRIBE_SPOOL_RECORDINGS")))
+
+
+# Upload-Codecs für REST-Provider: wav (PCM_16), flac (verlustfrei),
+# opus (OGG/Opus, verlustbehaftet). "auto" komprimiert ab der Mindestlänge
+# mit FLAC (~2ms Encode pro 5s Audio, ~30% kleiner); Opus spart ~90%, kostet
+# aber ~50ms Encode pro Sekunde Audio und lohnt nur bei sehr langsamem Uplink.
+# Messwerte: python -m benchmarks.upload_codecs
+# Die Codec-Liste selbst steht nur in providers._audio_upload.UPLOAD_CODECS.
+_UPLOAD_CODEC_DEFAULT = "auto"
+
+
+def get_upload_codec(provider_name: str | None = None) -> str:
+    """Return the configured REST upload codec (``auto`` by default).
+
+    Provider-spezifisch via ``PULSESCRIBE_<PROVIDER>_UPLOAD_CODEC`` (z.B.
+    ``PULSESCRIBE_GROQ_UPLOAD_CODEC=opus``), sonst global via
+    ``PULSESCRIBE_UPLOAD_CODEC``. Ungültige Werte fallen auf ``auto`` zurück.
+    """
+    from providers._audio_upload import UPLOAD_CODECS
+
+    candidates = []
+    if provider_name:
+        candidates.append(f"PULSESCRIBE_{provider_name.strip().upper()}_UPLOAD_CODEC")
+    candidates.append("PULSESCRIBE_UPLOAD_CODEC")
+
+    for env_name in candidates:
+        raw = getenv(env_name)
+        if raw is None or not raw.strip():
+            continue
+        codec = raw.strip().lower()
+        if codec == "auto" or codec in UPLOAD_CODECS:
+            return codec
+        logger.warning(
+            f"Ungültiger Wert für {env_name}='{raw}', verwende "
+            f"'{_UPLOAD_CODEC_DEFAULT}'. Unterstützt: auto, {', '.join(UPLOAD_CODECS)}"
+        )
+        return _UPLOAD_CODEC_DEFAULT
+    return _UPLOAD_CODEC_DEFAULT
+
+
+def get_upload_compress_min_seconds() -> float:
+    """Return the minimum recording length for ``auto`` upload compression."""
+    return _get_bounded_float_env(
+        "PULSESCRIBE_UPLOAD_COMPRESS_MIN_SECONDS",
+        2.0,
+        min_value=0.0,
+        max_value=600.0,
+    )
+
+
+# Lange Dateien (REST): an Sprechpausen in Chunks schneiden und parallel
+# hochladen – umgeht Upload-Limits (OpenAI/Groq: 25 MB) und serielle Uploads.
+def get_chunk_seconds() -> int:
+    """Return the target chunk length for long REST uploads (0 = no chunking)."""
+    return _get_bounded_int_env(
+        "PULSESCRIBE_CHUNK_SECONDS", 300, min_value=0, max_value=3600
+    )
+
+
+def get_chunk_overlap_seconds() -> float:
+    """Return the audio overlap between neighbouring chunks."""
+    return _get_bounded_float_env(
+        "PULSESCRIBE_CHUNK_OVERLAP_SECONDS", 1.0, min_value=0.0, max_value=10.0
+    )
+
+
+def get_chunk_workers() -> int:
+    """Return how many chunks of one file are uploaded concurrently."""
+    return _get_bounded_int_env(
+        "PULSESCRIBE_CHUNK_WORKERS", 4, min_value=1, max_value=16
+    )
+
+
+# Progressive Transkription (REST/Local): lange Diktate werden an VAD-Pausen
+# geschnitten und schon während der Aufnahme transkribiert. Kurze Segmente
+# kosten Kontext (Whisper-Genauigkeit), daher eine großzügige Mindestlänge.
+PROGRESSIVE_REST_WORKERS = 3  # parallele Uploads; local transkribiert seriell
+
+
+def get_progressive_transcription_enabled() -> bool:
+    """Return whether long recordings are transcribed segment by segment.
+
+    Wird zum Aufnahme-Start gelesen und ist damit reload-fähig.
+    """
+    from utils.env import parse_bool
+
+    return bool(parse_bool(getenv("PULSESCRIBE_PROGRESSIVE_TRANSCRIPTION")))
+
+
+def get_progressive_min_segment_seconds() -> float:
+    """Return the minimum segment length before a VAD pause is used as a cut."""
+    return _get_bounded_float_env(
+        "PULSESCRIBE_PROGRESSIVE_MIN_SEGMENT_SECONDS",
+        8.0,
+        min_value=2.0,
+        max_value=120.0,
+    )
+
+
+# Lokaler Model-Server: Whisper-Modelle in einem eigenen Prozess, der
+# Daemon-Neustarts überlebt (siehe providers/local_server.py)
+def get_local_model_server_enabled() -> bool:
+    """Return whether local transcription runs in the shared model server."""
+    from utils.env import parse_bool
+
+    return bool(parse_bool(getenv("PULSESCRIBE_LOCAL_MODEL_SERVER")))
+
+
+def get_local_model_server_idle_minutes() -> int:
+    """Return after how many idle minutes the model server exits (0 = never)."""
+    return _get_bounded_int_env(
+        "PULSESCRIBE_LOCAL_MODEL_SERVER_IDLE_MINUTES",
+        30,
+        min_value=0,
+        max_value=1440,
+    )
+
+
+def get_local_model_cache_budget_mb() -> int:
+    """Return the memory budget for cached local models in MB (0 = unlimited)."""
+    return _get_bounded_int_env(
+        "PULSESCRIBE_LOCAL_MODEL_CACHE_MB",
+        6144,
+        min_value=0,
+        max_value=262144,
+    )
+
+
+# Lokales Streaming: Whisper dekodiert während der Aufnahme ein gleitendes
+# Fenster und bestätigt den stabilen Präfix (LocalAgreement) – Interim-Text im
+# Overlay, beim Stop wird nur noch der unbestätigte Rest dekodiert.
+def get_local_streaming_enabled() -> bool:
+    """Return whether local mode decodes interim text while recording."""
+    from utils.env import parse_bool
+
+    return bool(parse_bool(getenv("PULSESCRIBE_LOCAL_STREAMING")))
+
+
+def get_local_streaming_interval_seconds() -> float:
+    """Return how much new audio triggers the next interim decode."""
+    return _get_bounded_float_env(
+        "PULSESCRIBE_LOCAL_STREAMING_INTERVAL",
+        1.0,
+        min_value=0.3,
+        max_value=10.0,
+    )
+
+
+# CLI-Batch-Modus (mehrere Dateien/Ordner): Parallelität je Provider.
+# REST-Provider vertragen parallele Uploads (Rate-Limits beachten), lokal
+# teilen sich alle Dateien ein Modell und laufen nacheinander (dafür batched).
+BATCH_PROVIDER_WORKERS = {"openai": 4, "deepgram": 8, "groq": 2, "local": 1}
+
+
+def get_batch_workers(mode: str) -> int:
+    """Return the worker count for CLI batch transcription in ``mode``.
+
+    ``PULSESCRIBE_BATCH_WORKERS`` überschreibt den Provider-Default (0 = Default).
+    """
+    override = _get_bounded_int_env(
+        "PULSESCRIBE_BATCH_WORKERS", 0, min_value=0, max_value=64
+    )
+    if override:
+        return override
+    return BATCH_PROVIDER_WORKERS.get(mode, 1)
+
+
+def get_local_batch_size() -> int:
+    """Return the faster-whisper batch size for CLI batch runs (1 = unbatched)."""
+    return _get_bounded_int_env(
+        "PULSESCRIBE_LOCAL_BATCH_SIZE", 8, min_value=1, max_value=64
+    )
+
+
+# Autotune-Profil (transcribe.py --autotune): gemessene Backend-/Compute-/
+# Thread-Kombination pro Rechner. Explizite ENV-Werte haben immer Vorrang.
+def get_local_profile_enabled() -> bool:
+    """Return whether LocalProvider applies the persisted autotune profile."""
+    from utils.env import parse_bool
+
+    value = parse_bool(getenv("PULSESCRIBE_LOCAL_PROFILE"))
+    return True if value is None else value
+
+
+# Transkript-Cache: gleiche Audiodaten + Provider/Modell/Sprache/Vocabulary
+# liefern das gespeicherte Transkript statt erneut zu transkribieren
+# (CLI: --no-cache). Größenbudget in MB, älteste Einträge fliegen zuerst.
+# Live-Diktate der Daemons wiederholen sich praktisch nie; sie landen nur bei
+# explizitem PULSESCRIBE_TRANSCRIPT_CACHE=true als Klartext im Cache.
+def get_transcript_cache_enabled(*, live_dictation: bool = False) -> bool:
+    """Return whether transcription results are cached on disk.
+
+    CLI/file inputs are cached unless disabled; live dictations only when
+    ``PULSESCRIBE_TRANSCRIPT_CACHE`` is explicitly enabled.
+    """
+    from utils.env import parse_bool
+
+    value = parse_bool(getenv("PULSESCRIBE_TRANSCRIPT_CACHE"))
+    if value is None:
+        return not live_dictation
+    return value
+
+
+def get_transcript_cache_max_mb() -> int:
+    """Return the on-disk budget of the transcript cache (0 = disabled)."""
+    return _get_bounded_int_env(
+        "PULSESCRIBE_TRANSCRIPT_CACHE_MB",
+        64,
+        min_value=0,
+        max_value=4096,
+    )
+
+
+# Refine-Cache: gleiches (normalisiertes) Transkript + aufgelöster Prompt +
+# Provider/Modell liefern das gespeicherte LLM-Ergebnis (RAM-LRU + Platte).
+# Prompt-Änderungen ändern den Schlüssel; die TTL verwirft alte Einträge.
+# Standardmäßig nur im RAM; als Klartext auf die Platte erst bei explizitem
+# PULSESCRIBE_REFINE_CACHE=true.
+def get_refine_cache_enabled() -> bool:
+    """Return whether LLM refine results are cached (at least in memory)."""
+    from utils.env import parse_bool
+
+    value = parse_bool(getenv("PULSESCRIBE_REFINE_CACHE"))
+    return True if value is None else value
+
+
+def get_refine_cache_persistent() -> bool:
+    """Return whether refine results are also written to disk (opt-in)."""
+    from utils.env import parse_bool
+
+    return parse_bool(getenv("PULSESCRIBE_REFINE_CACHE")) is True
+
+
+def get_refine_cache_max_mb() -> int:
+    """Return the on-disk budget of the refine cache (0 = disabled)."""
+    return _get_bounded_int_env(
+        "PULSESCRIBE_REFINE_CACHE_MB",
+        16,
+        min_value=0,
+        max_value=1024,
+    )
+
+
+def get_refine_cache_ttl_hours() -> int:
+    """Return how long cached refine results stay valid."""
+    return _get_bounded_int_env(
+        "PULSESCRIBE_REFINE_CACHE_TTL_HOURS",
+        168,
+        min_value=1,
+        max_value=24 * 365,
+    )
+
+
+# Lokale Nachbearbeitung: Diktate bis zu dieser Wortzahl bereinigt die lokale
+# Regel-Engine (Voice-Commands, Füllwörter) ohne LLM-Aufruf. 0 = aus.
+def get_local_refine_max_words() -> int:
+    """Return the word limit up to which refine runs locally (0 = always LLM)."""
+    return _get_bounded_int_env(
+        "PULSESCRIBE_LOCAL_REFINE_MAX_WORDS",
+        0,
+        min_value=0,
+        max_value=200,
+    )
+
+
+# Refine-Hedging: antwortet der primäre Provider nicht innerhalb seiner
+# gelernten p90-Latenz, geht dieselbe Anfrage zusätzlich an diesen Provider;
+# die erste gültige Antwort gewinnt. Leer = aus.
+def get_refine_hedge_provider() -> str | None:
+    """Return the secondary refine provider for hedged requests (None = off)."""
+    value = (getenv("PULSESCRIBE_REFINE_HEDGE_PROVIDER") or "").strip().lower()
+    return value or None
+
+
+def get_refine_hedge_model() -> str | None:
+    """Return the model for hedged requests (None = provider default)."""
+    value = (getenv("PULSESCRIBE_REFINE_HEDGE_MODEL") or "").strip()
+    return value or None
+
+
+# Hedge-Verzögerung, solange für den primären Provider noch keine
+# Latenz-Historie vorliegt
+def get_refine_hedge_delay_ms() -> int:
+    """Return the hedge delay used until a p90 latency has been learned."""
+    return _get_bounded_int_env(
+        "PULSESCRIBE_REFINE_HEDGE_DELAY_MS",
+        2500,
+        min_value=100,
+        max_value=30000,
+    )
+
+
+# Latenzbudget (Daemons): Zeit vom Aufnahme-Stopp bis zum eingefügten Text.
+# Das Refine bekommt den Rest als Deadline, wird bei knappem Budget auf
+# PULSESCRIBE_REFINE_FALLBACK_MODEL oder die lokale Bereinigung herabgestuft.
+# 0 = aus (unabhängige Timeouts wie bisher).
+def get_latency_budget_ms() -> int:
+    """Return the end-to-end latency budget after recording stops (0 = off)."""
+    return _get_bounded_int_env(
+        "PULSESCRIBE_LATENCY_BUDGET_MS",
+        0,
+        min_value=0,
+        max_value=60000,
+    )
+
+
+def get_refine_fallback_model() -> str | None:
+    """Return the smaller refine model used when the latency budget is tight."""
+    value = (getenv("PULSESCRIBE_REFINE_FALLBACK_MODEL") or "").strip()
+    return value or None
+
+
+# Interim-Text: Push über In-Process-Channel statt Dateipolling. Die
+# Interim-Datei wird nur noch geschrieben, wenn niemand abonniert hat.
+def get_interim_push_enabled() -> bool:
+    """Return whether the daemon subscribes to interim updates instead of polling."""
+    from utils.env import parse_bool
+
+    value = parse_bool(getenv("PULSESCRIBE_INTERIM_PUSH"))
+    return True if value is None else value
+
+
+def get_interim_socket_enabled() -> bool:
+    """Return whether interim updates are broadcast on a local socket."""
+    from utils.env import parse_bool
+
+    return bool(parse_bool(getenv("PULSESCRIBE_INTERIM_SOCKET")))
+
+
+# Streaming-Refine: LLM-Antwort als Stream lesen und abgeschlossene Sätze schon
+# während der Nachbearbeitung einfügen (statt erst nach der kompletten Antwort).
+def get_refine_stream_paste_enabled() -> bool:
+    """Return whether refined text is pasted sentence by sentence while streaming."""
+    from utils.env import parse_bool
+
+    return bool(parse_bool(getenv("PULSESCRIBE_REFINE_STREAM_PASTE")))
+
+
+# Adaptiver Keep-Alive (macOS-Daemon, MLX/Lightning): lernt Diktat-Pausen und
+# Tageszeiten und hält das Modell nur warm, wenn ein Diktat wahrscheinlich ist.
+# Aus = fester Timer alle LOCAL_KEEPALIVE_INTERVAL Sekunden.
+def get_local_keepalive_adaptive() -> bool:
+    """Return whether the daemon schedules keepalives from learned usage."""
+    from utils.env import parse_bool
+
+    value = parse_bool(getenv("PULSESCRIBE_LOCAL_KEEPALIVE_ADAPTIVE"))
+    return True if value is None else value
+
+
+# Mindestwahrscheinlichkeit für ein Diktat im nächsten Intervall, ab der
+# gewärmt wird. 0 = automatisch aus Keep-Alive-Kosten vs. Kaltstart-Aufpreis.
+def get_local_keepalive_min_probability() -> float:
+    """Return the fixed keepalive probability threshold (0 = cost-based)."""
+    return _get_bounded_float_env(
+        "PULSESCRIBE_LOCAL_KEEPALIVE_MIN_PROBABILITY",
+        0.0,
+        min_value=0.0,
+        max_value=1.0,
+    )
+
+
+# Audio-Replay statt Mikrofon: spielt eine WAV-Datei über dieselbe
+# InputStream-Schnittstelle ab (Latenz-Benchmarks, CI ohne Audio-Hardware).
+def get_audio_replay_file() -> Path | None:
+    """Return the WAV fixture replayed instead of the microphone (if any)."""
+    raw = getenv("PULSESCRIBE_AUDIO_REPLAY", "").strip()
+    return Path(raw).expanduser() if raw else None
+
+
+def get_audio_replay_speed() -> float:
+    """Return the replay speed factor (1 = real time, 0 = as fast as possible)."""
+    return _get_bounded_float_env(
+        "PULSESCRIBE_AUDIO_REPLAY_SPEED", 1.0, min_value=0.0, max_value=1000.0
+    )
+
+
+def get_audio_replay_jitter_ms() -> float:
+    """Return the max. random delivery delay per replayed block."""
+    return _get_bounded_float_env(
+        "PULSESCRIBE_AUDIO_REPLAY_JITTER_MS", 0.0, min_value=0.0, max_value=500.0
+    )
+
+
+def get_audio_replay_blocksize() -> int:
+    """Return the forced replay block size in frames (0 = stream default)."""
+    return _get_bounded_int_env(
+        "PULSESCRIBE_AUDIO_REPLAY_BLOCKSIZE", 0, min_value=0, max_value=65536
+    )
+
 
 # Watchdog: Automatisches Timeout wenn TRANSCRIBING zu lange dauert
 # Verhindert "hängendes Overlay" bei Worker-Problemen (z.B. WebSocket-Hänger)
@@ -577,6 +1032,14 @@ LOG_FILE = LOG_DIR / "pulsescribe.log"
 
 VOCABULARY_FILE = USER_CONFIG_DIR / "vocabulary.json"
 PROMPTS_FILE = USER_CONFIG_DIR / "prompts.toml"
+LOCAL_PROFILE_FILE = USER_CONFIG_DIR / "local_profile.json"
+KEEPALIVE_STATS_FILE = USER_CONFIG_DIR / "keepalive_stats.json"
+TRANSCRIPT_CACHE_DIR = USER_CONFIG_DIR / "cache" / "transcripts"
+REFINE_CACHE_DIR = USER_CONFIG_DIR / "cache" / "refine"
+REFINE_LATENCY_FILE = USER_CONFIG_DIR / "refine_latency.json"
+# Spool-Dateien laufender Aufnahmen; nicht im Temp-Verzeichnis, damit sie
+# einen Absturz samt Neustart (Temp wird geleert) überstehen
+RECORDING_SPOOL_DIR = USER_CONFIG_DIR / "spool"
 
 # Resource path helper import must happen after core constants to avoid circular imports
 # (utils imports config for IPC paths and config dir).
@@ -607,11 +1070,58 @@ __all__ = [
     "DEEPGRAM_TAIL_PADDING_SECONDS",
     "DEEPGRAM_EMPTY_FINALIZE_GRACE_SECONDS",
     "DEEPGRAM_KEEPALIVE_INTERVAL_SECONDS",
+    "DEEPGRAM_WARM_POOL_IDLE_SECONDS",
+    "DEEPGRAM_WARM_POOL_SIZE",
+    "DEEPGRAM_SEND_FRAME_MS",
+    "DEEPGRAM_QUEUE_SECONDS",
+    "DEEPGRAM_QUEUE_POLICIES",
+    "get_deepgram_queue_policy",
     "WINDOWS_STOP_GRACE_SECONDS",
     "get_windows_adaptive_stop_tail_enabled",
     "get_windows_paste_sync_seconds",
     "get_windows_latency_preset",
     "get_windows_stop_grace_seconds",
+    "get_recording_spool_enabled",
+    "RECORDING_SPOOL_QUEUE_SIZE",
+    "RECORDING_SPOOL_FLUSH_INTERVAL",
+    "get_upload_codec",
+    "get_upload_compress_min_seconds",
+    "get_chunk_seconds",
+    "get_chunk_overlap_seconds",
+    "get_chunk_workers",
+    "PROGRESSIVE_REST_WORKERS",
+    "BATCH_PROVIDER_WORKERS",
+    "get_progressive_transcription_enabled",
+    "get_progressive_min_segment_seconds",
+    "get_local_model_server_enabled",
+    "get_local_model_server_idle_minutes",
+    "get_local_model_cache_budget_mb",
+    "get_local_streaming_enabled",
+    "get_local_streaming_interval_seconds",
+    "get_batch_workers",
+    "get_local_batch_size",
+    "get_local_profile_enabled",
+    "get_local_keepalive_adaptive",
+    "get_local_keepalive_min_probability",
+    "get_transcript_cache_enabled",
+    "get_transcript_cache_max_mb",
+    "get_refine_cache_enabled",
+    "get_refine_cache_persistent",
+    "get_refine_cache_max_mb",
+    "get_refine_cache_ttl_hours",
+    "get_local_refine_max_words",
+    "get_refine_hedge_provider",
+    "get_refine_hedge_model",
+    "get_refine_hedge_delay_ms",
+    "get_latency_budget_ms",
+    "get_refine_fallback_model",
+    "get_interim_push_enabled",
+    "get_interim_socket_enabled",
+    "get_refine_stream_paste_enabled",
+    "get_audio_replay_file",
+    "get_audio_replay_speed",
+    "get_audio_replay_jitter_ms",
+    "get_audio_replay_blocksize",
     "TRANSCRIBING_TIMEOUT",
     "LLM_REFINE_TIMEOUT",
     "AUDIO_QUEUE_POLL_INTERVAL",
@@ -640,5 +1150,11 @@ __all__ = [
     "LOG_FILE",
     "VOCABULARY_FILE",
     "PROMPTS_FILE",
+    "LOCAL_PROFILE_FILE",
+    "KEEPALIVE_STATS_FILE",
+    "TRANSCRIPT_CACHE_DIR",
+    "REFINE_CACHE_DIR",
+    "REFINE_LATENCY_FILE",
+    "RECORDING_SPOOL_DIR",
     "reset_input_device_cache",
 ]
@@ -0,0 +1,239 @@
+"""In-memory audio payloads for REST transcription uploads.
+
+The daemons used to write every recording to a ``tempfile.mkstemp`` WAV that
+the provider immediately re-opened and read back. ``encode_audio_for_upload``
+encodes the captured array straight into memory instead, so the upload starts
+without a disk round-trip between key release and request sent.
+
+The payload codec is pluggable (``UPLOAD_CODECS``): raw WAV, lossless FLAC or
+lossy Opus/OGG, all encoded in-process via libsndfile.
+
+The saved time cannot be measured on the same run without doing the disk
+round-trip anyway. A one-off background probe (off the critical path) measures
+this machine's temp-file write/read throughput; later runs log the
+estimated savings.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Union
+
+logger = logging.getLogger("pulsescribe.providers")
+
+
+@dataclass(frozen=True)
+class UploadCodec:
+    """libsndfile container/subtype pair used for an upload payload."""
+
+    name: str
+    format: str
+    subtype: str
+    filename: str
+    # None = jede Rate; Opus kennt nur feste Raten
+    sample_rates: tuple[int, ...] | None = None
+
+    def supports(self, sample_rate: int) -> bool:
+        return self.sample_rates is None or sample_rate in self.sample_rates
+
+
+# Whisper-APIs brauchen nicht mehr als 16 Bit; identisch zu sf.write-Default
+UPLOAD_CODECS: dict[str, UploadCodec] = {
+    "wav": UploadCodec("wav", "WAV", "PCM_16", "audio.wav"),
+    "flac": UploadCodec("flac", "FLAC", "PCM_16", "audio.flac"),
+    "opus": UploadCodec(
+        "opus",
+        "OGG",
+        "OPUS",
+        "audio.ogg",
+        sample_rates=(8000, 12000, 16000, 24000, 48000),
+    ),
+}
+_DEFAULT_CODEC = "wav"
+_FALLBACK_CODEC = "flac"  # wenn Opus nicht verfügbar ist (Rate/libsndfile)
+_WAV_HEADER_BYTES = 44
+
+
+@dataclass(frozen=True)
+class EncodedAudio:
+    """Encoded audio held in memory, uploadable like a file."""
+
+    data: bytes
+    name: str = UPLOAD_CODECS[_DEFAULT_CODEC].filename
+    encode_ms: float = 0.0
+    codec: str = _DEFAULT_CODEC
+    # Größe als PCM_16-WAV (Vergleichswert für die Kompression)
+    wav_size: int = 0
+
+    @property
+    def size(self) -> int:
+        return len(self.data)
+
+    def open(self) -> BinaryIO:
+        """Return a file-like view (``BytesIO`` shares the immutable bytes)."""
+        return io.BytesIO(self.data)
+
+
+AudioSource = Union[Path, EncodedAudio]
+
+
+def audio_source_size(source: AudioSource) -> int:
+    """Return the payload size in bytes for a file path or in-memory payload."""
+    if isinstance(source, EncodedAudio):
+        return source.size
+    return source.stat().st_size
+
+
+def open_audio_source(source: AudioSource) -> BinaryIO:
+    """Open a file path or in-memory payload for reading."""
+    if isinstance(source, EncodedAudio):
+        return source.open()
+    return source.open("rb")
+
+
+def _resolve_codec(codec: str, sample_rate: int) -> UploadCodec:
+    """Map a codec name to a codec that can encode ``sample_rate`` here."""
+    import soundfile as sf
+
+    resolved = UPLOAD_CODECS.get(codec)
+    if resolved is None:
+        raise ValueError(f"Unbekannter Upload-Codec: {codec}")
+    if resolved.subtype not in sf.available_subtypes(resolved.format):
+        logger.debug(f"libsndfile ohne {resolved.subtype}, nutze {_FALLBACK_CODEC}")
+        return UPLOAD_CODECS[_FALLBACK_CODEC]
+    if not resolved.supports(sample_rate):
+        logger.debug(
+            f"{resolved.name} unterstützt {sample_rate}Hz nicht, nutze {_FALLBACK_CODEC}"
+        )
+        return UPLOAD_CODECS[_FALLBACK_CODEC]
+    return resolved
+
+
+def encode_audio_for_upload(
+    audio,
+    sample_rate: int,
+    *,
+    codec: str = _DEFAULT_CODEC,
+) -> EncodedAudio:
+    """Encode a float/int16 sample array in memory (WAV, FLAC or Opus/OGG)."""
+    import soundfile as sf
+
+    upload_codec = _resolve_codec(codec, sample_rate)
+    start = time.perf_counter()
+    buffer = io.BytesIO()
+    sf.write(
+        buffer,
+        audio,
+        sample_rate,
+        format=upload_codec.format,
+        subtype=upload_codec.subtype,
+    )
+    data = buffer.getvalue()
+    encode_ms = (time.perf_counter() - start) * 1000
+
+    frames = len(audio)
+    channels = 1 if getattr(audio, "ndim", 1) == 1 else int(audio.shape[1])
+    return EncodedAudio(
+        data=data,
+        name=upload_codec.filename,
+        encode_ms=encode_ms,
+        codec=upload_codec.name,
+        wav_size=_WAV_HEADER_BYTES + frames * channels * 2,
+    )
+
+
+class _DiskRoundtripProbe:
+    """Measures temp-file write + read-back throughput once per process."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._started = False
+        self._ms_per_byte: float | None = None
+        self._fixed_ms = 0.0
+
+    def estimate_ms(self, size: int) -> float | None:
+        """Estimated disk round-trip for ``size`` bytes (None until measured)."""
+        if self._ms_per_byte is None:
+            return None
+        return self._fixed_ms + self._ms_per_byte * size
+
+    def ensure_started(self, payload: bytes) -> None:
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+        threading.Thread(
+            target=self._measure,
+            args=(payload,),
+            daemon=True,
+            name="UploadDiskProbe",
+        ).start()
+
+    def _measure(self, payload: bytes) -> None:
+        try:
+            # Leere Datei: fixe Kosten (mkstemp, open, stat, unlink)
+            fixed_ms = self._roundtrip_ms(b"")
+            total_ms = self._roundtrip_ms(payload)
+        except OSError as exc:
+            logger.debug(f"Upload-Disk-Probe fehlgeschlagen: {exc}")
+            return
+        self._fixed_ms = fixed_ms
+        self._ms_per_byte = max(0.0, total_ms - fixed_ms) / max(1, len(payload))
+
+    @staticmethod
+    def _roundtrip_ms(payload: bytes) -> float:
+        start = time.perf_counter()
+        fd, temp_path = tempfile.mkstemp(suffix=".wav")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(payload)
+            path = Path(temp_path)
+            path.stat()
+            with path.open("rb") as handle:
+                handle.read()
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+        return (time.perf_counter() - start) * 1000
+
+
+_disk_probe = _DiskRoundtripProbe()
+
+
+def log_in_memory_upload(provider_logger: logging.Logger, encoded: EncodedAudio) -> None:
+    """Log codec, encode time and the estimated saved temp-file round-trip."""
+    payload = f"{encoded.size // 1024}KB {encoded.codec.upper()}"
+    if encoded.codec != _DEFAULT_CODEC and encoded.wav_size:
+        payload += f" (WAV: {encoded.wav_size // 1024}KB)"
+    # Verglichen wird mit dem früheren Pfad: WAV auf Platte schreiben + lesen
+    estimate = _disk_probe.estimate_ms(encoded.wav_size or encoded.size)
+    if estimate is None:
+        provider_logger.info(
+            f"In-Memory-Upload: {payload} in "
+            f"{encoded.encode_ms:.1f}ms encodiert (Temp-Datei vermieden)"
+        )
+        _disk_probe.ensure_started(encoded.data)
+        return
+    provider_logger.info(
+        f"In-Memory-Upload: {payload} in "
+        f"{encoded.encode_ms:.1f}ms encodiert, ~{estimate:.1f}ms "
+        "Temp-Datei-Roundtrip gespart"
+    )
+
+
+__all__ = [
+    "AudioSource",
+    "EncodedAudio",
+    "UPLOAD_CODECS",
+    "UploadCodec",
+    "audio_source_size",
+    "encode_audio_for_upload",
+    "log_in_memory_upload",
+    "open_audio_source",
+]
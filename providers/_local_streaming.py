@@ -0,0 +1,239 @@
+"""Streaming local transcription with LocalAgreement-style interim results.
+
+Whisper is not a streaming model, but re-decoding a growing window and only
+trusting what two consecutive decodes agree on gives stable interim text
+(LocalAgreement-2, as in whisper_streaming). ``LocalStreamingSession`` runs
+those decodes in the background while recording, commits the agreed prefix
+and moves the window start behind committed words. At stop only the window
+(uncommitted tail plus a few seconds of context) is decoded, so the final
+latency no longer grows with the length of the dictation.
+
+Usage:
+    session = provider.create_streaming_session(model="turbo", on_interim=show)
+    session.poll(buffer)               # periodically from the capture loop
+    ...
+    transcript = session.finish(audio)
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger("pulsescribe.providers.local")
+
+# Words starting before the committed end (minus jitter) were already emitted
+_OVERLAP_TOLERANCE_SECONDS = 0.1
+# Longest repeated n-gram stripped at the window start (re-decoded context)
+_MAX_OVERLAP_WORDS = 5
+# Trim the window once it holds more committed audio than this
+_TRIM_AFTER_SECONDS = 5.0
+# Committed audio kept at the window start after a trim, as decoding context
+_CONTEXT_SECONDS = 2.0
+# Whisper decodes at most 30 s; without agreement the window is force-committed
+_MAX_WINDOW_SECONDS = 25.0
+# Committed text passed as prompt to keep wording consistent across windows
+_PROMPT_CHARS = 200
+
+
+@dataclass(frozen=True)
+class TimedWord:
+    """One decoded word with absolute timestamps in seconds."""
+
+    start: float
+    end: float
+    text: str
+
+    @property
+    def key(self) -> str:
+        """Comparison form: case and surrounding punctuation do not matter."""
+        return self.text.strip().strip(".,!?;:…\"'").lower()
+
+
+def join_words(words: Sequence[TimedWord]) -> str:
+    """Join words as Whisper emits them (leading spaces are part of the word)."""
+    return "".join(word.text for word in words).strip()
+
+
+class LocalAgreement:
+    """Commits the longest common prefix of consecutive hypotheses."""
+
+    def __init__(self) -> None:
+        self.committed: list[TimedWord] = []
+        self.tentative: list[TimedWord] = []
+
+    @property
+    def committed_end(self) -> float:
+        return self.committed[-1].end if self.committed else 0.0
+
+    def _strip_committed(self, words: Sequence[TimedWord]) -> list[TimedWord]:
+        """Drop words of a new hypothesis that belong to committed audio."""
+        cutoff = self.committed_end - _OVERLAP_TOLERANCE_SECONDS
+        fresh = [word for word in words if word.start > cutoff]
+        if fresh and self.committed:
+            committed_keys = [word.key for word in self.committed[-_MAX_OVERLAP_WORDS:]]
+            for n in range(min(len(committed_keys), len(fresh)), 0, -1):
+                if committed_keys[-n:] == [word.key for word in fresh[:n]]:
+                    return fresh[n:]
+        return fresh
+
+    def insert(self, words: Sequence[TimedWord]) -> list[TimedWord]:
+        """Feed a new hypothesis and return the newly committed words."""
+        fresh = self._strip_committed(words)
+        agreed = 0
+        for new, old in zip(fresh, self.tentative):
+            if new.key != old.key:
+                break
+            agreed += 1
+        newly = fresh[:agreed]
+        self.committed.extend(newly)
+        self.tentative = fresh[agreed:]
+        return newly
+
+    def commit_tentative(self) -> list[TimedWord]:
+        """Commit the current hypothesis unconditionally (window overflow)."""
+        newly, self.tentative = self.tentative, []
+        self.committed.extend(newly)
+        return newly
+
+    def finish(self, words: Sequence[TimedWord]) -> list[TimedWord]:
+        """Commit the final hypothesis; returns the complete committed text."""
+        self.committed.extend(self._strip_committed(words))
+        self.tentative = []
+        return self.committed
+
+
+class LocalStreamingSession:
+    """Re-decodes a sliding window of the recording during capture.
+
+    ``poll`` is called from exactly one thread (capture loop); decodes run
+    one at a time on a background worker.
+    """
+
+    def __init__(
+        self,
+        decode: Callable[[Any, str | None], list[TimedWord]],
+        *,
+        sample_rate: int,
+        interval_seconds: float,
+        on_interim: Callable[[str], None] | None = None,
+    ) -> None:
+        """
+        Args:
+            decode: ``decode(audio, prompt)`` returns words with timestamps
+                relative to the start of ``audio``.
+            sample_rate: Sample rate of the polled buffer.
+            interval_seconds: New audio required before the next decode.
+            on_interim: Receives committed + tentative text after each decode.
+        """
+        self._decode = decode
+        self.sample_rate = sample_rate
+        self.interval_seconds = interval_seconds
+        self._on_interim = on_interim
+        self._agreement = LocalAgreement()
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="LocalStreaming"
+        )
+        self._pending: Future[None] | None = None
+        self._lock = threading.Lock()
+        self.window_frame = 0  # buffer frame where the next decode starts
+        self._decoded_frames = 0
+        self.decodes = 0
+        self._closed = False
+
+    @property
+    def committed_text(self) -> str:
+        with self._lock:
+            return join_words(self._agreement.committed)
+
+    def poll(self, buffer) -> bool:
+        """Start the next window decode once enough new audio arrived.
+
+        Args:
+            buffer: `SampleBuffer` of the running recording.
+
+        Returns:
+            True if a decode was started.
+        """
+        if self._closed or (self._pending is not None and not self._pending.done()):
+            return False
+        end = len(buffer)
+        if (end - self._decoded_frames) < self.interval_seconds * self.sample_rate:
+            return False
+        window = buffer.read(self.window_frame, end).reshape(-1)
+        self._decoded_frames = end
+        self._pending = self._executor.submit(self._decode_window, window, self.window_frame)
+        return True
+
+    def _prompt(self) -> str | None:
+        text = join_words(self._agreement.committed)
+        return text[-_PROMPT_CHARS:] if text else None
+
+    def _decode_at(self, audio, offset_frame: int) -> list[TimedWord]:
+        offset = offset_frame / self.sample_rate
+        with self._lock:
+            prompt = self._prompt()
+        return [
+            TimedWord(word.start + offset, word.end + offset, word.text)
+            for word in self._decode(audio, prompt)
+        ]
+
+    def _decode_window(self, window, offset_frame: int) -> None:
+        t0 = time.perf_counter()
+        try:
+            words = self._decode_at(window, offset_frame)
+        except Exception as e:
+            # Interim text is best effort; finish() decodes the window again
+            logger.warning(f"Local-Streaming: Zwischen-Dekodierung fehlgeschlagen: {e}")
+            return
+        window_seconds = window.shape[0] / self.sample_rate
+        with self._lock:
+            self.decodes += 1
+            newly = self._agreement.insert(words)
+            if window_seconds > _MAX_WINDOW_SECONDS and not newly:
+                newly = self._agreement.commit_tentative()
+            committed_end = self._agreement.committed_end
+            if committed_end - self.window_frame / self.sample_rate > _TRIM_AFTER_SECONDS:
+                # Re-decoded context words are dropped by _strip_committed
+                self.window_frame = int((committed_end - _CONTEXT_SECONDS) * self.sample_rate)
+            interim = join_words(self._agreement.committed + self._agreement.tentative)
+        logger.debug(
+            f"Local-Streaming: Fenster {window_seconds:.1f}s in "
+            f"{time.perf_counter() - t0:.2f}s, +{len(newly)} Wörter bestätigt"
+        )
+        if self._on_interim is not None and interim:
+            try:
+                self._on_interim(interim)
+            except Exception as e:
+                logger.debug(f"Local-Streaming: Interim-Callback fehlgeschlagen: {e}")
+
+    def finish(self, audio, *, timeout: float | None = None) -> str:
+        """Decode the uncommitted tail and return the complete transcript.
+
+        Args:
+            audio: Whole recording (same frame offsets as the polled buffer),
+                end may be trimmed or padded.
+            timeout: Max. wait for a running interim decode.
+        """
+        try:
+            if self._pending is not None:
+                self._pending.result(timeout=timeout)
+            tail = audio[self.window_frame :].reshape(-1)
+            words = self._decode_at(tail, self.window_frame) if len(tail) else []
+            with self._lock:
+                return join_words(self._agreement.finish(words))
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Stop the worker; a running decode finishes in the background."""
+        self._closed = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+__all__ = ["LocalAgreement", "LocalStreamingSession", "TimedWord", "join_words"]
@@ -0,0 +1,226 @@
+"""Memory-budgeted LRU cache for loaded local Whisper models."""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, MutableMapping
+from typing import Any, TypedDict
+
+logger = logging.getLogger("pulsescribe.providers.local")
+
+# Parameter counts (millions) of the Whisper checkpoints; longest match wins
+_MODEL_PARAMS_M = {
+    "tiny": 39,
+    "base": 74,
+    "small": 244,
+    "medium": 769,
+    "large": 1550,
+    "turbo": 809,
+    "large-v3-turbo": 809,
+    "distil-small": 166,
+    "distil-medium": 394,
+    "distil-large": 756,
+}
+_UNKNOWN_MODEL_PARAMS_M = 1550  # conservative: assume the largest checkpoint
+# Activations, KV cache, tokenizer, allocator slack
+_RUNTIME_OVERHEAD = 1.25
+
+_BYTES_PER_PARAM = {
+    "float32": 4.0,
+    "float16": 2.0,
+    "bfloat16": 2.0,
+    "int8": 1.0,
+    "int8_float16": 1.0,
+    "int8_bfloat16": 1.0,
+    "int8_float32": 1.0,
+    "int16": 2.0,
+    "4bit": 0.5,
+    "8bit": 1.0,
+}
+
+
+def _model_params(name: str) -> int:
+    name = name.lower()
+    matches = [key for key in _MODEL_PARAMS_M if re.search(rf"(^|[-/_]){key}($|[-._])", name)]
+    if not matches:
+        return _UNKNOWN_MODEL_PARAMS_M * 1_000_000
+    return _MODEL_PARAMS_M[max(matches, key=len)] * 1_000_000
+
+
+def estimate_model_bytes(cache_key: str) -> int:
+    """Estimate resident memory of a cached model from its cache key.
+
+    Keys follow ``LocalProvider``'s layout:
+    ``whisper:<model>:<device>``,
+    ``faster:<model>:<device>:<compute_type>:<threads>:<workers>`` and
+    ``lightning:<model>:<batch_size>:<quant>``.
+    """
+    backend, _, rest = cache_key.partition(":")
+    parts = rest.split(":")
+    model_name = parts[0] if parts else rest
+    if backend == "faster" and len(parts) >= 3:
+        precision = parts[2]
+    elif backend == "lightning" and len(parts) >= 3 and parts[2] not in ("None", ""):
+        precision = parts[2]
+    elif backend == "lightning":
+        precision = "float16"
+    else:
+        # openai-whisper keeps float32 weights (fp16 only during decoding)
+        precision = "float32"
+    bytes_per_param = _BYTES_PER_PARAM.get(precision.lower(), 2.0)
+    return int(_model_params(model_name) * bytes_per_param * _RUNTIME_OVERHEAD)
+
+
+class ModelCacheStats(TypedDict):
+    """Result of `ModelCache.stats` (also returned by the model server)."""
+
+    entries: int
+    active: str | None
+    hits: int
+    loads: int
+    evictions: int
+    bytes_resident: int
+    budget_bytes: int
+
+
+class ModelCache(MutableMapping):
+    """LRU model cache with a memory budget, used like the former plain dict.
+
+    - Entries are ordered by last use; ``cache[key]`` counts as a hit.
+    - The active model (last loaded or used) is pinned and never evicted.
+    - ``reserve(key)`` evicts least recently used models *before* a load, so
+      switching models does not keep the old one resident during the load.
+    - A budget of 0 disables eviction.
+    """
+
+    def __init__(
+        self,
+        budget_bytes: Callable[[], int],
+        *,
+        estimate: Callable[[str], int] = estimate_model_bytes,
+        on_evict: Callable[[], None] | None = None,
+    ) -> None:
+        self._budget_bytes = budget_bytes
+        self._estimate = estimate
+        self._on_evict = on_evict
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self._sizes: dict[str, int] = {}
+        self._lock = threading.RLock()
+        self.active_key: str | None = None
+        self.hits = 0
+        self.loads = 0
+        self.evictions = 0
+        self._just_loaded: str | None = None
+
+    # MutableMapping -----------------------------------------------------------
+
+    def __getitem__(self, key: str) -> Any:
+        with self._lock:
+            model = self._entries[key]
+            self._entries.move_to_end(key)
+            self.active_key = key
+            if key == self._just_loaded:
+                # the lookup right after the load is not a cache hit
+                self._just_loaded = None
+            else:
+                self.hits += 1
+            return model
+
+    def __setitem__(self, key: str, model: Any) -> None:
+        with self._lock:
+            if key not in self._entries:
+                self.loads += 1
+                self._just_loaded = key
+            self._entries[key] = model
+            self._entries.move_to_end(key)
+            self._sizes[key] = self._estimate(key)
+            self.active_key = key
+            evicted = self._evict_to_budget(key, incoming=0)
+            logger.debug(
+                f"Modell-Cache: '{key}' (~{self._sizes[key] / 2**20:.0f} MB), "
+                f"resident ~{self.bytes_resident / 2**20:.0f} MB"
+            )
+        self._after_evict(evicted)
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            del self._entries[key]
+            self._sizes.pop(key, None)
+            if self.active_key == key:
+                self.active_key = None
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self.active_key = None
+
+    # Budget -------------------------------------------------------------------
+
+    @property
+    def bytes_resident(self) -> int:
+        return sum(self._sizes.values())
+
+    def reserve(self, key: str) -> None:
+        """Make room for ``key`` before loading it and mark it active."""
+        with self._lock:
+            self.active_key = key
+            evicted = self._evict_to_budget(key, incoming=self._estimate(key))
+        self._after_evict(evicted)
+
+    def _evict_to_budget(self, keep: str, *, incoming: int) -> list[str]:
+        budget = self._budget_bytes()
+        if budget <= 0:
+            return []
+        evicted = []
+        for key in list(self._entries):
+            if self.bytes_resident + incoming <= budget:
+                break
+            if key in (keep, self.active_key):
+                continue
+            del self._entries[key]
+            size = self._sizes.pop(key, 0)
+            evicted.append(key)
+            self.evictions += 1
+            logger.info(
+                f"Modell-Cache: '{key}' entladen (~{size / 2**20:.0f} MB, "
+                f"Budget {budget / 2**20:.0f} MB)"
+            )
+        if incoming and self.bytes_resident + incoming > budget:
+            logger.warning(
+                f"Modell-Cache: aktives Modell (~{(self.bytes_resident + incoming) / 2**20:.0f} MB) "
+                f"größer als Budget ({budget / 2**20:.0f} MB)"
+            )
+        return evicted
+
+    def _after_evict(self, evicted: list[str]) -> None:
+        if evicted and self._on_evict is not None:
+            self._on_evict()
+
+    def stats(self) -> ModelCacheStats:
+        """Counters and residency for diagnostics."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "active": self.active_key,
+                "hits": self.hits,
+                "loads": self.loads,
+                "evictions": self.evictions,
+                "bytes_resident": self.bytes_resident,
+                "budget_bytes": self._budget_bytes(),
+            }
+
+
+__all__ = ["ModelCache", "ModelCacheStats", "estimate_model_bytes"]
@@ -1,14 +1,41 @@
-"""Shared helpers for resolving common provider transcription inputs."""
+"""Shared helpers for resolving common provider transcription inputs.
+
+Long recordings are split into chunks at speech pauses (with a small overlap),
+uploaded concurrently and stitched back together with the duplicated overlap
+words removed (``transcribe_audio_in_chunks``).
+"""
 
 from __future__ import annotations
 
-from collections.abc import Callable, Mapping
+import logging
+import re
+import time
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from pathlib import Path
 from typing import Any, BinaryIO
 
+from ._audio_upload import (
+    AudioSource,
+    EncodedAudio,
+    audio_source_size,
+    encode_audio_for_upload,
+    open_audio_source,
+)
 from ._language import normalize_auto_language
 
+logger = logging.getLogger("pulsescribe.providers")
+
+# Codec for ``auto`` above the minimum length, per provider. All three APIs
+# accept FLAC; lossless keeps recognition quality identical to WAV while
+# making the upload ~30% smaller. Numbers: ``python -m benchmarks.upload_codecs``.
+_AUTO_UPLOAD_CODECS: dict[str, str] = {
+    "openai": "flac",
+    "groq": "flac",
+    "deepgram": "flac",
+}
+_AUTO_UPLOAD_CODEC_FALLBACK = "flac"
+
 
 @dataclass(frozen=True)
 class ResolvedTranscriptionRequest:
@@ -20,7 +47,7 @@ class ResolvedTranscriptionRequest:
 
 
 def resolve_transcription_request(
-    audio_path: Path,
+    audio_path: AudioSource,
     *,
     model: str | None,
     default_model: str,
@@ -30,10 +57,27 @@ def resolve_transcription_request(
     return ResolvedTranscriptionRequest(
         model=model or default_model,
         language=normalize_auto_language(language),
-        audio_kb=audio_path.stat().st_size // 1024,
+        audio_kb=audio_source_size(audio_path) // 1024,
     )
 
 
+def select_upload_codec(provider_name: str, duration_s: float) -> str:
+    """Pick the in-memory upload codec for a recording.
+
+    An explicit ``PULSESCRIBE_[<PROVIDER>_]UPLOAD_CODEC`` always wins. ``auto``
+    uploads short clips as raw WAV (encoding would cost more than it saves on
+    the wire) and compresses longer recordings with the provider default.
+    """
+    from config import get_upload_codec, get_upload_compress_min_seconds
+
+    configured = get_upload_codec(provider_name)
+    if configured != "auto":
+        return configured
+    if duration_s < get_upload_compress_min_seconds():
+        return "wav"
+    return _AUTO_UPLOAD_CODECS.get(provider_name, _AUTO_UPLOAD_CODEC_FALLBACK)
+
+
 def build_transcription_params(
     *,
     model: str,
@@ -50,33 +94,35 @@ def build_transcription_params(
 
 
 def execute_audio_file_request(
-    audio_path: Path,
+    audio_path: AudioSource,
     *,
     request_callable: Callable[..., Any],
     build_params: Callable[[BinaryIO], Mapping[str, object]],
 ) -> Any:
-    """Open an audio file once and execute a provider SDK request with it."""
-    with audio_path.open("rb") as audio_file:
+    """Open an audio file (or in-memory payload) once and execute a provider SDK request with it."""
+    with open_audio_source(audio_path) as audio_file:
         return request_callable(**build_params(audio_file))
 
 
 def execute_audio_transcription_request(
-    audio_path: Path,
+    audio_path: AudioSource,
     *,
     request_callable: Callable[..., Any],
     model: str,
     language: str | None,
     extra_params: Mapping[str, object] | None = None,
-    build_file_payload: Callable[[Path, BinaryIO], object] | None = None,
+    build_file_payload: Callable[[AudioSource, BinaryIO], object] | None = None,
 ) -> Any:
     """Execute a file-based transcription request with shared param assembly."""
 
     def _build_params(audio_file: BinaryIO) -> dict[str, object]:
-        file_payload = (
-            build_file_payload(audio_path, audio_file)
-            if build_file_payload is not None
-            else audio_file
-        )
+        if build_file_payload is not None:
+            file_payload = build_file_payload(audio_path, audio_file)
+        elif isinstance(audio_path, EncodedAudio):
+            # BytesIO has no filename; SDKs derive the upload format from it
+            file_payload = (audio_path.name, audio_file)
+        else:
+            file_payload = audio_file
         return build_transcription_params(
             model=model,
             language=language,
@@ -88,3 +134,217 @@ def execute_audio_transcription_request(
         request_callable=request_callable,
         build_params=_build_params,
     )
+
+
+# Chunking -------------------------------------------------------------------
+
+# Recordings up to this factor of the chunk length stay one request (no tiny
+# trailing chunk, no split for a few seconds over the limit)
+_CHUNK_TOLERANCE = 1.1
+# Cut search window before the target boundary (fraction of the chunk length)
+_CUT_SEARCH_FRACTION = 0.2
+_CUT_SEARCH_MAX_SECONDS = 30.0
+_ENERGY_FRAME_SECONDS = 0.02
+# Smooth frame energy so the cut lands in a pause, not between two syllables
+_ENERGY_SMOOTH_FRAMES = 15
+# Words per overlap second that may be duplicated at a chunk boundary
+_OVERLAP_WORDS_PER_SECOND = 4
+_DECODE_BLOCK_SECONDS = 10
+_WORD_KEY_RE = re.compile(r"[^\w]+", re.UNICODE)
+
+
+def should_chunk(duration_s: float) -> bool:
+    """Return whether a recording of ``duration_s`` is split into chunks."""
+    from config import get_chunk_seconds
+
+    chunk_s = get_chunk_seconds()
+    return chunk_s > 0 and duration_s > chunk_s * _CHUNK_TOLERANCE
+
+
+def _quietest_frame(audio, start: int, end: int, sample_rate: int) -> int:
+    """Sample index of the quietest (smoothed) 20 ms frame in ``[start, end)``."""
+    import numpy as np
+
+    frame = max(1, int(sample_rate * _ENERGY_FRAME_SECONDS))
+    frames = (end - start) // frame
+    if frames <= 0:
+        return end
+    window = np.asarray(audio[start : start + frames * frame], dtype=np.float32)
+    energy = np.square(window.reshape(frames, frame)).mean(axis=1)
+    smooth = min(_ENERGY_SMOOTH_FRAMES, frames)
+    if smooth > 1:
+        energy = np.convolve(energy, np.ones(smooth) / smooth, mode="same")
+    return start + int(np.argmin(energy)) * frame + frame // 2
+
+
+def plan_audio_chunks(
+    audio,
+    sample_rate: int,
+    *,
+    chunk_s: float,
+    overlap_s: float,
+) -> list[tuple[int, int]]:
+    """Split ``audio`` into ``(start, end)`` sample ranges cut at pauses.
+
+    Each cut is placed at the quietest point shortly before the target chunk
+    length; neighbouring chunks share ``overlap_s`` of audio centred on the cut.
+    """
+    total = len(audio)
+    chunk = int(chunk_s * sample_rate)
+    if chunk <= 0 or total <= chunk * _CHUNK_TOLERANCE:
+        return [(0, total)]
+    search = int(min(chunk_s * _CUT_SEARCH_FRACTION, _CUT_SEARCH_MAX_SECONDS) * sample_rate)
+    half_overlap = int(overlap_s * sample_rate) // 2
+    bounds: list[tuple[int, int]] = []
+    start = 0
+    while total - start > chunk * _CHUNK_TOLERANCE:
+        target = start + chunk
+        cut = _quietest_frame(audio, max(start + 1, target - search), target, sample_rate)
+        bounds.append((start, min(total, cut + half_overlap)))
+        start = max(start + 1, cut - half_overlap)
+    bounds.append((start, total))
+    return bounds
+
+
+def _word_key(word: str) -> str:
+    return _WORD_KEY_RE.sub("", word).lower()
+
+
+def stitch_transcripts(parts: Sequence[str], *, max_overlap_words: int) -> str:
+    """Join chunk transcripts, dropping words repeated across a boundary.
+
+    The longest run (up to ``max_overlap_words``) that ends the previous text
+    and starts the next one - compared without case and punctuation - is kept
+    only once.
+    """
+    words: list[str] = []
+    for text in parts:
+        new_words = (text or "").split()
+        if words and new_words:
+            limit = min(max_overlap_words, len(words), len(new_words))
+            for size in range(limit, 0, -1):
+                tail = [_word_key(word) for word in words[-size:]]
+                if tail == [_word_key(word) for word in new_words[:size]] and any(tail):
+                    new_words = new_words[size:]
+                    break
+        words.extend(new_words)
+    return " ".join(words)
+
+
+def transcribe_audio_in_chunks(
+    audio,
+    sample_rate: int,
+    *,
+    provider_name: str,
+    transcribe_chunk: Callable[[EncodedAudio], str],
+) -> str:
+    """Transcribe a long mono recording as concurrently uploaded chunks."""
+    from config import get_chunk_overlap_seconds, get_chunk_seconds, get_chunk_workers
+
+    overlap_s = get_chunk_overlap_seconds()
+    bounds = plan_audio_chunks(
+        audio, sample_rate, chunk_s=get_chunk_seconds(), overlap_s=overlap_s
+    )
+    workers = min(get_chunk_workers(), len(bounds))
+
+    def run(index: int) -> str:
+        start, end = bounds[index]
+        segment = audio[start:end]
+        encoded = encode_audio_for_upload(
+            segment,
+            sample_rate,
+            codec=select_upload_codec(provider_name, len(segment) / sample_rate),
+        )
+        return transcribe_chunk(encoded)
+
+    t0 = time.perf_counter()
+    logger.info(
+        f"{provider_name}: {len(audio) / sample_rate:.0f}s Audio in {len(bounds)} "
+        f"Chunks, {workers} parallel"
+    )
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="UploadChunk") as pool:
+        parts = list(pool.map(run, range(len(bounds))))
+    logger.info(
+        f"{provider_name}: {len(bounds)} Chunks in {time.perf_counter() - t0:.2f}s transkribiert"
+    )
+    return stitch_transcripts(
+        parts,
+        max_overlap_words=max(1, round(overlap_s * _OVERLAP_WORDS_PER_SECOND)),
+    )
+
+
+def _read_mono_16k(audio_file: BinaryIO, sample_rate: int):
+    """Decode blockwise to 16 kHz mono float32 (no full-rate copy in RAM)."""
+    import numpy as np
+    import soundfile as sf
+
+    from audio.resample import StreamingResampler
+    from config import WHISPER_SAMPLE_RATE
+
+    resampler = (
+        StreamingResampler(sample_rate, WHISPER_SAMPLE_RATE)
+        if sample_rate != WHISPER_SAMPLE_RATE
+        else None
+    )
+    blocks = []
+    for block in sf.blocks(
+        audio_file,
+        blocksize=int(sample_rate * _DECODE_BLOCK_SECONDS),
+        dtype="float32",
+        always_2d=True,
+    ):
+        mono = block.mean(axis=1) if block.shape[1] > 1 else block[:, 0]
+        blocks.append(resampler.process(mono) if resampler else mono.copy())
+    if resampler is not None:
+        blocks.append(resampler.flush())
+    return np.concatenate(blocks) if blocks else np.zeros(0, dtype=np.float32)
+
+
+def maybe_transcribe_file_in_chunks(
+    audio_path: AudioSource,
+    *,
+    provider_name: str,
+    transcribe_chunk: Callable[[EncodedAudio], str],
+) -> str | None:
+    """Chunk a long audio file; None means "send it as one request".
+
+    In-memory payloads are already chunked by ``transcribe_audio``; formats
+    libsndfile cannot read (e.g. some MP4/M4A) are uploaded as before.
+    """
+    from config import WHISPER_SAMPLE_RATE, get_chunk_seconds
+
+    if isinstance(audio_path, EncodedAudio) or get_chunk_seconds() <= 0:
+        return None
+    try:
+        import soundfile as sf
+
+        with open_audio_source(audio_path) as audio_file:
+            info = sf.info(audio_file)
+            if not should_chunk(info.duration):
+                return None
+            audio_file.seek(0)
+            audio = _read_mono_16k(audio_file, info.samplerate)
+    except Exception as exc:
+        logger.debug(f"{provider_name}: Chunking nicht möglich ({exc}), ein Request")
+        return None
+    return transcribe_audio_in_chunks(
+        audio,
+        WHISPER_SAMPLE_RATE,
+        provider_name=provider_name,
+        transcribe_chunk=transcribe_chunk,
+    )
+
+
+__all__ = [
+    "ResolvedTranscriptionRequest",
+    "build_transcription_params",
+    "execute_audio_file_request",
+    "execute_audio_transcription_request",
+    "maybe_transcribe_file_in_chunks",
+    "plan_audio_chunks",
+    "resolve_transcription_request",
+    "select_upload_codec",
+    "should_chunk",
+    "stitch_transcripts",
+    "transcribe_audio_in_chunks",
+]
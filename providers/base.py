@@ -3,6 +3,7 @@
 Alle Provider müssen dieses Interface implementieren.
 """
 
+import logging
 import os
 from pathlib import Path
 from typing import Protocol, runtime_checkable
@@ -79,5 +80,59 @@ class EnvValidatedProvider:
         """Env-validated REST providers do not stream by default."""
         return False
 
+    def transcribe_audio(
+        self,
+        audio_data,
+        model: str | None = None,
+        language: str | None = None,
+        *,
+        sample_rate: int | None = None,
+    ) -> str:
+        """Transkribiert ein Audio-Array ohne Temp-Datei (In-Memory-Upload).
+
+        Der Upload-Codec (WAV/FLAC/Opus) wird per ``select_upload_codec``
+        anhand von Provider und Aufnahmelänge gewählt. Lange Aufnahmen werden
+        an Sprechpausen geteilt und parallel hochgeladen
+        (``PULSESCRIBE_CHUNK_SECONDS``).
+
+        Args:
+            audio_data: numpy-Array (float32 oder int16)
+            model: Modell-Name (optional, nutzt Provider-Default)
+            language: Sprachcode oder None für Auto-Detection
+            sample_rate: Sample-Rate des Arrays (default: WHISPER_SAMPLE_RATE)
+        """
+        from config import WHISPER_SAMPLE_RATE
+
+        from ._audio_upload import encode_audio_for_upload, log_in_memory_upload
+        from ._transcription_request import (
+            select_upload_codec,
+            should_chunk,
+            transcribe_audio_in_chunks,
+        )
+
+        self._validate()
+        provider_name = getattr(self, "name", "provider")
+        rate = sample_rate or WHISPER_SAMPLE_RATE
+        if should_chunk(len(audio_data) / rate):
+            return transcribe_audio_in_chunks(
+                audio_data,
+                rate,
+                provider_name=provider_name,
+                transcribe_chunk=lambda chunk: self.transcribe(  # type: ignore[attr-defined]
+                    chunk, model=model, language=language
+                ),
+            )
+        encoded = encode_audio_for_upload(
+            audio_data,
+            rate,
+            codec=select_upload_codec(provider_name, len(audio_data) / rate),
+        )
+        log_in_memory_upload(
+            logging.getLogger(f"pulsescribe.providers.{provider_name}"), encoded
+        )
+        return self.transcribe(  # type: ignore[attr-defined]
+            encoded, model=model, language=language
+        )
+
 
 __all__ = ["TranscriptionProvider", "EnvValidatedProvider"]
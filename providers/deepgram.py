@@ -10,10 +10,12 @@ from utils.timing import timed_operation
 from utils.vocabulary import load_vocabulary
 
 from config import DEFAULT_DEEPGRAM_MODEL
+from ._audio_upload import EncodedAudio
 from ._client_cache import EnvClientCache, build_cached_env_client_getter
 from ._response_utils import log_transcription_result
 from ._transcription_request import (
     build_transcription_params,
+    maybe_transcribe_file_in_chunks,
     resolve_transcription_request,
 )
 from .base import EnvValidatedProvider
@@ -63,8 +65,15 @@ def _build_vocabulary_params(model: str, keywords: list[str]) -> dict[str, list[
     return {"keywords": list(keywords)}
 
 
+def _build_request_payload(audio_path: Path | EncodedAudio):
+    """In-memory payloads go out as one body; files are streamed in chunks."""
+    if isinstance(audio_path, EncodedAudio):
+        return audio_path.data
+    return _iter_audio_chunks(audio_path)
+
+
 def _build_request_params(
-    audio_path: Path,
+    audio_path: Path | EncodedAudio,
     *,
     model: str,
     language: str | None,
@@ -75,7 +84,7 @@ def _build_request_params(
         model=model,
         language=language,
         extra_params={
-            "request": _iter_audio_chunks(audio_path),
+            "request": _build_request_payload(audio_path),
             "smart_format": True,
             "punctuate": True,
             **_build_vocabulary_params(model, keywords),
@@ -127,14 +136,14 @@ class DeepgramProvider(EnvValidatedProvider):
 
     def transcribe(
         self,
-        audio_path: Path,
+        audio_path: Path | EncodedAudio,
         model: str | None = None,
         language: str | None = None,
     ) -> str:
         """Transkribiert Audio über Deepgram REST API.
 
         Args:
-            audio_path: Pfad zur Audio-Datei
+            audio_path: Pfad zur Audio-Datei oder In-Memory-Payload
             model: Modell (default: nova-3)
             language: Sprachcode oder None für Auto-Detection
 
@@ -143,6 +152,17 @@ class DeepgramProvider(EnvValidatedProvider):
         """
         self._validate()
 
+        # Lange Dateien: an Sprechpausen teilen und parallel hochladen
+        chunked = maybe_transcribe_file_in_chunks(
+            audio_path,
+            provider_name=self.name,
+            transcribe_chunk=lambda chunk: self.transcribe(
+                chunk, model=model, language=language
+            ),
+        )
+        if chunked is not None:
+            return chunked
+
         request = resolve_transcription_request(
             audio_path,
             model=model,
@@ -19,6 +19,7 @@ Usage:
 from __future__ import annotations
 
 import asyncio
+import collections
 import logging
 import os
 import queue
@@ -42,6 +43,10 @@ from config import (
     DEEPGRAM_EMPTY_FINALIZE_GRACE_SECONDS,
     DEEPGRAM_CLOSE_TIMEOUT,
     DEEPGRAM_KEEPALIVE_INTERVAL_SECONDS,
+    DEEPGRAM_QUEUE_SECONDS,
+    DEEPGRAM_SEND_FRAME_MS,
+    DEEPGRAM_WARM_POOL_IDLE_SECONDS,
+    DEEPGRAM_WARM_POOL_SIZE,
     DEEPGRAM_TAIL_PADDING_SECONDS,
     DEEPGRAM_WS_URL,
     DEFAULT_DEEPGRAM_MODEL,
@@ -59,6 +64,7 @@ from config import (
     WHISPER_BLOCKSIZE,
     WHISPER_CHANNELS,
     WHISPER_SAMPLE_RATE,
+    get_deepgram_queue_policy,
     get_input_device,
 )
 from providers._language import normalize_auto_language
@@ -66,6 +72,7 @@ from utils.audio_latency import (
     create_low_latency_input_stream,
     platform_audio_blocksize,
 )
+from utils.interim_channel import get_interim_channel
 from utils.logging import get_session_id
 from utils.timing import redacted_text_summary
 
@@ -75,6 +82,8 @@ if TYPE_CHECKING:
     import numpy as np
     import sounddevice as sd
 
+    from audio.vad import StreamingVAD
+
     LiveResultResponse = Any
     AsyncV1SocketClient = Any
 
@@ -129,6 +138,37 @@ class WarmStreamSource:
             )
 
 
+@dataclass
+class StreamSendStats:
+    """Zähler für den Weg Mikrofon → Event-Loop → WebSocket."""
+
+    blocks_in: int = 0  # Audio-Blöcke von PortAudio/Warm-Stream
+    handoffs: int = 0  # call_soon_threadsafe-Übergaben an den Event-Loop
+    frames_sent: int = 0  # WebSocket-Frames (send_media)
+    bytes_sent: int = 0
+    max_queue_depth: int = 0  # Höchststand der Audio-Queue vor dem Senden
+    max_queue_bytes: int = 0  # High-Water-Mark ungesendeter Bytes
+    max_queue_age_ms: float = 0.0  # Ältester Chunk beim Senden (Rückstau)
+    merged_chunks: int = 0  # Bei voller Queue an den jüngsten Frame angehängt
+    dropped_chunks: int = 0  # Verworfen (Queue bzw. CLI-Puffer voll)
+    dropped_bytes: int = 0
+    blocked_ms: float = 0.0  # Wartezeit der Producer (Policy "block")
+
+    def describe(self) -> str:
+        summary = (
+            f"{self.frames_sent} Frames, {self.bytes_sent / 1024:.0f} KB, "
+            f"{self.blocks_in} Blöcke, {self.handoffs} Übergaben, "
+            f"max. Queue {self.max_queue_depth} "
+            f"({self.max_queue_bytes / 1024:.0f} KB, {self.max_queue_age_ms:.0f}ms)"
+        )
+        if self.dropped_chunks:
+            summary += (
+                f", {self.dropped_chunks} Chunks verworfen "
+                f"({self.dropped_bytes / 1024:.0f} KB)"
+            )
+        return summary
+
+
 @dataclass
 class StreamState:
     """Zentraler State für Streaming-Session.
@@ -152,6 +192,7 @@ class StreamState:
     final_transcript_event: asyncio.Event = field(default_factory=asyncio.Event)
     # Flag für einmalige Buffer-Warnung
     buffer_overflow_logged: bool = False
+    send_stats: StreamSendStats = field(default_factory=StreamSendStats)
 
 
 @dataclass
@@ -192,6 +233,7 @@ class _PreparedDeepgramConnection:
     context: AsyncContextManager[AsyncV1SocketClient]
     connection: AsyncV1SocketClient
     keepalive_task: asyncio.Task[None] | None = None
+    idle_since: float = field(default_factory=time.monotonic)
 
 
 DeepgramConnectionFactory = Callable[..., AsyncContextManager[Any]]
@@ -299,19 +341,30 @@ async def _create_deepgram_connection(
 
 
 class DeepgramWarmConnectionManager:
-    """Preconnect one Deepgram websocket for the next transcription.
+    """Keep a small pool of preconnected Deepgram websockets.
 
     Deepgram's ``CloseStream`` ends a streaming session, so a socket is claimed
-    exactly once and replaced after every dictation. All websocket operations run
-    on one dedicated asyncio loop to preserve loop affinity.
+    exactly once and replaced after every dictation. The replacement is opened
+    as soon as a socket is claimed, and ``pool_size`` sockets are kept ready so
+    rapid back-to-back dictations never wait for a handshake. Sockets are
+    bucketed by :class:`DeepgramConnectionConfig`; a session only claims a
+    socket with a matching config. Idle sockets send KeepAlive and are closed
+    after ``idle_expiry`` seconds; the pool refills on the next ``prewarm`` or
+    dictation, and only sockets lost to a KeepAlive failure are reopened right
+    away. All websocket operations run on one dedicated asyncio loop to
+    preserve loop affinity.
     """
 
     def __init__(
         self,
         *,
         keepalive_interval: float = DEEPGRAM_KEEPALIVE_INTERVAL_SECONDS,
+        pool_size: int = DEEPGRAM_WARM_POOL_SIZE,
+        idle_expiry: float = DEEPGRAM_WARM_POOL_IDLE_SECONDS,
     ) -> None:
         self._keepalive_interval = max(0.01, keepalive_interval)
+        self._pool_size = max(1, pool_size)
+        self._idle_expiry = max(self._keepalive_interval, idle_expiry)
         self._state_lock = threading.Lock()
         self._session_lock = threading.Lock()
         self._loop_started = threading.Event()
@@ -321,9 +374,10 @@ class DeepgramWarmConnectionManager:
         self._closing = False
         self._enabled = False
         self._desired_config: DeepgramConnectionConfig | None = None
+        self._stats = {"hits": 0, "misses": 0, "opened": 0, "expired": 0, "evicted": 0}
 
         # The following fields are accessed only on the manager event loop.
-        self._prepared: _PreparedDeepgramConnection | None = None
+        self._pool: dict[DeepgramConnectionConfig, list[_PreparedDeepgramConnection]] = {}
         self._prewarm_task: asyncio.Task[None] | None = None
         self._prewarm_config: DeepgramConnectionConfig | None = None
         self._active_task: asyncio.Task[Any] | None = None
@@ -561,12 +615,7 @@ class DeepgramWarmConnectionManager:
             if self._closing or not self._enabled or self._desired_config != config:
                 return
 
-        prepared = self._prepared
-        if (
-            prepared is not None
-            and prepared.config == config
-            and self._connection_is_open(prepared.connection)
-        ):
+        if self._ready_count(config) >= self._pool_size:
             self._prewarm_complete.set()
             return
 
@@ -587,32 +636,45 @@ class DeepgramWarmConnectionManager:
     async def _prewarm_connection(self, config: DeepgramConnectionConfig) -> None:
         current_task = asyncio.current_task()
         try:
-            if self._prepared is not None:
-                prepared, self._prepared = self._prepared, None
-                await self._close_prepared(prepared)
-
-            prepared = await self._open_prepared(config)
-            with self._state_lock:
-                still_desired = (
-                    self._enabled
-                    and not self._closing
-                    and self._desired_config == config
-                )
-            if not still_desired:
-                await self._close_prepared(prepared)
+            missing = self._pool_size - self._ready_count(config)
+            if missing <= 0:
                 return
+            await self._evict_other_buckets(config, needed=missing)
 
-            self._prepared = prepared
-            prepared.keepalive_task = asyncio.create_task(
-                self._keepalive(prepared),
-                name="DeepgramWebSocketKeepAlive",
-            )
-            logger.info(
-                "Deepgram WebSocket vorgewärmt: model=%s, lang=%s, %sHz",
-                config.model,
-                config.language or "auto",
-                config.sample_rate,
-            )
+            tasks = [
+                asyncio.create_task(self._open_prepared(config)) for _ in range(missing)
+            ]
+            try:
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+            except asyncio.CancelledError:
+                await self._close_opened(tasks)
+                raise
+
+            opened = 0
+            for result in results:
+                if isinstance(result, BaseException):
+                    logger.debug("Deepgram WebSocket Pre-Warm fehlgeschlagen: %s", result)
+                    continue
+                with self._state_lock:
+                    still_desired = (
+                        self._enabled
+                        and not self._closing
+                        and self._desired_config == config
+                    )
+                if not still_desired:
+                    await self._close_prepared(result)
+                    continue
+                self._add_to_pool(result)
+                opened += 1
+            if opened:
+                logger.info(
+                    "Deepgram WebSocket vorgewärmt: model=%s, lang=%s, %sHz (%d/%d bereit)",
+                    config.model,
+                    config.language or "auto",
+                    config.sample_rate,
+                    self._ready_count(config),
+                    self._pool_size,
+                )
         except asyncio.CancelledError:
             raise
         except Exception as exc:
@@ -626,6 +688,16 @@ class DeepgramWarmConnectionManager:
             if should_signal:
                 self._prewarm_complete.set()
 
+    async def _close_opened(self, tasks: list[asyncio.Task[Any]]) -> None:
+        """Close sockets whose handshake finished before a prewarm was cancelled."""
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for task in tasks:
+            if not task.cancelled() and task.exception() is None:
+                with suppress(asyncio.CancelledError):
+                    await self._close_prepared(task.result())
+
     async def _open_prepared(
         self,
         config: DeepgramConnectionConfig,
@@ -638,18 +710,77 @@ class DeepgramWarmConnectionManager:
             channels=config.channels,
         )
         connection = await context.__aenter__()
+        self._stats["opened"] += 1
         return _PreparedDeepgramConnection(
             config=config,
             context=context,
             connection=connection,
         )
 
+    def _add_to_pool(self, prepared: _PreparedDeepgramConnection) -> None:
+        prepared.idle_since = time.monotonic()
+        self._pool.setdefault(prepared.config, []).append(prepared)
+        prepared.keepalive_task = asyncio.create_task(
+            self._keepalive(prepared),
+            name="DeepgramWebSocketKeepAlive",
+        )
+
+    def _remove_from_pool(self, prepared: _PreparedDeepgramConnection) -> bool:
+        bucket = self._pool.get(prepared.config)
+        if bucket is None or prepared not in bucket:
+            return False
+        bucket.remove(prepared)
+        if not bucket:
+            del self._pool[prepared.config]
+        return True
+
+    def _ready_count(self, config: DeepgramConnectionConfig) -> int:
+        return sum(
+            1
+            for prepared in self._pool.get(config, ())
+            if self._connection_is_open(prepared.connection)
+        )
+
+    async def _evict_other_buckets(
+        self,
+        config: DeepgramConnectionConfig,
+        *,
+        needed: int,
+    ) -> None:
+        """Make room for ``needed`` sockets, closing the longest-idle others first."""
+        others = sorted(
+            (
+                prepared
+                for bucket_config, bucket in self._pool.items()
+                if bucket_config != config
+                for prepared in bucket
+            ),
+            key=lambda prepared: prepared.idle_since,
+        )
+        total = sum(len(bucket) for bucket in self._pool.values())
+        for prepared in others:
+            if total + needed <= self._pool_size:
+                break
+            self._remove_from_pool(prepared)
+            self._stats["evicted"] += 1
+            total -= 1
+            await self._close_prepared(prepared)
+
     async def _keepalive(self, prepared: _PreparedDeepgramConnection) -> None:
         from deepgram.extensions.types.sockets import ListenV1ControlMessage
 
+        expired = False
         try:
             while True:
                 await asyncio.sleep(self._keepalive_interval)
+                if time.monotonic() - prepared.idle_since >= self._idle_expiry:
+                    logger.debug(
+                        "Deepgram Warm-WebSocket nach %.0fs ungenutzt geschlossen",
+                        self._idle_expiry,
+                    )
+                    self._stats["expired"] += 1
+                    expired = True
+                    break
                 await prepared.connection.send_control(
                     ListenV1ControlMessage(type="KeepAlive")
                 )
@@ -657,15 +788,52 @@ class DeepgramWarmConnectionManager:
             raise
         except Exception as exc:
             logger.debug("Deepgram Warm-WebSocket KeepAlive fehlgeschlagen: %s", exc)
-            if self._prepared is prepared:
-                self._prepared = None
-            prepared.keepalive_task = None
-            await self._close_prepared(prepared, cancel_keepalive=False)
-            with self._state_lock:
-                desired = self._desired_config
-                should_reconnect = self._enabled and not self._closing
-            if desired is not None and should_reconnect:
-                await self._request_prewarm(desired)
+        self._remove_from_pool(prepared)
+        prepared.keepalive_task = None
+        await self._close_prepared(prepared, cancel_keepalive=False)
+        if expired:
+            # Ungenutzt: erst beim nächsten prewarm()/Diktat neu verbinden,
+            # sonst baut der Pool im Leerlauf alle idle_expiry Sekunden neu auf
+            return
+        with self._state_lock:
+            desired = self._desired_config
+            should_reconnect = self._enabled and not self._closing
+        if desired is not None and should_reconnect:
+            await self._request_prewarm(desired)
+
+    def _claim(
+        self, config: DeepgramConnectionConfig
+    ) -> tuple[_PreparedDeepgramConnection | None, list[_PreparedDeepgramConnection]]:
+        """Pop the freshest open socket for ``config`` plus any stale ones."""
+        stale: list[_PreparedDeepgramConnection] = []
+        bucket = self._pool.get(config, [])
+        while bucket:
+            prepared = bucket.pop()
+            if self._connection_is_open(prepared.connection):
+                break
+            stale.append(prepared)
+        else:
+            prepared = None
+        if not bucket:
+            self._pool.pop(config, None)
+        return prepared, stale
+
+    def pool_stats(self) -> dict[str, Any]:
+        """Hit/miss counters and current pool occupancy."""
+        stats: dict[str, Any] = dict(self._stats)
+        claims = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / claims if claims else 0.0
+        stats["idle"] = sum(len(bucket) for bucket in list(self._pool.values()))
+        stats["pool_size"] = self._pool_size
+        return stats
+
+    def describe_pool(self) -> str:
+        stats = self.pool_stats()
+        return (
+            f"Warm-WebSocket-Pool: {stats['hits']} Treffer, {stats['misses']} ohne "
+            f"({stats['hit_rate']:.0%}), {stats['opened']} geöffnet, "
+            f"{stats['expired']} abgelaufen, {stats['evicted']} verdrängt"
+        )
 
     @asynccontextmanager
     async def _acquire_connection(
@@ -692,16 +860,24 @@ class DeepgramWarmConnectionManager:
 
         if warm_enabled:
             task = self._prewarm_task
-            if task is not None and not task.done() and self._prewarm_config == config:
+            if (
+                task is not None
+                and not task.done()
+                and self._prewarm_config == config
+                and self._ready_count(config) == 0
+            ):
                 await asyncio.gather(task, return_exceptions=True)
 
-            prepared, self._prepared = self._prepared, None
+            prepared, stale = self._claim(config)
+            for stale_prepared in stale:
+                await self._close_prepared(stale_prepared)
             if prepared is not None:
                 await self._stop_keepalive(prepared)
-                if prepared.config == config and self._connection_is_open(
-                    prepared.connection
-                ):
+                if self._connection_is_open(prepared.connection):
+                    self._stats["hits"] += 1
                     logger.info("Deepgram Warm-WebSocket übernommen")
+                    # Ersatz sofort verbinden, nicht erst nach dem Diktat
+                    await self._request_prewarm(config)
                     try:
                         yield prepared.connection, True
                     finally:
@@ -709,6 +885,7 @@ class DeepgramWarmConnectionManager:
                     return
                 await self._close_prepared(prepared)
 
+        self._stats["misses"] += 1
         logger.debug("Kein nutzbarer Warm-WebSocket; öffne frische Verbindung")
         async with _create_deepgram_connection(
             api_key,
@@ -718,6 +895,8 @@ class DeepgramWarmConnectionManager:
             channels=channels,
             **connection_kwargs,
         ) as connection:
+            if warm_enabled:
+                await self._request_prewarm(config)
             yield connection, False
 
     async def _stop_keepalive(self, prepared: _PreparedDeepgramConnection) -> None:
@@ -759,8 +938,9 @@ class DeepgramWarmConnectionManager:
         return getattr(state, "name", None) != "CLOSED"
 
     async def _has_ready_connection(self) -> bool:
-        prepared = self._prepared
-        return prepared is not None and self._connection_is_open(prepared.connection)
+        with self._state_lock:
+            desired = self._desired_config
+        return desired is not None and self._ready_count(desired) > 0
 
     async def _invalidate_async(self) -> None:
         task, self._prewarm_task = self._prewarm_task, None
@@ -768,8 +948,9 @@ class DeepgramWarmConnectionManager:
         if task is not None and task is not asyncio.current_task():
             task.cancel()
             await asyncio.gather(task, return_exceptions=True)
-        if self._prepared is not None:
-            prepared, self._prepared = self._prepared, None
+        pooled = [prepared for bucket in self._pool.values() for prepared in bucket]
+        self._pool.clear()
+        for prepared in pooled:
             await self._close_prepared(prepared)
         self._prewarm_complete.set()
 
@@ -785,6 +966,8 @@ class DeepgramWarmConnectionManager:
                 active.cancel()
                 await asyncio.gather(active, return_exceptions=True)
         await self._invalidate_async()
+        if self._stats["hits"] or self._stats["misses"]:
+            logger.info(self.describe_pool())
 
 
 # =============================================================================
@@ -816,8 +999,10 @@ def _create_mic_stream(
         Tuple (mic_stream, sample_rate)
     """
     import numpy as np
-    import sounddevice as sd
 
+    from audio.input_stream import get_sounddevice
+
+    sd = get_sounddevice()
     input_device, sample_rate = get_input_device()
     blocksize = _stream_blocksize(sample_rate)
 
@@ -838,6 +1023,308 @@ def _create_mic_stream(
     return mic_stream, sample_rate
 
 
+# =============================================================================
+# Frame Coalescing
+# =============================================================================
+
+# Obergrenze für das Zusammenfassen bereits wartender Chunks im Sender
+_MAX_SEND_FRAME_MS = 250
+
+
+def _frame_bytes(sample_rate: int, frame_ms: float) -> int:
+    """Bytes eines linear16-Frames von ``frame_ms`` Millisekunden."""
+    return int(sample_rate * WHISPER_CHANNELS * 2 * frame_ms / 1000)
+
+
+class _FrameCoalescer:
+    """Bündelt Audio-Blöcke zu größeren Frames vor der Übergabe an den Loop.
+
+    PortAudio liefert unter Windows 20ms-Blöcke; jeder einzeln bedeutet ein
+    ``call_soon_threadsafe`` (Loop-Wakeup) und einen eigenen WebSocket-Frame.
+    Hier werden Blöcke gesammelt, bis ``frame_ms`` erreicht sind. ``flush()``
+    übergibt den Rest (Stop/Finalize). Vor ``configure()`` und bei
+    ``frame_ms <= 0`` werden Blöcke unverändert durchgereicht.
+
+    Thread-safe: ``push`` läuft im Audio-/Forwarder-Thread, ``flush`` auch im
+    Event-Loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        loop: asyncio.AbstractEventLoop,
+        audio_queue: asyncio.Queue[bytes | None],
+        stats: StreamSendStats,
+        frame_ms: float = DEEPGRAM_SEND_FRAME_MS,
+    ) -> None:
+        self._loop = loop
+        self._audio_queue = audio_queue
+        self._stats = stats
+        self._frame_ms = frame_ms
+        self._frame_bytes = 0
+        self._parts: list[bytes] = []
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def configure(self, sample_rate: int) -> None:
+        """Setzt die Frame-Größe, sobald die Sample-Rate bekannt ist."""
+        with self._lock:
+            self._frame_bytes = (
+                _frame_bytes(sample_rate, self._frame_ms) if self._frame_ms > 0 else 0
+            )
+
+    def push(self, chunk: bytes, *, may_block: bool = False) -> None:
+        with self._lock:
+            self._stats.blocks_in += 1
+            if self._frame_bytes <= 0 and not self._parts:
+                frame = chunk
+            else:
+                self._parts.append(chunk)
+                self._size += len(chunk)
+                if self._size < self._frame_bytes:
+                    return
+                frame = self._take_locked()
+            self._stats.handoffs += 1
+        _handoff_audio(self._loop, self._audio_queue, frame, may_block=may_block)
+
+    def flush(self) -> None:
+        """Übergibt angesammelte Blöcke sofort (Stop, Finalize)."""
+        with self._lock:
+            if not self._parts:
+                return
+            frame = self._take_locked()
+            self._stats.handoffs += 1
+        _handoff_audio(self._loop, self._audio_queue, frame)
+
+    def _take_locked(self) -> bytes:
+        frame = self._parts[0] if len(self._parts) == 1 else b"".join(self._parts)
+        self._parts = []
+        self._size = 0
+        return frame
+
+
+def _handoff_audio(
+    loop: asyncio.AbstractEventLoop,
+    audio_queue: asyncio.Queue[bytes | None],
+    chunk: bytes,
+    *,
+    may_block: bool = False,
+) -> None:
+    """Übergibt einen Chunk threadsafe an den Event-Loop.
+
+    Backpressure (Policy ``block``) nur mit ``may_block``: der
+    PortAudio-Callback darf nie warten, bei ihm greift sofort die Overflow-
+    Behandlung der Queue.
+    """
+    if may_block and isinstance(audio_queue, _AudioChannel):
+        audio_queue.wait_for_space(len(chunk))
+    loop.call_soon_threadsafe(audio_queue.put_nowait, chunk)
+
+
+def _enqueue_audio(
+    chunk: bytes,
+    *,
+    loop: asyncio.AbstractEventLoop,
+    audio_queue: asyncio.Queue[bytes | None],
+    coalescer: _FrameCoalescer | None,
+    may_block: bool = False,
+) -> None:
+    """Übergibt einen Block an den Event-Loop (gebündelt, falls Coalescer aktiv)."""
+    if coalescer is not None:
+        coalescer.push(chunk, may_block=may_block)
+    else:
+        _handoff_audio(loop, audio_queue, chunk, may_block=may_block)
+
+
+def _coalesce_queued_audio(
+    chunk: bytes,
+    audio_queue: asyncio.Queue[bytes | None],
+    max_bytes: int,
+) -> tuple[bytes, bool]:
+    """Hängt bereits wartende Chunks an (bis ``max_bytes``).
+
+    Returns:
+        (Frame, Sentinel erreicht)
+    """
+    parts = [chunk]
+    size = len(chunk)
+    while size < max_bytes:
+        try:
+            queued = audio_queue.get_nowait()
+        except asyncio.QueueEmpty:
+            break
+        if queued is None:
+            return b"".join(parts), True
+        parts.append(queued)
+        size += len(queued)
+    return (chunk if len(parts) == 1 else b"".join(parts)), False
+
+
+# =============================================================================
+# Audio Channel (begrenzte Queue mit Backpressure)
+# =============================================================================
+
+# Obergrenze für einen per "merge" angewachsenen Frame (Aufholen nach Stall)
+_MAX_MERGED_FRAME_MS = 1000
+# Producer-Wartezeit bei Policy "block", bevor auf "drop-oldest" zurückgefallen wird
+_QUEUE_BLOCK_TIMEOUT = 0.5
+# Ab diesem Alter des ältesten ungesendeten Chunks einmalig warnen
+_QUEUE_AGE_WARN_SECONDS = 2.0
+
+
+class _AudioChannel(asyncio.Queue):
+    """Audio-Queue mit Byte-Kapazität und expliziter Overflow-Policy.
+
+    Drop-in für ``asyncio.Queue[bytes | None]``: Producer übergeben weiter
+    per ``call_soon_threadsafe(put_nowait, chunk)``, der Sender liest per
+    ``get``/``get_nowait``. Ist mehr als ``max_seconds`` Audio ungesendet
+    (Netzwerk-Stall), greift die Policy:
+
+    - ``merge``: neues Audio wird an den jüngsten Frame angehängt (verlustfrei,
+      weniger Sends beim Aufholen); ab doppelter Kapazität wie ``drop-oldest``.
+    - ``drop-oldest``: ältestes Audio wird verworfen und gezählt.
+    - ``block``: der Warm-Stream-Forwarder wartet bis zu ``_QUEUE_BLOCK_TIMEOUT``
+      auf Platz, danach wie ``drop-oldest``. Der PortAudio-Callback und der
+      Event-Loop warten nie; für sie gilt direkt ``drop-oldest``.
+
+    Der Sentinel ``None`` zählt nicht zur Kapazität und wird nie verworfen.
+    High-Water-Marks, Drops und das Alter des ältesten Chunks landen in
+    ``stats``; ``oldest_age_s()`` liefert das aktuelle Alter als Gauge (der
+    Sender tastet es ab, solange nichts gesendet wird).
+    """
+
+    def __init__(
+        self,
+        *,
+        stats: StreamSendStats,
+        max_seconds: float = DEEPGRAM_QUEUE_SECONDS,
+        policy: str | None = None,
+        sample_rate: int = WHISPER_SAMPLE_RATE,
+        session_id: str = "",
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__()
+        self._stats = stats
+        self._max_seconds = max_seconds
+        self.policy = policy or get_deepgram_queue_policy()
+        self._session_id = session_id
+        self._clock = clock
+        self._bytes = 0
+        self._space = threading.Condition()
+        self._block_expired = False
+        self._age_warned = False
+        self._loop_thread = threading.get_ident()
+        self.configure(sample_rate)
+
+    def configure(self, sample_rate: int) -> None:
+        """Rechnet die Kapazität auf die tatsächliche Sample-Rate um."""
+        self.max_bytes = _frame_bytes(sample_rate, self._max_seconds * 1000)
+        self._max_merged_bytes = _frame_bytes(sample_rate, _MAX_MERGED_FRAME_MS)
+
+    @property
+    def queued_bytes(self) -> int:
+        return self._bytes
+
+    def oldest_age_s(self) -> float:
+        """Alter des ältesten ungesendeten Chunks (0 bei leerer Queue)."""
+        for enqueued_at, item in self._queue:
+            if item is not None:
+                return self._clock() - enqueued_at
+        return 0.0
+
+    def wait_for_space(self, size: int) -> None:
+        """Backpressure für Producer-Threads (nur Policy ``block``)."""
+        if self.policy != "block" or threading.get_ident() == self._loop_thread:
+            return
+        start = time.perf_counter()
+        with self._space:
+            if self._block_expired:
+                return  # Stall läuft schon: Audio-Thread nicht weiter ausbremsen
+            if not self._space.wait_for(
+                lambda: self._bytes + size <= self.max_bytes,
+                timeout=_QUEUE_BLOCK_TIMEOUT,
+            ):
+                self._block_expired = True
+        self._stats.blocked_ms += (time.perf_counter() - start) * 1000
+
+    # asyncio.Queue-Hooks (laufen im Event-Loop-Thread)
+
+    def _init(self, maxsize: int) -> None:
+        self._queue: collections.deque[tuple[float, bytes | None]] = (
+            collections.deque()
+        )
+
+    def _put(self, item: bytes | None) -> None:
+        now = self._clock()
+        if item is None:
+            self._queue.append((now, None))
+            return
+        size = len(item)
+        with self._space:
+            if self._bytes + size > self.max_bytes:
+                if self._try_merge_locked(item):
+                    self._bytes += size
+                    self._record_high_water()
+                    return
+                limit = self.max_bytes * (2 if self.policy == "merge" else 1)
+                self._drop_oldest_locked(limit - size)
+            self._queue.append((now, item))
+            self._bytes += size
+        self._record_high_water()
+
+    def _get(self) -> bytes | None:
+        enqueued_at, item = self._queue.popleft()
+        if item is None:
+            return None
+        with self._space:
+            self._bytes -= len(item)
+            if self._bytes <= self.max_bytes // 2:
+                self._block_expired = False
+            self._space.notify_all()
+        age = self._clock() - enqueued_at
+        self._stats.max_queue_age_ms = max(self._stats.max_queue_age_ms, age * 1000)
+        if age >= _QUEUE_AGE_WARN_SECONDS and not self._age_warned:
+            self._age_warned = True
+            logger.warning(
+                f"[{self._session_id}] Audio-Rückstau: ältester Chunk {age:.1f}s alt, "
+                f"{self._bytes / 1024:.0f} KB ungesendet"
+            )
+        return item
+
+    def _try_merge_locked(self, item: bytes) -> bool:
+        if self.policy != "merge" or self._bytes + len(item) > 2 * self.max_bytes:
+            return False
+        if not self._queue:
+            return False
+        enqueued_at, tail = self._queue[-1]
+        if tail is None or len(tail) + len(item) > self._max_merged_bytes:
+            return False
+        self._queue[-1] = (enqueued_at, tail + item)
+        self._stats.merged_chunks += 1
+        return True
+
+    def _drop_oldest_locked(self, limit: int) -> None:
+        while self._bytes > max(limit, 0) and self._queue:
+            enqueued_at, oldest = self._queue[0]
+            if oldest is None:
+                break
+            self._queue.popleft()
+            self._bytes -= len(oldest)
+            if not self._stats.dropped_chunks:
+                logger.warning(
+                    f"[{self._session_id}] Audio-Queue voll "
+                    f"({self._max_seconds:g}s, Policy {self.policy}), "
+                    "verwerfe ältestes Audio"
+                )
+            self._stats.dropped_chunks += 1
+            self._stats.dropped_bytes += len(oldest)
+
+    def _record_high_water(self) -> None:
+        stats = self._stats
+        stats.max_queue_depth = max(stats.max_queue_depth, len(self._queue))
+        stats.max_queue_bytes = max(stats.max_queue_bytes, self._bytes)
+
+
 # =============================================================================
 # Audio Callback Factory
 # =============================================================================
@@ -850,6 +1337,7 @@ def _handle_buffered_audio(
     session_id: str,
     loop: asyncio.AbstractEventLoop,
     audio_queue: asyncio.Queue[bytes | None],
+    coalescer: _FrameCoalescer | None = None,
 ) -> None:
     """Handhabt Audio im Buffer-Mode (CLI).
 
@@ -862,7 +1350,10 @@ def _handle_buffered_audio(
         if is_buffering:
             if len(buffer_state.buffer) < CLI_BUFFER_LIMIT:
                 buffer_state.buffer.append(audio_bytes)
-            elif not state.buffer_overflow_logged:
+                return
+            state.send_stats.dropped_chunks += 1
+            state.send_stats.dropped_bytes += len(audio_bytes)
+            if not state.buffer_overflow_logged:
                 logger.warning(
                     f"[{session_id}] Audio-Buffer voll ({CLI_BUFFER_LIMIT} Chunks), "
                     "verwerfe weiteres Audio bis WebSocket verbunden"
@@ -871,7 +1362,7 @@ def _handle_buffered_audio(
             return
 
     # Buffering deaktiviert: Direkt an Queue senden (außerhalb des Locks)
-    loop.call_soon_threadsafe(audio_queue.put_nowait, audio_bytes)
+    _enqueue_audio(audio_bytes, loop=loop, audio_queue=audio_queue, coalescer=coalescer)
 
 
 def _create_audio_callback(
@@ -882,6 +1373,8 @@ def _create_audio_callback(
     session_id: str,
     buffer_state: BufferState | None = None,
     audio_level_callback: Callable[[float], None] | None = None,
+    coalescer: _FrameCoalescer | None = None,
+    speech_vad: StreamingVAD | None = None,
 ) -> Callable[[np.ndarray, int, Any, Any], None]:
     """Factory für Audio-Callbacks.
 
@@ -897,6 +1390,9 @@ def _create_audio_callback(
         session_id: Session-ID für Logging
         buffer_state: Optional BufferState für CLI-Mode
         audio_level_callback: Optional Callback für Audio-Level (Visualisierung)
+        coalescer: Optional Frame-Bündelung vor der Übergabe an den Loop
+        speech_vad: Optionale Streaming-VAD; wird mit jedem Block gefüttert
+            und liefert dann auch den Audio-Level (Start-Trigger des Aufrufers)
 
     Returns:
         Callback-Funktion für sounddevice.InputStream
@@ -918,20 +1414,28 @@ def _create_audio_callback(
         # Bis dahin sollen alle Chunks verarbeitet werden (verhindert abgeschnittene Wörter).
 
         # Audio-Level für Visualisierung berechnen (optional)
+        rms: float | None = None
+        if speech_vad is not None:
+            rms = speech_vad.feed(indata, scale=INT16_MAX)
         if audio_level_callback is not None:
-            rms = float(np.sqrt(np.mean(indata.astype(np.float32) ** 2)) / INT16_MAX)
+            if rms is None:
+                rms = float(
+                    np.sqrt(np.mean(indata.astype(np.float32) ** 2)) / INT16_MAX
+                )
             audio_level_callback(rms)
 
         audio_bytes = indata.tobytes()
 
         # Direct Mode: Sofort an Queue senden
         if buffer_state is None:
-            loop.call_soon_threadsafe(audio_queue.put_nowait, audio_bytes)
+            _enqueue_audio(
+                audio_bytes, loop=loop, audio_queue=audio_queue, coalescer=coalescer
+            )
             return
 
         # Buffer Mode: Puffern bis WebSocket verbunden
         _handle_buffered_audio(
-            buffer_state, audio_bytes, state, session_id, loop, audio_queue
+            buffer_state, audio_bytes, state, session_id, loop, audio_queue, coalescer
         )
 
     return audio_callback
@@ -969,8 +1473,12 @@ def _forward_warm_chunk(
     loop: asyncio.AbstractEventLoop,
     audio_queue: asyncio.Queue[bytes | None],
     chunk: bytes,
+    coalescer: _FrameCoalescer | None = None,
 ) -> None:
-    loop.call_soon_threadsafe(audio_queue.put_nowait, chunk)
+    # Forwarder-Thread statt Audio-Callback: Backpressure erlaubt
+    _enqueue_audio(
+        chunk, loop=loop, audio_queue=audio_queue, coalescer=coalescer, may_block=True
+    )
 
 
 def _forward_warm_stream_until_stop(
@@ -980,11 +1488,14 @@ def _forward_warm_stream_until_stop(
     loop: asyncio.AbstractEventLoop,
     audio_queue: asyncio.Queue[bytes | None],
     session_id: str,
+    coalescer: _FrameCoalescer | None = None,
 ) -> None:
     while not state.stop_event.is_set():
         try:
             chunk = warm_source.audio_queue.get(timeout=AUDIO_QUEUE_POLL_INTERVAL)
-            _forward_warm_chunk(loop=loop, audio_queue=audio_queue, chunk=chunk)
+            _forward_warm_chunk(
+                loop=loop, audio_queue=audio_queue, chunk=chunk, coalescer=coalescer
+            )
         except queue.Empty:
             continue
         except Exception as e:
@@ -998,12 +1509,15 @@ def _drain_available_warm_chunks(
     warm_source: WarmStreamSource,
     loop: asyncio.AbstractEventLoop,
     audio_queue: asyncio.Queue[bytes | None],
+    coalescer: _FrameCoalescer | None = None,
 ) -> int:
     drained = 0
     while True:
         try:
             chunk = warm_source.audio_queue.get_nowait()
-            _forward_warm_chunk(loop=loop, audio_queue=audio_queue, chunk=chunk)
+            _forward_warm_chunk(
+                loop=loop, audio_queue=audio_queue, chunk=chunk, coalescer=coalescer
+            )
             drained += 1
         except (queue.Empty, RuntimeError):
             return drained
@@ -1014,6 +1528,7 @@ def _pre_drain_warm_stream(
     warm_source: WarmStreamSource,
     loop: asyncio.AbstractEventLoop,
     audio_queue: asyncio.Queue[bytes | None],
+    coalescer: _FrameCoalescer | None = None,
 ) -> int:
     """Drain in-flight warm-stream chunks before the callback is disarmed.
 
@@ -1032,7 +1547,9 @@ def _pre_drain_warm_stream(
     while time.monotonic() < hard_deadline:
         try:
             chunk = warm_source.audio_queue.get(timeout=DRAIN_POLL_INTERVAL)
-            _forward_warm_chunk(loop=loop, audio_queue=audio_queue, chunk=chunk)
+            _forward_warm_chunk(
+                loop=loop, audio_queue=audio_queue, chunk=chunk, coalescer=coalescer
+            )
             drained += 1
             empty_count = 0
         except queue.Empty:
@@ -1053,6 +1570,7 @@ def _post_drain_warm_stream(
     loop: asyncio.AbstractEventLoop,
     audio_queue: asyncio.Queue[bytes | None],
     session_id: str,
+    coalescer: _FrameCoalescer | None = None,
 ) -> None:
     if warm_source.drain_event is not None:
         warm_source.drain_event.set()
@@ -1072,7 +1590,12 @@ def _post_drain_warm_stream(
                 break
             try:
                 chunk = warm_source.audio_queue.get(timeout=DRAIN_POLL_INTERVAL)
-                _forward_warm_chunk(loop=loop, audio_queue=audio_queue, chunk=chunk)
+                _forward_warm_chunk(
+                    loop=loop,
+                    audio_queue=audio_queue,
+                    chunk=chunk,
+                    coalescer=coalescer,
+                )
                 drained += 1
                 empty_count = 0
             except queue.Empty:
@@ -1098,6 +1621,7 @@ def _run_warm_stream_forwarder(
     loop: asyncio.AbstractEventLoop,
     audio_queue: asyncio.Queue[bytes | None],
     session_id: str,
+    coalescer: _FrameCoalescer | None = None,
 ) -> None:
     """Leitet Audio von sync Queue an async Queue weiter und drained Rest-Chunks."""
     _forward_warm_stream_until_stop(
@@ -1106,6 +1630,7 @@ def _run_warm_stream_forwarder(
         loop=loop,
         audio_queue=audio_queue,
         session_id=session_id,
+        coalescer=coalescer,
     )
 
     # Zwischen queue.get(timeout) und stop_event Check können Chunks eintreffen.
@@ -1113,6 +1638,7 @@ def _run_warm_stream_forwarder(
         warm_source=warm_source,
         loop=loop,
         audio_queue=audio_queue,
+        coalescer=coalescer,
     )
     if immediate_drained > 0:
         logger.debug(f"[{session_id}] Immediate-Drain: {immediate_drained} Chunks")
@@ -1122,6 +1648,7 @@ def _run_warm_stream_forwarder(
         warm_source=warm_source,
         loop=loop,
         audio_queue=audio_queue,
+        coalescer=coalescer,
     )
     if pre_drained > 0:
         logger.debug(f"[{session_id}] Pre-Drain: {pre_drained} Chunks geleert")
@@ -1131,7 +1658,11 @@ def _run_warm_stream_forwarder(
         loop=loop,
         audio_queue=audio_queue,
         session_id=session_id,
+        coalescer=coalescer,
     )
+    # Letzten Teil-Frame vor dem Sentinel übergeben
+    if coalescer is not None:
+        coalescer.flush()
 
 
 def _init_warm_stream(
@@ -1142,6 +1673,7 @@ def _init_warm_stream(
     session_id: str,
     play_ready: bool,
     stream_start: float,
+    coalescer: _FrameCoalescer | None = None,
 ) -> AudioSourceResult:
     """Initialisiert Audio-Source für Warm-Stream-Mode.
 
@@ -1152,6 +1684,9 @@ def _init_warm_stream(
         f"[{session_id}] Warm-Stream Mode: {warm_source.sample_rate}Hz, instant-start"
     )
 
+    if coalescer is not None:
+        coalescer.configure(warm_source.sample_rate)
+
     # Arm the stream - ab jetzt werden Samples gesammelt
     warm_source.arm_event.set()
 
@@ -1163,6 +1698,7 @@ def _init_warm_stream(
             "loop": loop,
             "audio_queue": audio_queue,
             "session_id": session_id,
+            "coalescer": coalescer,
         },
         daemon=True,
         name="WarmStreamForwarder",
@@ -1187,6 +1723,7 @@ def _init_daemon_stream(
     session_id: str,
     play_ready: bool,
     stream_start: float,
+    coalescer: _FrameCoalescer | None = None,
 ) -> AudioSourceResult:
     """Initialisiert Audio-Source für Daemon-Mode.
 
@@ -1205,9 +1742,12 @@ def _init_daemon_stream(
         audio_queue=audio_queue,
         session_id=session_id,
         buffer_state=None,  # Direct Mode
+        coalescer=coalescer,
     )
 
     mic_stream, sample_rate = _create_mic_stream(callback, session_id, stream_start)
+    if coalescer is not None:
+        coalescer.configure(sample_rate)
 
     _log_init_complete(
         session_id, stream_start, "Daemon-Mode Mikrofon bereit", play_ready
@@ -1228,6 +1768,8 @@ def _init_cli_stream(
     play_ready: bool,
     stream_start: float,
     audio_level_callback: Callable[[float], None] | None = None,
+    coalescer: _FrameCoalescer | None = None,
+    speech_vad: StreamingVAD | None = None,
 ) -> AudioSourceResult:
     """Initialisiert Audio-Source für CLI-Mode.
 
@@ -1243,9 +1785,13 @@ def _init_cli_stream(
         session_id=session_id,
         buffer_state=buffer_state,
         audio_level_callback=audio_level_callback,
+        coalescer=coalescer,
+        speech_vad=speech_vad,
     )
 
     mic_stream, sample_rate = _create_mic_stream(callback, session_id, stream_start)
+    if coalescer is not None:
+        coalescer.configure(sample_rate)
 
     _log_init_complete(session_id, stream_start, "CLI-Mode Mikrofon bereit", play_ready)
 
@@ -1332,14 +1878,21 @@ def _handle_interim_transcript(
     now = time.perf_counter()
     if transcript == state.last_interim_written_text:
         return
+
+    channel = get_interim_channel()
+    if channel.has_subscribers():
+        # Push an Abonnenten: sofort, ohne Throttle und ohne Dateischreiben
+        _notify_interim_callback(interim_text_callback, transcript, session_id)
+        channel.publish(transcript, session_id=session_id)
+        state.last_interim_write = now
+        state.last_interim_written_text = transcript
+        return
+
+    # Fallback ohne Abonnenten: gedrosselt in die Interim-Datei (CLI, Skripte)
     if (now - state.last_interim_write) * 1000 < INTERIM_THROTTLE_MS:
         return
 
-    if interim_text_callback is not None:
-        try:
-            interim_text_callback(transcript)
-        except Exception as e:
-            logger.debug(f"[{session_id}] Interim-Callback fehlgeschlagen: {e}")
+    _notify_interim_callback(interim_text_callback, transcript, session_id)
     try:
         _write_interim_text(INTERIM_FILE, transcript)
         state.last_interim_write = now
@@ -1349,6 +1902,19 @@ def _handle_interim_transcript(
         logger.warning(f"[{session_id}] Interim-Write fehlgeschlagen: {e}")
 
 
+def _notify_interim_callback(
+    callback: Callable[[str], None] | None,
+    transcript: str,
+    session_id: str,
+) -> None:
+    if callback is None:
+        return
+    try:
+        callback(transcript)
+    except Exception as e:
+        logger.debug(f"[{session_id}] Interim-Callback fehlgeschlagen: {e}")
+
+
 def _create_message_handler(
     state: StreamState,
     session_id: str,
@@ -1753,6 +2319,8 @@ def _init_audio_source(
     play_ready: bool,
     stream_start: float,
     audio_level_callback: Callable[[float], None] | None,
+    coalescer: _FrameCoalescer | None = None,
+    speech_vad: StreamingVAD | None = None,
 ) -> AudioSourceResult:
     if mode == AudioSourceMode.WARM_STREAM:
         assert warm_stream_source is not None
@@ -1764,6 +2332,7 @@ def _init_audio_source(
             session_id=session_id,
             play_ready=play_ready,
             stream_start=stream_start,
+            coalescer=coalescer,
         )
     if mode == AudioSourceMode.DAEMON:
         assert early_buffer is not None
@@ -1775,6 +2344,7 @@ def _init_audio_source(
             session_id=session_id,
             play_ready=play_ready,
             stream_start=stream_start,
+            coalescer=coalescer,
         )
 
     return _init_cli_stream(
@@ -1785,6 +2355,8 @@ def _init_audio_source(
         play_ready=play_ready,
         stream_start=stream_start,
         audio_level_callback=audio_level_callback,
+        coalescer=coalescer,
+        speech_vad=speech_vad,
     )
 
 
@@ -1836,8 +2408,14 @@ async def _send_audio_to_deepgram(
     state: StreamState,
     audio_queue: asyncio.Queue[bytes | None],
     session_id: str,
+    max_frame_bytes: int = 0,
 ) -> None:
-    """Sendet Audio-Chunks an Deepgram bis Sentinel."""
+    """Sendet Audio-Chunks an Deepgram bis Sentinel.
+
+    Mit ``max_frame_bytes`` werden bereits wartende Chunks (Early-Buffer,
+    CLI-Puffer, Rückstau) zu einem Frame zusammengefasst.
+    """
+    stats = state.send_stats
     last_chunk_at = time.monotonic()
     try:
         while True:
@@ -1847,11 +2425,25 @@ async def _send_audio_to_deepgram(
                 )
                 if chunk is None:
                     break
+                stats.max_queue_depth = max(stats.max_queue_depth, audio_queue.qsize() + 1)
+                reached_sentinel = False
+                if max_frame_bytes > 0:
+                    chunk, reached_sentinel = _coalesce_queued_audio(
+                        chunk, audio_queue, max_frame_bytes
+                    )
                 last_chunk_at = time.monotonic()
                 await asyncio.wait_for(
                     connection.send_media(chunk), timeout=SEND_MEDIA_TIMEOUT
                 )
+                stats.frames_sent += 1
+                stats.bytes_sent += len(chunk)
+                if reached_sentinel:
+                    break
             except asyncio.TimeoutError:
+                # Nichts gesendet (Stall oder Pause): Rückstau trotzdem messen
+                if isinstance(audio_queue, _AudioChannel):
+                    age_ms = audio_queue.oldest_age_s() * 1000
+                    stats.max_queue_age_ms = max(stats.max_queue_age_ms, age_ms)
                 if (
                     state.stop_event.is_set()
                     and time.monotonic() - last_chunk_at >= FINALIZE_TIMEOUT
@@ -1887,6 +2479,7 @@ async def _stop_audio_source_before_shutdown(
     *,
     audio_result: AudioSourceResult,
     session_id: str,
+    coalescer: _FrameCoalescer | None = None,
 ) -> None:
     if audio_result.forwarder_thread is not None:
         await _finish_warm_forwarder(audio_result, session_id)
@@ -1901,6 +2494,9 @@ async def _stop_audio_source_before_shutdown(
         logger.debug(f"[{session_id}] Mikrofon gestoppt (vor Graceful Shutdown)")
     except Exception as e:
         logger.debug(f"[{session_id}] Mikrofon-Stop fehlgeschlagen: {e}")
+    # Mikrofon steht: angefangenen Frame übergeben (vor Tail-Padding/Sentinel)
+    if coalescer is not None:
+        coalescer.flush()
 
 
 def _cleanup_deepgram_audio_source(
@@ -1945,6 +2541,7 @@ async def deepgram_stream_core(
     warm_stream_source: WarmStreamSource | None = None,
     stop_grace_seconds: "float | Callable[[], float]" = 0.0,
     connection_factory: DeepgramConnectionFactory | None = None,
+    speech_vad: StreamingVAD | None = None,
 ) -> str:
     """Gemeinsamer Streaming-Core für Deepgram (SDK v5.3).
 
@@ -1961,6 +2558,7 @@ async def deepgram_stream_core(
         stop_grace_seconds: Zusätzliche Aufnahmezeit nach externem Stop-Signal
             (float oder Callable; Callables werden erst beim Stop ausgewertet)
         connection_factory: Optionaler Connection-Provider für einen vorgewärmten Socket
+        speech_vad: Streaming-VAD, die im CLI-Mode jeden Mikrofon-Block erhält
 
     Drei Modi:
     - CLI (early_buffer=None): Buffering während WebSocket-Connect
@@ -1994,7 +2592,10 @@ async def deepgram_stream_core(
     # Zentraler State
     state = StreamState()
     loop = asyncio.get_running_loop()
-    audio_queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+    audio_queue = _AudioChannel(stats=state.send_stats, session_id=session_id)
+    coalescer = _FrameCoalescer(
+        loop=loop, audio_queue=audio_queue, stats=state.send_stats
+    )
 
     # Stop-Mechanismus einrichten
     _setup_stop_mechanism(
@@ -2021,7 +2622,10 @@ async def deepgram_stream_core(
         play_ready=play_ready,
         stream_start=stream_start,
         audio_level_callback=audio_level_callback,
+        coalescer=coalescer,
+        speech_vad=speech_vad,
     )
+    audio_queue.configure(audio_result.sample_rate)
 
     create_connection = connection_factory or _create_deepgram_connection
 
@@ -2060,6 +2664,11 @@ async def deepgram_stream_core(
                     state=state,
                     audio_queue=audio_queue,
                     session_id=session_id,
+                    max_frame_bytes=(
+                        _frame_bytes(audio_result.sample_rate, _MAX_SEND_FRAME_MS)
+                        if DEEPGRAM_SEND_FRAME_MS > 0
+                        else 0
+                    ),
                 )
             )
             listen_task = asyncio.create_task(
@@ -2072,7 +2681,12 @@ async def deepgram_stream_core(
             # Warten auf Stop
             await state.stop_event.wait()
             logger.info(f"[{session_id}] Stop-Signal empfangen")
-            _emit_latency_event(latency_event_callback, "deepgram_stop_signal")
+            _emit_latency_event(
+                latency_event_callback,
+                "deepgram_stop_signal",
+                queue_age_ms=round(audio_queue.oldest_age_s() * 1000, 1),
+                queued_bytes=audio_queue.queued_bytes,
+            )
 
             # Interim-Datei sofort löschen
             INTERIM_FILE.unlink(missing_ok=True)
@@ -2084,6 +2698,7 @@ async def deepgram_stream_core(
             await _stop_audio_source_before_shutdown(
                 audio_result=audio_result,
                 session_id=session_id,
+                coalescer=coalescer,
             )
 
             # Graceful Shutdown durchführen
@@ -2107,6 +2722,24 @@ async def deepgram_stream_core(
         # Signal-Handler entfernen
         _cleanup_stop_mechanism(loop, external_stop_event)
 
+    if state.send_stats.dropped_chunks:
+        logger.warning(f"[{session_id}] Audio-Versand: {state.send_stats.describe()}")
+    else:
+        logger.debug(f"[{session_id}] Audio-Versand: {state.send_stats.describe()}")
+    _emit_latency_event(
+        latency_event_callback,
+        "deepgram_send_stats",
+        frames=state.send_stats.frames_sent,
+        bytes=state.send_stats.bytes_sent,
+        blocks=state.send_stats.blocks_in,
+        handoffs=state.send_stats.handoffs,
+        max_queue_depth=state.send_stats.max_queue_depth,
+        max_queue_bytes=state.send_stats.max_queue_bytes,
+        max_queue_age_ms=round(state.send_stats.max_queue_age_ms, 1),
+        dropped_chunks=state.send_stats.dropped_chunks,
+        dropped_bytes=state.send_stats.dropped_bytes,
+    )
+
     if state.stream_error:
         raise state.stream_error
 
@@ -8,10 +8,12 @@ from pathlib import Path
 from utils.timing import timed_operation
 
 from config import DEFAULT_GROQ_MODEL
+from ._audio_upload import EncodedAudio
 from ._client_cache import EnvClientCache, build_cached_env_client_getter
 from ._response_utils import log_transcription_result, require_text_response
 from ._transcription_request import (
     execute_audio_transcription_request,
+    maybe_transcribe_file_in_chunks,
     resolve_transcription_request,
 )
 from .base import EnvValidatedProvider
@@ -53,14 +55,14 @@ class GroqProvider(EnvValidatedProvider):
 
     def transcribe(
         self,
-        audio_path: Path,
+        audio_path: Path | EncodedAudio,
         model: str | None = None,
         language: str | None = None,
     ) -> str:
         """Transkribiert Audio über Groq API.
 
         Args:
-            audio_path: Pfad zur Audio-Datei
+            audio_path: Pfad zur Audio-Datei oder In-Memory-Payload
             model: Modell (default: whisper-large-v3)
             language: Sprachcode oder None für Auto-Detection
 
@@ -69,6 +71,17 @@ class GroqProvider(EnvValidatedProvider):
         """
         self._validate()
 
+        # Lange Dateien: an Sprechpausen teilen und parallel hochladen
+        chunked = maybe_transcribe_file_in_chunks(
+            audio_path,
+            provider_name=self.name,
+            transcribe_chunk=lambda chunk: self.transcribe(
+                chunk, model=model, language=language
+            ),
+        )
+        if chunked is not None:
+            return chunked
+
         request = resolve_transcription_request(
             audio_path,
             model=model,
@@ -5,6 +5,13 @@ Standardmäßig nutzt er openai-whisper (PyTorch). Optional kann über
 (CTranslate2) genutzt werden. Auf Apple Silicon kann optional auch
 `PULSESCRIBE_LOCAL_BACKEND=mlx` (mlx-whisper / Metal) oder
 `PULSESCRIBE_LOCAL_BACKEND=lightning` (lightning-whisper-mlx, ~4x schneller) genutzt werden.
+
+Mit `PULSESCRIBE_LOCAL_MODEL_SERVER=true` laufen Modelle und Transkription in
+einem eigenen Prozess (siehe `providers.local_server`), der Daemon-Neustarts
+überlebt; ist er nicht erreichbar, transkribiert der Provider wie bisher selbst.
+
+Mit `PULSESCRIBE_LOCAL_STREAMING=true` liefert faster-whisper schon während
+der Aufnahme Interim-Text (`create_streaming_session`).
 """
 
 import gc
@@ -15,9 +22,11 @@ import sys
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from collections.abc import Callable
 from contextlib import contextmanager
+from enum import Enum, auto
 from pathlib import Path
-from typing import Any, Generator
+from typing import TYPE_CHECKING, Any, Generator, Literal, TypeVar
 
 from config import (
     DEFAULT_LOCAL_MODEL,
@@ -25,19 +34,29 @@ from config import (
     PRELOAD_WARMUP_DURATION,
     USER_CONFIG_DIR,
     WHISPER_SAMPLE_RATE,
+    get_local_model_cache_budget_mb,
+    get_local_model_server_enabled,
+    get_local_profile_enabled,
+    get_local_streaming_interval_seconds,
 )
-from utils.env import get_env_bool, get_env_int
+from utils.env import get_env_bool, get_env_int, getenv
 from utils.local_backend import (
     DEFAULT_LOCAL_BACKEND,
     LOCAL_BACKEND_ALIASES,
     VALID_LOCAL_BACKENDS,
     normalize_local_backend,
 )
+from utils.local_profile import LocalRuntimeProfile, load_local_profile
 from ._language import is_auto_language
+from ._local_streaming import LocalStreamingSession, TimedWord
+from ._model_cache import ModelCache, ModelCacheStats
 from utils.logging import log
 from utils.timing import timed_operation
 from utils.vocabulary import load_vocabulary
 
+if TYPE_CHECKING:
+    from .local_server import ModelServerClient
+
 logger = logging.getLogger("pulsescribe.providers.local")
 
 # Command for missing cuDNN libraries
@@ -53,6 +72,19 @@ _LOCAL_VOCAB_KEYWORDS_MAX = 50
 _BACKENDS_WITHOUT_BEAM_SEARCH = ("mlx", "lightning")
 _LIGHTNING_WORKDIR_LOCK = threading.RLock()
 _NVIDIA_DLL_DIRECTORY_HANDLES: dict[str, object] = {}
+# Nach einem Verbindungsfehler so lange In-Process transkribieren
+_MODEL_SERVER_RETRY_SECONDS = 30.0
+
+
+
+class _NotHandled(Enum):
+    """Sentinel: Model-Server deaktiviert/nicht erreichbar (In-Process weiter)."""
+
+    TOKEN = auto()
+
+
+_NOT_HANDLED = _NotHandled.TOKEN
+_T = TypeVar("_T")
 
 
 def _get_warmup_language() -> str:
@@ -60,7 +92,7 @@ def _get_warmup_language() -> str:
 
     Normalisiert 'auto' zu 'en', da Warmup eine konkrete Sprache braucht.
     """
-    lang = os.getenv("PULSESCRIBE_LANGUAGE") or "en"
+    lang = getenv("PULSESCRIBE_LANGUAGE") or "en"
     return "en" if is_auto_language(lang) else lang
 
 
@@ -306,7 +338,7 @@ def _select_device() -> str:
       3) CUDA (falls verfügbar UND funktional)
       4) CPU
     """
-    env_device = (os.getenv("PULSESCRIBE_DEVICE") or "").strip().lower()
+    env_device = (getenv("PULSESCRIBE_DEVICE") or "").strip().lower()
     if env_device and env_device != "auto":
         return env_device
     try:
@@ -345,15 +377,25 @@ class LocalProvider:
     default_model = DEFAULT_LOCAL_MODEL
 
     def __init__(self) -> None:
-        self._model_cache: dict = {}
+        # LRU mit Speicherbudget (PULSESCRIBE_LOCAL_MODEL_CACHE_MB); das aktive
+        # Modell bleibt immer geladen
+        self._model_cache: ModelCache = ModelCache(
+            lambda: get_local_model_cache_budget_mb() * 2**20,
+            on_evict=self._release_backend_allocator_caches,
+        )
         self._device: str | None = None
         self._fp16_override: bool | None = None
         self._fast_mode: bool | None = None
         self._backend: str | None = None
         self._lightning_fallback_active = False
         self._compute_type: str | None = None
+        # Autotune-Profil (~/.pulsescribe/local_profile.json), lazy geladen
+        self._profile: LocalRuntimeProfile | None = None
+        self._profile_loaded = False
         self._load_lock = threading.Lock()
         self._transcribe_lock = threading.Lock()
+        self._server_client: "ModelServerClient | None" = None
+        self._server_retry_at = 0.0
 
     def invalidate_runtime_config(self) -> None:
         """Invalidiert ENV-basierte Runtime-Konfiguration ohne Model-Cache zu löschen.
@@ -369,6 +411,36 @@ class LocalProvider:
         self._fast_mode = None
         self._lightning_fallback_active = False
         self._compute_type = None
+        self._profile = None
+        self._profile_loaded = False
+
+    def _runtime_profile(self) -> LocalRuntimeProfile | None:
+        """Autotune-Profil für das konfigurierte Modell (None = keins/deaktiviert)."""
+        if not self._profile_loaded:
+            self._profile_loaded = True
+            if get_local_profile_enabled():
+                self._profile = load_local_profile(self._resolve_model_name(None))
+                if self._profile is not None:
+                    log(f"Lokales Autotune-Profil: {self._profile.describe()}")
+        return self._profile
+
+    def _profile_for_backend(self, backend: str | None) -> LocalRuntimeProfile | None:
+        """Profil nur anwenden, wenn es für das aktive Backend gemessen wurde."""
+        profile = self._runtime_profile()
+        if profile is None or profile.backend != backend:
+            return None
+        return profile
+
+    def _faster_thread_settings(self) -> tuple[int, int]:
+        """cpu_threads/num_workers: ENV > Autotune-Profil > Default (auto, 1)."""
+        profile = self._profile_for_backend("faster")
+        cpu_threads = get_env_int("PULSESCRIBE_LOCAL_CPU_THREADS")
+        if cpu_threads is None and profile is not None:
+            cpu_threads = profile.cpu_threads
+        num_workers = get_env_int("PULSESCRIBE_LOCAL_NUM_WORKERS")
+        if num_workers is None and profile is not None:
+            num_workers = profile.num_workers
+        return cpu_threads or 0, num_workers or 1
 
     @staticmethod
     def _release_backend_allocator_caches() -> None:
@@ -411,18 +483,92 @@ class LocalProvider:
                         "mlx.core.metal.clear_cache() fehlgeschlagen", exc_info=True
                     )
 
+    def _model_server_client(self) -> "ModelServerClient | None":
+        """Client zum Model-Server, falls aktiviert (None = In-Process)."""
+        if not get_local_model_server_enabled():
+            return None
+        if time.monotonic() < self._server_retry_at:
+            return None
+        if self._server_client is None:
+            from .local_server import ModelServerClient
+
+            self._server_client = ModelServerClient()
+        return self._server_client
+
+    def _on_model_server(
+        self,
+        action: str,
+        call: Callable[["ModelServerClient", bool], _T],
+        *,
+        spawn: bool = True,
+    ) -> _T | Literal[_NotHandled.TOKEN]:
+        """Führt ``call(client)`` im Model-Server aus.
+
+        Returns:
+            Ergebnis oder ``_NOT_HANDLED``, wenn der Server deaktiviert bzw.
+            nicht erreichbar ist (Aufrufer macht dann In-Process weiter).
+        """
+        client = self._model_server_client()
+        if client is None:
+            return _NOT_HANDLED
+        from .local_server import ModelServerUnavailable
+
+        try:
+            return call(client, spawn)
+        except ModelServerUnavailable as e:
+            if spawn:
+                self._server_retry_at = time.monotonic() + _MODEL_SERVER_RETRY_SECONDS
+                logger.warning(f"Model-Server ({action}): {e} – nutze In-Process-Modell")
+            return _NOT_HANDLED
+
     def clear_model_cache(self) -> int:
-        """Release cached local model objects and best-effort allocator state."""
+        """Release cached local model objects and best-effort allocator state.
+
+        Mit Model-Server wird auch dessen Cache geleert (z.B. Backend-Wechsel).
+        """
+        remote_cleared = self._on_model_server(
+            "clear_model_cache",
+            lambda client, spawn: client.request("clear_model_cache", spawn=spawn),
+            spawn=False,
+        )
         with self._transcribe_lock:
             with self._load_lock:
                 cleared_entries = len(self._model_cache)
                 self._model_cache.clear()
 
         self._release_backend_allocator_caches()
+        if remote_cleared is not _NOT_HANDLED:
+            cleared_entries += remote_cleared or 0
         return cleared_entries
 
+    def get_model_cache_stats(self) -> ModelCacheStats:
+        """Treffer, Loads, Evictions und residenter Speicher des Modell-Caches."""
+        remote = self._on_model_server(
+            "cache_stats",
+            lambda client, spawn: client.cache_stats(spawn=spawn),
+            spawn=False,
+        )
+        if remote is not _NOT_HANDLED:
+            return remote
+        return self._model_cache.stats()
+
+    def _reserve_model_slot(self, cache_key: str) -> None:
+        """Entlädt LRU-Modelle vor dem Load, falls das Budget sonst überläuft."""
+        reserve = getattr(self._model_cache, "reserve", None)
+        if reserve is not None:
+            reserve(cache_key)
+
     def cleanup(self) -> None:
-        """Release cached models and reset ENV-derived runtime configuration."""
+        """Release cached models and reset ENV-derived runtime configuration.
+
+        Mit Model-Server wird nur die Verbindung getrennt: die Modelle bleiben
+        im Server warm und überleben so den Daemon-Neustart.
+        """
+        client = self._server_client
+        if client is not None and get_local_model_server_enabled():
+            client.close()
+            self.invalidate_runtime_config()
+            return
         self.clear_model_cache()
         self.invalidate_runtime_config()
 
@@ -434,13 +580,20 @@ class LocalProvider:
 
     def _ensure_runtime_config(self) -> None:
         if self._backend is None:
-            self._backend = _resolve_local_backend(
-                os.getenv("PULSESCRIBE_LOCAL_BACKEND")
-            )
+            backend_env = getenv("PULSESCRIBE_LOCAL_BACKEND")
+            profile = self._runtime_profile()
+            if not (backend_env or "").strip() and profile is not None:
+                backend_env = profile.backend
+            self._backend = _resolve_local_backend(backend_env)
             log(f"Lokales Whisper Backend: {self._backend}")
 
         if self._device is None:
-            self._device = _select_device()
+            device_env = (getenv("PULSESCRIBE_DEVICE") or "").strip().lower()
+            profile = self._profile_for_backend(self._backend)
+            if device_env in ("", "auto") and profile is not None:
+                self._device = profile.device
+            else:
+                self._device = _select_device()
             log(f"Lokales Whisper Device: {self._device}")
 
         if self._fp16_override is None:
@@ -455,9 +608,12 @@ class LocalProvider:
                 self._fast_mode = fast_env
 
         if self._compute_type is None:
-            compute_env = os.getenv("PULSESCRIBE_LOCAL_COMPUTE_TYPE")
+            compute_env = getenv("PULSESCRIBE_LOCAL_COMPUTE_TYPE")
+            profile = self._profile_for_backend(self._backend)
             if compute_env:
                 self._compute_type = compute_env.strip()
+            elif profile is not None and profile.compute_type:
+                self._compute_type = profile.compute_type
 
     def _map_faster_model_name(self, model_name: str) -> str:
         """Mappt openai-whisper Namen auf faster-whisper Konventionen."""
@@ -541,6 +697,7 @@ class LocalProvider:
             if cache_key in self._model_cache:
                 return self._model_cache[cache_key]
 
+            self._reserve_model_slot(cache_key)
             log(f"Lade Modell '{model_name}' ({self._device})...")
             cache_key = self._load_whisper_model_with_fallback(
                 whisper,
@@ -629,8 +786,7 @@ class LocalProvider:
         device = "cuda" if self._device == "cuda" else "cpu"
         compute_type = self._compute_type or ("float16" if device == "cuda" else CPU_COMPUTE_TYPE)
 
-        cpu_threads = get_env_int("PULSESCRIBE_LOCAL_CPU_THREADS") or 0
-        num_workers = get_env_int("PULSESCRIBE_LOCAL_NUM_WORKERS") or 1
+        cpu_threads, num_workers = self._faster_thread_settings()
 
         cache_key = (
             f"faster:{faster_name}:{device}:{compute_type}:{cpu_threads}:{num_workers}"
@@ -641,6 +797,7 @@ class LocalProvider:
         with self._load_lock:
             if cache_key in self._model_cache:
                 return self._model_cache[cache_key]
+            self._reserve_model_slot(cache_key)
             log(
                 f"Lade faster-whisper Modell '{faster_name}' "
                 f"(Device: {device.upper()}, Compute: {compute_type}, "
@@ -722,7 +879,7 @@ class LocalProvider:
 
         # Batch-Size und Quantisierung aus ENV
         batch_size = get_env_int("PULSESCRIBE_LIGHTNING_BATCH_SIZE") or 12
-        quant_env = os.getenv("PULSESCRIBE_LIGHTNING_QUANT", "").strip().lower()
+        quant_env = getenv("PULSESCRIBE_LIGHTNING_QUANT", "").strip().lower()
         quant = None if quant_env in ("", "none", "false") else quant_env
 
         cache_key = f"lightning:{lightning_name}:{batch_size}:{quant}"
@@ -733,6 +890,7 @@ class LocalProvider:
             if cache_key in self._model_cache:
                 return self._model_cache[cache_key]
 
+            self._reserve_model_slot(cache_key)
             log(
                 f"Lade lightning-whisper-mlx '{lightning_name}' "
                 f"(batch_size={batch_size}, quant={quant})..."
@@ -816,7 +974,7 @@ class LocalProvider:
         if best_of is not None:
             options["best_of"] = best_of
 
-        temp_env = os.getenv("PULSESCRIBE_LOCAL_TEMPERATURE")
+        temp_env = getenv("PULSESCRIBE_LOCAL_TEMPERATURE")
         if temp_env:
             try:
                 options["temperature"] = _parse_temperature_override(temp_env)
@@ -844,7 +1002,7 @@ class LocalProvider:
         """Ermittelt Modellname aus Arg > PULSESCRIBE_LOCAL_MODEL > Default."""
         if model:
             return model
-        env_model = os.getenv("PULSESCRIBE_LOCAL_MODEL")
+        env_model = getenv("PULSESCRIBE_LOCAL_MODEL")
         if env_model:
             return env_model.strip()
         return self.default_model
@@ -855,6 +1013,13 @@ class LocalProvider:
         Returns:
             Dict mit backend, device, compute_type (compute_type nur bei faster-whisper).
         """
+        remote = self._on_model_server(
+            "runtime_info",
+            lambda client, spawn: client.request("runtime_info", spawn=spawn),
+            spawn=False,
+        )
+        if remote is not _NOT_HANDLED:
+            return remote
         self._ensure_runtime_config()
         backend = self._effective_backend()
         info: dict[str, str | None] = {
@@ -870,8 +1035,14 @@ class LocalProvider:
         return info
 
     def preload(self, model: str | None = None) -> None:
-        """Lädt ein Modell vorab in den Cache."""
+        """Lädt ein Modell vorab in den Cache (bzw. im Model-Server)."""
         model_name = self._resolve_model_name(model)
+        remote = self._on_model_server(
+            "preload",
+            lambda client, spawn: client.request("preload", spawn=spawn, model=model_name),
+        )
+        if remote is not _NOT_HANDLED:
+            return
         self._ensure_runtime_config()
         backend = self._effective_backend()
         if backend == "faster":
@@ -941,15 +1112,30 @@ class LocalProvider:
         else:
             self._get_whisper_model(model_name)
 
-    def keepalive(self, model: str | None = None) -> None:
+    def keepalive(
+        self, model: str | None = None, *, duration_s: float | None = None
+    ) -> None:
         """Hält Metal-Shader warm durch minimales Dummy-Transcribe.
 
         Verhindert GPU-Cache-Eviction bei Inaktivität. Sollte periodisch
         aufgerufen werden (z.B. alle 60s) wenn das Modell nicht aktiv genutzt wird.
+        ``duration_s`` überschreibt die Audio-Dauer (Default
+        KEEPALIVE_WARMUP_DURATION), z.B. für ein volles Rewarm nach Pause.
 
         Nur relevant für MLX/Lightning Backends (Metal GPU). Für whisper/faster
         ist kein Keep-Alive nötig (CPU/CUDA haben kein Shader-Caching-Problem).
         """
+        extra = {} if duration_s is None else {"duration_s": duration_s}
+        remote = self._on_model_server(
+            "keepalive",
+            lambda client, spawn: client.request(
+                "keepalive", spawn=spawn, model=self._resolve_model_name(model), **extra
+            ),
+            spawn=False,
+        )
+        if remote is not _NOT_HANDLED or self._model_server_client() is not None:
+            # Läuft kein Server, gibt es auch kein warmes Modell zu halten
+            return
         self._ensure_runtime_config()
 
         # Nur für Metal-Backends relevant
@@ -961,7 +1147,10 @@ class LocalProvider:
 
         import numpy as np
 
-        keepalive_samples = int(WHISPER_SAMPLE_RATE * KEEPALIVE_WARMUP_DURATION)
+        keepalive_samples = int(
+            WHISPER_SAMPLE_RATE
+            * (KEEPALIVE_WARMUP_DURATION if duration_s is None else duration_s)
+        )
         keepalive_audio = np.zeros(keepalive_samples, dtype=np.float32)
 
         t0 = time.perf_counter()
@@ -978,7 +1167,7 @@ class LocalProvider:
                     f"wechsle zu MLX. Fehler: {e}"
                 )
                 log(f"⚠️ Lightning Keep-Alive → MLX Fallback (Grund: {type(e).__name__})")
-                self.keepalive(model=model_name)
+                self.keepalive(model=model_name, duration_s=duration_s)
                 return
         else:
             with self._transcribe_lock:
@@ -1050,21 +1239,42 @@ class LocalProvider:
     ) -> str:
         """Transkribiert ein Audio-Array lokal (ohne Dateischreibzugriff)."""
         model_name = self._resolve_model_name(model)
+        remote = self._on_model_server(
+            "transcribe",
+            lambda client, spawn: self._transcribe_on_server(
+                client.transcribe_audio, audio, model_name=model_name, language=language
+            ),
+        )
+        if remote is not _NOT_HANDLED:
+            return remote
         self._log_transcription_start(model_name, language)
         options = self._build_options(language)
         return self._transcribe_with_backend(audio, model_name=model_name, options=options)
 
+    def _transcribe_on_server(self, send, audio_source, *, model_name: str, language: str | None) -> str:
+        """Transkription im Model-Server (Backend/Device loggt der Server)."""
+        logger.info(f"Local (Model-Server): {model_name}, lang={language or 'auto'}")
+        with timed_operation("Local-Transkription", logger=logger, include_session=False):
+            return send(audio_source, model=model_name, language=language)
+
     def _transcribe_faster(self, audio, model_name: str, options: dict) -> str:
+        return "".join(seg.text for seg in self._faster_segments(audio, model_name, options))
+
+    def _faster_segments(self, audio, model_name: str, options: dict) -> list:
+        """Dekodiert via faster-whisper (inkl. VAD-/CUDA-Fallback) zu Segmenten."""
         model = self._get_faster_model(model_name)
         faster_opts = {k: v for k, v in options.items() if k != "fp16"}
         # faster-whisper erwartet float temperature; Tuple → erstes Element
         temp = faster_opts.get("temperature")
         if isinstance(temp, tuple):
             faster_opts["temperature"] = float(temp[0])
+        batch_size = faster_opts.pop("batch_size", 1)
+        if batch_size > 1:
+            model = self._batched_faster_pipeline(model, faster_opts, batch_size)
 
         try:
             segments, _info = model.transcribe(audio, **faster_opts)
-            return "".join(seg.text for seg in segments)
+            return list(segments)
         except Exception as e:
             error_msg = str(e).lower()
             if faster_opts.get("vad_filter") and "silero_vad_v6.onnx" in error_msg:
@@ -1076,7 +1286,7 @@ class LocalProvider:
                 retry_opts["vad_filter"] = False
                 try:
                     segments, _info = model.transcribe(audio, **retry_opts)
-                    return "".join(seg.text for seg in segments)
+                    return list(segments)
                 except Exception as retry_error:
                     faster_opts = retry_opts
                     e = retry_error
@@ -1096,10 +1306,28 @@ class LocalProvider:
                     del self._model_cache[k]
                 # Neu laden mit CPU und erneut versuchen
                 model = self._get_faster_model(model_name)
+                if "batch_size" in faster_opts:
+                    model = self._batched_faster_pipeline(model, faster_opts, batch_size)
                 segments, _info = model.transcribe(audio, **faster_opts)
-                return "".join(seg.text for seg in segments)
+                return list(segments)
             raise
 
+    @staticmethod
+    def _batched_faster_pipeline(model, faster_opts: dict, batch_size: int):
+        """Wrappt ein faster-whisper-Modell für gebatchte Inferenz (CLI-Batch).
+
+        BatchedInferencePipeline (faster-whisper >= 1.1) schneidet per VAD in
+        Chunks und dekodiert sie parallel; ältere Versionen laufen ungebatcht.
+        """
+        try:
+            from faster_whisper import BatchedInferencePipeline
+        except ImportError:
+            logger.debug("BatchedInferencePipeline nicht verfügbar – ungebatcht")
+            faster_opts.pop("batch_size", None)
+            return model
+        faster_opts["batch_size"] = batch_size
+        return BatchedInferencePipeline(model=model)
+
     def _coerce_transcription_result(self, result: object) -> str:
         """Normalize backend-specific transcription payloads to plain text."""
         if isinstance(result, dict):
@@ -1215,6 +1443,7 @@ class LocalProvider:
         audio_path: Path,
         model: str | None = None,
         language: str | None = None,
+        batch_size: int | None = None,
     ) -> str:
         """Transkribiert Audio lokal (whisper/faster/mlx/lightning).
 
@@ -1222,13 +1451,28 @@ class LocalProvider:
             audio_path: Pfad zur Audio-Datei
             model: Modell-Name (default: turbo)
             language: Sprachcode oder None für Auto-Detection
+            batch_size: Gebatchte Inferenz für lange Dateien (nur faster-whisper
+                im Prozess, z.B. CLI-Batch-Modus); None/1 = ungebatcht
 
         Returns:
             Transkribierter Text
         """
         model_name = self._resolve_model_name(model)
+        remote = self._on_model_server(
+            "transcribe",
+            lambda client, spawn: self._transcribe_on_server(
+                lambda path, **kw: client.request("transcribe", path=str(path), **kw),
+                audio_path,
+                model_name=model_name,
+                language=language,
+            ),
+        )
+        if remote is not _NOT_HANDLED:
+            return remote
         self._log_transcription_start(model_name, language)
         options = self._build_options(language)
+        if batch_size and batch_size > 1 and self._effective_backend() == "faster":
+            options["batch_size"] = batch_size
         return self._transcribe_with_backend(
             str(audio_path),
             model_name=model_name,
@@ -1236,8 +1480,80 @@ class LocalProvider:
         )
 
     def supports_streaming(self) -> bool:
-        """Lokales Whisper unterstützt kein Streaming."""
+        """Lokales Whisper unterstützt kein Deepgram-artiges Streaming."""
         return False
 
+    def supports_local_streaming(self) -> bool:
+        """True, wenn Interim-Text per LocalAgreement möglich ist.
+
+        Braucht Wort-Timestamps aus dem Prozess: derzeit nur faster-whisper,
+        nicht über den Model-Server.
+        """
+        if get_local_model_server_enabled():
+            return False
+        self._ensure_runtime_config()
+        return self._effective_backend() == "faster"
+
+    def transcribe_audio_words(
+        self,
+        audio,
+        model: str | None = None,
+        language: str | None = None,
+        prompt: str | None = None,
+    ) -> list[TimedWord]:
+        """Transkribiert ein Audio-Array zu Wörtern mit Timestamps (faster-whisper).
+
+        Args:
+            prompt: Bereits bestätigter Text als Kontext (hinter dem
+                Vocabulary-Prompt angehängt).
+        """
+        model_name = self._resolve_model_name(model)
+        options = self._build_options(language)
+        options["word_timestamps"] = True
+        options["without_timestamps"] = False
+        if prompt:
+            vocabulary = options.get("initial_prompt")
+            options["initial_prompt"] = f"{vocabulary}\n{prompt}" if vocabulary else prompt
+        with self._transcribe_lock:
+            segments = self._faster_segments(audio, model_name, options)
+        return [
+            TimedWord(float(word.start), float(word.end), word.word)
+            for segment in segments
+            for word in (getattr(segment, "words", None) or ())
+        ]
+
+    def create_streaming_session(
+        self,
+        model: str | None = None,
+        language: str | None = None,
+        *,
+        on_interim=None,
+        interval_seconds: float | None = None,
+    ) -> LocalStreamingSession:
+        """Startet eine Streaming-Session für eine laufende Aufnahme.
+
+        Die Session dekodiert während der Aufnahme ein gleitendes Fenster,
+        meldet Interim-Text an ``on_interim`` und dekodiert beim Stop nur
+        noch den unbestätigten Rest (siehe `providers._local_streaming`).
+        """
+        model_name = self._resolve_model_name(model)
+        self._log_transcription_start(model_name, language)
+
+        def decode(audio, prompt: str | None) -> list[TimedWord]:
+            return self.transcribe_audio_words(
+                audio, model=model_name, language=language, prompt=prompt
+            )
+
+        return LocalStreamingSession(
+            decode,
+            sample_rate=WHISPER_SAMPLE_RATE,
+            interval_seconds=(
+                get_local_streaming_interval_seconds()
+                if interval_seconds is None
+                else interval_seconds
+            ),
+            on_interim=on_interim,
+        )
+
 
 __all__ = ["LocalProvider"]
@@ -0,0 +1,569 @@
+"""Lokaler Model-Server: Whisper-Modelle außerhalb des Daemon-Prozesses.
+
+Ohne Server lädt `LocalProvider` die Modelle in den Daemon-Prozess: jeder
+Daemon-Neustart bezahlt den kompletten Modell-Load erneut, und lange Decodes
+laufen im selben Prozess wie Hotkeys, Overlay und Audio-Capture.
+
+Mit ``PULSESCRIBE_LOCAL_MODEL_SERVER=true`` startet der erste Daemon bei
+Bedarf einen eigenständigen Prozess (``python -m providers.local_server``),
+der einen eigenen `LocalProvider` samt ``_model_cache`` besitzt:
+
+    - erreichbar über einen lokalen Socket (Unix-Socket bzw. Named Pipe via
+      ``multiprocessing.connection``, Authkey in ``~/.pulsescribe``)
+    - Audio-Arrays gehen über ``multiprocessing.shared_memory``; durch den
+      Socket laufen nur Segment-Name und Länge
+    - überlebt Daemon-Neustarts: ein neuer Daemon hängt sich in Millisekunden
+      an das bereits warme Modell
+    - beendet sich nach ``PULSESCRIBE_LOCAL_MODEL_SERVER_IDLE_MINUTES`` ohne
+      Anfrage selbst und gibt RAM/VRAM frei
+
+Die ``PULSESCRIBE_*``-Variablen des Daemons gehen mit jeder Anfrage mit.
+Der Server schreibt sie nicht in ``os.environ``, sondern führt die Anfrage in
+einem `utils.env.env_overrides`-Kontext aus. Ändern sie sich (Settings-Reload),
+wartet die Anfrage auf laufende Anfragen mit den alten Settings und
+invalidiert dann die Runtime-Konfiguration wie der In-Process-Provider.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import secrets
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from config import LOG_DIR, USER_CONFIG_DIR
+from utils.env import env_overrides
+
+if TYPE_CHECKING:
+    from providers._model_cache import ModelCacheStats
+
+logger = logging.getLogger("pulsescribe.providers.local_server")
+
+_SERVER_MODULE = "providers.local_server"
+_SOCKET_FILENAME = "model_server.sock"
+_AUTHKEY_FILE = USER_CONFIG_DIR / "model_server.key"
+_SERVER_LOG_FILE = LOG_DIR / "model_server.log"
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Server-Start: Python + numpy + Provider-Import, noch kein Modell-Load
+SERVER_STARTUP_TIMEOUT = 15.0
+_CONNECT_RETRY_INTERVAL = 0.05
+_IDLE_CHECK_INTERVAL = 30.0
+
+_ENV_SYNC_PREFIX = "PULSESCRIBE_"
+# Server-eigene Schalter nicht synchronisieren (der Server ist nie selbst Client)
+_SERVER_ENV_PREFIX = "PULSESCRIBE_LOCAL_MODEL_SERVER"
+
+
+class ModelServerUnavailable(RuntimeError):
+    """Server nicht erreichbar oder Verbindung verloren (Fallback: In-Process)."""
+
+
+class ModelServerError(RuntimeError):
+    """Anfrage ist im Server fehlgeschlagen."""
+
+
+def default_address() -> str:
+    """Socket-Pfad (POSIX) bzw. Named-Pipe-Name (Windows) des Servers."""
+    if sys.platform == "win32":
+        user = os.getenv("USERNAME") or "user"
+        return rf"\\.\pipe\pulsescribe-model-server-{user}"
+    return str(USER_CONFIG_DIR / _SOCKET_FILENAME)
+
+
+def _address_family(address: str) -> str:
+    return "AF_PIPE" if address.startswith("\\\\.\\pipe\\") else "AF_UNIX"
+
+
+def load_authkey(path: Path = _AUTHKEY_FILE) -> bytes:
+    """Liest den gemeinsamen Authkey (legt ihn beim ersten Mal an, 0600)."""
+    try:
+        key = path.read_bytes()
+    except FileNotFoundError:
+        key = b""
+    if key:
+        return key
+
+    key = secrets.token_bytes(32)
+    tmp_path = path.with_suffix(".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.write(fd, key)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+    return key
+
+
+def _env_snapshot() -> dict[str, str]:
+    return {
+        key: value
+        for key, value in os.environ.items()
+        if key.startswith(_ENV_SYNC_PREFIX) and not key.startswith(_SERVER_ENV_PREFIX)
+    }
+
+
+def _attach_shared_audio(name: str, *, owner_pid: int):
+    """Öffnet das Audio-Segment des Clients, ohne es dem Server zuzuordnen."""
+    from multiprocessing import resource_tracker, shared_memory
+
+    try:
+        # Python 3.13+
+        return shared_memory.SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+    except TypeError:
+        pass
+    shm = shared_memory.SharedMemory(name=name)
+    if sys.platform != "win32" and owner_pid != os.getpid():
+        # Vor 3.13 registriert auch das Attach das Segment; der Resource-Tracker
+        # des Servers würde es sonst beim Beenden als Leck "aufräumen". Der
+        # Client ist Besitzer und ruft unlink().
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+    return shm
+
+
+class ModelServer:
+    """Beantwortet Anfragen der Daemons mit einem eigenen `LocalProvider`.
+
+    Jede Verbindung läuft in einem eigenen Thread; die Locks des Providers
+    serialisieren Modell-Loads und Transkriptionen wie im Daemon.
+    """
+
+    def __init__(
+        self,
+        provider,
+        *,
+        address: str | None = None,
+        authkey: bytes | None = None,
+        idle_timeout: float | None = None,
+    ) -> None:
+        self._provider = provider
+        self.address = address or default_address()
+        self._authkey = authkey if authkey is not None else load_authkey()
+        self._idle_timeout = idle_timeout
+        self._listener = None
+        self._stop_event = threading.Event()
+        self._ready = threading.Event()
+        self._activity_lock = threading.Lock()
+        self._active_requests = 0
+        self._last_activity = time.monotonic()
+        # Settings der laufenden Anfragen; wechseln nur, wenn keine mehr läuft
+        self._settings_cond = threading.Condition()
+        self._settings = _env_snapshot()
+        self._settings_users = 0
+
+    @property
+    def ready(self) -> threading.Event:
+        """Gesetzt, sobald der Socket Verbindungen annimmt."""
+        return self._ready
+
+    def _prepare_address(self) -> None:
+        """Räumt einen verwaisten Unix-Socket ab; bricht ab, falls ein Server läuft."""
+        if _address_family(self.address) != "AF_UNIX":
+            return
+        path = Path(self.address)
+        if not path.exists():
+            return
+        from multiprocessing.connection import Client
+
+        try:
+            Client(self.address, family="AF_UNIX", authkey=self._authkey).close()
+        except (OSError, EOFError):
+            path.unlink(missing_ok=True)
+            return
+        raise ModelServerError(f"Model-Server läuft bereits ({self.address})")
+
+    def serve_forever(self) -> None:
+        from multiprocessing import AuthenticationError
+        from multiprocessing.connection import Listener
+
+        self._prepare_address()
+        self._listener = Listener(
+            self.address, family=_address_family(self.address), authkey=self._authkey
+        )
+        if self._idle_timeout:
+            threading.Thread(
+                target=self._idle_watchdog, daemon=True, name="ModelServerIdle"
+            ).start()
+        logger.info(f"Model-Server bereit (pid={os.getpid()}, {self.address})")
+        self._ready.set()
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    conn = self._listener.accept()
+                except (OSError, EOFError, AuthenticationError) as e:
+                    if self._stop_event.is_set():
+                        break
+                    logger.debug(f"Model-Server: Verbindung abgelehnt: {e}")
+                    continue
+                if self._stop_event.is_set():
+                    conn.close()
+                    break
+                threading.Thread(
+                    target=self._serve_connection,
+                    args=(conn,),
+                    daemon=True,
+                    name="ModelServerConnection",
+                ).start()
+        finally:
+            self._listener.close()
+            logger.info("Model-Server beendet")
+
+    def stop(self) -> None:
+        """Beendet die Accept-Schleife (weckt ``accept`` per Selbst-Verbindung)."""
+        if self._stop_event.is_set():
+            return
+        self._stop_event.set()
+        from multiprocessing.connection import Client
+
+        try:
+            Client(
+                self.address, family=_address_family(self.address), authkey=self._authkey
+            ).close()
+        except Exception:
+            pass
+
+    def _idle_watchdog(self) -> None:
+        idle_timeout = self._idle_timeout
+        if not idle_timeout:
+            return
+        interval = min(_IDLE_CHECK_INTERVAL, idle_timeout)
+        while not self._stop_event.wait(interval):
+            with self._activity_lock:
+                idle = time.monotonic() - self._last_activity
+                busy = self._active_requests > 0
+            if not busy and idle >= idle_timeout:
+                logger.info(
+                    f"Model-Server: {idle / 60:.0f} min ohne Anfrage, beende "
+                    "(Modelle werden freigegeben)"
+                )
+                self.stop()
+                return
+
+    def _serve_connection(self, conn) -> None:
+        with conn:
+            while not self._stop_event.is_set():
+                try:
+                    request = conn.recv()
+                except (EOFError, OSError):
+                    return
+                reply = self.handle(request)
+                try:
+                    conn.send(reply)
+                except OSError:
+                    return
+
+    def handle(self, request: dict) -> dict:
+        """Führt eine Anfrage aus; Fehler gehen als Antwort zurück."""
+        command = request.get("command")
+        handler = getattr(self, f"_cmd_{command}", None)
+        if handler is None:
+            return {"ok": False, "error": f"Unbekannter Befehl: {command}", "error_type": "ValueError"}
+        with self._activity_lock:
+            self._active_requests += 1
+        try:
+            with self._client_settings(request.get("env")):
+                return {"ok": True, "result": handler(request)}
+        except Exception as e:
+            logger.exception(f"Model-Server: '{command}' fehlgeschlagen")
+            return {"ok": False, "error": str(e), "error_type": type(e).__name__}
+        finally:
+            with self._activity_lock:
+                self._active_requests -= 1
+                self._last_activity = time.monotonic()
+
+    @contextmanager
+    def _client_settings(self, env: dict[str, str] | None) -> Iterator[None]:
+        """Führt eine Anfrage mit den PULSESCRIBE_*-Variablen des Clients aus.
+
+        ``os.environ`` bleibt unverändert; die Werte gelten nur im Kontext des
+        Verbindungs-Threads. Der Provider cached Runtime-Config aus diesen
+        Werten, daher wechseln die Settings erst, wenn keine Anfrage mit den
+        alten mehr läuft.
+        """
+        with self._settings_cond:
+            if env is not None:
+                while env != self._settings and self._settings_users:
+                    self._settings_cond.wait()
+                if env != self._settings:
+                    self._settings = dict(env)
+                    self._provider.invalidate_runtime_config()
+                    logger.debug(
+                        "Model-Server: Client-Settings gewechselt, Runtime-Config invalidiert"
+                    )
+            self._settings_users += 1
+            settings = {
+                **self._settings,
+                # Server-eigene Schalter kommen nie vom Client
+                **{
+                    key: value
+                    for key, value in os.environ.items()
+                    if key.startswith(_SERVER_ENV_PREFIX)
+                },
+            }
+        try:
+            with env_overrides(settings, prefix=_ENV_SYNC_PREFIX):
+                yield
+        finally:
+            with self._settings_cond:
+                self._settings_users -= 1
+                self._settings_cond.notify_all()
+
+    # Befehle ----------------------------------------------------------------
+
+    def _cmd_ping(self, _request: dict) -> dict[str, Any]:
+        return {"pid": os.getpid(), "models": sorted(self._provider._model_cache)}
+
+    def _cmd_preload(self, request: dict) -> None:
+        self._provider.preload(request.get("model"))
+
+    def _cmd_keepalive(self, request: dict) -> None:
+        duration_s = request.get("duration_s")
+        if duration_s is None:
+            self._provider.keepalive(request.get("model"))
+        else:
+            self._provider.keepalive(request.get("model"), duration_s=float(duration_s))
+
+    def _cmd_runtime_info(self, _request: dict) -> dict[str, str | None]:
+        return self._provider.get_runtime_info()
+
+    def _cmd_cache_stats(self, _request: dict) -> ModelCacheStats:
+        return self._provider.get_model_cache_stats()
+
+    def _cmd_clear_model_cache(self, _request: dict) -> int:
+        return self._provider.clear_model_cache()
+
+    def _cmd_transcribe(self, request: dict) -> str:
+        return self._provider.transcribe(
+            Path(request["path"]),
+            model=request.get("model"),
+            language=request.get("language"),
+        )
+
+    def _cmd_transcribe_audio(self, request: dict) -> str:
+        import numpy as np
+
+        shm = _attach_shared_audio(request["shm"], owner_pid=request.get("pid", -1))
+        try:
+            audio = np.ndarray((request["frames"],), dtype=np.float32, buffer=shm.buf)
+            text = self._provider.transcribe_audio(
+                audio, model=request.get("model"), language=request.get("language")
+            )
+            del audio
+            return text
+        finally:
+            try:
+                shm.close()
+            except BufferError:
+                # Backend hält noch eine View; der GC schließt das Mapping später
+                logger.debug("Model-Server: Audio-Segment noch referenziert")
+
+    def _cmd_shutdown(self, _request: dict) -> None:
+        threading.Timer(0.05, self.stop).start()
+
+
+def _server_command() -> list[str]:
+    if getattr(sys, "frozen", False):
+        if sys.platform == "win32":
+            return [sys.executable, "--model-server"]
+        raise ModelServerUnavailable("Model-Server ist im App-Bundle nicht verfügbar")
+    return [sys.executable, "-m", _SERVER_MODULE]
+
+
+def spawn_server() -> subprocess.Popen:
+    """Startet den Server losgelöst vom Daemon (überlebt dessen Neustart)."""
+    kwargs: dict[str, Any] = {
+        "cwd": str(_PROJECT_ROOT),
+        "stdin": subprocess.DEVNULL,
+        "stdout": subprocess.DEVNULL,
+        "stderr": subprocess.DEVNULL,
+    }
+    if sys.platform == "win32":
+        kwargs["creationflags"] = (
+            subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.DETACHED_PROCESS
+        )
+    else:
+        kwargs["start_new_session"] = True
+    process = subprocess.Popen(_server_command(), **kwargs)
+    logger.info(f"Model-Server gestartet (pid={process.pid})")
+    return process
+
+
+class ModelServerClient:
+    """Verbindung eines Daemons zum Model-Server (thread-safe, eine Anfrage zur Zeit).
+
+    Usage:
+        client = ModelServerClient()
+        client.request("preload", model="turbo")          # startet Server bei Bedarf
+        text = client.transcribe_audio(audio, model="turbo", language="de")
+    """
+
+    def __init__(
+        self,
+        address: str | None = None,
+        *,
+        authkey: bytes | None = None,
+        startup_timeout: float = SERVER_STARTUP_TIMEOUT,
+    ) -> None:
+        self.address = address or default_address()
+        self._authkey = authkey
+        self._startup_timeout = startup_timeout
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        from multiprocessing import AuthenticationError
+        from multiprocessing.connection import Client
+
+        if self._authkey is None:
+            self._authkey = load_authkey()
+        try:
+            return Client(
+                self.address, family=_address_family(self.address), authkey=self._authkey
+            )
+        except (OSError, EOFError, AuthenticationError) as e:
+            raise ModelServerUnavailable(f"Model-Server nicht erreichbar: {e}") from e
+
+    def _connect_or_spawn(self):
+        try:
+            return self._connect()
+        except ModelServerUnavailable:
+            process = spawn_server()
+        deadline = time.monotonic() + self._startup_timeout
+        while True:
+            time.sleep(_CONNECT_RETRY_INTERVAL)
+            try:
+                return self._connect()
+            except ModelServerUnavailable:
+                if process.poll() is not None:
+                    raise ModelServerUnavailable(
+                        f"Model-Server beim Start beendet (exit={process.returncode}), "
+                        f"siehe {_SERVER_LOG_FILE}"
+                    ) from None
+                if time.monotonic() > deadline:
+                    raise
+
+    def request(self, command: str, *, spawn: bool = True, **payload: Any) -> Any:
+        """Schickt eine Anfrage und wartet auf die Antwort.
+
+        Args:
+            command: Server-Befehl (``preload``, ``transcribe_audio``, …).
+            spawn: Server starten, falls er nicht läuft. Ohne ``spawn`` wirft
+                ein nicht laufender Server `ModelServerUnavailable`.
+
+        Raises:
+            ModelServerUnavailable: Server nicht erreichbar / Verbindung verloren.
+            ModelServerError: Befehl ist im Server fehlgeschlagen.
+        """
+        message = {"command": command, "env": _env_snapshot(), "pid": os.getpid(), **payload}
+        with self._lock:
+            if self._conn is None:
+                self._conn = self._connect_or_spawn() if spawn else self._connect()
+            try:
+                self._conn.send(message)
+                reply = self._conn.recv()
+            except (EOFError, OSError) as e:
+                self._close_connection()
+                raise ModelServerUnavailable(f"Verbindung zum Model-Server verloren: {e}") from e
+        if not reply.get("ok"):
+            raise ModelServerError(f"{reply.get('error_type')}: {reply.get('error')}")
+        return reply.get("result")
+
+    def cache_stats(self, *, spawn: bool = True) -> ModelCacheStats:
+        """Statistik des Modell-Caches im Server."""
+        return self.request("cache_stats", spawn=spawn)
+
+    def transcribe_audio(self, audio, *, model: str | None, language: str | None) -> str:
+        """Transkribiert ein Mono-Array; die Samples gehen über Shared Memory."""
+        import numpy as np
+        from multiprocessing import shared_memory
+
+        samples = np.asarray(audio, dtype=np.float32).reshape(-1)
+        shm = shared_memory.SharedMemory(create=True, size=max(samples.nbytes, 1))
+        try:
+            np.ndarray(samples.shape, dtype=np.float32, buffer=shm.buf)[:] = samples
+            return self.request(
+                "transcribe_audio",
+                shm=shm.name,
+                frames=int(samples.size),
+                model=model,
+                language=language,
+            )
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def _close_connection(self) -> None:
+        conn = self._conn
+        self._conn = None
+        if conn is not None:
+            try:
+                conn.close()
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        """Trennt die Verbindung; der Server und seine Modelle bleiben bestehen."""
+        with self._lock:
+            self._close_connection()
+
+
+def _setup_server_logging() -> None:
+    from logging.handlers import RotatingFileHandler
+
+    root = logging.getLogger("pulsescribe")
+    root.setLevel(logging.DEBUG if os.getenv("PULSESCRIBE_DEBUG") else logging.INFO)
+    try:
+        handler: logging.Handler = RotatingFileHandler(
+            _SERVER_LOG_FILE, maxBytes=5_000_000, backupCount=2, encoding="utf-8"
+        )
+    except OSError:
+        handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(
+        logging.Formatter("%(asctime)s [%(levelname)s] %(message)s", "%H:%M:%S")
+    )
+    root.addHandler(handler)
+
+
+def main() -> int:
+    """Einstiegspunkt des Server-Prozesses."""
+    from config import get_local_model_server_idle_minutes
+    from utils.env import load_environment
+
+    _setup_server_logging()
+    load_environment()
+    # Der Provider im Server transkribiert selbst (keine Rekursion)
+    os.environ["PULSESCRIBE_LOCAL_MODEL_SERVER"] = "false"
+
+    from .local import LocalProvider
+
+    idle_minutes = get_local_model_server_idle_minutes()
+    server = ModelServer(
+        LocalProvider(), idle_timeout=idle_minutes * 60 if idle_minutes else None
+    )
+    try:
+        server.serve_forever()
+    except ModelServerError as e:
+        logger.info(str(e))
+        return 0
+    return 0
+
+
+__all__ = [
+    "ModelServer",
+    "ModelServerClient",
+    "ModelServerError",
+    "ModelServerUnavailable",
+    "default_address",
+    "spawn_server",
+]
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -8,6 +8,7 @@ from pathlib import Path
 from utils.timing import timed_operation
 
 from config import DEFAULT_API_MODEL
+from ._audio_upload import EncodedAudio
 from ._client_cache import EnvClientCache, build_cached_env_client_getter
 from ._response_utils import (
     log_transcription_result,
@@ -16,6 +17,7 @@ from ._response_utils import (
 )
 from ._transcription_request import (
     execute_audio_transcription_request,
+    maybe_transcribe_file_in_chunks,
     resolve_transcription_request,
 )
 from .base import EnvValidatedProvider
@@ -78,7 +80,7 @@ class OpenAIProvider(EnvValidatedProvider):
 
     def transcribe(
         self,
-        audio_path: Path,
+        audio_path: Path | EncodedAudio,
         model: str | None = None,
         language: str | None = None,
         response_format: str = "text",
@@ -86,7 +88,7 @@ class OpenAIProvider(EnvValidatedProvider):
         """Transkribiert Audio über die OpenAI API.
 
         Args:
-            audio_path: Pfad zur Audio-Datei
+            audio_path: Pfad zur Audio-Datei oder In-Memory-Payload
             model: Modell (default: gpt-4o-transcribe)
             language: Sprachcode oder None für Auto-Detection
             response_format: Output-Format (text, json, srt, vtt)
@@ -96,6 +98,18 @@ class OpenAIProvider(EnvValidatedProvider):
         """
         self._validate()
 
+        if response_format == "text":
+            # Lange Dateien: an Sprechpausen teilen und parallel hochladen
+            chunked = maybe_transcribe_file_in_chunks(
+                audio_path,
+                provider_name=self.name,
+                transcribe_chunk=lambda chunk: self.transcribe(
+                    chunk, model=model, language=language
+                ),
+            )
+            if chunked is not None:
+                return chunked
+
         request = resolve_transcription_request(
             audio_path,
             model=model,
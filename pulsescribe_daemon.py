@@ -30,7 +30,7 @@ import time
 import weakref
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Annotated, Any
+from typing import Annotated, Any, Callable
 
 import typer
 
@@ -57,17 +57,50 @@ try:
     from config import TRANSCRIBING_TIMEOUT, PRELOAD_WARMUP_DURATION, LOCAL_KEEPALIVE_INTERVAL
     from utils import setup_logging, show_error_alert
     from config import DEFAULT_DEEPGRAM_MODEL, DEFAULT_LOCAL_MODEL
+    from config import get_recording_spool_enabled
+    from config import (
+        PROGRESSIVE_REST_WORKERS,
+        get_progressive_min_segment_seconds,
+        get_progressive_transcription_enabled,
+    )
+    from config import get_local_streaming_enabled
+    from config import get_interim_push_enabled, get_interim_socket_enabled
+    from config import get_refine_stream_paste_enabled
+    from config import (
+        KEEPALIVE_STATS_FILE,
+        KEEPALIVE_WARMUP_DURATION,
+        get_local_keepalive_adaptive,
+        get_local_keepalive_min_probability,
+    )
     from utils.env import (
         get_env_bool,
         get_env_bool_default,
         parse_bool,
         load_environment,
     )
+    from audio.buffer import SampleBuffer
+    from audio.input_stream import get_sounddevice
+    from audio.progressive import ProgressiveTranscriber
+    from audio.spool import RecordingSpool, report_orphaned_spools
+    from audio.vad import StreamingVAD
     from providers.deepgram_stream import deepgram_stream_core
     from providers import get_provider
     from whisper_platform import get_sound_player
     from utils.state import AppState, DaemonMessage, MessageType
     from utils.hold_state import HoldHotkeyState
+    from utils.keepalive_scheduler import KeepaliveScheduler
+    from utils.latency_budget import LatencyBudget, start_latency_budget
+    from utils.interim_channel import (
+        InterimUpdate,
+        get_interim_channel,
+        publish_interim,
+    )
+    from utils.transcript_cache import (
+        TranscriptCache,
+        audio_array_digest,
+        get_transcript_cache,
+        transcript_cache_key,
+    )
     from utils import parse_hotkey, paste_transcript
     from utils.hotkey import hotkeys_conflict
     from utils.permissions import (
@@ -247,6 +280,15 @@ class PulseScribeDaemon:
         self._interim_timer_interval_seconds = None
         self._last_interim_mtime = 0.0
         self._interim_idle_ticks = 0
+        # Push-Abo auf den Interim-Channel (ersetzt das Dateipolling)
+        self._interim_unsubscribe: Callable[[], None] | None = None
+        self._last_interim_seq = 0
+        self._interim_socket = None
+        # Streaming-Refine: bereits eingefügter Präfix des finalen Transkripts
+        self._stream_pasted_text = ""
+        self._stream_paste_failed = False
+        # Latenzbudget ab Aufnahme-Stopp (None = PULSESCRIBE_LATENCY_BUDGET_MS aus)
+        self._latency_budget: LatencyBudget | None = None
         self._last_ui_state_payload: tuple[AppState, str | None] | None = None
         self._last_menubar_title: str | None = None
         # Watchdog-Timer: Verhindert hängendes Overlay bei Worker-Problemen
@@ -288,6 +330,9 @@ class PulseScribeDaemon:
         # Keep-Alive Timer für Metal-Shader (verhindert Cache-Eviction bei Inaktivität)
         self._keepalive_stop_event = threading.Event()
         self._keepalive_thread: threading.Thread | None = None
+        # Adaptiver Keep-Alive: lernt Diktat-Rhythmus, weckt Loop bei Aufnahmestart
+        self._keepalive_scheduler: KeepaliveScheduler | None = None
+        self._keepalive_wake_event = threading.Event()
 
     # =============================================================================
     # Thread-safe State Properties
@@ -651,42 +696,6 @@ class PulseScribeDaemon:
                 backend = "whisper"
         return backend or None
 
-    @staticmethod
-    def _trim_silence(
-        data,
-        threshold: float,
-        sample_rate: int,
-        pad_s: float = 0.15,
-    ):
-        """Schneidet Stille am Anfang/Ende ab (RMS über kurze Fenster)."""
-        import numpy as np
-
-        mono = data.squeeze()
-        if mono.ndim != 1:
-            mono = mono.reshape(-1)
-        window = int(sample_rate * 0.02)  # 20ms
-        hop = int(sample_rate * 0.01)  # 10ms
-        if mono.shape[0] <= window:
-            return mono.astype(np.float32, copy=False)
-        frame_count = (mono.shape[0] - window) // hop + 1
-        if frame_count <= 0:
-            return mono.astype(np.float32, copy=False)
-        strides = (mono.strides[0] * hop, mono.strides[0])
-        frames = np.lib.stride_tricks.as_strided(
-            mono, shape=(frame_count, window), strides=strides
-        )
-        rms = np.sqrt(np.mean(frames**2, axis=1))
-        # Für Trimming ist ein "inklusive" Threshold sinnvoller, um leise
-        # Auskling-Phoneme nicht abzuschneiden (>= statt >).
-        active = rms >= threshold
-        if not np.any(active):
-            return mono.astype(np.float32, copy=False)
-        first = int(np.argmax(active))
-        last = int(len(active) - np.argmax(active[::-1]) - 1)
-        start = max(0, first * hop - int(pad_s * sample_rate))
-        end = min(mono.shape[0], last * hop + window + int(pad_s * sample_rate))
-        return mono[start:end].astype(np.float32, copy=False)
-
     def _preload_local_model_async(self) -> None:
         """Lädt lokales Modell im Hintergrund vor (reduziert erste Latenz)."""
         if self.mode != "local":
@@ -759,8 +768,10 @@ class PulseScribeDaemon:
     def _start_keepalive_timer(self) -> None:
         """Startet Keep-Alive Timer für Metal-Shader (nur für lokale Metal-Backends).
 
-        Der Timer ruft periodisch provider.keepalive() auf, um Metal-Shader
-        im GPU-Cache zu halten und Cache-Eviction bei Inaktivität zu verhindern.
+        Der Timer ruft provider.keepalive() auf, um Metal-Shader im GPU-Cache
+        zu halten und Cache-Eviction bei Inaktivität zu verhindern. Adaptiv
+        (Default) nur, wenn laut KeepaliveScheduler ein Diktat wahrscheinlich
+        ist; sonst fest alle LOCAL_KEEPALIVE_INTERVAL Sekunden.
         """
         if self.mode != "local":
             return
@@ -781,21 +792,62 @@ class PulseScribeDaemon:
             logger.debug(f"Keep-Alive nicht nötig für Backend '{backend}'")
             return
 
+        scheduler = None
+        if get_local_keepalive_adaptive():
+            scheduler = KeepaliveScheduler(
+                interval_s=LOCAL_KEEPALIVE_INTERVAL,
+                state_path=KEEPALIVE_STATS_FILE,
+                min_probability=get_local_keepalive_min_probability(),
+                warmup_s=KEEPALIVE_WARMUP_DURATION,
+                rewarm_s=PRELOAD_WARMUP_DURATION,
+            )
+        self._keepalive_scheduler = scheduler
         self._keepalive_stop_event.clear()
+        self._keepalive_wake_event.clear()
 
         def _keepalive_loop():
             logger.info(
-                f"Keep-Alive Timer gestartet (Interval: {LOCAL_KEEPALIVE_INTERVAL}s, Backend: {backend})"
+                f"Keep-Alive Timer gestartet (Interval: {LOCAL_KEEPALIVE_INTERVAL}s, "
+                f"Backend: {backend}, {'adaptiv' if scheduler else 'fest'})"
             )
-            while not self._keepalive_stop_event.wait(LOCAL_KEEPALIVE_INTERVAL):
+            wait_s = LOCAL_KEEPALIVE_INTERVAL
+            while not self._keepalive_stop_event.is_set():
+                woken = self._keepalive_wake_event.wait(wait_s)
+                self._keepalive_wake_event.clear()
+                if self._keepalive_stop_event.is_set():
+                    break
+                decision = None
+                if scheduler is not None:
+                    if woken:
+                        # Aufnahmestart: nach kalter Phase parallel zur Aufnahme wärmen
+                        wait_s = LOCAL_KEEPALIVE_INTERVAL
+                        decision = scheduler.wake_decision()
+                        if decision is None:
+                            continue
+                    else:
+                        decision = scheduler.decide()
+                        wait_s = decision.next_check_s
+                        if not decision.warm:
+                            continue
                 # Nur Keep-Alive wenn IDLE (nicht während Recording/Transcribing)
-                if self._current_state != AppState.IDLE:
+                if not woken and self._current_state != AppState.IDLE:
                     logger.debug("Keep-Alive übersprungen (nicht IDLE)")
                     continue
+                t0 = time.perf_counter()
                 try:
-                    provider.keepalive(self.model)  # type: ignore[attr-defined]
+                    if decision is None:
+                        provider.keepalive(self.model)  # type: ignore[attr-defined]
+                    else:
+                        provider.keepalive(  # type: ignore[attr-defined]
+                            self.model, duration_s=decision.warmup_s
+                        )
                 except Exception as e:
                     logger.debug(f"Keep-Alive fehlgeschlagen: {e}")
+                    continue
+                if scheduler is not None and decision is not None:
+                    scheduler.record_keepalive(
+                        (time.perf_counter() - t0) * 1000, rewarm=decision.rewarm
+                    )
             logger.debug("Keep-Alive Timer gestoppt")
 
         self._keepalive_thread = threading.Thread(
@@ -803,22 +855,47 @@ class PulseScribeDaemon:
         )
         self._keepalive_thread.start()
 
+    def _notify_keepalive_dictation(self) -> None:
+        """Meldet einen Aufnahmestart an den adaptiven Keep-Alive."""
+        scheduler = self._keepalive_scheduler
+        if scheduler is None:
+            return
+        scheduler.record_dictation()
+        self._keepalive_wake_event.set()
+
     def _stop_keepalive_timer(self) -> None:
         """Stoppt den Keep-Alive Timer."""
         self._keepalive_stop_event.set()
+        self._keepalive_wake_event.set()
         if self._keepalive_thread is not None:
             self._keepalive_thread.join(timeout=1.0)
             self._keepalive_thread = None
+        scheduler, self._keepalive_scheduler = self._keepalive_scheduler, None
+        if scheduler is not None:
+            scheduler.save_state()
+            logger.info(f"Keep-Alive-Bilanz: {scheduler.describe()}")
 
-    def _update_state(self, state: AppState, text: str | None = None) -> None:
+    def _update_state(
+        self,
+        state: AppState,
+        text: str | None = None,
+        *,
+        only_if: AppState | None = None,
+    ) -> None:
         """Aktualisiert State und benachrichtigt UI-Controller.
 
         Thread-safe: Kann von jedem Thread aufgerufen werden.
         UI-Updates werden automatisch auf den Main-Thread dispatcht.
+
+        Args:
+            only_if: Nur übernehmen, wenn der State (atomar geprüft) noch
+                diesem Wert entspricht.
         """
         # Atomares Read-Modify-Write mit explizitem Lock
         with self._state_lock:
             prev_state = self.__current_state
+            if only_if is not None and prev_state != only_if:
+                return
             previous_ui_payload = self._last_ui_state_payload
             self.__current_state = state
             next_ui_payload = (state, text)
@@ -1024,6 +1101,8 @@ class PulseScribeDaemon:
 
     def _handle_worker_error(self, err: Exception) -> None:
         self._last_rtf = None  # RTF bei Fehler zurücksetzen
+        self._reset_stream_paste()
+        self._latency_budget = None
         error_info = infer_daemon_status_error(err)
         error_text = build_daemon_status_label(
             AppState.ERROR,
@@ -1110,6 +1189,10 @@ class PulseScribeDaemon:
 
     def _handle_transcript_result(self, transcript: str) -> None:
         """Verarbeitet das fertige Transkript: UI-Update, History, Auto-Paste."""
+        # Streaming-Refine hat evtl. schon Sätze eingefügt: nur den Rest
+        paste_text = self._take_unpasted_remainder(transcript)
+        budget, self._latency_budget = self._latency_budget, None
+
         # Test-Modus: Callback ausführen, kein Auto-Paste
         if self._test_run_active:
             self._last_rtf = None  # RTF im Test-Modus nicht relevant
@@ -1133,10 +1216,39 @@ class PulseScribeDaemon:
         get_sound_player().play("done")  # Sofortiges auditives Feedback
         self._flush_ui_and_wait()  # ✅ muss sichtbar sein BEVOR Text eingefügt wird
         self._save_to_history(transcript)
-        self._paste_result(transcript)
+        if paste_text:
+            self._paste_result(paste_text)
+        if budget is not None:
+            budget.finish()
         self._update_state(AppState.IDLE)  # Reset nach erfolgreichem Paste
         self._apply_pending_hotkey_reconfigure_if_safe()
 
+    def _handle_transcript_chunk(self, text: str) -> None:
+        """Fügt einen fertigen Satzblock des Streaming-Refines sofort ein.
+
+        Nach einem fehlgeschlagenen Paste wird nichts mehr vorab eingefügt;
+        der Rest geht dann gesammelt über _handle_transcript_result.
+        """
+        if self._test_run_active or self._stream_paste_failed or not text:
+            return
+        if paste_transcript(text):
+            self._stream_pasted_text += text
+        else:
+            logger.error("Auto-Paste (Streaming-Refine) fehlgeschlagen")
+            self._stream_paste_failed = True
+
+    def _reset_stream_paste(self) -> None:
+        self._stream_pasted_text = ""
+        self._stream_paste_failed = False
+
+    def _take_unpasted_remainder(self, transcript: str) -> str:
+        """Liefert den noch nicht eingefügten Teil und setzt den Stream-Status zurück."""
+        from refine.llm import unpasted_remainder
+
+        pasted = self._stream_pasted_text
+        self._reset_stream_paste()
+        return unpasted_remainder(transcript, pasted)
+
     def _maybe_refine(
         self,
         transcript: str,
@@ -1160,6 +1272,9 @@ class PulseScribeDaemon:
                 type=MessageType.STATUS_UPDATE, payload=AppState.REFINING
             )
         )
+        if get_refine_stream_paste_enabled() and not self._test_run_active:
+            return self._stream_refine(transcript, result_queue=result_queue)
+
         from refine.llm import maybe_refine_transcript
 
         original = transcript
@@ -1169,10 +1284,36 @@ class PulseScribeDaemon:
             refine_model=self.refine_model,
             refine_provider=self.refine_provider,
             context=self.context,
+            budget=self._latency_budget,
         )
         self._last_was_refined = transcript != original
         return transcript
 
+    def _stream_refine(
+        self,
+        transcript: str,
+        *,
+        result_queue: queue.Queue[DaemonMessage | Exception],
+    ) -> str:
+        """Streaming-Refine: fertige Sätze gehen als TRANSCRIPT_CHUNK vorab an den Main-Thread."""
+        from refine.llm import maybe_refine_transcript_streaming
+
+        def on_sentences(text: str) -> None:
+            result_queue.put(
+                DaemonMessage(type=MessageType.TRANSCRIPT_CHUNK, payload=text)
+            )
+
+        result = maybe_refine_transcript_streaming(
+            transcript,
+            on_sentences=on_sentences,
+            refine_model=self.refine_model,
+            refine_provider=self.refine_provider,
+            context=self.context,
+            budget=self._latency_budget,
+        )
+        self._last_was_refined = result.refined
+        return result.text
+
     def _save_to_history(self, transcript: str) -> None:
         """Speichert Transkript in der Historie."""
         from utils.history import save_transcript
@@ -1735,6 +1876,8 @@ class PulseScribeDaemon:
 
         self._recording = True
         self._update_state(AppState.LISTENING)
+        if effective_mode == "local":
+            self._notify_keepalive_dictation()
 
         # Interim-Datei löschen, um veralteten Text zu vermeiden
         INTERIM_FILE.unlink(missing_ok=True)
@@ -1771,18 +1914,26 @@ class PulseScribeDaemon:
         self._worker_thread.start()
 
         # Interim-Polling starten (nur bei Streaming sinnvoll, aber schadet nicht)
-        if use_streaming:
+        if use_streaming or (
+            effective_mode == "local" and get_local_streaming_enabled()
+        ):
             self._start_interim_polling()
 
         # Result-Polling sofort starten für Audio-Levels und VAD
         self._start_result_polling()
 
     def _start_interim_polling(self) -> None:
-        """Startet NSTimer für Interim-Text-Polling.
+        """Startet Interim-Updates: Push-Abo, Dateipolling nur als Fallback.
+
+        Mit Push (Default) abonniert der Daemon den Interim-Channel; Provider
+        schreiben dann keine Interim-Datei mehr. Ohne Push: NSTimer-Polling.
 
         Verwendet weakref um Circular References zu vermeiden:
         NSTimer → Block → self → NSTimer würde Memory-Leak verursachen.
         """
+        if get_interim_push_enabled():
+            self._subscribe_interim_channel()
+            return
         if self._interim_timer is not None:
             self._update_interim_timer_interval()
             return
@@ -1791,6 +1942,43 @@ class PulseScribeDaemon:
         self._interim_idle_ticks = 0
         self._schedule_interim_timer(INTERIM_POLL_INTERVAL_ACTIVE)
 
+    def _subscribe_interim_channel(self) -> None:
+        if self._interim_unsubscribe is not None:
+            return
+        channel = get_interim_channel()
+        channel.clear()
+        weak_self = weakref.ref(self)
+
+        def on_update(update: InterimUpdate) -> None:
+            daemon = weak_self()
+            if daemon is not None:
+                daemon._on_interim_update(update)
+
+        self._interim_unsubscribe = channel.subscribe(on_update)
+
+    def _on_interim_update(self, update: InterimUpdate) -> None:
+        """Interim-Update aus dem Deepgram-Loop-Thread → Main-Thread."""
+        self._call_on_main(lambda: self._apply_interim_update(update))
+
+    def _apply_interim_update(self, update: InterimUpdate) -> None:
+        """Zeigt ein Interim-Update, solange noch aufgenommen wird.
+
+        Der Worker kann parallel auf TRANSCRIBING wechseln; ``only_if`` prüft
+        und setzt den State atomar, damit ein spätes Interim ihn nicht auf
+        RECORDING zurücksetzt.
+        """
+        with self._state_lock:
+            if self.__current_state != AppState.RECORDING:
+                return
+            if update.seq <= self._last_interim_seq:
+                return  # überholtes Update
+            self._last_interim_seq = update.seq
+        interim_text = update.text[-INTERIM_POLL_MAX_CHARS:].strip()
+        if interim_text:
+            self._update_state(
+                AppState.RECORDING, interim_text, only_if=AppState.RECORDING
+            )
+
     def _desired_interim_poll_interval(self) -> float:
         """Verlangsamt Dateipolling leicht, wenn sich Interim-Inhalte stabilisieren."""
         if self._interim_idle_ticks >= INTERIM_POLL_IDLE_THRESHOLD:
@@ -1863,7 +2051,10 @@ class PulseScribeDaemon:
         self._interim_timer_interval_seconds = None
 
     def _stop_interim_polling(self) -> None:
-        """Stoppt Interim-Polling."""
+        """Stoppt Interim-Polling bzw. das Push-Abo."""
+        unsubscribe, self._interim_unsubscribe = self._interim_unsubscribe, None
+        if unsubscribe is not None:
+            unsubscribe()
         if self._interim_timer:
             self._interim_timer.invalidate()
             self._interim_timer = None
@@ -2035,13 +2226,17 @@ class PulseScribeDaemon:
         run_id: int | None,
         result_queue_ref: queue.Queue[DaemonMessage | Exception],
         stop_event: threading.Event | None,
-    ) -> tuple[list[Any], float, bool]:
-        import numpy as np
-        import sounddevice as sd
-
-        recorded_chunks: list[Any] = []
-        max_rms = 0.0
-        had_speech = False
+        spool: RecordingSpool | None = None,
+        progressive: ProgressiveTranscriber | None = None,
+        local_streaming: Any | None = None,
+    ) -> tuple[SampleBuffer, StreamingVAD]:
+        sd = get_sounddevice()
+
+        # Block-Puffer: kein indata.copy() pro Callback; beim Stop kopiert
+        # _prepare_recorded_audio nur den getrimmten Bereich (inkl. Padding)
+        recorded_audio = SampleBuffer(sample_rate=WHISPER_SAMPLE_RATE)
+        # Streaming-VAD: Sprache + Trim-Punkte inkrementell, kein O(n)-Pass beim Stop
+        vad = StreamingVAD(sample_rate=WHISPER_SAMPLE_RATE, threshold=VAD_THRESHOLD)
         player = get_sound_player()
         finished_event = threading.Event()
         callback_abort_exc = getattr(sd, "CallbackAbort", None)
@@ -2050,11 +2245,10 @@ class PulseScribeDaemon:
         player.play("ready")
 
         def callback(indata, _frames, _time, _status):
-            nonlocal max_rms, had_speech
-            recorded_chunks.append(indata.copy())
-            rms = float(np.sqrt(np.mean(indata**2)))
-            max_rms = max(max_rms, rms)
-            had_speech = had_speech or rms > VAD_THRESHOLD
+            recorded_audio.append(indata)
+            if spool is not None:
+                spool.write(indata)
+            rms = vad.feed(indata)
             try:
                 result_queue_ref.put_nowait(
                     DaemonMessage(type=MessageType.AUDIO_LEVEL, payload=rms)
@@ -2085,6 +2279,12 @@ class PulseScribeDaemon:
             self._set_worker_phase("recording:capture", run_id=run_id)
             while stop_event is not None and not stop_event.is_set():
                 sd.sleep(50)
+                if progressive is not None:
+                    # Abgeschlossene Sprechpausen schon jetzt transkribieren
+                    progressive.poll(recorded_audio, vad)
+                if local_streaming is not None:
+                    # Gleitendes Fenster neu dekodieren (Interim-Text)
+                    local_streaming.poll(recorded_audio)
         finally:
             self._shutdown_input_stream(
                 stream,
@@ -2094,71 +2294,51 @@ class PulseScribeDaemon:
 
         self._set_worker_phase("recording:stop-sound", run_id=run_id)
         player.play("stop")
-        return recorded_chunks, max_rms, had_speech
+        return recorded_audio, vad
 
     def _prepare_recorded_audio(
         self,
         *,
-        recorded_chunks: list[Any],
-        max_rms: float,
-        had_speech: bool,
+        recorded_audio: SampleBuffer,
+        vad: StreamingVAD,
         result_queue_ref: queue.Queue[DaemonMessage | Exception],
         run_id: int | None,
     ) -> tuple[Any, float] | None:
-        import numpy as np
-
         self._set_worker_phase("recording:finalize-audio", run_id=run_id)
-        if not recorded_chunks:
+        if not len(recorded_audio):
             logger.warning("Keine Audiodaten aufgenommen")
             # Leeres Ergebnis signalisieren, damit Result-Polling sauber endet.
             self._put_empty_transcript_result(result_queue_ref)
             return None
-        if not had_speech:
+        if not vad.had_speech:
             logger.info(
-                f"Keine Sprache erkannt (max_rms={max_rms:.4f}) – Transkription übersprungen"
+                f"Keine Sprache erkannt (max_rms={vad.max_rms:.4f}) – Transkription übersprungen"
             )
             self._put_empty_transcript_result(result_queue_ref)
             return None
 
-        audio_data = np.concatenate(recorded_chunks)
-        audio_duration = 0.0
-        if not hasattr(audio_data, "shape"):
-            return audio_data, audio_duration
-
-        raw_duration = float(audio_data.shape[0]) / WHISPER_SAMPLE_RATE
-        # VAD_THRESHOLD ist fürs Triggern optimiert und kann am Ende zu aggressiv
-        # sein. Für Trimming nutzen wir einen konservativeren dynamischen Wert.
-        trim_threshold = VAD_THRESHOLD * 0.5
-        if max_rms > 0:
-            trim_threshold = min(trim_threshold, max_rms * 0.03)
-        trimmed_audio = self._trim_silence(
-            audio_data,
-            trim_threshold,
-            WHISPER_SAMPLE_RATE,
-            pad_s=0.25,
+        raw_duration = len(recorded_audio) / WHISPER_SAMPLE_RATE
+        # Trim-Punkte liegen dank Streaming-VAD schon vor (konservative,
+        # dynamische Schwelle) – kopiert wird nur der getrimmte Bereich.
+        trim_bounds = vad.trim_bounds(pad_s=0.25)
+        start, end = trim_bounds if trim_bounds is not None else (0, None)
+
+        # Lokales Whisper profitiert oft von etwas künstlicher End-Silence, damit
+        # letzte Wörter stabiler dekodiert werden. Sie landet direkt im Ergebnis
+        # von take() statt per zweiter concatenate-Kopie.
+        mode_for_run = self._run_mode or self.mode
+        tail_samples = int(WHISPER_SAMPLE_RATE * 0.2) if mode_for_run == "local" else 0
+        audio_data = recorded_audio.take(start, end, pad_frames=tail_samples).reshape(-1)
+        trimmed_duration = (
+            float(audio_data.shape[0] - tail_samples) / WHISPER_SAMPLE_RATE
         )
-        trimmed_duration = float(trimmed_audio.shape[0]) / WHISPER_SAMPLE_RATE
         if trimmed_duration < raw_duration - 0.05:
             logger.info(
                 f"Trimmed silence: raw={raw_duration:.2f}s -> "
                 f"trimmed={trimmed_duration:.2f}s"
             )
 
-        audio_data = trimmed_audio
-        audio_duration = trimmed_duration
-
-        # Lokales Whisper profitiert oft von etwas künstlicher End-Silence, damit
-        # letzte Wörter stabiler dekodiert werden.
-        mode_for_run = self._run_mode or self.mode
-        if mode_for_run == "local":
-            tail_s = 0.2
-            tail_samples = int(WHISPER_SAMPLE_RATE * tail_s)
-            if tail_samples > 0:
-                audio_data = np.concatenate(
-                    [audio_data, np.zeros(tail_samples, dtype=np.float32)]
-                )
-                audio_duration += tail_s
-
+        audio_duration = float(audio_data.shape[0]) / WHISPER_SAMPLE_RATE
         return audio_data, audio_duration
 
     def _log_local_preload_status(
@@ -2195,11 +2375,7 @@ class PulseScribeDaemon:
         result_queue_ref: queue.Queue[DaemonMessage | Exception],
         run_id: int | None,
     ) -> str:
-        import soundfile as sf
-
-        fd, temp_path = tempfile.mkstemp(suffix=".wav")
-        os.close(fd)
-
+        temp_path: str | None = None
         try:
             mode_for_run = (
                 self._run_mode
@@ -2222,12 +2398,34 @@ class PulseScribeDaemon:
                         audio_data, model=model_for_provider, language=self.language
                     )
                 else:
-                    sf.write(temp_path, audio_data, WHISPER_SAMPLE_RATE)
-                    transcript = provider.transcribe(
-                        Path(temp_path),
-                        model=model_for_provider,
-                        language=self.language,
+                    cache_entry = self._transcript_cache_entry(
+                        audio_data, mode_for_run, provider
                     )
+                    cached = cache_entry[0].get(cache_entry[1]) if cache_entry else None
+                    if cached is not None:
+                        logger.info(f"Transkript aus Cache ({mode_for_run})")
+                        transcript = cached
+                    elif hasattr(provider, "transcribe_audio"):
+                        # REST-Provider: WAV im RAM encodieren, kein Disk-Roundtrip
+                        transcript = provider.transcribe_audio(  # type: ignore[attr-defined]
+                            audio_data,
+                            model=model_for_provider,
+                            language=self.language,
+                            sample_rate=WHISPER_SAMPLE_RATE,
+                        )
+                    else:
+                        import soundfile as sf
+
+                        fd, temp_path = tempfile.mkstemp(suffix=".wav")
+                        os.close(fd)
+                        sf.write(temp_path, audio_data, WHISPER_SAMPLE_RATE)
+                        transcript = provider.transcribe(
+                            Path(temp_path),
+                            model=model_for_provider,
+                            language=self.language,
+                        )
+                    if cache_entry is not None and cached is None:
+                        cache_entry[0].put(cache_entry[1], transcript)
             except Exception as e:
                 if mode_for_run == "local":
                     raise
@@ -2255,9 +2453,201 @@ class PulseScribeDaemon:
             )
             return transcript
         finally:
-            if os.path.exists(temp_path):
+            if temp_path is not None and os.path.exists(temp_path):
                 os.unlink(temp_path)
 
+    def _transcript_cache_entry(
+        self, audio_data: Any, mode_for_run: str, provider: Any
+    ) -> tuple[TranscriptCache, str] | None:
+        """Transkript-Cache und Schlüssel für eine REST-Aufnahme (None = aus)."""
+        cache = get_transcript_cache(live_dictation=True)
+        if cache is None:
+            return None
+        key = transcript_cache_key(
+            audio_array_digest(audio_data, WHISPER_SAMPLE_RATE),
+            provider=mode_for_run,
+            # REST-Provider bekommen model=None → ihr Default-Modell
+            model=getattr(provider, "default_model", None),
+            language=self.language,
+        )
+        return cache, key
+
+    def _start_recording_spool(self) -> RecordingSpool | None:
+        """Startet den Crash-Recovery-Spool für REST-Provider.
+
+        Hochgeladen wird weiterhin aus dem RAM (VAD-Trim, Upload-Codec); die
+        Spool-Datei bleibt nur liegen, wenn der Prozess vorher abstürzt.
+        """
+        mode_for_run = self._run_mode or self.mode
+        if mode_for_run == "local" or not get_recording_spool_enabled():
+            return None
+        spool = RecordingSpool(sample_rate=WHISPER_SAMPLE_RATE)
+        try:
+            spool.start()
+        except Exception as e:
+            logger.warning(f"Recording-Spool nicht verfügbar: {e}")
+            spool.discard()
+            return None
+        return spool
+
+    def _start_progressive_transcription(self) -> ProgressiveTranscriber | None:
+        """Progressive Transkription für Provider mit Array-API (opt-in)."""
+        if not get_progressive_transcription_enabled():
+            return None
+        mode_for_run = (
+            self._run_mode or self.mode or os.getenv("PULSESCRIBE_MODE", "deepgram")
+        )
+        provider = self._get_provider(mode_for_run)
+        if not hasattr(provider, "transcribe_audio"):
+            return None
+
+        if mode_for_run == "local":
+            model = self.model
+            extra: dict[str, Any] = {}
+            workers = 1  # ein Modell, serielle Inferenz
+        else:
+            model = None
+            extra = {"sample_rate": WHISPER_SAMPLE_RATE}
+            workers = PROGRESSIVE_REST_WORKERS
+
+        def transcribe_segment(segment) -> str:
+            return provider.transcribe_audio(  # type: ignore[attr-defined]
+                segment, model=model, language=self.language, **extra
+            )
+
+        return ProgressiveTranscriber(
+            transcribe_segment,
+            sample_rate=WHISPER_SAMPLE_RATE,
+            min_segment_seconds=get_progressive_min_segment_seconds(),
+            max_workers=workers,
+        )
+
+    def _start_local_streaming(self) -> Any | None:
+        """Streaming-Session für Local-Mode (opt-in, faster-whisper)."""
+        mode_for_run = self._run_mode or self.mode
+        if mode_for_run != "local" or not get_local_streaming_enabled():
+            return None
+        provider = self._get_provider("local")
+        supports = getattr(provider, "supports_local_streaming", None)
+        if not callable(supports) or not supports():
+            logger.info(
+                "Local-Streaming nicht verfügbar (nur faster-whisper ohne "
+                "Model-Server) – Standard-Aufnahme"
+            )
+            return None
+
+        def write_interim(text: str) -> None:
+            publish_interim(text, fallback_file=INTERIM_FILE)
+
+        return provider.create_streaming_session(  # type: ignore[attr-defined]
+            model=self.model, language=self.language, on_interim=write_interim
+        )
+
+    def _finish_local_streaming(
+        self,
+        *,
+        local_streaming: Any,
+        recorded_audio: SampleBuffer,
+        vad: StreamingVAD,
+        result_queue_ref: queue.Queue[DaemonMessage | Exception],
+        run_id: int | None,
+    ) -> str | None:
+        """Dekodiert nur den unbestätigten Rest der Local-Streaming-Session.
+
+        Returns:
+            Transkript oder None, wenn keine Sprache aufgenommen wurde (leeres
+            Ergebnis ist dann schon gesendet). Bei Fehlern wird die komplette
+            Aufnahme wie bisher transkribiert.
+        """
+        self._set_worker_phase("recording:finalize-audio", run_id=run_id)
+        if not len(recorded_audio) or not vad.had_speech:
+            local_streaming.close()
+            self._put_empty_transcript_result(result_queue_ref)
+            return None
+        # Start nicht trimmen: Frame-Offsets der Session bleiben gültig
+        trim_bounds = vad.trim_bounds(pad_s=0.25)
+        end = trim_bounds[1] if trim_bounds is not None else None
+        audio_data = recorded_audio.take(
+            0, end, pad_frames=int(WHISPER_SAMPLE_RATE * 0.2)
+        ).reshape(-1)
+
+        self._set_worker_phase("recording:transcribing", run_id=run_id)
+        t0 = time.perf_counter()
+        tail_seconds = (audio_data.shape[0] - local_streaming.window_frame) / WHISPER_SAMPLE_RATE
+        try:
+            transcript = local_streaming.finish(audio_data, timeout=TRANSCRIBING_TIMEOUT)
+        except Exception as e:
+            logger.warning(
+                f"Local-Streaming fehlgeschlagen ({e}), transkribiere komplette Aufnahme"
+            )
+            start = trim_bounds[0] if trim_bounds is not None else 0
+            audio_data = audio_data[start:]
+            return self._transcribe_recorded_audio(
+                audio_data=audio_data,
+                audio_duration=float(audio_data.shape[0]) / WHISPER_SAMPLE_RATE,
+                result_queue_ref=result_queue_ref,
+                run_id=run_id,
+            )
+
+        logger.info(
+            f"Local-Streaming: {local_streaming.decodes} Zwischen-Dekodierungen, "
+            f"audio={audio_data.shape[0] / WHISPER_SAMPLE_RATE:.2f}s, "
+            f"Rest={tail_seconds:.2f}s, nach Stop={time.perf_counter() - t0:.2f}s"
+        )
+        return transcript
+
+    def _finish_progressive_transcription(
+        self,
+        *,
+        progressive: ProgressiveTranscriber,
+        recorded_audio: SampleBuffer,
+        vad: StreamingVAD,
+        result_queue_ref: queue.Queue[DaemonMessage | Exception],
+        run_id: int | None,
+    ) -> str:
+        """Transkribiert nur den Rest nach dem letzten Schnitt und fügt zusammen.
+
+        Schlägt ein Segment fehl, wird wie bisher die komplette Aufnahme
+        transkribiert (inkl. Local-Fallback in `_transcribe_recorded_audio`).
+        """
+        import numpy as np
+
+        self._set_worker_phase("recording:finalize-audio", run_id=run_id)
+        audio_data = recorded_audio.take().reshape(-1)
+        tail = progressive.tail_after_cut(audio_data, vad)
+        mode_for_run = self._run_mode or self.mode
+        if tail is not None and mode_for_run == "local":
+            tail = np.concatenate(
+                [tail, np.zeros(int(WHISPER_SAMPLE_RATE * 0.2), dtype=np.float32)]
+            )
+
+        self._set_worker_phase("recording:transcribing", run_id=run_id)
+        t0 = time.perf_counter()
+        segments = progressive.segment_count + (tail is not None)
+        try:
+            transcript = progressive.finish(tail, timeout=TRANSCRIBING_TIMEOUT)
+        except Exception as e:
+            logger.warning(
+                f"Progressive Transkription fehlgeschlagen ({e}), "
+                "transkribiere komplette Aufnahme"
+            )
+            trim_bounds = vad.trim_bounds(pad_s=0.25)
+            if trim_bounds is not None:
+                audio_data = audio_data[trim_bounds[0] : trim_bounds[1]]
+            return self._transcribe_recorded_audio(
+                audio_data=audio_data,
+                audio_duration=float(audio_data.shape[0]) / WHISPER_SAMPLE_RATE,
+                result_queue_ref=result_queue_ref,
+                run_id=run_id,
+            )
+
+        logger.info(
+            f"Progressive Transkription: {segments} Segmente, "
+            f"audio={audio_data.shape[0] / WHISPER_SAMPLE_RATE:.2f}s, "
+            f"nach Stop={time.perf_counter() - t0:.2f}s"
+        )
+        return transcript
+
     def _log_transcription_performance(
         self,
         *,
@@ -2298,7 +2688,10 @@ class PulseScribeDaemon:
         Standard-Aufnahme für OpenAI, Groq, Local.
 
         Nimmt Audio auf bis Stop-Event, speichert als WAV,
-        und ruft dann Provider direkt auf.
+        und ruft dann Provider direkt auf. Mit
+        PULSESCRIBE_PROGRESSIVE_TRANSCRIPTION laufen abgeschlossene Segmente
+        schon während der Aufnahme, mit PULSESCRIBE_LOCAL_STREAMING (local)
+        liefert ein gleitendes Fenster Interim-Text.
 
         Garantiert: Sendet IMMER entweder TRANSCRIPT_RESULT oder Exception.
         """
@@ -2309,29 +2702,57 @@ class PulseScribeDaemon:
         self._set_worker_phase("recording:boot", run_id=run_id)
         logger.debug(f"RecordingWorker gestartet (run={run_id})")
 
+        spool = None
+        progressive = None
+        local_streaming = None
         try:
-            recorded_chunks, max_rms, had_speech = self._capture_recording_audio(
+            spool = self._start_recording_spool()
+            local_streaming = self._start_local_streaming()
+            if local_streaming is None:
+                progressive = self._start_progressive_transcription()
+            recorded_audio, vad = self._capture_recording_audio(
                 run_id=run_id,
                 result_queue_ref=result_queue_ref,
                 stop_event=stop_event,
+                spool=spool,
+                progressive=progressive,
+                local_streaming=local_streaming,
             )
-            prepared_audio = self._prepare_recorded_audio(
-                recorded_chunks=recorded_chunks,
-                max_rms=max_rms,
-                had_speech=had_speech,
-                result_queue_ref=result_queue_ref,
-                run_id=run_id,
-            )
-            if prepared_audio is None:
-                return
-
-            audio_data, audio_duration = prepared_audio
-            transcript = self._transcribe_recorded_audio(
-                audio_data=audio_data,
-                audio_duration=audio_duration,
-                result_queue_ref=result_queue_ref,
-                run_id=run_id,
-            )
+            if local_streaming is not None:
+                transcript = self._finish_local_streaming(
+                    local_streaming=local_streaming,
+                    recorded_audio=recorded_audio,
+                    vad=vad,
+                    result_queue_ref=result_queue_ref,
+                    run_id=run_id,
+                )
+                if transcript is None:
+                    return
+            elif progressive is not None and progressive.has_segments:
+                transcript = self._finish_progressive_transcription(
+                    progressive=progressive,
+                    recorded_audio=recorded_audio,
+                    vad=vad,
+                    result_queue_ref=result_queue_ref,
+                    run_id=run_id,
+                )
+            else:
+                prepared_audio = self._prepare_recorded_audio(
+                    recorded_audio=recorded_audio,
+                    vad=vad,
+                    result_queue_ref=result_queue_ref,
+                    run_id=run_id,
+                )
+                if prepared_audio is None:
+                    return
+
+                audio_data, audio_duration = prepared_audio
+                transcript = self._transcribe_recorded_audio(
+                    audio_data=audio_data,
+                    audio_duration=audio_duration,
+                    result_queue_ref=result_queue_ref,
+                    run_id=run_id,
+                )
 
             transcript = self._maybe_refine(
                 transcript,
@@ -2351,6 +2772,13 @@ class PulseScribeDaemon:
             logger.exception(f"Recording-Worker Fehler: {e}")
             emergency_log(f"RecordingWorker Exception: {type(e).__name__}: {e}")
             result_queue_ref.put(e)
+        finally:
+            if progressive is not None:
+                progressive.close()
+            if local_streaming is not None:
+                local_streaming.close()
+            if spool is not None:
+                spool.discard()
 
     def _stop_recording(self) -> None:
         """Stoppt Aufnahme (non-blocking) und lässt Worker im Hintergrund auslaufen."""
@@ -2361,6 +2789,9 @@ class PulseScribeDaemon:
 
         self._stop_interim_polling()
 
+        # Ab hier läuft das Latenzbudget (Text soll nach X ms erscheinen)
+        self._latency_budget = start_latency_budget()
+
         # Signal an Worker: Beende Deepgram-Stream sauber
         if self._stop_event:
             self._stop_event.set()
@@ -2523,6 +2954,10 @@ class PulseScribeDaemon:
             self._handle_audio_level_message(result, batch_state)
             return False
 
+        if result.type == MessageType.TRANSCRIPT_CHUNK:
+            self._handle_transcript_chunk(str(result.payload or ""))
+            return False
+
         if result.type == MessageType.TRANSCRIPT_RESULT:
             self._stop_result_polling()
             transcript = str(result.payload or "")
@@ -2701,6 +3136,9 @@ class PulseScribeDaemon:
         self._stop_transcribing_watchdog()
         self._stop_error_reset_timer()
         self._stop_keepalive_timer()
+        server, self._interim_socket = self._interim_socket, None
+        if server is not None:
+            server.stop()
 
         # Provider-Cache leeren (Local Whisper kann ~500MB RAM halten)
         with self._provider_cache_lock:
@@ -3426,11 +3864,31 @@ class PulseScribeDaemon:
         bindings_for_info = self._resolve_hotkey_bindings()
         self._log_startup_permission_status()
         self._print_startup_info(show_dock=show_dock, bindings_for_info=bindings_for_info)
+        report_orphaned_spools()
         self._preload_local_model_async()
+        self._start_interim_socket()
         self._reconfigure_hotkeys(show_alerts=True)
         self._install_runloop_shutdown_handlers(app=app, timer_cls=NSTimer, signal_mod=signal)
         app.run()
 
+    def _start_interim_socket(self) -> None:
+        """Interim-Updates für UIs in anderen Prozessen (opt-in)."""
+        if not get_interim_socket_enabled():
+            return
+        if not get_interim_push_enabled():
+            # Ein Socket-Abonnent würde die Interim-Datei des Pollings abklemmen
+            logger.warning("Interim-Socket benötigt PULSESCRIBE_INTERIM_PUSH=true")
+            return
+        try:
+            from utils.interim_channel import InterimBroadcastServer
+
+            server = InterimBroadcastServer()
+            server.start()
+        except Exception as e:
+            logger.warning(f"Interim-Socket nicht verfügbar: {e}")
+            return
+        self._interim_socket = server
+
     def _configure_ns_application(self):
         from AppKit import NSApplication  # type: ignore[import-not-found]
 
@@ -64,10 +64,22 @@ setup_logging(debug=_env_flag(os.getenv("PULSESCRIBE_DEBUG"), default=False))
 logger = get_logger()
 
 # Imports nach Logging-Setup
+from audio.buffer import SampleBuffer
+from audio.input_stream import get_sounddevice
+from audio.progressive import ProgressiveTranscriber
+from audio.resample import StreamingResampler, resample_audio
+from audio.spool import RecordingSpool, report_orphaned_spools
+from audio.vad import StreamingVAD
 from utils.state import AppState
 from utils.hold_state import HoldHotkeyState
 from utils.hotkey import paste_transcript
+from utils.latency_budget import LatencyBudget, start_latency_budget
 from utils.timing import redacted_text_summary
+from utils.transcript_cache import (
+    audio_array_digest,
+    get_transcript_cache,
+    transcript_cache_key,
+)
 from utils.hotkey_windows import hotkeys_conflict, parse_windows_hotkey_for_pynput
 from utils.subprocess_io import start_stream_drain_thread
 from utils.audio_latency import (
@@ -83,8 +95,10 @@ from utils.windows_responsiveness import apply_windows_responsiveness_boost
 from whisper_platform import get_clipboard, get_sound_player
 from config import (
     INTERIM_FILE,
+    TRANSCRIBING_TIMEOUT,
     WARM_STREAM_QUEUE_SIZE,
     get_input_device,
+    get_refine_stream_paste_enabled,
     get_windows_adaptive_stop_tail_enabled,
     get_windows_stop_grace_seconds,
 )
@@ -181,10 +195,11 @@ _HOTKEY_DISPATCH_SLOW_MS = 100.0
 # Timeout für "stale" Keys (Sekunden) - Keys älter als dies werden entfernt
 _KEY_STALE_TIMEOUT_SEC = 2.0
 
-# VAD Threshold: Audio-Level ab dem Sprache erkannt wird
-# REST-Modus verwendet Peak (max), Streaming verwendet RMS (niedriger)
-_VAD_THRESHOLD_PEAK = 0.01  # Für REST-Modus (float32 peak)
-_VAD_THRESHOLD_RMS = 0.003  # Für Streaming-Modus (RMS/INT16_MAX)
+# VAD Threshold: Audio-Level ab dem Sprache erkannt wird. Der Start-Trigger
+# (LISTENING → RECORDING) läuft in allen Modi über StreamingVAD (Energie +
+# Zero-Crossing wie auf macOS); der Peak dient nur noch dem adaptiven Stop-Tail.
+_VAD_THRESHOLD_PEAK = 0.01  # float32 peak
+_VAD_THRESHOLD_RMS = 0.003  # RMS (float bzw. RMS/INT16_MAX)
 
 # Adaptiver Stop-Tail: War das Audio vor dem Hotkey-Release bereits so lange
 # still, hat der Sprecher fertig gesprochen - der konservative Stop-Grace
@@ -236,40 +251,6 @@ _SHUTDOWN_TIMEOUT_SEC = 0.1
 _DONE_DISPLAY_HOLD_SEC = 0.6
 
 
-def _resample_audio(audio, from_rate: int, to_rate: int):
-    """Resampled Audio-Array von from_rate auf to_rate.
-
-    Verwendet scipy.signal.resample wenn verfügbar, sonst lineare Interpolation.
-    Für Downsampling (z.B. 48kHz → 16kHz) ist die Qualität ausreichend für Sprache.
-    """
-    import numpy as np
-
-    # Edge-Case: Leeres Audio (z.B. VAD trimmt alles)
-    if len(audio) == 0:
-        return np.array([], dtype=np.float32)
-
-    if from_rate == to_rate:
-        return audio
-
-    # Ziel-Länge berechnen
-    new_length = int(len(audio) * to_rate / from_rate)
-
-    # Versuch 1: scipy (beste Qualität, Anti-Aliasing)
-    try:
-        from scipy.signal import resample
-
-        return resample(audio, new_length).astype(np.float32)
-    except ImportError:
-        pass
-
-    # Fallback: numpy lineare Interpolation (ausreichend für Sprache)
-    return np.interp(
-        np.linspace(0, len(audio) - 1, new_length),
-        np.arange(len(audio)),
-        audio,
-    ).astype(np.float32)
-
-
 def _load_tray_dependencies():
     """Lädt pystray und Pillow (lazy)."""
     global pystray, PIL_Image, PIL_ImageDraw
@@ -337,6 +318,10 @@ class PulseScribeWindows:
         self._last_was_refined: bool = (
             False  # Ob Refinement den Text tatsächlich verändert hat
         )
+        # Streaming-Refine: bereits eingefügter Präfix des finalen Transkripts
+        self._stream_pasted_text = ""
+        # Latenzbudget ab Aufnahme-Stopp (None = PULSESCRIBE_LATENCY_BUDGET_MS aus)
+        self._latency_budget: LatencyBudget | None = None
 
         # Hold-Mode State (wie macOS)
         self._hold_state = HoldHotkeyState()
@@ -397,8 +382,21 @@ class PulseScribeWindows:
         self._watchdog_token = 0
 
         # Audio buffer für REST-Modus
-        self._audio_buffer = []
+        self._audio_buffer = SampleBuffer(sample_rate=16000)
         self._audio_sample_rate = 16000  # Default, wird in _recording_loop aktualisiert
+        # Optionaler Disk-Spool (PULSESCRIBE_SPOOL_RECORDINGS) für REST-Uploads
+        self._audio_spool: RecordingSpool | None = None
+        # Streaming-VAD der REST-Aufnahme: stille Aufnahmen nicht hochladen
+        self._audio_vad = StreamingVAD(sample_rate=16000, threshold=_VAD_THRESHOLD_RMS)
+        # Start-Trigger des Warm-Streams (nur vom Audio-Callback gefüttert,
+        # vor jedem Armen neu angelegt)
+        self._warm_stream_vad: StreamingVAD | None = None
+        # Local-Mode mit 44.1/48 kHz: Resampling auf 16 kHz schon beim Capture
+        self._audio_resampler: StreamingResampler | None = None
+        # PULSESCRIBE_PROGRESSIVE_TRANSCRIPTION: Segmente schon beim Aufnehmen
+        self._audio_progressive: ProgressiveTranscriber | None = None
+        # PULSESCRIBE_LOCAL_STREAMING: Interim-Text im Local-Mode
+        self._audio_local_streaming = None
         self._audio_lock = threading.Lock()
 
         # ═══════════════════════════════════════════════════════════════════
@@ -1080,6 +1078,13 @@ class PulseScribeWindows:
         self._is_prewarm_loading = False
         return True
 
+    def _reset_warm_stream_vad(self) -> None:
+        """Frische Start-VAD für den nächsten Armed-Abschnitt des Warm-Streams."""
+        self._warm_stream_vad = StreamingVAD(
+            sample_rate=self._warm_stream_sample_rate,
+            threshold=_VAD_THRESHOLD_RMS,
+        )
+
     def _enter_recording_from_audio_callback(self) -> None:
         """Switch LISTENING → RECORDING from the audio callback with minimal work.
 
@@ -1112,10 +1117,11 @@ class PulseScribeWindows:
         Ermöglicht instant-start Recording ohne WASAPI-Cold-Start-Delay.
         """
         import numpy as np
-        import sounddevice as sd
 
         from config import INT16_MAX
 
+        sd = get_sounddevice()
+
         input_device, sample_rate = get_input_device()
         self._warm_stream_sample_rate = sample_rate
 
@@ -1133,8 +1139,14 @@ class PulseScribeWindows:
             if status:
                 logger.debug(f"Warm-Stream Status: {status}")
 
-            # RMS immer berechnen (für VAD, unabhängig von Overlay)
-            rms = float(np.sqrt(np.mean(indata.astype(np.float32) ** 2)) / INT16_MAX)
+            armed = self._warm_stream_armed.is_set()
+            trigger_vad = self._warm_stream_vad if armed else None
+            if trigger_vad is not None:
+                # Gleiche Streaming-VAD wie die REST-Aufnahme und macOS
+                rms = trigger_vad.feed(indata, scale=INT16_MAX)
+            else:
+                # Unarmed: nur Pegel für Overlay und Stop-Tail
+                rms = float(np.sqrt(np.mean(indata.astype(np.float32) ** 2)) / INT16_MAX)
 
             # Sprach-Aktivität für adaptiven Stop-Tail tracken (empfindlichere
             # Schwelle als die Start-VAD, damit leises Ausklingen zählt)
@@ -1144,13 +1156,12 @@ class PulseScribeWindows:
             # Audio-Level für Overlay (optional)
             self._overlay_update_audio_level(rms)
 
-            if self._warm_stream_armed.is_set():
+            if armed:
                 self._latency_mark_once("first_audio_callback")
 
             # VAD: State-Transition LISTENING → RECORDING (nur wenn armed)
-            if self._warm_stream_armed.is_set():
-                current_state = self.state
-                if current_state == AppState.LISTENING and rms > _VAD_THRESHOLD_RMS:
+            if trigger_vad is not None and trigger_vad.had_speech:
+                if self.state == AppState.LISTENING:
                     logger.debug(f"VAD triggered: level={rms:.4f}")
                     self._enter_recording_from_audio_callback()
 
@@ -1229,6 +1240,7 @@ class PulseScribeWindows:
                         "Warm-Stream Queue voll, Pre-Roll-Audio wurde verworfen"
                     )
                     break
+            self._reset_warm_stream_vad()
             self._warm_stream_armed.set()
 
         if preroll_chunks:
@@ -1398,6 +1410,7 @@ class PulseScribeWindows:
 
             logger.info("Stoppe Aufnahme...")
             self._latency_mark("stop_requested")
+            self._latency_budget = start_latency_budget()
 
             # Hold-Flag zurücksetzen - egal wie Recording gestoppt wurde
             self._hold_state.reset()
@@ -1471,27 +1484,31 @@ class PulseScribeWindows:
     def _recording_loop(self):
         """Audio-Aufnahme Loop (läuft in separatem Thread)."""
         try:
-            import sounddevice as sd
             import numpy as np
 
+            sd = get_sounddevice()
+
             channels = 1
             chunk_duration = WINDOWS_AUDIO_BLOCK_MS / 1000
 
             # Device und native Sample Rate ermitteln
             input_device, actual_sample_rate = get_input_device()
 
-            with self._audio_lock:
-                self._audio_buffer = []
-                self._audio_sample_rate = actual_sample_rate  # Für _transcribe_rest
+            self._reset_rest_audio_capture(actual_sample_rate)
 
             def audio_callback(indata, frames, time_info, status):
                 if status:
                     logger.warning(f"Audio-Status: {status}")
                 with self._audio_lock:
-                    self._audio_buffer.append(indata.copy())
+                    if self._audio_resampler is not None:
+                        self._audio_buffer.append(self._audio_resampler.process(indata))
+                    else:
+                        self._audio_buffer.append(indata)
+                    if self._audio_spool is not None:
+                        self._audio_spool.write(indata)
+                    rms = self._audio_vad.feed(indata)
 
                 # Audio-Level für Overlay (AGC im Overlay normalisiert automatisch)
-                rms = float(np.sqrt(np.mean(indata**2)))
                 self._overlay_update_audio_level(rms)
                 self._latency_mark_once("first_audio_callback")
 
@@ -1500,11 +1517,9 @@ class PulseScribeWindows:
                 if peak > _ADAPTIVE_TAIL_VOICE_PEAK:
                     self._last_voice_monotonic = time.monotonic()
 
-                # State auf RECORDING setzen wenn Audio erkannt
-                if self.state == AppState.LISTENING:
-                    # Einfache VAD: Prüfe ob Audio über Threshold (Peak für REST)
-                    if peak > _VAD_THRESHOLD_PEAK:
-                        self._enter_recording_from_audio_callback()
+                # State auf RECORDING setzen, sobald die Streaming-VAD Sprache sieht
+                if self.state == AppState.LISTENING and self._audio_vad.had_speech:
+                    self._enter_recording_from_audio_callback()
 
             with create_low_latency_input_stream(
                 sd,
@@ -1518,6 +1533,7 @@ class PulseScribeWindows:
             ):
                 while not self._recording_stop_event.is_set():
                     time.sleep(0.05)
+                    self._poll_progressive_transcription()
                 self._wait_for_windows_stop_grace("REST cold")
 
         except ImportError as e:
@@ -1551,6 +1567,7 @@ class PulseScribeWindows:
             self._prepare_warm_rest_audio_buffer()
 
             # Warm-Stream armen
+            self._reset_warm_stream_vad()
             self._warm_stream_armed.set()
             logger.debug("Warm-Stream armed für REST-Recording")
 
@@ -1592,15 +1609,146 @@ class PulseScribeWindows:
                 self._warm_stream_draining.clear()
 
     def _prepare_warm_rest_audio_buffer(self) -> None:
+        self._reset_rest_audio_capture(self._warm_stream_sample_rate)
+
+    def _reset_rest_audio_capture(self, sample_rate: int) -> None:
+        """Setzt Puffer (und ggf. Disk-Spool) für eine neue REST-Aufnahme auf."""
+        from config import WHISPER_SAMPLE_RATE, get_recording_spool_enabled
+
+        spool = None
+        resampler = None
+        buffer_rate = sample_rate
+        mode_for_run = self._run_mode or self.mode
+        if mode_for_run == "local" and sample_rate != WHISPER_SAMPLE_RATE:
+            # Whisper erwartet 16 kHz: blockweise konvertieren statt nach dem Stop
+            resampler = StreamingResampler(sample_rate, WHISPER_SAMPLE_RATE)
+            buffer_rate = WHISPER_SAMPLE_RATE
+        if mode_for_run != "local" and get_recording_spool_enabled():
+            spool = RecordingSpool(sample_rate=sample_rate)
+            try:
+                spool.start()
+            except Exception as e:
+                logger.warning(f"Recording-Spool nicht verfügbar: {e}")
+                spool.discard()
+                spool = None
+
+        local_streaming = self._create_local_streaming_session(mode_for_run)
+        progressive = (
+            self._create_progressive_transcriber(mode_for_run, buffer_rate)
+            if local_streaming is None
+            else None
+        )
+
         with self._audio_lock:
-            self._audio_buffer = []
-            self._audio_sample_rate = self._warm_stream_sample_rate
+            previous_spool = self._audio_spool
+            previous_progressive = self._audio_progressive
+            previous_local_streaming = self._audio_local_streaming
+            self._audio_buffer = SampleBuffer(sample_rate=buffer_rate)
+            self._audio_sample_rate = buffer_rate  # Für _transcribe_rest
+            self._audio_spool = spool
+            self._audio_resampler = resampler
+            self._audio_progressive = progressive
+            self._audio_local_streaming = local_streaming
+            self._audio_vad = StreamingVAD(
+                sample_rate=sample_rate, threshold=_VAD_THRESHOLD_RMS
+            )
+        if previous_spool is not None:
+            previous_spool.discard()
+        if previous_progressive is not None:
+            previous_progressive.close()
+        if previous_local_streaming is not None:
+            previous_local_streaming.close()
+
+    def _create_local_streaming_session(self, mode: str):
+        """Local-Streaming-Session mit Interim-Text im Overlay (opt-in)."""
+        from config import get_local_streaming_enabled
+
+        if mode != "local" or not get_local_streaming_enabled():
+            return None
+        try:
+            provider = self._get_provider(mode)
+            model, language = self._get_transcription_config(mode)
+            if not provider.supports_local_streaming():
+                logger.info(
+                    "Local-Streaming nicht verfügbar (nur faster-whisper ohne "
+                    "Model-Server) – Standard-Aufnahme"
+                )
+                return None
+        except Exception as e:
+            logger.debug(f"Local-Streaming nicht verfügbar: {e}")
+            return None
+        return provider.create_streaming_session(
+            model=model,
+            language=language,
+            on_interim=self._overlay_update_interim_text,
+        )
+
+    def _create_progressive_transcriber(
+        self, mode: str, sample_rate: int
+    ) -> ProgressiveTranscriber | None:
+        """Progressive Transkription für Provider mit Array-API (opt-in)."""
+        from config import (
+            PROGRESSIVE_REST_WORKERS,
+            get_progressive_min_segment_seconds,
+            get_progressive_transcription_enabled,
+        )
+
+        if not get_progressive_transcription_enabled():
+            return None
+        try:
+            provider = self._get_provider(mode)
+            model, language = self._get_transcription_config(mode)
+        except Exception as e:
+            logger.debug(f"Progressive Transkription nicht verfügbar: {e}")
+            return None
+        if not hasattr(provider, "transcribe_audio"):
+            return None
+
+        extra = {} if mode == "local" else {"sample_rate": sample_rate}
+
+        def transcribe_segment(segment) -> str:
+            return provider.transcribe_audio(
+                segment, model=model, language=language, **extra
+            )
+
+        return ProgressiveTranscriber(
+            transcribe_segment,
+            sample_rate=sample_rate,
+            min_segment_seconds=get_progressive_min_segment_seconds(),
+            # Local: ein Modell, serielle Inferenz
+            max_workers=1 if mode == "local" else PROGRESSIVE_REST_WORKERS,
+        )
+
+    def _poll_progressive_transcription(self) -> None:
+        # Unter dem Lock nur Referenzen holen: poll() kopiert Segmente bzw.
+        # das Dekodierfenster (bis ~30 s), und audio_callback wartet auf
+        # _audio_lock. SampleBuffer ist selbst thread-safe, die VAD wird wie
+        # im macOS-Daemon nur gelesen.
+        with self._audio_lock:
+            buffer = self._audio_buffer
+            vad = self._audio_vad
+            progressive = self._audio_progressive
+            local_streaming = self._audio_local_streaming
+        if progressive is not None:
+            progressive.poll(buffer, vad)
+        if local_streaming is not None:
+            local_streaming.poll(buffer)
 
     def _append_warm_stream_chunk(self, chunk: bytes, np, int16_max: int) -> None:
-        audio_int16 = np.frombuffer(chunk, dtype=np.int16)
-        audio_float32 = audio_int16.astype(np.float32) / int16_max
+        # int16 → float32 direkt in den vorallokierten Puffer (kein astype-Temp)
         with self._audio_lock:
-            self._audio_buffer.append(audio_float32)
+            if self._audio_resampler is not None:
+                self._audio_buffer.append(
+                    self._audio_resampler.process_bytes(
+                        chunk, dtype="int16", scale=int16_max
+                    )
+                )
+            else:
+                self._audio_buffer.append_bytes(chunk, dtype="int16", scale=int16_max)
+            self._audio_vad.feed_bytes(chunk, dtype="int16", scale=int16_max)
+            if self._audio_spool is not None:
+                # bytes sind immutable → keine Kopie für den Writer-Thread nötig
+                self._audio_spool.write(np.frombuffer(chunk, dtype=np.int16), copy=False)
 
     def _maybe_mark_warm_stop_seen(
         self,
@@ -1650,6 +1798,7 @@ class PulseScribeWindows:
             if self._warm_stop_grace_elapsed(stop_seen_at, grace_seconds):
                 return
             if self._try_collect_warm_stream_chunk(np, int16_max, timeout=0.02):
+                self._poll_progressive_transcription()
                 continue
             if stop_seen_at is not None and grace_seconds <= 0:
                 return
@@ -1711,6 +1860,8 @@ class PulseScribeWindows:
 
         try:
             logger.debug("Starte deepgram_stream_core")
+            _device, device_rate = get_input_device()
+            speech_vad = StreamingVAD(sample_rate=device_rate, threshold=_VAD_THRESHOLD_RMS)
 
             def on_audio_level(level: float):
                 if level > _ADAPTIVE_TAIL_VOICE_RMS:
@@ -1723,10 +1874,8 @@ class PulseScribeWindows:
                     logger.debug("Mikrofon bereit → LISTENING")
                     self._set_state(AppState.LISTENING)
                     self._latency_mark("listening_state")
-                elif current_state == AppState.LISTENING and level > _VAD_THRESHOLD_RMS:
-                    logger.debug(
-                        f"VAD triggered: level={level:.4f} > threshold={_VAD_THRESHOLD_RMS}"
-                    )
+                elif current_state == AppState.LISTENING and speech_vad.had_speech:
+                    logger.debug(f"VAD triggered: level={level:.4f}")
                     self._set_state(AppState.RECORDING)
                     self._latency_mark("recording_state")
 
@@ -1736,6 +1885,7 @@ class PulseScribeWindows:
                 play_ready=True,
                 external_stop_event=self._recording_stop_event,
                 audio_level_callback=on_audio_level,
+                speech_vad=speech_vad,
                 interim_text_callback=self._overlay_update_interim_text,
                 latency_event_callback=self._latency_event,
                 # Callable: wird erst beim Stop aufgelöst (adaptiver Stop-Tail)
@@ -1798,41 +1948,82 @@ class PulseScribeWindows:
 
     def _transcribe_rest(self, mode_override: str | None = None):
         """Transkribiert aufgenommenes Audio via REST API."""
+        with self._audio_lock:
+            spool = self._audio_spool
+            self._audio_spool = None
+            local_streaming = self._audio_local_streaming
+            self._audio_local_streaming = None
         try:
-            import numpy as np
+            self._transcribe_rest_audio(mode_override, local_streaming)
+        finally:
+            # Auch bei "keine Sprache"/Fehlern den Decode-Worker beenden
+            if local_streaming is not None:
+                local_streaming.close()
+            if spool is not None:
+                spool.discard()
+
+    def _transcribe_rest_audio(self, mode_override: str | None, local_streaming) -> None:
+        try:
+            # Konfiguration holen (zentralisiert für alle Modi)
+            mode_for_run = mode_override or self._run_mode or self.mode
+            model, language = self._get_transcription_config(mode_for_run)
+            provider = self._get_provider(mode_for_run)
+            use_local_audio = mode_for_run == "local" and hasattr(
+                provider, "transcribe_audio"
+            )
 
-            # Audio-Buffer zusammenfügen
+            # Audio-Buffer übernehmen; kopiert wird erst nach dem Lock
             with self._audio_lock:
-                if not self._audio_buffer:
+                if self._audio_resampler is not None:
+                    # Nur die Filter-Latenz (wenige ms) ist noch offen
+                    self._audio_buffer.append(self._audio_resampler.flush())
+                    self._audio_resampler = None
+                if not len(self._audio_buffer):
                     self._handle_no_speech_result("Kein Audio aufgenommen")
                     return
+                if not self._audio_vad.had_speech:
+                    # Stille Aufnahme: weder hochladen noch lokal decodieren
+                    self._audio_buffer.clear()
+                    self._handle_no_speech_result(
+                        "Keine Sprache erkannt "
+                        f"(max_rms={self._audio_vad.max_rms:.4f}) – "
+                        "Transkription übersprungen"
+                    )
+                    return
 
-                audio_data = np.concatenate(self._audio_buffer)
                 sample_rate = self._audio_sample_rate
-                self._audio_buffer = []
+                duration = self._audio_buffer.duration
+                progressive = self._audio_progressive
+                self._audio_progressive = None
+                audio_buffer = self._audio_buffer
+                vad = self._audio_vad
+
+            # Eine Kopie beim Stop, außerhalb von _audio_lock (Blöcke werden
+            # dabei freigegeben). Tail-Padding (verhindert abgeschnittene
+            # letzte Wörter bei Whisper) landet direkt im Ergebnis.
+            tail_samples = int(sample_rate * _TAIL_PADDING_SEC) if use_local_audio else 0
+            audio_data = audio_buffer.take(pad_frames=tail_samples).reshape(-1)
 
-            duration = len(audio_data) / sample_rate
             logger.info(f"Transkribiere {duration:.1f}s Audio ({sample_rate}Hz)...")
             self._latency_mark("rest_transcribe_start", duration_s=round(duration, 3))
 
-            # Konfiguration holen (zentralisiert für alle Modi)
-            mode_for_run = mode_override or self._run_mode or self.mode
-            model, language = self._get_transcription_config(mode_for_run)
-            provider = self._get_provider(mode_for_run)
-
+            progressive_transcript = self._finish_progressive_transcription(
+                progressive, audio_data, vad, pad_tail=use_local_audio
+            )
+            if progressive_transcript is None:
+                progressive_transcript = self._finish_local_streaming(
+                    local_streaming, audio_data, sample_rate
+                )
+            if progressive_transcript is not None:
+                transcript = progressive_transcript
             # Local-Mode: In-Memory Transkription (kein WAV schreiben)
-            if mode_for_run == "local" and hasattr(provider, "transcribe_audio"):
+            elif use_local_audio:
                 from config import WHISPER_SAMPLE_RATE
 
-                # Tail-Padding (verhindert abgeschnittene letzte Wörter bei Whisper)
-                tail_samples = int(sample_rate * _TAIL_PADDING_SEC)
-                audio_data = np.concatenate(
-                    [audio_data, np.zeros(tail_samples, dtype=np.float32)]
-                )
-
-                # Resampling auf 16kHz (Whisper erwartet WHISPER_SAMPLE_RATE)
+                # Normalfall: schon beim Capture auf 16kHz resampled. Nur falls
+                # die Aufnahme ohne Resampler lief (Modus-Wechsel), hier nachholen.
                 if sample_rate != WHISPER_SAMPLE_RATE:
-                    audio_data = _resample_audio(
+                    audio_data = resample_audio(
                         audio_data, sample_rate, WHISPER_SAMPLE_RATE
                     )
                     logger.debug(
@@ -1843,22 +2034,48 @@ class PulseScribeWindows:
                     audio_data, model=model, language=language
                 )
             else:
-                # Andere Provider: WAV-Datei schreiben
-                import soundfile as sf
-                import tempfile
-                from pathlib import Path
-
-                with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-                    temp_path = Path(f.name)
-
-                try:
-                    sf.write(temp_path, audio_data, sample_rate)
-                    transcript = provider.transcribe(
-                        audio_path=temp_path, model=model, language=language
+                cache = get_transcript_cache(live_dictation=True)
+                cache_key = (
+                    transcript_cache_key(
+                        audio_array_digest(audio_data, sample_rate),
+                        provider=mode_for_run,
+                        model=model or getattr(provider, "default_model", None),
+                        language=language,
+                    )
+                    if cache is not None
+                    else None
+                )
+                cached = cache.get(cache_key) if cache is not None and cache_key is not None else None
+                if cached is not None:
+                    logger.info(f"Transkript aus Cache ({mode_for_run})")
+                    transcript = cached
+                elif hasattr(provider, "transcribe_audio"):
+                    # REST-Provider: WAV im RAM encodieren, kein Disk-Roundtrip
+                    transcript = provider.transcribe_audio(
+                        audio_data,
+                        model=model,
+                        language=language,
+                        sample_rate=sample_rate,
                     )
-                finally:
-                    if temp_path.exists():
-                        temp_path.unlink()
+                else:
+                    # Fallback: WAV-Datei schreiben
+                    import soundfile as sf
+                    import tempfile
+                    from pathlib import Path
+
+                    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
+                        temp_path = Path(f.name)
+
+                    try:
+                        sf.write(temp_path, audio_data, sample_rate)
+                        transcript = provider.transcribe(
+                            audio_path=temp_path, model=model, language=language
+                        )
+                    finally:
+                        if temp_path.exists():
+                            temp_path.unlink()
+                if cache is not None and cache_key is not None and cached is None:
+                    cache.put(cache_key, transcript)
 
             self._latency_mark("rest_transcribe_done", chars=len(transcript or ""))
 
@@ -1884,6 +2101,72 @@ class PulseScribeWindows:
             time.sleep(1.0)
             self._set_state(AppState.IDLE)
 
+    def _finish_progressive_transcription(
+        self,
+        progressive: ProgressiveTranscriber | None,
+        audio_data,
+        vad: StreamingVAD,
+        *,
+        pad_tail: bool,
+    ) -> str | None:
+        """Rest nach dem letzten Schnitt transkribieren und Segmente zusammensetzen.
+
+        None → kein Segment abgeschickt oder fehlgeschlagen; dann wie bisher
+        die komplette Aufnahme transkribieren.
+        """
+        import numpy as np
+
+        if progressive is None:
+            return None
+        if not progressive.has_segments:
+            progressive.close()
+            return None
+        tail = progressive.tail_after_cut(audio_data, vad)
+        if tail is not None and pad_tail:
+            tail = np.concatenate(
+                [
+                    tail,
+                    np.zeros(
+                        int(progressive.sample_rate * _TAIL_PADDING_SEC),
+                        dtype=np.float32,
+                    ),
+                ]
+            )
+        try:
+            transcript = progressive.finish(tail, timeout=TRANSCRIBING_TIMEOUT)
+        except Exception as e:
+            logger.warning(
+                f"Progressive Transkription fehlgeschlagen ({e}), "
+                "transkribiere komplette Aufnahme"
+            )
+            return None
+        self._latency_mark("rest_progressive_done", segments=progressive.segment_count)
+        return transcript
+
+    def _finish_local_streaming(self, local_streaming, audio_data, sample_rate: int) -> str | None:
+        """Nur den unbestätigten Rest der Local-Streaming-Session dekodieren.
+
+        None → keine Session oder fehlgeschlagen; dann wie bisher die
+        komplette Aufnahme transkribieren.
+        """
+        from config import WHISPER_SAMPLE_RATE
+
+        if local_streaming is None:
+            return None
+        if sample_rate != WHISPER_SAMPLE_RATE:
+            # Frame-Offsets der Session passen nur zum 16-kHz-Puffer
+            local_streaming.close()
+            return None
+        try:
+            transcript = local_streaming.finish(audio_data, timeout=TRANSCRIBING_TIMEOUT)
+        except Exception as e:
+            logger.warning(
+                f"Local-Streaming fehlgeschlagen ({e}), transkribiere komplette Aufnahme"
+            )
+            return None
+        self._latency_mark("rest_local_streaming_done", decodes=local_streaming.decodes)
+        return transcript
+
     def _maybe_refine(self, transcript: str) -> str:
         """Wendet LLM-Refinement an (falls aktiviert) und trackt ob Text verändert wurde."""
         self._last_was_refined = False
@@ -1891,18 +2174,63 @@ class PulseScribeWindows:
             return transcript
         self._set_state(AppState.REFINING)
         self._latency_mark("refine_start")
-        from refine.llm import maybe_refine_transcript
+        if self._should_stream_refine_paste():
+            refined = self._stream_refine(transcript)
+        else:
+            from refine.llm import maybe_refine_transcript
+
+            refined = maybe_refine_transcript(
+                transcript,
+                refine=True,
+                refine_model=self.refine_model,
+                refine_provider=self.refine_provider,
+                context=self.context,
+                budget=self._latency_budget,
+            )
+            self._last_was_refined = refined != transcript
+        self._latency_mark("refine_done", changed=self._last_was_refined)
+        return refined
 
-        refined = maybe_refine_transcript(
+    def _should_stream_refine_paste(self) -> bool:
+        """Sätze vorab einfügen nur bei Auto-Paste und nicht im IPC-Test."""
+        if not (self.auto_paste and get_refine_stream_paste_enabled()):
+            return False
+        with self._ipc_state_lock:
+            return self._ipc_test_cmd_id is None
+
+    def _stream_refine(self, transcript: str) -> str:
+        """Streaming-Refine: fertige Sätze direkt aus dem Worker einfügen.
+
+        Nach einem fehlgeschlagenen Paste wird nichts mehr vorab eingefügt;
+        _handle_result fügt dann den Rest gesammelt ein (mit Clipboard-Fallback).
+        """
+        from refine.llm import maybe_refine_transcript_streaming
+
+        self._stream_pasted_text = ""
+        paste_failed = False
+
+        def on_sentences(text: str) -> None:
+            nonlocal paste_failed
+            if paste_failed:
+                return
+            if not self._stream_pasted_text:
+                self._latency_mark("refine_first_paste", chars=len(text))
+            if paste_transcript(text):
+                self._stream_pasted_text += text
+            else:
+                logger.error("Auto-Paste (Streaming-Refine) fehlgeschlagen")
+                paste_failed = True
+
+        result = maybe_refine_transcript_streaming(
             transcript,
-            refine=True,
+            on_sentences=on_sentences,
             refine_model=self.refine_model,
             refine_provider=self.refine_provider,
             context=self.context,
+            budget=self._latency_budget,
         )
-        self._last_was_refined = refined != transcript
-        self._latency_mark("refine_done", changed=self._last_was_refined)
-        return refined
+        self._last_was_refined = result.refined
+        return result.text
 
     def _save_to_history(self, transcript: str, *, mode: str, refined: bool) -> None:
         """Speichert Transkript in der Historie.
@@ -1928,14 +2256,16 @@ class PulseScribeWindows:
         logger.info(f"Transkript: {redacted_text_summary(transcript)}")
         # Run-Metadaten und Latency-Run VOR dem DONE-State snapshotten/abkoppeln:
         # DONE ist startfähig, ein sofortiger Hotkey- oder IPC-Start darf
-        # `_run_mode`, `_last_was_refined`, `_ipc_test_cmd_id` und
-        # `_latency_run` überschreiben, ohne dieses Ergebnis zu verfälschen.
+        # `_run_mode`, `_last_was_refined`, `_ipc_test_cmd_id`, `_latency_run`
+        # und `_latency_budget` überschreiben, ohne dieses Ergebnis zu verfälschen.
         # Vor DONE ist der State TRANSCRIBING/REFINING (nicht startfähig),
         # daher sind diese Snapshots race-frei.
         run = self._latency_run
         self._latency_run = None
+        budget, self._latency_budget = self._latency_budget, None
         run_mode = self._run_mode or self.mode
         was_refined = self._last_was_refined
+        stream_pasted, self._stream_pasted_text = self._stream_pasted_text, ""
         with self._ipc_state_lock:
             ipc_cmd_id = self._ipc_test_cmd_id
             ipc_server = self._ipc_server
@@ -1969,10 +2299,14 @@ class PulseScribeWindows:
             run.mark("paste_start", auto_paste=self.auto_paste)
         paste_success = True
         if self.auto_paste:
-            paste_success = paste_transcript(transcript)
+            from refine.llm import unpasted_remainder
+
+            paste_text = unpasted_remainder(transcript, stream_pasted)
+            if paste_text:
+                paste_success = paste_transcript(paste_text)
             if not paste_success:
                 # Fallback: Nur in Clipboard kopieren
-                get_clipboard().copy(transcript)
+                get_clipboard().copy(paste_text)
                 logger.info(
                     "Text in Zwischenablage kopiert (Auto-Paste fehlgeschlagen)"
                 )
@@ -1981,6 +2315,8 @@ class PulseScribeWindows:
             logger.info("Text in Zwischenablage kopiert")
         if run is not None:
             run.mark("paste_done", success=paste_success)
+        if budget is not None:
+            budget.finish()
 
         # History-IO (inkl. möglicher Datei-Rotation) erst NACH dem Paste:
         # Der sichtbare "Text erscheint"-Moment darf nicht auf Disk-IO warten.
@@ -3338,6 +3674,7 @@ class PulseScribeWindows:
         """Startet den Daemon."""
         apply_windows_responsiveness_boost(logger)
         self._print_startup_banner()
+        report_orphaned_spools()
         self._setup_startup_hotkeys()
         self._setup_overlay()
         self._start_prewarm_thread()
@@ -3420,9 +3757,20 @@ def main():
         action="store_true",
         help="Onboarding-Wizard öffnen (statt Daemon starten)",
     )
+    parser.add_argument(
+        "--model-server",
+        action="store_true",
+        help="Lokalen Whisper-Model-Server starten (wird vom Daemon gestartet)",
+    )
 
     args = parser.parse_args()
 
+    # --model-server: hält lokale Modelle über Daemon-Neustarts hinweg warm
+    if args.model_server:
+        from providers.local_server import main as model_server_main
+
+        sys.exit(model_server_main())
+
     # --settings: Settings-Fenster öffnen und beenden (kein Daemon)
     if args.settings:
         try:
@@ -10,11 +10,18 @@ Usage:
 """
 
 from .context import detect_context, get_context_for_app
-from .llm import refine_transcript, maybe_refine_transcript
+from .llm import (
+    maybe_refine_transcript,
+    maybe_refine_transcript_streaming,
+    refine_transcript,
+    stream_refine_transcript,
+)
 
 __all__ = [
     "refine_transcript",
     "maybe_refine_transcript",
+    "stream_refine_transcript",
+    "maybe_refine_transcript_streaming",
     "detect_context",
     "get_context_for_app",
 ]
@@ -1,19 +1,31 @@
 """LLM-Nachbearbeitung für PulseScribe.
 
 Enthält Funktionen für die Nachbearbeitung von Transkripten mit LLMs
-(OpenAI, OpenRouter, Groq).
+(OpenAI, OpenRouter, Groq, Gemini) – als Komplett-Antwort oder als Stream,
+dessen abgeschlossene Sätze schon während der Antwort eingefügt werden können.
+Optional wird eine langsame Anfrage an einen zweiten Provider abgesichert
+(Hedging, PULSESCRIBE_REFINE_HEDGE_PROVIDER).
 """
 
 import logging
 import os
+import queue
+import re
 import threading
-from collections.abc import Mapping
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any
 
+from .local_rules import get_local_rules, local_refine
 from .prompts import get_prompt_for_context
 from .context import detect_context
 from utils.timing import redacted_text_summary
 from utils.logging import get_session_id
 from utils.env import get_env_bool_default
+from utils.refine_cache import RefineCache, get_refine_cache, refine_cache_key
+from utils.latency_budget import LatencyBudget
+from utils.refine_latency import get_refine_latency_stats
 
 # Zentrale Konfiguration importieren
 from config import (
@@ -21,6 +33,11 @@ from config import (
     DEFAULT_GEMINI_REFINE_MODEL,
     OPENROUTER_BASE_URL,
     LLM_REFINE_TIMEOUT,
+    get_refine_hedge_delay_ms,
+    get_refine_hedge_model,
+    get_refine_fallback_model,
+    get_refine_hedge_provider,
+    get_local_refine_max_words,
 )
 
 logger = logging.getLogger("pulsescribe")
@@ -308,6 +325,17 @@ def _resolve_gemini_thinking_level(types_module: object, model: str):
     return thinking_level.LOW
 
 
+def _build_gemini_config(model: str, *, session_id: str):
+    """Build the Gemini request config with the model's thinking level."""
+    from google.genai import types
+
+    thinking_level = _resolve_gemini_thinking_level(types, model)
+    logger.info(f"[{session_id}] Gemini thinking_level={thinking_level}")
+    return types.GenerateContentConfig(
+        thinking_config=types.ThinkingConfig(thinking_level=thinking_level)
+    )
+
+
 def _build_openai_api_params(model: str, full_prompt: str) -> dict[str, object]:
     """Build the OpenAI Responses API params with the existing GPT-5 tweak."""
     api_params: dict[str, object] = {
@@ -359,17 +387,10 @@ def _execute_gemini_refine(
     session_id: str,
 ) -> str:
     """Execute the Gemini refine request with provider-specific thinking config."""
-    from google.genai import types
-
-    thinking_level = _resolve_gemini_thinking_level(types, model)
-    logger.info(f"[{session_id}] Gemini thinking_level={thinking_level}")
-
     response = client.models.generate_content(
         model=model,
         contents=full_prompt,
-        config=types.GenerateContentConfig(
-            thinking_config=types.ThinkingConfig(thinking_level=thinking_level)
-        ),
+        config=_build_gemini_config(model, session_id=session_id),
     )
     return (response.text or "").strip()
 
@@ -412,12 +433,287 @@ def _execute_refine_request(
     )
 
 
+def _timed_refine_request(
+    provider: str,
+    model: str,
+    full_prompt: str,
+    *,
+    session_id: str,
+) -> str:
+    """Führt eine Refine-Anfrage aus und lernt dabei die Latenz des Providers."""
+    client = _get_refine_client(provider)
+    start = time.perf_counter()
+    result = _execute_refine_request(
+        provider,
+        client,
+        model,
+        full_prompt,
+        session_id=session_id,
+    )
+    get_refine_latency_stats().record(
+        provider, model, (time.perf_counter() - start) * 1000
+    )
+    return result
+
+
+def _resolve_hedge_target(provider: str, model: str) -> tuple[str, str] | None:
+    """Zweiter Provider/Modell für Hedging oder None (aus/identisch/ungültig)."""
+    hedge_provider = get_refine_hedge_provider()
+    if hedge_provider is None:
+        return None
+    try:
+        hedge_provider = _normalize_refine_provider(hedge_provider)
+    except ValueError as e:
+        logger.warning(f"Refine-Hedging deaktiviert: {e}")
+        return None
+    hedge_model = get_refine_hedge_model() or _default_refine_model_for_provider(
+        hedge_provider
+    )
+    if (hedge_provider, hedge_model) == (provider, model):
+        return None
+    return hedge_provider, hedge_model
+
+
+def _hedge_delay_seconds(provider: str, model: str) -> float:
+    """Gelernte p90-Latenz des Providers, sonst PULSESCRIBE_REFINE_HEDGE_DELAY_MS."""
+    learned_ms = get_refine_latency_stats().quantile(provider, model, 0.9)
+    delay_ms = learned_ms if learned_ms is not None else get_refine_hedge_delay_ms()
+    return delay_ms / 1000
+
+
+def _hedged_refine_request(
+    primary: tuple[str, str],
+    secondary: tuple[str, str],
+    full_prompt: str,
+    *,
+    session_id: str,
+) -> str:
+    """Refine mit Absicherung: erste gültige Antwort von zwei Providern gewinnt.
+
+    Der sekundäre Provider wird erst gefragt, wenn der primäre nach seiner
+    p90-Latenz noch nicht geantwortet hat oder vorher scheitert. Die
+    Antwort des Verlierers wird verworfen; bereits laufende HTTP-Anfragen
+    der synchronen SDKs lassen sich nicht abbrechen und laufen im
+    Hintergrund-Thread aus (ihre Latenz fließt noch ins Histogramm).
+    """
+    outcomes: queue.SimpleQueue[tuple[str, str, Exception | None]] = queue.SimpleQueue()
+    start = time.perf_counter()
+
+    def run(provider: str, model: str) -> None:
+        try:
+            text = _timed_refine_request(
+                provider, model, full_prompt, session_id=session_id
+            )
+        except Exception as e:
+            outcomes.put((provider, "", e))
+        else:
+            outcomes.put((provider, text, None))
+
+    def launch(target: tuple[str, str]) -> None:
+        threading.Thread(
+            target=run, args=target, daemon=True, name=f"Refine-{target[0]}"
+        ).start()
+
+    delay_s = _hedge_delay_seconds(*primary)
+    launch(primary)
+    pending = 1
+    hedged = False
+    errors: list[Exception] = []
+    while pending:
+        try:
+            provider, text, error = outcomes.get(
+                timeout=LLM_REFINE_TIMEOUT + 5 if hedged else delay_s
+            )
+        except queue.Empty:
+            if hedged:
+                raise TimeoutError("LLM-Nachbearbeitung: keine Antwort von beiden Providern")
+            logger.info(
+                f"[{session_id}] Refine-Hedge: {primary[0]} nach {delay_s * 1000:.0f} ms "
+                f"ohne Antwort, frage zusätzlich {secondary[0]}"
+            )
+            launch(secondary)
+            pending += 1
+            hedged = True
+            continue
+
+        pending -= 1
+        if text and text.strip():
+            if hedged:
+                logger.info(
+                    f"[{session_id}] Refine-Hedge: Antwort von {provider} nach "
+                    f"{(time.perf_counter() - start) * 1000:.0f} ms"
+                )
+            return text
+        if error is not None:
+            errors.append(error)
+        if not hedged:
+            logger.info(
+                f"[{session_id}] Refine-Hedge: {primary[0]} ohne gültige Antwort, "
+                f"frage {secondary[0]}"
+            )
+            launch(secondary)
+            pending += 1
+            hedged = True
+
+    if errors:
+        raise errors[0]
+    return ""
+
+
+def _iter_chat_completion_deltas(stream: Iterable[Any]) -> Iterator[str]:
+    """Yield text deltas from an OpenAI-compatible chat-completions stream."""
+    for chunk in stream:
+        choices = getattr(chunk, "choices", None)
+        if not choices:
+            continue  # z.B. Usage-Chunk am Ende
+        delta = getattr(choices[0], "delta", None)
+        content = getattr(delta, "content", None)
+        if content:
+            yield _extract_message_content(content, _strip_outer=False)
+
+
+def _stream_groq_refine(
+    client: object,
+    model: str,
+    full_prompt: str,
+    *,
+    session_id: str,
+) -> Iterator[str]:
+    """Stream the Groq chat-completions refine request."""
+    del session_id
+    stream = client.chat.completions.create(
+        model=model,
+        messages=_build_chat_messages(full_prompt),
+        timeout=LLM_REFINE_TIMEOUT,
+        stream=True,
+    )
+    yield from _iter_chat_completion_deltas(stream)
+
+
+def _stream_openrouter_refine(
+    client: object,
+    model: str,
+    full_prompt: str,
+    *,
+    session_id: str,
+) -> Iterator[str]:
+    """Stream the OpenRouter refine request with optional routing config."""
+    stream = client.chat.completions.create(
+        **_build_openrouter_create_kwargs(model, full_prompt, session_id=session_id),
+        stream=True,
+    )
+    yield from _iter_chat_completion_deltas(stream)
+
+
+def _stream_gemini_refine(
+    client: object,
+    model: str,
+    full_prompt: str,
+    *,
+    session_id: str,
+) -> Iterator[str]:
+    """Stream the Gemini refine request."""
+    for chunk in client.models.generate_content_stream(
+        model=model,
+        contents=full_prompt,
+        config=_build_gemini_config(model, session_id=session_id),
+    ):
+        text = getattr(chunk, "text", None)
+        if text:
+            yield text
+
+
+def _stream_openai_refine(
+    client: object,
+    model: str,
+    full_prompt: str,
+    *,
+    session_id: str,
+) -> Iterator[str]:
+    """Stream the OpenAI Responses API refine request (output_text deltas)."""
+    del session_id
+    stream = client.responses.create(
+        **_build_openai_api_params(model, full_prompt), stream=True
+    )
+    for event in stream:
+        if getattr(event, "type", None) == "response.output_text.delta":
+            delta = getattr(event, "delta", None)
+            if delta:
+                yield delta
+
+
+_REFINE_STREAM_EXECUTORS = {
+    "groq": _stream_groq_refine,
+    "openrouter": _stream_openrouter_refine,
+    "gemini": _stream_gemini_refine,
+    "openai": _stream_openai_refine,
+}
+
+
+def _prepare_refine_request(
+    transcript: str,
+    *,
+    model: str | None,
+    prompt: str | None,
+    provider: str | None,
+    context: str | None,
+    session_id: str,
+) -> tuple[str, str, str]:
+    """Resolve prompt, provider and model for one refine request.
+
+    Returns:
+        (provider, model, resolved prompt)
+    """
+    prompt = _resolve_refine_prompt(
+        prompt,
+        context=context,
+        session_id=session_id,
+    )
+
+    effective_provider, effective_model = _resolve_refine_target(provider, model)
+
+    logger.info(
+        f"[{session_id}] LLM-Nachbearbeitung: provider={effective_provider}, model={effective_model}"
+    )
+    logger.debug(f"[{session_id}] Input: {len(transcript)} Zeichen")
+    return effective_provider, effective_model, prompt
+
+
+def _build_full_prompt(prompt: str, transcript: str) -> str:
+    return f"{prompt}\n\nTranskript:\n{transcript}"
+
+
+def _lookup_refine_cache(
+    transcript: str,
+    *,
+    prompt: str,
+    provider: str,
+    model: str,
+    use_cache: bool,
+    session_id: str,
+) -> tuple[RefineCache | None, str, str | None]:
+    """Refine-Cache nachschlagen.
+
+    Returns:
+        (cache oder None wenn deaktiviert, Schlüssel, gecachtes Ergebnis oder None)
+    """
+    cache = get_refine_cache() if use_cache else None
+    if cache is None:
+        return None, "", None
+    key = refine_cache_key(transcript, prompt=prompt, provider=provider, model=model)
+    cached = cache.get(key)
+    if cached is not None:
+        logger.info(f"[{session_id}] LLM-Nachbearbeitung aus Cache ({cache.describe()})")
+    return cache, key, cached
+
+
 def refine_transcript(
     transcript: str,
     model: str | None = None,
     prompt: str | None = None,
     provider: str | None = None,
     context: str | None = None,
+    use_cache: bool = True,
 ) -> str:
     """Nachbearbeitung mit LLM (Flow-Style). Kontext-aware Prompts.
 
@@ -427,6 +723,10 @@ def refine_transcript(
         prompt: Custom Prompt (überschreibt Kontext-Prompt)
         provider: LLM-Provider (groq, openai, openrouter)
         context: Kontext-Typ für Prompt-Auswahl (email, chat, code, default)
+        use_cache: Refine-Cache nutzen (False: immer neu anfragen)
+
+    Mit PULSESCRIBE_REFINE_HEDGE_PROVIDER geht die Anfrage zusätzlich an einen
+    zweiten Provider, wenn der erste länger als seine p90-Latenz braucht.
 
     Returns:
         Das nachbearbeitete Transkript
@@ -448,35 +748,278 @@ def refine_transcript(
         logger.debug(f"[{session_id}] Leeres Transkript, überspringe Nachbearbeitung")
         return transcript
 
-    prompt = _resolve_refine_prompt(
-        prompt,
+    effective_provider, effective_model, resolved_prompt = _prepare_refine_request(
+        transcript,
+        model=model,
+        prompt=prompt,
+        provider=provider,
         context=context,
         session_id=session_id,
     )
+    cache, cache_key, cached = _lookup_refine_cache(
+        transcript,
+        prompt=resolved_prompt,
+        provider=effective_provider,
+        model=effective_model,
+        use_cache=use_cache,
+        session_id=session_id,
+    )
+    if cached is not None:
+        return cached
 
-    effective_provider, effective_model = _resolve_refine_target(provider, model)
+    full_prompt = _build_full_prompt(resolved_prompt, transcript)
+    hedge_target = _resolve_hedge_target(effective_provider, effective_model)
+    with timed_operation("LLM-Nachbearbeitung"):
+        if hedge_target is None:
+            result = _timed_refine_request(
+                effective_provider,
+                effective_model,
+                full_prompt,
+                session_id=session_id,
+            )
+        else:
+            result = _hedged_refine_request(
+                (effective_provider, effective_model),
+                hedge_target,
+                full_prompt,
+                session_id=session_id,
+            )
 
-    logger.info(
-        f"[{session_id}] LLM-Nachbearbeitung: provider={effective_provider}, model={effective_model}"
+    logger.debug(f"[{session_id}] Output: {redacted_text_summary(result)}")
+    if cache is not None:
+        # Auch eine Hedge-Antwort gilt für die gestellte Anfrage
+        cache.put(cache_key, result)
+    return result
+
+
+def stream_refine_transcript(
+    transcript: str,
+    model: str | None = None,
+    prompt: str | None = None,
+    provider: str | None = None,
+    context: str | None = None,
+    use_cache: bool = True,
+) -> Iterator[str]:
+    """Wie refine_transcript, liefert die Antwort aber als Text-Deltas.
+
+    Zusammengesetzt (und getrimmt) ergeben die Deltas dasselbe wie
+    refine_transcript. Fehler (fehlender API-Key, Netzwerk) treten beim
+    Iterieren auf, ggf. erst nach den ersten Deltas. Ein Cache-Treffer
+    kommt als ein einziges Delta.
+    """
+    session_id = get_session_id()
+
+    if not transcript or not transcript.strip():
+        logger.debug(f"[{session_id}] Leeres Transkript, überspringe Nachbearbeitung")
+        return
+
+    effective_provider, effective_model, resolved_prompt = _prepare_refine_request(
+        transcript,
+        model=model,
+        prompt=prompt,
+        provider=provider,
+        context=context,
+        session_id=session_id,
     )
-    logger.debug(f"[{session_id}] Input: {len(transcript)} Zeichen")
+    cache, cache_key, cached = _lookup_refine_cache(
+        transcript,
+        prompt=resolved_prompt,
+        provider=effective_provider,
+        model=effective_model,
+        use_cache=use_cache,
+        session_id=session_id,
+    )
+    if cached is not None:
+        yield cached
+        return
 
     client = _get_refine_client(effective_provider)
-    full_prompt = f"{prompt}\n\nTranskript:\n{transcript}"
+    parts: list[str] = []
+    for delta in _REFINE_STREAM_EXECUTORS[effective_provider](
+        client,
+        effective_model,
+        _build_full_prompt(resolved_prompt, transcript),
+        session_id=session_id,
+    ):
+        parts.append(delta)
+        yield delta
+    if cache is not None:
+        # Nur vollständige Antworten cachen (abgebrochene Streams enden vorher)
+        cache.put(cache_key, "".join(parts).strip())
 
-    with timed_operation("LLM-Nachbearbeitung"):
-        result = _execute_refine_request(
-            effective_provider,
-            client,
-            effective_model,
-            full_prompt,
-            session_id=session_id,
-        )
 
-    logger.debug(f"[{session_id}] Output: {redacted_text_summary(result)}")
+# Satzende: .!? oder … (ggf. mit schließenden Anführungszeichen/Klammern)
+# gefolgt von Leerraum, oder ein Zeilenumbruch. "3.5" oder "v1.2" trennen nicht.
+_SENTENCE_BOUNDARY = re.compile(r"[.!?…][\"'»«“”)\]]*\s+|\n")
+
+
+def split_completed_sentences(text: str) -> tuple[str, str]:
+    """Trennt ``text`` hinter dem letzten Satzende.
+
+    Returns:
+        (abgeschlossene Sätze inkl. folgendem Leerraum, unfertiger Rest)
+    """
+    end = 0
+    for match in _SENTENCE_BOUNDARY.finditer(text):
+        end = match.end()
+    return text[:end], text[end:]
+
+
+def _unrefined_tail(transcript: str, emitted: str) -> str:
+    """Rohtext hinter den Sätzen, die bereits verfeinert eingefügt wurden.
+
+    Zuordnung über die Anzahl der Satzenden – das LLM korrigiert Wörter,
+    lässt die Satzgrenzen aber praktisch immer stehen.
+    """
+    count = len(_SENTENCE_BOUNDARY.findall(emitted))
+    boundaries = list(_SENTENCE_BOUNDARY.finditer(transcript))
+    if count > len(boundaries):
+        return ""
+    if count == 0:
+        return transcript.strip()
+    return transcript[boundaries[count - 1].end():].strip()
+
+
+def unpasted_remainder(text: str, pasted: str) -> str:
+    """Teil von ``text``, den Streaming-Refine noch nicht eingefügt hat.
+
+    ``text`` ist rechts getrimmt und kann daher um den Leerraum hinter dem
+    letzten eingefügten Satz kürzer sein als ``pasted``.
+    """
+    if not pasted:
+        return text
+    if text.startswith(pasted):
+        return text[len(pasted):].lstrip()
+    stripped = pasted.rstrip()
+    if text.startswith(stripped):
+        return text[len(stripped):].lstrip()
+    logger.warning("Streaming-Refine: Ergebnis passt nicht zum eingefügten Text")
+    return ""
+
+
+@dataclass(frozen=True)
+class StreamedRefineResult:
+    """Ergebnis von maybe_refine_transcript_streaming.
+
+    ``emitted`` ist der bereits an ``on_sentences`` gegebene Präfix von
+    ``text``; den Rest ``text[len(emitted):]`` fügt der Aufrufer ein.
+    """
+
+    text: str
+    emitted: str = ""
+    refined: bool = False
+
+    @property
+    def remainder(self) -> str:
+        return self.text[len(self.emitted):]
+
+
+def _log_refine_error(error: Exception) -> None:
+    """Loggt einen Refine-Fehler; muss im except-Block aufgerufen werden."""
+    from openai import APIError, APIConnectionError, APITimeoutError, RateLimitError
+
+    if isinstance(error, ValueError):
+        # Fehlende API-Keys (z.B. OPENROUTER_API_KEY)
+        logger.warning(f"LLM-Nachbearbeitung übersprungen: {error}")
+    elif isinstance(error, APITimeoutError):
+        logger.warning(f"LLM-Nachbearbeitung Timeout: {error}")
+    elif isinstance(error, (APIError, APIConnectionError, RateLimitError)):
+        logger.warning(f"LLM-Nachbearbeitung fehlgeschlagen: {error}")
+    else:
+        # Generischer Fallback für unerwartete Fehler (z.B. Netzwerk, JSON-Parsing)
+        logger.exception("LLM-Nachbearbeitung fehlgeschlagen (unerwartet)")
+
+
+def _try_local_refine(transcript: str) -> str | None:
+    """Kurze Diktate lokal bereinigen; None = LLM-Nachbearbeitung nötig."""
+    result = local_refine(transcript)
+    if result is None:
+        return None
+    logger.info(
+        f"[{get_session_id()}] LLM-Nachbearbeitung übersprungen: "
+        f"kurzes Diktat lokal bereinigt ({len(transcript.split())} Wörter)"
+    )
+    # Nur Füllwörter diktiert → Original behalten (wie bei leerer LLM-Antwort)
+    return result if result.strip() else transcript
+
+
+def _budget_fallback(transcript: str) -> str:
+    """Ersatz fürs LLM bei knappem Budget.
+
+    Lokale Regeln (Voice-Commands, Füllwörter) nur, wenn Local Refine aktiv
+    ist (PULSESCRIBE_LOCAL_REFINE_MAX_WORDS > 0), sonst der Rohtext.
+    """
+    if get_local_refine_max_words() <= 0:
+        return transcript
+    result = get_local_rules().apply(transcript)
+    return result if result.strip() else transcript
+
+
+def _refine_with_deadline(timeout: float | None, **kwargs) -> str | None:
+    """refine_transcript mit Deadline (None = ohne); None, wenn sie verstreicht.
+
+    Die synchronen SDK-Aufrufe lassen sich nicht abbrechen: der Thread läuft
+    aus und füllt noch Refine-Cache und Latenz-Histogramm.
+    """
+    outcome: queue.SimpleQueue[tuple[str | None, Exception | None]] = queue.SimpleQueue()
+
+    def run() -> None:
+        try:
+            outcome.put((refine_transcript(**kwargs), None))
+        except Exception as e:
+            outcome.put((None, e))
+
+    threading.Thread(target=run, daemon=True, name="RefineDeadline").start()
+    try:
+        result, error = outcome.get(timeout=timeout)
+    except queue.Empty:
+        return None
+    if error is not None:
+        raise error
     return result
 
 
+class _RefineDeadlineExpired(Exception):
+    """Latenzbudget ist während des Refine-Streams abgelaufen."""
+
+
+def _stream_with_deadline(
+    deltas: Callable[[], Iterable[str]], timeout: float | None
+) -> Iterator[str]:
+    """Reicht Stream-Deltas weiter; wirft _RefineDeadlineExpired nach ``timeout``.
+
+    Der Stream läuft in einem eigenen Thread, damit auch ein hängender Chunk
+    die Deadline nicht aushebelt. Wie bei _refine_with_deadline läuft der
+    Thread danach aus; einen abgebrochenen Stream cacht der Refine-Cache nicht.
+    """
+    if timeout is None:
+        yield from deltas()
+        return
+    items: queue.SimpleQueue[tuple[str | None, Exception | None]] = queue.SimpleQueue()
+
+    def run() -> None:
+        try:
+            for delta in deltas():
+                items.put((delta, None))
+        except Exception as e:
+            items.put((None, e))
+            return
+        items.put((None, None))
+
+    threading.Thread(target=run, daemon=True, name="RefineStreamDeadline").start()
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            delta, error = items.get(timeout=max(0.0, deadline - time.monotonic()))
+        except queue.Empty:
+            raise _RefineDeadlineExpired from None
+        if error is not None:
+            raise error
+        if delta is None:
+            return
+        yield delta
+
+
 def maybe_refine_transcript(
     transcript: str,
     *,
@@ -485,6 +1028,8 @@ def maybe_refine_transcript(
     refine_model: str | None = None,
     refine_provider: str | None = None,
     context: str | None = None,
+    use_cache: bool = True,
+    budget: LatencyBudget | None = None,
 ) -> str:
     """Wendet LLM-Nachbearbeitung an, falls aktiviert. Gibt Rohtext bei Fehler zurück.
 
@@ -495,22 +1040,62 @@ def maybe_refine_transcript(
         refine_model: Modell fuer Nachbearbeitung
         refine_provider: Provider (openai, openrouter, groq)
         context: Kontext-Typ (email, chat, code, default)
+        use_cache: Refine-Cache nutzen (CLI: --no-cache)
+        budget: Latenzbudget (Daemons); bestimmt Deadline, Modell oder den
+            Verzicht aufs LLM (Rohtext bzw. lokale Bereinigung)
+
+    Kurze Diktate (PULSESCRIBE_LOCAL_REFINE_MAX_WORDS) bereinigt die lokale
+    Regel-Engine ohne LLM-Aufruf.
 
     Returns:
         Das nachbearbeitete Transkript oder Original bei Fehler/Deaktivierung
     """
-    from openai import APIError, APIConnectionError, APITimeoutError, RateLimitError
-
     if not refine or no_refine:
         return transcript
 
+    local = _try_local_refine(transcript)
+    if local is not None:
+        return local
+
     try:
-        result = refine_transcript(
-            transcript,
-            model=refine_model,
-            provider=refine_provider,
-            context=context,
-        )
+        if budget is None:
+            result = refine_transcript(
+                transcript,
+                model=refine_model,
+                provider=refine_provider,
+                context=context,
+                use_cache=use_cache,
+            )
+        else:
+            provider, model = _resolve_refine_target(refine_provider, refine_model)
+            plan = budget.plan_refine(
+                provider, model, fallback_model=get_refine_fallback_model()
+            )
+            if plan.action == "local":
+                logger.info(
+                    f"[{get_session_id()}] LLM-Nachbearbeitung übersprungen "
+                    f"(Latenzbudget: {plan.reason})"
+                )
+                return _budget_fallback(transcript)
+            if plan.action == "downgrade":
+                logger.info(
+                    f"[{get_session_id()}] Latenzbudget: {plan.model} statt {model} "
+                    f"({plan.reason})"
+                )
+            result = _refine_with_deadline(
+                plan.timeout_s,
+                transcript=transcript,
+                model=plan.model or model,
+                provider=provider,
+                context=context,
+                use_cache=use_cache,
+            )
+            if result is None:
+                logger.warning(
+                    f"[{get_session_id()}] LLM-Nachbearbeitung nach "
+                    f"{plan.timeout_s:.2f}s abgebrochen (Latenzbudget)"
+                )
+                return _budget_fallback(transcript)
         # Fallback auf Original wenn LLM leeren String zurückgibt
         if not result or not result.strip():
             logger.warning(
@@ -518,17 +1103,112 @@ def maybe_refine_transcript(
             )
             return transcript
         return result
-    except ValueError as e:
-        # Fehlende API-Keys (z.B. OPENROUTER_API_KEY)
-        logger.warning(f"LLM-Nachbearbeitung übersprungen: {e}")
-        return transcript
-    except APITimeoutError as e:
-        logger.warning(f"LLM-Nachbearbeitung Timeout: {e}")
-        return transcript
-    except (APIError, APIConnectionError, RateLimitError) as e:
-        logger.warning(f"LLM-Nachbearbeitung fehlgeschlagen: {e}")
-        return transcript
-    except Exception:
-        # Generischer Fallback für unerwartete Fehler (z.B. Netzwerk, JSON-Parsing)
-        logger.exception("LLM-Nachbearbeitung fehlgeschlagen (unerwartet)")
+    except Exception as e:
+        _log_refine_error(e)
         return transcript
+
+
+def maybe_refine_transcript_streaming(
+    transcript: str,
+    *,
+    on_sentences: Callable[[str], None],
+    refine_model: str | None = None,
+    refine_provider: str | None = None,
+    context: str | None = None,
+    budget: LatencyBudget | None = None,
+) -> StreamedRefineResult:
+    """LLM-Nachbearbeitung als Stream: fertige Sätze gehen sofort an ``on_sentences``.
+
+    Der sichtbare Text erscheint damit nach dem ersten Satz statt nach der
+    kompletten Antwort. Scheitert der Stream, bevor etwas ausgegeben wurde,
+    ist ``text`` wie bei maybe_refine_transcript das Original. Danach lässt
+    sich bereits Eingefügtes nicht zurücknehmen: ``text`` ist dann der
+    bisher empfangene verfeinerte Text plus der Rest als Rohtext.
+
+    Args:
+        transcript: Das zu verfeinernde Transkript
+        on_sentences: Erhält abgeschlossene Sätze (inkl. folgendem Leerraum)
+        refine_model: Modell fuer Nachbearbeitung
+        refine_provider: Provider (openai, openrouter, groq, gemini)
+        context: Kontext-Typ (email, chat, code, default)
+        budget: Latenzbudget (Daemons) wie bei maybe_refine_transcript; die
+            Deadline wird zwischen den Stream-Chunks geprüft
+    """
+    local = _try_local_refine(transcript)
+    if local is not None:
+        return StreamedRefineResult(text=local, refined=local != transcript)
+
+    timeout: float | None = None
+    if budget is not None:
+        try:
+            provider, model = _resolve_refine_target(refine_provider, refine_model)
+        except Exception as e:
+            _log_refine_error(e)
+            return StreamedRefineResult(text=transcript)
+        plan = budget.plan_refine(
+            provider, model, fallback_model=get_refine_fallback_model()
+        )
+        if plan.action == "local":
+            logger.info(
+                f"[{get_session_id()}] LLM-Nachbearbeitung übersprungen "
+                f"(Latenzbudget: {plan.reason})"
+            )
+            text = _budget_fallback(transcript)
+            return StreamedRefineResult(text=text, refined=text != transcript)
+        if plan.action == "downgrade":
+            logger.info(
+                f"[{get_session_id()}] Latenzbudget: {plan.model} statt {model} "
+                f"({plan.reason})"
+            )
+        refine_provider, refine_model = provider, plan.model or model
+        timeout = plan.timeout_s
+
+    emitted = ""
+    pending = ""
+    try:
+        for delta in _stream_with_deadline(
+            lambda: stream_refine_transcript(
+                transcript,
+                model=refine_model,
+                provider=refine_provider,
+                context=context,
+            ),
+            timeout,
+        ):
+            pending += delta
+            if not emitted:
+                pending = pending.lstrip()
+            sentences, pending = split_completed_sentences(pending)
+            if sentences:
+                on_sentences(sentences)
+                emitted += sentences
+    except Exception as e:
+        expired = isinstance(e, _RefineDeadlineExpired)
+        if expired:
+            logger.warning(
+                f"[{get_session_id()}] LLM-Stream nach {timeout:.2f}s "
+                "abgebrochen (Latenzbudget)"
+            )
+        else:
+            _log_refine_error(e)
+        if not emitted:
+            text = _budget_fallback(transcript) if expired else transcript
+            return StreamedRefineResult(text=text, refined=text != transcript)
+        # Bereits eingefügte Sätze lassen sich nicht zurückholen: den Rest
+        # unverfeinert anhängen statt ihn zu verlieren.
+        text = (emitted + _unrefined_tail(transcript, emitted)).rstrip()
+        logger.warning(
+            f"LLM-Stream nach {len(emitted)} eingefügten Zeichen abgebrochen, "
+            "Rest wird als Rohtext eingefügt"
+        )
+        return StreamedRefineResult(text=text, emitted=emitted[: len(text)], refined=True)
+
+    text = (emitted + pending).rstrip()
+    if not text:
+        logger.warning("LLM-Nachbearbeitung gab leeren String zurück, verwende Original")
+        return StreamedRefineResult(text=transcript)
+    return StreamedRefineResult(
+        text=text,
+        emitted=emitted[: len(text)],
+        refined=text != transcript,
+    )
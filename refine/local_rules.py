@@ -0,0 +1,267 @@
+"""Lokale Regel-Engine für Voice-Commands und Füllwörter.
+
+Jeder Refine-Aufruf schickt ``VOICE_COMMANDS_INSTRUCTION`` ans LLM, nur damit
+aus "neuer Absatz" ein Umbruch, aus "Komma" ein Komma wird und "ähm"
+verschwindet. ``LocalRules`` erledigt genau das deterministisch: alle
+Befehle und Füllwörter stecken in einem einzigen kompilierten Regex
+(Alternation, längste Phrase zuerst), die Ersetzung ist ein Dict-Lookup.
+Ein Transkript ohne Treffer kostet einen einzigen Suchlauf.
+
+``local_refine()`` ist die Policy dazu: Kurze Diktate (bis
+``PULSESCRIBE_LOCAL_REFINE_MAX_WORDS`` Wörter) werden nur lokal bereinigt,
+das LLM wird gar nicht erst gefragt.
+
+Bewusst nicht entfernt werden Füllwörter mit Bedeutung ("also", "quasi",
+"sozusagen") – das bleibt dem LLM-Prompt überlassen. Einwortbefehle wie
+"Punkt" oder "period" sind oft ganz normale Nomen ("Der Punkt ist", "um Punkt
+drei", "drei Komma fünf", "a period of time"); sie greifen daher nur hinter
+einem Wort, nicht hinter Artikeln/Präpositionen und nicht zwischen Zahlen.
+
+Anpassbar in ~/.pulsescribe/prompts.toml:
+    [local_rules.commands]
+    "neuer Punkt" = "\\n- "
+    "punkt" = ""            # leer = Befehl deaktivieren
+
+    [local_rules.fillers]
+    de = ["ähm", "äh", "öhm"]  # ersetzt die Default-Liste für "de"
+
+Usage:
+    from refine.local_rules import local_refine
+
+    cleaned = local_refine(transcript)  # None → LLM nötig
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections.abc import Iterable, Mapping
+
+# Gesprochener Befehl → eingefügter Text (entspricht VOICE_COMMANDS_INSTRUCTION)
+DEFAULT_VOICE_COMMANDS: dict[str, str] = {
+    "neuer absatz": "\n\n",
+    "new paragraph": "\n\n",
+    "neue zeile": "\n",
+    "new line": "\n",
+    "punkt": ".",
+    "period": ".",
+    "full stop": ".",
+    "komma": ",",
+    "comma": ",",
+    "fragezeichen": "?",
+    "question mark": "?",
+    "ausrufezeichen": "!",
+    "exclamation mark": "!",
+    "doppelpunkt": ":",
+    "colon": ":",
+    "semikolon": ";",
+    "semicolon": ";",
+}
+
+# Reine Verzögerungslaute pro Sprache. Alle Listen gelten gleichzeitig, daher
+# nichts, was in der anderen Sprache ein Wort ist ("um", "er" im Deutschen).
+DEFAULT_FILLERS: dict[str, tuple[str, ...]] = {
+    "de": ("ähm", "ähmm", "äh", "ähh", "öhm", "öh"),
+    "en": ("umm", "uh", "uhm", "erm"),
+}
+
+# Markiert im Zwischenergebnis "nächstes Wort großschreiben"
+_CAPITALIZE_MARK = "\x00"
+_CAPITALIZE_NEXT = re.compile(_CAPITALIZE_MARK + r"(\s*)(\w)")
+_PUNCTUATION = frozenset(",.;:!?")
+_SENTENCE_END = frozenset(".!?")
+_LINE_PADDING = re.compile(r"[ \t]*\n[ \t]*")
+_EXTRA_BREAKS = re.compile(r"\n{3,}")
+_EXTRA_SPACES = re.compile(r"[ \t]{2,}")
+
+# Hinter diesen Wörtern ist ein Einwortbefehl ein Nomen ("der Punkt",
+# "um Punkt drei", "a period of time"), kein Befehl
+_NOUN_MARKERS = frozenset(
+    (
+        "der die das den dem des ein eine einen einem einer eines kein keine"
+        " keinen keinem keiner dieser diesen diesem jeder jeden jedem"
+        " um am im zum beim vom"
+        " the a an this that each every no per"
+    ).split()
+)
+# Zwischen Zahlen ist "Komma"/"Punkt" Teil der Zahl ("drei Komma fünf")
+_NUMBER_WORDS = frozenset(
+    (
+        "null eins zwei drei vier fünf sechs sieben acht neun zehn"
+        " zero one two three four five six seven eight nine ten"
+    ).split()
+)
+_PREVIOUS_WORD = re.compile(r"(\w+)[^\w\n]*$")
+_NEXT_WORD = re.compile(r"[ \t]*(\w+)")
+# Rückblick für das vorige Wort (begrenzt, damit lange Texte linear bleiben)
+_LOOKBEHIND_CHARS = 64
+
+
+def _normalize_phrase(phrase: str) -> str:
+    return " ".join(phrase.lower().split())
+
+
+class LocalRules:
+    """Kompilierter Matcher für Voice-Commands und Füllwörter.
+
+    Vom ASR gesetzte Satzzeichen direkt an einem Befehl ("Hallo, Komma, wie")
+    werden durch das Befehlszeichen ersetzt; bei Füllwörtern bleibt das
+    stärkere Satzzeichen stehen. Großgeschrieben wird nur hinter eingefügten
+    Satzenden und Umbrüchen, der restliche Text bleibt unangetastet.
+    Einwortbefehle gelten nur in Befehlsposition (siehe ``_is_command_position``).
+    """
+
+    def __init__(self, commands: Mapping[str, str], fillers: Iterable[str]) -> None:
+        self._replacements: dict[str, str] = {}
+        for phrase, replacement in commands.items():
+            if _normalize_phrase(phrase) and replacement:
+                self._replacements[_normalize_phrase(phrase)] = replacement
+        for filler in fillers:
+            if _normalize_phrase(filler):
+                self._replacements.setdefault(_normalize_phrase(filler), "")
+
+        phrases = sorted(self._replacements, key=len, reverse=True)
+        alternation = "|".join(
+            r"\s+".join(re.escape(word) for word in phrase.split())
+            for phrase in phrases
+        )
+        self._pattern = (
+            re.compile(
+                rf"[ \t]*([,.;:!?]?)[ \t]*(?<!\w)({alternation})(?!\w)([,.;:!?]?)",
+                re.IGNORECASE,
+            )
+            if phrases
+            else None
+        )
+
+    def apply(self, text: str) -> str:
+        """Wendet Befehle und Füllwort-Entfernung auf ``text`` an."""
+        if self._pattern is None or not self._pattern.search(text):
+            return text
+        result = self._pattern.sub(self._replace, text)
+        result = _CAPITALIZE_NEXT.sub(
+            lambda m: m.group(1) + m.group(2).upper(), result
+        ).replace(_CAPITALIZE_MARK, "")
+        result = _LINE_PADDING.sub("\n", result)
+        result = _EXTRA_BREAKS.sub("\n\n", result)
+        return _EXTRA_SPACES.sub(" ", result).strip()
+
+    def _replace(self, match: re.Match[str]) -> str:
+        before, phrase, after = match.groups()
+        key = _normalize_phrase(phrase)
+        replacement = self._replacements[key]
+        if replacement and " " not in key and not _is_command_position(match):
+            return match.group(0)  # Einwortbefehl als Nomen ("der Punkt")
+        if replacement:
+            if not replacement.strip():
+                # Umbruch: Satzzeichen davor gehört zum vorigen Satz
+                return before + replacement + _CAPITALIZE_MARK
+            if replacement not in _PUNCTUATION:
+                # Eigener Text (z.B. ":)") steht als Wort, nicht am Wort davor
+                replacement = before + " " + replacement
+            if replacement.rstrip()[-1:] in _SENTENCE_END:
+                return replacement + _CAPITALIZE_MARK
+            return replacement
+
+        # Füllwort
+        if after in _SENTENCE_END:
+            return after
+        if before in _SENTENCE_END or (not before and match.start() == 0):
+            return before + _CAPITALIZE_MARK
+        if before and after:
+            return ""  # ", äh," → Einschub komplett entfernen
+        return before
+
+
+def _is_command_position(match: re.Match[str]) -> bool:
+    """Ob ein Einwortbefehl als Befehl und nicht als Nomen gemeint ist.
+
+    Verlangt ein Wort davor (in derselben Zeile), das weder Artikel noch
+    Präposition ist; zwischen zwei Zahlen gehört das Wort zur Zahl.
+    """
+    text = match.string
+    start = match.start(2)
+    previous = _PREVIOUS_WORD.search(text[max(0, start - _LOOKBEHIND_CHARS):start])
+    if previous is None:
+        return False
+    previous_word = previous.group(1).lower()
+    if previous_word in _NOUN_MARKERS:
+        return False
+    if match.group(3):
+        return True  # "Komma," – eigenes Satzzeichen dahinter, kein Zahlteil
+    following = _NEXT_WORD.match(text, match.end(2))
+    return not (
+        following is not None
+        and _is_number(previous_word)
+        and _is_number(following.group(1).lower())
+    )
+
+
+def _is_number(word: str) -> bool:
+    return word.isdigit() or word in _NUMBER_WORDS
+
+
+def build_local_rules(
+    command_overrides: Mapping[str, str] | None = None,
+    filler_overrides: Mapping[str, Iterable[str]] | None = None,
+) -> LocalRules:
+    """Erzeugt Regeln aus Defaults plus Overrides (aus prompts.toml)."""
+    commands = dict(DEFAULT_VOICE_COMMANDS)
+    for phrase, replacement in (command_overrides or {}).items():
+        commands[_normalize_phrase(phrase)] = replacement
+    fillers = dict(DEFAULT_FILLERS)
+    for language, words in (filler_overrides or {}).items():
+        fillers[language] = tuple(words)
+    return LocalRules(commands, (word for words in fillers.values() for word in words))
+
+
+_rules_lock = threading.Lock()
+_rules_cache: tuple[object, LocalRules] | None = None
+
+
+def get_local_rules() -> LocalRules:
+    """Prozessweite Regeln; neu kompiliert, wenn sich prompts.toml ändert."""
+    global _rules_cache
+    from utils.custom_prompts import get_local_rule_overrides
+
+    overrides = get_local_rule_overrides()
+    signature = (
+        tuple(sorted(overrides["commands"].items())),
+        tuple(sorted((lang, tuple(words)) for lang, words in overrides["fillers"].items())),
+    )
+    with _rules_lock:
+        if _rules_cache is None or _rules_cache[0] != signature:
+            _rules_cache = (
+                signature,
+                build_local_rules(overrides["commands"], overrides["fillers"]),
+            )
+        return _rules_cache[1]
+
+
+def local_refine(transcript: str, *, max_words: int | None = None) -> str | None:
+    """Bereinigt kurze Transkripte lokal statt per LLM.
+
+    Args:
+        transcript: Rohtranskript
+        max_words: Wortgrenze (default: PULSESCRIBE_LOCAL_REFINE_MAX_WORDS, 0 = aus)
+
+    Returns:
+        Bereinigter Text, oder None, wenn das LLM nachbearbeiten soll.
+    """
+    if max_words is None:
+        from config import get_local_refine_max_words
+
+        max_words = get_local_refine_max_words()
+    if max_words <= 0 or len(transcript.split()) > max_words:
+        return None
+    return get_local_rules().apply(transcript)
+
+
+__all__ = [
+    "DEFAULT_FILLERS",
+    "DEFAULT_VOICE_COMMANDS",
+    "LocalRules",
+    "build_local_rules",
+    "get_local_rules",
+    "local_refine",
+]
@@ -102,20 +102,37 @@ def temp_files(tmp_path, monkeypatch):
 
 
 @pytest.fixture(autouse=True)
-def reset_caches(monkeypatch):
+def reset_caches(monkeypatch, tmp_path):
     """
     Setzt Module-Level Caches vor jedem Test zurück.
 
     Wichtig für: _custom_app_contexts_cache (wird bei erstem Aufruf befüllt)
+    sowie Autotune-Profil, Transkript- und Refine-Cache, Spool-Verzeichnis und Refine-Latenzen
+    des Entwicklerrechners (~/.pulsescribe). Der Interim-Kanal wird pro Test neu angelegt, damit
+    Abonnenten nicht gestoppter Daemons nicht in andere Tests durchschlagen.
     """
+    import config
     import refine.context
     import refine.llm
     import utils.env
+    import utils.interim_channel
+    import utils.latency_budget
 
     monkeypatch.setattr(refine.context, "_custom_app_contexts_cache", None)
     refine.llm._clients.clear()
     refine.llm._signatures.clear()
     monkeypatch.setattr(utils.env, "_loaded_env_values", {})
+    monkeypatch.setattr(config, "LOCAL_PROFILE_FILE", tmp_path / "local_profile.json")
+    monkeypatch.setattr(config, "TRANSCRIPT_CACHE_DIR", tmp_path / "transcripts")
+    monkeypatch.setattr(config, "REFINE_CACHE_DIR", tmp_path / "refine")
+    monkeypatch.setattr(config, "RECORDING_SPOOL_DIR", tmp_path / "spool")
+    monkeypatch.setattr(config, "REFINE_LATENCY_FILE", tmp_path / "refine_latency.json")
+    monkeypatch.setattr(
+        utils.interim_channel, "_channel", utils.interim_channel.InterimChannel()
+    )
+    monkeypatch.setattr(
+        utils.latency_budget, "_stats", utils.latency_budget.BudgetStats()
+    )
 
 
 @pytest.fixture
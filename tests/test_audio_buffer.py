@@ -0,0 +1,110 @@
+"""Tests fuer audio.buffer.SampleBuffer."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from audio.buffer import SampleBuffer
+
+
+def test_append_matches_concatenate_of_callback_blocks():
+    buffer = SampleBuffer(sample_rate=1_000, block_seconds=0.008)
+    blocks = [
+        np.full((7, 1), index / 10, dtype=np.float32) for index in range(1, 6)
+    ]
+
+    for block in blocks:
+        buffer.append(block)
+
+    assert len(buffer) == 35
+    np.testing.assert_array_equal(buffer.read(), np.concatenate(blocks))
+
+
+def test_full_blocks_are_never_reallocated():
+    buffer = SampleBuffer(sample_rate=1_000, block_seconds=0.004)
+    buffer.append(np.array([0.1, 0.2, 0.3, 0.4], dtype=np.float32))
+    first_block = buffer._blocks[0]
+    early = buffer.read()
+
+    buffer.append(np.array([0.5, 0.6, 0.7], dtype=np.float32))
+
+    assert buffer.capacity == 8
+    assert buffer._blocks[0] is first_block
+    np.testing.assert_allclose(early.reshape(-1), [0.1, 0.2, 0.3, 0.4])
+    np.testing.assert_allclose(
+        buffer.read().reshape(-1), [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7]
+    )
+
+
+def test_read_range_spans_block_boundaries():
+    buffer = SampleBuffer(sample_rate=1_000, block_seconds=0.004)
+    buffer.append(np.arange(10, dtype=np.float32))
+
+    np.testing.assert_array_equal(buffer.read(3, 9).reshape(-1), [3, 4, 5, 6, 7, 8])
+    np.testing.assert_array_equal(buffer.read(5, 7).reshape(-1), [5, 6])
+    np.testing.assert_array_equal(buffer.read(8, 50).reshape(-1), [8, 9])
+    assert buffer.read(6, 6).shape == (0, 1)
+
+
+def test_append_bytes_scales_int16_without_temp_astype():
+    buffer = SampleBuffer(sample_rate=16_000)
+    raw = np.array([32767, -32767, 0], dtype=np.int16).tobytes()
+
+    buffer.append_bytes(raw, dtype="int16", scale=32767)
+
+    audio = buffer.read().reshape(-1)
+    assert audio.dtype == np.float32
+    np.testing.assert_allclose(audio, [1.0, -1.0, 0.0])
+
+
+def test_take_returns_samples_and_resets_buffer():
+    buffer = SampleBuffer(sample_rate=16_000)
+    buffer.append(np.array([0.25, 0.5], dtype=np.float32))
+
+    taken = buffer.take()
+    buffer.append(np.array([0.75], dtype=np.float32))
+
+    np.testing.assert_allclose(taken.reshape(-1), [0.25, 0.5])
+    np.testing.assert_allclose(buffer.read().reshape(-1), [0.75])
+
+
+def test_take_range_with_padding_copies_once_and_releases_blocks():
+    buffer = SampleBuffer(sample_rate=1_000, block_seconds=0.004)
+    buffer.append(np.arange(1, 11, dtype=np.float32))
+    blocks = buffer._blocks
+
+    taken = buffer.take(2, 9, pad_frames=3)
+
+    np.testing.assert_array_equal(taken.reshape(-1), [3, 4, 5, 6, 7, 8, 9, 0, 0, 0])
+    assert blocks == [None, None, None]
+    assert len(buffer) == 0
+
+
+def test_take_pads_empty_buffer_with_silence():
+    buffer = SampleBuffer(sample_rate=16_000)
+
+    assert buffer.take(pad_frames=2).reshape(-1).tolist() == [0.0, 0.0]
+
+
+def test_empty_buffer_reports_zero_frames_and_duration():
+    buffer = SampleBuffer(sample_rate=16_000, channels=2)
+
+    assert len(buffer) == 0
+    assert buffer.duration == 0.0
+    assert buffer.read().shape == (0, 2)
+    assert buffer.take().shape == (0, 2)
+
+
+def test_multichannel_blocks_keep_frame_layout():
+    buffer = SampleBuffer(sample_rate=8_000, channels=2)
+    buffer.append(np.array([[0.1, 0.2], [0.3, 0.4]], dtype=np.float32))
+
+    assert len(buffer) == 2
+    assert buffer.duration == pytest.approx(2 / 8_000)
+    np.testing.assert_allclose(buffer.read(), [[0.1, 0.2], [0.3, 0.4]])
+
+
+def test_invalid_channel_count_is_rejected():
+    with pytest.raises(ValueError):
+        SampleBuffer(sample_rate=16_000, channels=0)
@@ -0,0 +1,151 @@
+"""Tests fuer audio.input_stream (Replay-Backend statt Mikrofon)."""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+import audio.input_stream as input_stream
+from audio.input_stream import (
+    CallbackAbort,
+    ReplayBackend,
+    get_sounddevice,
+    set_audio_backend,
+)
+from audio.recording import AudioRecorder
+from config import get_audio_replay_speed
+
+
+@pytest.fixture(autouse=True)
+def _reset_backend(monkeypatch):
+    monkeypatch.setattr(input_stream, "_installed_backend", None)
+    monkeypatch.setattr(input_stream, "_env_backend", None)
+    monkeypatch.setattr(input_stream, "_env_backend_key", None)
+    monkeypatch.delenv("PULSESCRIBE_AUDIO_REPLAY", raising=False)
+
+
+def _ramp(frames: int):
+    return (np.arange(frames, dtype=np.float32) / frames * 0.5).astype(np.float32)
+
+
+def _collect(stream_factory, **kwargs):
+    blocks = []
+
+    def callback(indata, _frames, _time_info, _status):
+        blocks.append(indata.copy())
+
+    stream = stream_factory(callback=callback, **kwargs)
+    stream.start()
+    assert stream.exhausted.wait(2.0)
+    stream.stop()
+    return stream, blocks
+
+
+def test_replay_delivers_file_then_silence():
+    backend = ReplayBackend(_ramp(1000), 16000, speed=0, blocksize=256)
+
+    stream, blocks = _collect(backend.InputStream, channels=1, dtype="float32")
+
+    audio = np.concatenate(blocks)
+    assert audio.shape[1] == 1
+    assert all(block.shape == (256, 1) for block in blocks)
+    np.testing.assert_allclose(audio[:1000, 0], _ramp(1000))
+    assert not audio[1000:].any()
+    assert stream.first_block_at is not None
+    assert backend.last_stream is stream
+
+
+def test_replay_paces_blocks_in_real_time():
+    backend = ReplayBackend(_ramp(1600), 16000, speed=1.0, blocksize=320)
+
+    start = time.perf_counter()
+    _collect(backend.InputStream)
+    elapsed = time.perf_counter() - start
+
+    # 5 volle Blöcke à 20 ms, der sechste (Rest + Stille) markiert das Ende
+    assert 0.09 <= elapsed < 1.0
+
+
+def test_replay_converts_rate_channels_and_int16():
+    backend = ReplayBackend(_ramp(4800), 48000, speed=0, blocksize=160)
+
+    _stream, blocks = _collect(
+        backend.InputStream, samplerate=16000, channels=2, dtype="int16"
+    )
+
+    audio = np.concatenate(blocks)
+    assert audio.dtype == np.int16
+    assert audio.shape[1] == 2
+    np.testing.assert_array_equal(audio[:, 0], audio[:, 1])
+    # 4800 Samples @48k → 1600 Samples @16k, danach nur Stille
+    assert audio.shape[0] >= 1600
+    assert not audio[1600:].any()
+    assert np.abs(audio[800:1500, 0]).max() > 0.2 * 32767
+
+
+def test_callback_abort_stops_stream():
+    backend = ReplayBackend(_ramp(16000), 16000, speed=0, blocksize=100)
+    finished = []
+    calls = []
+
+    def callback(*_args):
+        calls.append(1)
+        if len(calls) == 3:
+            raise CallbackAbort
+
+    stream = backend.InputStream(
+        callback=callback, finished_callback=lambda: finished.append(1)
+    )
+    stream.start()
+    stream._thread.join(2.0)
+
+    assert not stream.active
+    assert len(calls) == 3
+    assert finished == [1]
+
+
+def test_get_sounddevice_prefers_installed_backend():
+    backend = ReplayBackend(_ramp(100), 16000)
+
+    set_audio_backend(backend)
+
+    assert get_sounddevice() is backend
+
+
+def test_get_sounddevice_loads_replay_file_from_env(tmp_path, monkeypatch):
+    path = tmp_path / "replay.wav"
+    sf.write(path, _ramp(800), 8000)
+    monkeypatch.setenv("PULSESCRIBE_AUDIO_REPLAY", str(path))
+    monkeypatch.setenv("PULSESCRIBE_AUDIO_REPLAY_SPEED", "4")
+
+    backend = get_sounddevice()
+
+    assert isinstance(backend, ReplayBackend)
+    assert backend.default_samplerate == 8000
+    assert backend.speed == 4.0
+    assert get_sounddevice() is backend  # gecacht, solange ENV gleich bleibt
+
+
+def test_replay_speed_env_is_bounded(monkeypatch):
+    monkeypatch.setenv("PULSESCRIBE_AUDIO_REPLAY_SPEED", "abc")
+    assert get_audio_replay_speed() == 1.0
+    monkeypatch.setenv("PULSESCRIBE_AUDIO_REPLAY_SPEED", "0")
+    assert get_audio_replay_speed() == 0.0
+
+
+def test_audio_recorder_records_from_replay(tmp_path):
+    backend = ReplayBackend(_ramp(4800), 48000, speed=0)
+    set_audio_backend(backend)
+    recorder = AudioRecorder(spool=False)
+
+    recorder.start(play_ready_sound=False)
+    assert backend.last_stream.exhausted.wait(2.0)
+    path = recorder.stop(output_path=tmp_path / "out.wav")
+
+    audio, rate = sf.read(path, dtype="float32")
+    # Ohne Gerät nutzt der Recorder die native Rate der Replay-Quelle
+    assert rate == 48000
+    np.testing.assert_allclose(audio[:4800], _ramp(4800), atol=1e-4)
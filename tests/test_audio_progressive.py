@@ -0,0 +1,116 @@
+"""Tests fuer audio.progressive.ProgressiveTranscriber."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from audio.buffer import SampleBuffer
+from audio.progressive import ProgressiveTranscriber
+from audio.vad import StreamingVAD
+
+SAMPLE_RATE = 16_000
+
+
+def _tone(seconds: float) -> np.ndarray:
+    t = np.arange(int(SAMPLE_RATE * seconds), dtype=np.float32) / SAMPLE_RATE
+    return (0.2 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def _silence(seconds: float) -> np.ndarray:
+    return np.zeros(int(SAMPLE_RATE * seconds), dtype=np.float32)
+
+
+def _capture(progressive, buffer, vad, audio, block: int = 1_600) -> None:
+    """Simuliert Callback + Capture-Schleife (poll nach jedem Block)."""
+    for start in range(0, audio.size, block):
+        chunk = audio[start : start + block]
+        buffer.append(chunk)
+        vad.feed(chunk)
+        progressive.poll(buffer, vad)
+
+
+def _setup(transcribe, *, min_segment_seconds: float = 2.0, max_workers: int = 1):
+    buffer = SampleBuffer(sample_rate=SAMPLE_RATE)
+    vad = StreamingVAD(sample_rate=SAMPLE_RATE)
+    progressive = ProgressiveTranscriber(
+        transcribe,
+        sample_rate=SAMPLE_RATE,
+        min_segment_seconds=min_segment_seconds,
+        max_workers=max_workers,
+    )
+    return buffer, vad, progressive
+
+
+def test_cuts_at_pauses_and_stitches_in_order():
+    lengths: list[float] = []
+
+    def transcribe(segment):
+        lengths.append(segment.shape[0] / SAMPLE_RATE)
+        return f"teil{len(lengths)} "
+
+    buffer, vad, progressive = _setup(transcribe)
+    audio = np.concatenate(
+        [_tone(2.5), _silence(0.5), _tone(0.5), _silence(0.5), _tone(2.5), _silence(0.6)]
+    )
+    _capture(progressive, buffer, vad, audio)
+
+    # Kurze Phrase (0.5s) wird nicht einzeln geschnitten: Mindestlänge 2s
+    assert progressive.segment_count == 2
+    audio_data = buffer.take().reshape(-1)
+    tail = progressive.tail_after_cut(audio_data, vad)
+
+    assert tail is None  # nach dem letzten Schnitt nur noch Stille
+    assert progressive.finish(tail) == "teil1 teil2"
+    assert lengths[0] == pytest.approx(2.5 + 0.15, abs=0.05)
+    assert sum(lengths) == pytest.approx(audio.size / SAMPLE_RATE - 0.6 + 0.15, abs=0.1)
+
+
+def test_finish_transcribes_tail_and_keeps_order_with_parallel_workers():
+    release_first = threading.Event()
+
+    def transcribe(segment):
+        index = int(round(segment.shape[0] / SAMPLE_RATE))
+        if index == 3:  # erstes Segment (3s) wird als letztes fertig
+            release_first.wait(timeout=2)
+        else:
+            release_first.set()
+        return f"{index}s"
+
+    buffer, vad, progressive = _setup(transcribe, max_workers=3)
+    _capture(progressive, buffer, vad, np.concatenate([_tone(2.85), _silence(0.5)]))
+    _capture(progressive, buffer, vad, _tone(1.0))
+
+    audio_data = buffer.take().reshape(-1)
+    tail = progressive.tail_after_cut(audio_data, vad)
+
+    assert tail is not None
+    assert tail.shape[0] / SAMPLE_RATE == pytest.approx(1.35, abs=0.05)
+    assert progressive.finish(tail, timeout=5) == "3s 1s"
+
+
+def test_segment_failure_propagates_from_finish():
+    def transcribe(_segment):
+        raise RuntimeError("API down")
+
+    buffer, vad, progressive = _setup(transcribe)
+    _capture(progressive, buffer, vad, np.concatenate([_tone(2.5), _silence(0.5)]))
+
+    assert progressive.has_segments
+    with pytest.raises(RuntimeError, match="API down"):
+        progressive.finish(None)
+
+
+def test_poll_after_close_submits_nothing():
+    calls: list[int] = []
+    buffer, vad, progressive = _setup(lambda segment: calls.append(1) or "")
+
+    progressive.close()
+    _capture(progressive, buffer, vad, np.concatenate([_tone(2.5), _silence(0.5)]))
+    time.sleep(0.01)
+
+    assert progressive.has_segments is False
+    assert calls == []
@@ -285,10 +285,8 @@ def test_audio_recorder_stop_is_single_use_and_clears_buffer(
     recorder._session_active = True
     recorder._recording_start = time.perf_counter() - 0.5
     recorder._active_sample_rate = 16_000
-    recorder._recorded_chunks = [
-        np.array([[0.1], [0.2]], dtype=np.float32),
-        np.array([[0.3]], dtype=np.float32),
-    ]
+    recorder._audio_callback(np.array([[0.1], [0.2]], dtype=np.float32), 2, None, None)
+    recorder._audio_callback(np.array([[0.3]], dtype=np.float32), 1, None, None)
 
     output_path = tmp_path / "recording.wav"
     assert recorder.stop(output_path) == output_path
@@ -305,6 +303,35 @@ def test_audio_recorder_stop_is_single_use_and_clears_buffer(
     assert sounds == ["stop"]
 
 
+def test_audio_recorder_spool_mode_writes_during_capture(monkeypatch, tmp_path):
+    import audio.recording as recording
+    import soundfile as sf
+
+    captured: dict = {}
+    fake_sd = SimpleNamespace(
+        InputStream=lambda **kwargs: _DummyInputStream(captured, **kwargs)
+    )
+    monkeypatch.setattr(recording, "get_input_device", lambda: (None, 16_000))
+    monkeypatch.setattr(recording, "_play_sound", lambda _name: None)
+    monkeypatch.setitem(sys.modules, "sounddevice", fake_sd)
+    monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+
+    recorder = recording.AudioRecorder(spool=True)
+    recorder.start(play_ready_sound=False)
+    captured["callback"](np.array([[0.1], [0.2]], dtype=np.float32), 2, None, None)
+    captured["callback"](np.array([[0.3]], dtype=np.float32), 1, None, None)
+
+    output_path = tmp_path / "recording.wav"
+    assert recorder.stop(output_path) == output_path
+
+    # Spool-Modus: RAM-Puffer bleibt leer, Audio liegt vollständig auf der Platte
+    assert recorder.chunks == []
+    audio_data, sample_rate = sf.read(output_path, dtype="float32")
+    assert sample_rate == 16_000
+    np.testing.assert_allclose(audio_data, [0.1, 0.2, 0.3], atol=1 / 32_767)
+    assert list(tmp_path.glob("pulsescribe_spool_*")) == []
+
+
 def test_audio_recorder_stop_closes_stream_when_stop_fails(monkeypatch):
     import audio.recording as recording
 
@@ -0,0 +1,103 @@
+"""Tests fuer audio.resample.StreamingResampler."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from audio.resample import StreamingResampler, resample_audio
+
+TARGET_RATE = 16_000
+
+
+def _speech_band_signal(rate: int, seconds: float = 1.0):
+    def signal(t):
+        return 0.3 * np.sin(2 * np.pi * 440 * t) + 0.2 * np.sin(
+            2 * np.pi * 3_000 * t + 0.3
+        )
+
+    t = np.arange(int(rate * seconds)) / rate
+    return signal(t).astype(np.float32), signal
+
+
+def _resample_in_chunks(resampler: StreamingResampler, audio, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    parts = []
+    position = 0
+    while position < audio.size:
+        size = int(rng.integers(1, 2_000))
+        parts.append(resampler.process(audio[position : position + size]))
+        position += size
+    parts.append(resampler.flush())
+    return np.concatenate(parts)
+
+
+@pytest.mark.parametrize("source_rate", [48_000, 44_100, 22_050])
+def test_matches_analytic_signal_at_target_rate(source_rate):
+    audio, signal = _speech_band_signal(source_rate)
+
+    out = _resample_in_chunks(StreamingResampler(source_rate, TARGET_RATE), audio)
+
+    expected = signal(np.arange(out.size) / TARGET_RATE)
+    assert out.dtype == np.float32
+    assert out.size == int(audio.size * TARGET_RATE / source_rate)
+    # Ränder ausgenommen (Signal startet/endet hart)
+    assert np.abs(out[200:-200] - expected[200:-200]).max() < 1e-4
+
+
+@pytest.mark.parametrize("source_rate", [48_000, 44_100])
+def test_output_is_independent_of_chunking(source_rate):
+    audio, _ = _speech_band_signal(source_rate, seconds=0.5)
+
+    chunked = _resample_in_chunks(StreamingResampler(source_rate, TARGET_RATE), audio)
+
+    np.testing.assert_array_equal(chunked, resample_audio(audio, source_rate, TARGET_RATE))
+
+
+def test_matches_scipy_resample():
+    signal_module = pytest.importorskip("scipy.signal")
+    audio, _ = _speech_band_signal(48_000)
+
+    out = resample_audio(audio, 48_000, TARGET_RATE)
+    reference = signal_module.resample(audio, out.size)
+
+    assert np.abs(out[200:-200] - reference[200:-200]).max() < 1e-3
+
+
+def test_attenuates_content_above_target_nyquist():
+    t = np.arange(48_000) / 48_000
+    alias_tone = (0.5 * np.sin(2 * np.pi * 12_000 * t)).astype(np.float32)
+
+    out = resample_audio(alias_tone, 48_000, TARGET_RATE)
+
+    # np.interp würde 12 kHz als 4-kHz-Alias mit voller Amplitude durchlassen
+    assert np.abs(out[200:-200]).max() < 1e-3
+
+
+def test_process_bytes_scales_int16_and_holds_back_latency():
+    resampler = StreamingResampler(48_000, TARGET_RATE)
+    raw = (np.full(4_800, 16_384, dtype=np.int16)).tobytes()
+
+    head = resampler.process_bytes(raw, dtype="int16", scale=32_767)
+    rest = resampler.flush()
+
+    held_back = -(-resampler.latency_samples // 3)
+    assert head.size == 1_600 - held_back
+    assert head.size + rest.size == 1_600
+    assert abs(float(head[head.size // 2]) - 0.5) < 1e-3
+
+
+def test_flush_is_final():
+    resampler = StreamingResampler(44_100, TARGET_RATE)
+    head = resampler.process(np.zeros(441, dtype=np.float32))
+
+    assert head.size + resampler.flush().size == 160
+    assert resampler.flush().size == 0
+    with pytest.raises(RuntimeError):
+        resampler.process(np.zeros(10, dtype=np.float32))
+
+
+def test_same_rate_is_passthrough():
+    audio = np.linspace(-1, 1, 100, dtype=np.float32)
+
+    np.testing.assert_array_equal(resample_audio(audio, 16_000, 16_000), audio)
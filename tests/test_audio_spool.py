@@ -0,0 +1,184 @@
+"""Tests fuer audio.spool.RecordingSpool."""
+
+from __future__ import annotations
+
+import shutil
+import struct
+import time
+import wave
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from audio.spool import (
+    SPOOL_FILE_PREFIX,
+    RecordingSpool,
+    find_orphaned_spools,
+    repair_wav_header,
+    report_orphaned_spools,
+)
+
+
+def test_write_and_finalize_round_trip(tmp_path):
+    spool = RecordingSpool(sample_rate=16_000, directory=tmp_path)
+    path = spool.start()
+    blocks = [np.full((160, 1), index / 10, dtype=np.float32) for index in range(1, 4)]
+
+    for block in blocks:
+        assert spool.write(block) is True
+
+    assert spool.finalize() == path
+    assert path.name.startswith(SPOOL_FILE_PREFIX)
+    assert spool.frames_written == 480
+    assert spool.duration == pytest.approx(0.03)
+
+    audio, sample_rate = sf.read(path, dtype="float32")
+    assert sample_rate == 16_000
+    np.testing.assert_allclose(
+        audio, np.concatenate(blocks).reshape(-1), atol=1 / 32_767
+    )
+
+
+def test_int16_blocks_are_written_unscaled(tmp_path):
+    spool = RecordingSpool(sample_rate=8_000, path=tmp_path / "spool.wav")
+    spool.start()
+    spool.write(np.array([1000, -1000, 0], dtype=np.int16), copy=False)
+
+    audio, _ = sf.read(spool.finalize(), dtype="int16")
+
+    np.testing.assert_array_equal(audio, [1000, -1000, 0])
+
+
+def test_callback_buffer_reuse_does_not_corrupt_spool(tmp_path):
+    spool = RecordingSpool(sample_rate=16_000, directory=tmp_path)
+    spool.start()
+    indata = np.full((4, 1), 0.5, dtype=np.float32)
+
+    spool.write(indata)
+    indata[:] = 0.0  # PortAudio recycelt den Callback-Puffer
+
+    audio, _ = sf.read(spool.finalize(), dtype="float32")
+    np.testing.assert_allclose(audio, [0.5] * 4, atol=1 / 32_767)
+
+
+def test_finalize_is_idempotent_and_stops_accepting_blocks(tmp_path):
+    spool = RecordingSpool(sample_rate=16_000, directory=tmp_path)
+    spool.start()
+    spool.write(np.zeros(10, dtype=np.float32))
+
+    first = spool.finalize()
+    second = spool.finalize()
+
+    assert first == second
+    assert spool.write(np.zeros(10, dtype=np.float32)) is False
+    assert spool.frames_written == 10
+
+
+def test_discard_removes_file(tmp_path):
+    spool = RecordingSpool(sample_rate=16_000, directory=tmp_path)
+    path = spool.start()
+    spool.write(np.zeros(10, dtype=np.float32))
+
+    spool.discard()
+
+    assert not path.exists()
+
+
+def test_full_queue_drops_blocks_instead_of_blocking(tmp_path):
+    spool = RecordingSpool(sample_rate=16_000, directory=tmp_path, queue_size=1)
+    # Writer nicht starten: Queue wird nie geleert
+    spool._thread = object()  # type: ignore[assignment]
+
+    assert spool.write(np.zeros(4, dtype=np.float32)) is True
+    assert spool.write(np.zeros(4, dtype=np.float32)) is False
+    assert spool.dropped_blocks == 1
+
+
+def test_finalize_without_start_raises():
+    spool = RecordingSpool(sample_rate=16_000)
+
+    with pytest.raises(RuntimeError):
+        spool.finalize()
+
+
+def test_unsupported_format_is_rejected():
+    with pytest.raises(ValueError):
+        RecordingSpool(sample_rate=16_000, file_format="mp3")
+
+
+def test_find_orphaned_spools_lists_only_spool_files(tmp_path):
+    orphan = tmp_path / f"{SPOOL_FILE_PREFIX}abc.wav"
+    orphan.write_bytes(b"")
+    (tmp_path / "other.wav").write_bytes(b"")
+
+    assert find_orphaned_spools(tmp_path) == [orphan]
+
+
+def test_spools_default_to_user_dir_and_skip_live_owners(tmp_path, monkeypatch):
+    import audio.spool as spool_module
+    import config
+
+    spool = RecordingSpool(sample_rate=16_000)
+    path = spool.start()
+    dead = config.RECORDING_SPOOL_DIR / f"{SPOOL_FILE_PREFIX}999999_alt.wav"
+    dead.write_bytes(b"")
+    monkeypatch.setattr(
+        spool_module, "_process_alive", lambda pid: pid != 999999
+    )
+
+    try:
+        assert path.parent == config.RECORDING_SPOOL_DIR
+        assert find_orphaned_spools() == [dead]  # laufende Aufnahme bleibt aus
+    finally:
+        spool.discard()
+
+
+def test_report_orphaned_spools_keeps_files(tmp_path, caplog):
+    orphan = tmp_path / f"{SPOOL_FILE_PREFIX}crash.wav"
+    orphan.write_bytes(b"")
+
+    with caplog.at_level("WARNING", logger="pulsescribe"):
+        assert report_orphaned_spools(tmp_path) == [orphan]
+
+    assert orphan.exists()
+    assert str(orphan) in caplog.text
+
+
+def test_running_spool_keeps_wav_header_in_sync(tmp_path):
+    spool = RecordingSpool(sample_rate=16_000, directory=tmp_path, flush_interval=0.01)
+    path = spool.start()
+    spool.write(np.full((320, 1), 0.25, dtype=np.float32))
+
+    crashed = tmp_path / "crashed.wav"  # Kopie ohne finalize() = Crash-Zustand
+    frames = 0
+    deadline = time.monotonic() + 2.0
+    while frames != 320 and time.monotonic() < deadline:
+        time.sleep(0.01)
+        shutil.copyfile(path, crashed)
+        try:
+            with wave.open(str(crashed)) as reader:  # vertraut nur dem Header
+                frames = reader.getnframes()
+        except wave.Error:
+            frames = 0  # RIFF-Größe noch vom Öffnen
+    spool.discard()
+
+    assert frames == 320
+
+
+def test_orphaned_spool_header_is_repaired_to_file_length(tmp_path):
+    orphan = tmp_path / f"{SPOOL_FILE_PREFIX}crash.wav"
+    sf.write(orphan, np.zeros(100, dtype=np.int16), 16_000, subtype="PCM_16")
+    with open(orphan, "r+b") as handle:  # Header wie vor dem ersten Sync
+        handle.seek(0, 2)
+        handle.write(np.ones(50, dtype=np.int16).tobytes() + b"\x01")  # + halber Frame
+        handle.seek(4)
+        handle.write(struct.pack("<I", 36))
+        handle.seek(40)
+        handle.write(struct.pack("<I", 0))
+
+    assert find_orphaned_spools(tmp_path) == [orphan]
+
+    with wave.open(str(orphan)) as reader:
+        assert reader.getnframes() == 150
+    assert repair_wav_header(orphan) is False  # schon konsistent
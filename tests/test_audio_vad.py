@@ -0,0 +1,108 @@
+"""Tests fuer audio.vad.StreamingVAD."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from audio.vad import StreamingVAD
+
+SAMPLE_RATE = 16_000
+
+
+def _tone(seconds: float, amplitude: float = 0.2) -> np.ndarray:
+    t = np.arange(int(SAMPLE_RATE * seconds), dtype=np.float32) / SAMPLE_RATE
+    return (amplitude * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def _silence(seconds: float) -> np.ndarray:
+    return np.zeros(int(SAMPLE_RATE * seconds), dtype=np.float32)
+
+
+def _feed_in_blocks(vad: StreamingVAD, audio: np.ndarray, block: int = 1_024) -> None:
+    for start in range(0, audio.size, block):
+        vad.feed(audio[start : start + block].reshape(-1, 1))
+
+
+def test_silence_has_no_speech_and_reports_chunk_rms():
+    vad = StreamingVAD(sample_rate=SAMPLE_RATE)
+
+    _feed_in_blocks(vad, _silence(1.0))
+    level = vad.feed(np.full((160, 1), 0.001, dtype=np.float32))
+
+    assert abs(level - 0.001) < 1e-6
+    assert vad.max_rms == level
+    assert vad.had_speech is False
+    assert vad.segments == []
+
+
+def test_trim_bounds_cover_speech_with_padding():
+    vad = StreamingVAD(sample_rate=SAMPLE_RATE)
+    audio = np.concatenate([_silence(1.0), _tone(0.5), _silence(1.0)])
+
+    _feed_in_blocks(vad, audio, block=333)  # Blöcke nicht an Hops ausgerichtet
+
+    start, end = vad.trim_bounds(pad_s=0.1)
+    assert vad.had_speech is True
+    assert vad.total_samples == audio.size
+    assert abs(start - int(0.9 * SAMPLE_RATE)) <= 320
+    assert abs(end - int(1.6 * SAMPLE_RATE)) <= 320
+
+
+def test_segments_split_after_hangover():
+    vad = StreamingVAD(sample_rate=SAMPLE_RATE, hangover_ms=200)
+    audio = np.concatenate(
+        [_tone(0.3), _silence(0.1), _tone(0.3), _silence(0.5), _tone(0.2)]
+    )
+
+    _feed_in_blocks(vad, audio)
+
+    segments = vad.segments
+    assert len(segments) == 2  # kurze Pause (< Hangover) trennt nicht
+    assert len(vad.closed_segments) == 1
+    assert vad.in_speech is True
+    first, second = segments
+    assert first.start == 0
+    assert abs(first.end - int(0.7 * SAMPLE_RATE)) <= 320
+    assert abs(second.start - int(1.2 * SAMPLE_RATE)) <= 320
+
+
+def test_high_zero_crossing_noise_near_threshold_is_not_speech():
+    rng = np.random.default_rng(0)
+    noise = rng.normal(0, 0.02, SAMPLE_RATE).astype(np.float32)  # RMS ~0.02
+    vad = StreamingVAD(sample_rate=SAMPLE_RATE, threshold=0.015)
+
+    _feed_in_blocks(vad, noise)
+
+    assert vad.had_speech is False
+
+
+def _hum(seconds: float, rms: float) -> np.ndarray:
+    t = np.arange(int(SAMPLE_RATE * seconds), dtype=np.float32) / SAMPLE_RATE
+    return (rms * np.sqrt(2) * np.sin(2 * np.pi * 50 * t)).astype(np.float32)
+
+
+def test_noise_floor_adaptation_raises_threshold():
+    background = _hum(1.0, rms=0.004)  # knapp unter der Schwelle
+    louder_hum = _hum(0.5, rms=0.008)
+    fixed = StreamingVAD(sample_rate=SAMPLE_RATE, threshold=0.005)
+    adaptive = StreamingVAD(
+        sample_rate=SAMPLE_RATE, threshold=0.005, adapt_noise_floor=True
+    )
+
+    for vad in (fixed, adaptive):
+        _feed_in_blocks(vad, background)
+        _feed_in_blocks(vad, louder_hum)
+
+    assert fixed.had_speech is True
+    assert adaptive.noise_floor is not None
+    assert adaptive.effective_threshold > 0.008
+    assert adaptive.had_speech is False
+
+
+def test_feed_bytes_scales_int16():
+    vad = StreamingVAD(sample_rate=SAMPLE_RATE)
+    raw = (np.ones(320, dtype=np.int16) * 16_384).tobytes()
+
+    level = vad.feed_bytes(raw, dtype="int16", scale=32_767)
+
+    assert abs(level - 0.5) < 1e-3
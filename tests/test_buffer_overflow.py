@@ -63,6 +63,16 @@ def test_buffer_overflow_discards_chunks_instead_of_bypassing(buffer_env) -> Non
     assert buffer_env["audio_queue"].empty()
 
 
+def test_buffer_overflow_counts_dropped_audio(buffer_env) -> None:
+    """Discarded chunks are accounted for instead of vanishing silently."""
+    for chunk in (b"chunk1", b"chunk2", b"over1", b"over22"):
+        _send(buffer_env, chunk)
+
+    stats = buffer_env["state"].send_stats
+    assert stats.dropped_chunks == 2
+    assert stats.dropped_bytes == len(b"over1") + len(b"over22")
+
+
 def test_buffer_sends_directly_after_deactivation(buffer_env) -> None:
     """After buffer is deactivated, chunks go directly to asyncio queue."""
     buffer_env["buffer_state"].active = False
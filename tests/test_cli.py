@@ -1,8 +1,9 @@
 """Tests für CLI-Argument-Parsing mit Typer."""
 
+import json
 import re
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from typer.testing import CliRunner
 
@@ -325,3 +326,73 @@ class TestCLI:
         assert result.exit_code == 1
         assert "transcribe failed" in result.output
         assert "file is busy" not in result.output
+
+    def test_batch_mode_reuses_provider_and_emits_json_lines(
+        self, clean_env, tmp_path
+    ):
+        """Mehrere Dateien → ein Provider, eine JSON-Zeile pro Datei."""
+        first = tmp_path / "a.wav"
+        second = tmp_path / "b.wav"
+        for audio_file in (first, second):
+            audio_file.write_bytes(b"fake audio")
+        provider = MagicMock()
+        provider.transcribe.side_effect = lambda path, **_kwargs: f"text {path.stem}"
+
+        with patch("providers.get_provider", return_value=provider) as get_provider:
+            result = runner.invoke(
+                app, [str(tmp_path), "--mode", "groq", "--no-refine"]
+            )
+
+        assert result.exit_code == 0
+        get_provider.assert_called_once_with("groq")
+        lines = [
+            json.loads(line)
+            for line in result.stdout.splitlines()
+            if line.startswith("{")
+        ]
+        assert sorted(line["text"] for line in lines) == ["text a", "text b"]
+
+    def test_batch_mode_exits_nonzero_when_a_file_fails(self, clean_env, tmp_path):
+        """Fehlgeschlagene Dateien brechen den Batch nicht ab, setzen aber Exit 1."""
+        good = tmp_path / "good.wav"
+        bad = tmp_path / "bad.wav"
+        for audio_file in (good, bad):
+            audio_file.write_bytes(b"fake audio")
+        provider = MagicMock()
+
+        def fake_transcribe(path, **_kwargs):
+            if path == bad:
+                raise RuntimeError("kaputt")
+            return "ok"
+
+        provider.transcribe.side_effect = fake_transcribe
+
+        with patch("providers.get_provider", return_value=provider):
+            result = runner.invoke(
+                app, [str(good), str(bad), "--mode", "deepgram", "--no-refine"]
+            )
+
+        assert result.exit_code == 1
+        assert provider.transcribe.call_count == 2
+        assert '"error": "kaputt"' in result.stdout
+
+
+    def test_repeated_run_uses_transcript_cache(self, clean_env, tmp_path):
+        """Gleiche Datei erneut → Transkript aus Cache, --no-cache erzwingt neu."""
+        audio_file = tmp_path / "test.wav"
+        audio_file.write_bytes(b"fake audio")
+        args = [str(audio_file), "--mode", "groq", "--no-refine"]
+
+        with patch("transcribe.transcribe", return_value="erster Lauf") as mock_transcribe:
+            first = runner.invoke(app, args)
+            second = runner.invoke(app, args)
+        assert first.exit_code == second.exit_code == 0
+        assert "erster Lauf" in second.stdout
+        assert mock_transcribe.call_count == 1
+
+        with patch("transcribe.transcribe", return_value="neu") as mock_transcribe:
+            forced = runner.invoke(app, [*args, "--no-cache"])
+            changed_language = runner.invoke(app, [*args, "--language", "en"])
+        assert "neu" in forced.stdout
+        assert "neu" in changed_language.stdout
+        assert mock_transcribe.call_count == 2
@@ -0,0 +1,91 @@
+"""Tests für den CLI-Batch-Modus (cli/batch.py)."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from cli.batch import expand_audio_inputs, is_batch_request, run_batch
+
+
+def _touch(path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"audio")
+    return path
+
+
+def test_expand_inputs_handles_files_directories_and_globs(tmp_path):
+    a = _touch(tmp_path / "meetings" / "a.wav")
+    b = _touch(tmp_path / "meetings" / "sub" / "b.MP3")
+    _touch(tmp_path / "meetings" / "notes.txt")
+    c = _touch(tmp_path / "extra" / "c.m4a")
+
+    files = expand_audio_inputs(
+        [tmp_path / "meetings", str(tmp_path / "extra" / "*.m4a"), a]
+    )
+
+    assert files == [a, b, c]
+
+
+def test_expand_inputs_rejects_missing_paths(tmp_path):
+    with pytest.raises(FileNotFoundError, match="Datei nicht gefunden"):
+        expand_audio_inputs([tmp_path / "fehlt.wav"])
+    with pytest.raises(FileNotFoundError, match="Muster"):
+        expand_audio_inputs([str(tmp_path / "*.wav")])
+
+
+def test_single_file_is_not_a_batch(tmp_path):
+    audio = _touch(tmp_path / "a.wav")
+
+    assert is_batch_request([audio]) is False
+    assert is_batch_request([tmp_path]) is True
+    assert is_batch_request([audio, audio]) is True
+    assert is_batch_request([str(tmp_path / "*.wav")]) is True
+
+
+def test_run_batch_limits_concurrency_and_reports_failures(tmp_path):
+    files = [_touch(tmp_path / f"{i}.wav") for i in range(6)]
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def transcribe_file(path: Path) -> str:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+        if path.stem == "3":
+            raise RuntimeError("rate limited")
+        return f"text {path.stem}"
+
+    emitted = []
+    summary = run_batch(files, transcribe_file, workers=2, on_result=emitted.append)
+
+    assert peak == 2
+    assert len(emitted) == 6
+    assert (summary.succeeded, summary.failed) == (5, 1)
+    failed = next(result for result in emitted if not result.ok)
+    assert json.loads(failed.to_json())["error"] == "rate limited"
+
+
+def test_summary_reports_throughput_from_audio_headers(tmp_path):
+    path = tmp_path / "one_second.wav"
+    sf.write(path, np.zeros(16000, dtype=np.float32), 16000)
+
+    summary = run_batch([path], lambda _path: "hallo", workers=4)
+
+    assert summary.workers == 1
+    assert summary.audio_s == pytest.approx(1.0)
+    assert summary.realtime_factor is not None
+    line = json.loads(summary.results[0].to_json())
+    assert line["text"] == "hallo"
+    assert line["audio_s"] == pytest.approx(1.0)
@@ -91,6 +91,54 @@ def test_windows_latency_preset_invalid_value_falls_back_to_safe(monkeypatch) ->
     assert config_module._windows_latency_default(0.30, 0.20) == 0.30
 
 
+def test_upload_codec_prefers_provider_override_and_rejects_invalid(
+    monkeypatch,
+) -> None:
+    import config as config_module
+
+    monkeypatch.delenv("PULSESCRIBE_UPLOAD_CODEC", raising=False)
+    monkeypatch.delenv("PULSESCRIBE_GROQ_UPLOAD_CODEC", raising=False)
+    assert config_module.get_upload_codec("groq") == "auto"
+
+    monkeypatch.setenv("PULSESCRIBE_UPLOAD_CODEC", "FLAC")
+    monkeypatch.setenv("PULSESCRIBE_GROQ_UPLOAD_CODEC", "opus")
+    assert config_module.get_upload_codec("groq") == "opus"
+    assert config_module.get_upload_codec("openai") == "flac"
+
+    monkeypatch.setenv("PULSESCRIBE_UPLOAD_CODEC", "mp3")
+    assert config_module.get_upload_codec("openai") == "auto"
+
+
+def test_progressive_transcription_is_opt_in_with_bounded_segment_length(
+    monkeypatch,
+) -> None:
+    import config as config_module
+
+    monkeypatch.delenv("PULSESCRIBE_PROGRESSIVE_TRANSCRIPTION", raising=False)
+    monkeypatch.delenv("PULSESCRIBE_PROGRESSIVE_MIN_SEGMENT_SECONDS", raising=False)
+    assert config_module.get_progressive_transcription_enabled() is False
+    assert config_module.get_progressive_min_segment_seconds() == 8.0
+
+    monkeypatch.setenv("PULSESCRIBE_PROGRESSIVE_TRANSCRIPTION", "1")
+    monkeypatch.setenv("PULSESCRIBE_PROGRESSIVE_MIN_SEGMENT_SECONDS", "0.5")
+    assert config_module.get_progressive_transcription_enabled() is True
+    assert config_module.get_progressive_min_segment_seconds() == 2.0
+
+
+def test_local_streaming_is_opt_in_with_bounded_interval(monkeypatch) -> None:
+    import config as config_module
+
+    monkeypatch.delenv("PULSESCRIBE_LOCAL_STREAMING", raising=False)
+    monkeypatch.delenv("PULSESCRIBE_LOCAL_STREAMING_INTERVAL", raising=False)
+    assert config_module.get_local_streaming_enabled() is False
+    assert config_module.get_local_streaming_interval_seconds() == 1.0
+
+    monkeypatch.setenv("PULSESCRIBE_LOCAL_STREAMING", "true")
+    monkeypatch.setenv("PULSESCRIBE_LOCAL_STREAMING_INTERVAL", "0.05")
+    assert config_module.get_local_streaming_enabled() is True
+    assert config_module.get_local_streaming_interval_seconds() == 0.3
+
+
 def test_get_input_device_retries_after_initial_probe_failure(monkeypatch) -> None:
     import config as config_module
 
@@ -477,6 +477,24 @@ class TestSaveCustomPrompts:
         assert "Chat Prompt mit Umlauten" in loaded["prompts"]["chat"]["prompt"]
         assert loaded["app_contexts"]["Test App"] == "email"
 
+    def test_local_rules_roundtrip_and_filter(self, prompts_file):
+        """Local-Rules-Overrides überleben Speichern, Laden und Storage-Filter."""
+        from utils.custom_prompts import (
+            filter_overrides_for_storage,
+            load_custom_prompts,
+            save_custom_prompts,
+        )
+
+        local_rules = {
+            "commands": {"neuer Punkt": "\n- ", "punkt": ""},
+            "fillers": {"de": ["ähm", "öhm"]},
+        }
+        save_custom_prompts({"local_rules": local_rules}, path=prompts_file)
+        loaded = load_custom_prompts(path=prompts_file)
+
+        assert loaded["local_rules"] == local_rules
+        assert filter_overrides_for_storage(loaded) == {"local_rules": local_rules}
+
     def test_save_state_warms_cache_without_reloading_toml(self, prompts_file, monkeypatch):
         """Der Save-Pfad soll die gemergten Prompt-Daten direkt cachen."""
         from utils.custom_prompts import load_custom_prompts, save_custom_prompts_state
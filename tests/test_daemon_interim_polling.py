@@ -7,6 +7,7 @@ from pulsescribe_daemon import (
     INTERIM_POLL_MAX_CHARS,
     PulseScribeDaemon,
 )
+from utils.interim_channel import get_interim_channel
 from utils.state import AppState
 
 
@@ -30,7 +31,8 @@ class _FakeNSTimerFactory:
         return timer
 
 
-def test_interim_polling_reads_tail_once_per_file_change():
+def test_interim_polling_reads_tail_once_per_file_change(monkeypatch):
+    monkeypatch.setenv("PULSESCRIBE_INTERIM_PUSH", "false")
     daemon = PulseScribeDaemon(mode="deepgram")
     daemon._overlay = MagicMock()
     daemon._current_state = AppState.RECORDING
@@ -70,7 +72,8 @@ def test_interim_polling_reads_tail_once_per_file_change():
     )
 
 
-def test_interim_polling_backs_off_after_repeated_idle_polls():
+def test_interim_polling_backs_off_after_repeated_idle_polls(monkeypatch):
+    monkeypatch.setenv("PULSESCRIBE_INTERIM_PUSH", "false")
     daemon = PulseScribeDaemon(mode="deepgram")
     daemon._current_state = AppState.RECORDING
     timer_factory = _FakeNSTimerFactory()
@@ -90,3 +93,46 @@ def test_interim_polling_backs_off_after_repeated_idle_polls():
     assert timer_factory.created_timers[0].interval == INTERIM_POLL_INTERVAL_ACTIVE
     assert active_timer.invalidated is True
     assert timer_factory.created_timers[-1].interval == INTERIM_POLL_INTERVAL_IDLE
+
+
+
+def test_interim_push_updates_overlay_without_file_polling():
+    daemon = PulseScribeDaemon(mode="deepgram")
+    daemon._overlay = MagicMock()
+    daemon._current_state = AppState.RECORDING
+    channel = get_interim_channel()
+
+    daemon._start_interim_polling()
+    try:
+        assert daemon._interim_timer is None
+        first = channel.publish("  erste Wörter  ")
+        channel.publish("zweite")
+        daemon._on_interim_update(first)  # verspätet zugestellt: verworfen
+    finally:
+        daemon._stop_interim_polling()
+    channel.publish("nach dem Stop")
+
+    assert daemon._overlay.update_state.call_args_list == [
+        ((AppState.RECORDING, "erste Wörter"),),
+        ((AppState.RECORDING, "zweite"),),
+    ]
+    assert not channel.has_subscribers()
+
+
+def test_late_interim_update_does_not_revert_transcribing_state():
+    daemon = PulseScribeDaemon(mode="deepgram")
+    daemon._overlay = MagicMock()
+    daemon._current_state = AppState.RECORDING
+    update = get_interim_channel().publish("letzte Wörter")
+    apply_state = daemon._update_state
+
+    def racing_update_state(*args, **kwargs):
+        # Worker wechselt zwischen State-Check und Update auf TRANSCRIBING
+        daemon._current_state = AppState.TRANSCRIBING
+        apply_state(*args, **kwargs)
+
+    daemon._update_state = racing_update_state
+    daemon._on_interim_update(update)
+
+    assert daemon._current_state == AppState.TRANSCRIBING
+    daemon._overlay.update_state.assert_not_called()
@@ -4,6 +4,7 @@ import threading
 import unittest
 from unittest.mock import MagicMock, patch
 
+import numpy as np  # noqa: F401 - vor patch.dict(sys.modules) laden (kein Re-Import)
 from typer.testing import CliRunner
 
 from pulsescribe_daemon import PulseScribeDaemon, app
@@ -253,15 +254,11 @@ class TestDaemonMode(unittest.TestCase):
         # Mocking items used inside _recording_worker
         mock_sd = MagicMock()
         mock_sf = MagicMock()
-        mock_np = MagicMock()
 
         # Mock context manager for InputStream
         mock_stream = MagicMock()
         mock_sd.InputStream.return_value.__enter__.return_value = mock_stream
 
-        # Setup numpy to return concatenatable result
-        mock_np.concatenate.return_value = b"fake_audio_data"
-
         # Stop event handling: let the loop run once then stop
         def side_effect_sleep(*args):
             # Capture callback and call it
@@ -270,10 +267,10 @@ class TestDaemonMode(unittest.TestCase):
                 kw = call_args[1]
                 callback = kw.get("callback")
                 if callback:
-                    # Call with dummy data
+                    # Call with speech-level dummy data (real numpy: SampleBuffer)
                     import numpy as np
 
-                    callback(np.zeros((100, 1), dtype="float32"), 100, None, None)
+                    callback(np.full((100, 1), 0.5, dtype="float32"), 100, None, None)
 
             daemon._stop_event.set()
 
@@ -288,7 +285,7 @@ class TestDaemonMode(unittest.TestCase):
         with (
             patch.dict(
                 sys.modules,
-                {"sounddevice": mock_sd, "soundfile": mock_sf, "numpy": mock_np},
+                {"sounddevice": mock_sd, "soundfile": mock_sf},
             ),
             patch(
                 "pulsescribe_daemon.tempfile.mkstemp",
@@ -306,19 +303,98 @@ class TestDaemonMode(unittest.TestCase):
             mock_player.play.assert_any_call("ready")
             mock_player.play.assert_any_call("stop")
 
-            # Verify provider called
+            # Verify provider called with in-memory audio (no temp WAV)
             mock_get_provider.assert_called_with("openai")
-            mock_provider.transcribe.assert_called_once()
-            call_args = mock_provider.transcribe.call_args
-            self.assertEqual(
-                str(call_args[0][0]), "/tmp/fake.wav"
-            )  # First arg is audio_path
+            mock_provider.transcribe.assert_not_called()
+            mock_sf.write.assert_not_called()
+            mock_provider.transcribe_audio.assert_called_once()
+            call_args = mock_provider.transcribe_audio.call_args
             self.assertEqual(call_args[1]["model"], None)  # Default
             self.assertEqual(call_args[1]["language"], "de")
+            self.assertEqual(call_args[1]["sample_rate"], 16000)
 
             # Verify result put in queue
             self.assertFalse(daemon._result_queue.empty())
 
+    def test_recording_worker_writes_wav_for_providers_without_array_api(self):
+        daemon = PulseScribeDaemon(mode="openai", language="de")
+        daemon._stop_event = threading.Event()
+
+        mock_sd = MagicMock()
+        mock_sf = MagicMock()
+
+        def side_effect_sleep(*_args):
+            callback = mock_sd.InputStream.call_args[1].get("callback")
+            callback(np.full((100, 1), 0.5, dtype="float32"), 100, None, None)
+            daemon._stop_event.set()
+
+        mock_sd.sleep.side_effect = side_effect_sleep
+        mock_provider = MagicMock(spec=["transcribe"])
+        mock_provider.transcribe.return_value = "text"
+
+        with (
+            patch.dict(
+                sys.modules,
+                {"sounddevice": mock_sd, "soundfile": mock_sf},
+            ),
+            patch(
+                "pulsescribe_daemon.tempfile.mkstemp",
+                return_value=(123, "/tmp/fake.wav"),
+            ),
+            patch("pulsescribe_daemon.os.close"),
+            patch("pulsescribe_daemon.os.unlink"),
+            patch("pulsescribe_daemon.os.path.exists", return_value=True),
+            patch(
+                "pulsescribe_daemon.get_provider",
+                MagicMock(return_value=mock_provider),
+            ),
+            patch("pulsescribe_daemon.get_sound_player", MagicMock()),
+        ):
+            daemon._recording_worker()
+
+        mock_sf.write.assert_called_once()
+        call_args = mock_provider.transcribe.call_args
+        self.assertEqual(str(call_args[0][0]), "/tmp/fake.wav")
+
+    def test_progressive_failure_falls_back_to_full_recording(self):
+        from audio.buffer import SampleBuffer
+        from audio.progressive import ProgressiveTranscriber
+        from audio.vad import StreamingVAD
+
+        daemon = PulseScribeDaemon(mode="openai", language="de")
+        buffer = SampleBuffer(sample_rate=16000)
+        vad = StreamingVAD(sample_rate=16000)
+        t = np.arange(16000 * 3) / 16000
+        speech = (0.2 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+        audio = np.concatenate([speech, np.zeros(8000, dtype=np.float32), speech])
+
+        def fail_segment(_segment):
+            raise RuntimeError("segment upload failed")
+
+        progressive = ProgressiveTranscriber(
+            fail_segment, sample_rate=16000, min_segment_seconds=2.0
+        )
+        for block in np.array_split(audio, 70):
+            buffer.append(block)
+            vad.feed(block)
+            progressive.poll(buffer, vad)
+        self.assertTrue(progressive.has_segments)
+
+        with patch.object(
+            daemon, "_transcribe_recorded_audio", return_value="voll"
+        ) as full:
+            transcript = daemon._finish_progressive_transcription(
+                progressive=progressive,
+                recorded_audio=buffer,
+                vad=vad,
+                result_queue_ref=MagicMock(),
+                run_id=None,
+            )
+
+        self.assertEqual(transcript, "voll")
+        full_audio = full.call_args.kwargs["audio_data"]
+        self.assertGreater(full_audio.shape[0], audio.shape[0] - 16000)
+
     def test_recording_worker_no_audio_puts_empty_result(self):
         """Sehr kurzer Hold-Tap ohne Callback darf nicht im TRANSCRIBING hängen bleiben."""
         daemon = PulseScribeDaemon(mode="openai")
@@ -369,7 +445,6 @@ class TestDaemonMode(unittest.TestCase):
 
         mock_sd = MagicMock()
         mock_sf = MagicMock()
-        mock_np = MagicMock()
 
         mock_stream = MagicMock()
         mock_sd.InputStream.return_value.__enter__.return_value = mock_stream
@@ -379,7 +454,9 @@ class TestDaemonMode(unittest.TestCase):
             if call_args:
                 callback = call_args[1].get("callback")
                 if callback:
-                    callback(MagicMock(), 100, None, None)
+                    import numpy as np
+
+                    callback(np.full((100, 1), 0.5, dtype="float32"), 100, None, None)
             daemon._stop_event.set()
 
         mock_sd.sleep.side_effect = side_effect_sleep
@@ -391,7 +468,7 @@ class TestDaemonMode(unittest.TestCase):
         with (
             patch.dict(
                 sys.modules,
-                {"sounddevice": mock_sd, "soundfile": mock_sf, "numpy": mock_np},
+                {"sounddevice": mock_sd, "soundfile": mock_sf},
             ),
             patch("pulsescribe_daemon.get_provider", mock_get_provider),
             patch("pulsescribe_daemon.get_sound_player", mock_get_player),
@@ -428,6 +505,66 @@ class TestDaemonMode(unittest.TestCase):
         mock_no_speech.assert_called_once_with()
         mock_apply_pending.assert_not_called()
 
+    def test_transcript_chunks_are_pasted_before_final_result(self):
+        """Streaming-Refine: Vorab eingefügte Sätze werden am Ende nicht erneut eingefügt."""
+        from pulsescribe_daemon import ResultQueueBatchState
+
+        daemon = PulseScribeDaemon(mode="openai")
+        daemon._overlay = MagicMock()
+        pasted: list[str] = []
+
+        with (
+            patch(
+                "pulsescribe_daemon.paste_transcript",
+                side_effect=lambda text: pasted.append(text) or True,
+            ),
+            patch("pulsescribe_daemon.get_sound_player"),
+            patch.object(daemon, "_flush_ui_and_wait"),
+            patch.object(daemon, "_save_to_history") as mock_history,
+            patch.object(daemon, "_stop_result_polling"),
+        ):
+            batch_state = ResultQueueBatchState()
+            for chunk in ("Erster Satz. ", "Zweiter Satz. "):
+                done = daemon._handle_result_queue_item(
+                    DaemonMessage(type=MessageType.TRANSCRIPT_CHUNK, payload=chunk),
+                    batch_state,
+                )
+                self.assertFalse(done)
+            daemon._handle_result_queue_item(
+                DaemonMessage(
+                    type=MessageType.TRANSCRIPT_RESULT,
+                    payload="Erster Satz. Zweiter Satz. Rest",
+                ),
+                batch_state,
+            )
+
+        self.assertEqual(pasted, ["Erster Satz. ", "Zweiter Satz. ", "Rest"])
+        mock_history.assert_called_once_with("Erster Satz. Zweiter Satz. Rest")
+        self.assertEqual(daemon._stream_pasted_text, "")
+
+    def test_latency_budget_is_finished_after_paste(self):
+        """Das Budget läuft ab Stopp und wird nach dem Paste abgeschlossen."""
+        daemon = PulseScribeDaemon(mode="openai")
+        daemon._overlay = MagicMock()
+        budget = MagicMock()
+        daemon._latency_budget = budget
+        calls: list[str] = []
+        budget.finish.side_effect = lambda: calls.append("finish")
+
+        with (
+            patch(
+                "pulsescribe_daemon.paste_transcript",
+                side_effect=lambda text: calls.append("paste") or True,
+            ),
+            patch("pulsescribe_daemon.get_sound_player"),
+            patch.object(daemon, "_flush_ui_and_wait"),
+            patch.object(daemon, "_save_to_history"),
+        ):
+            daemon._handle_transcript_result("Hallo Welt")
+
+        self.assertEqual(calls, ["paste", "finish"])
+        self.assertIsNone(daemon._latency_budget)
+
     def test_recording_worker_local_keeps_trailing_audio_and_pads_tail(self):
         """Local mode: Trimming darf leise Enden nicht abschneiden; zusätzlich wird Tail-Padding angehängt."""
         import numpy as np
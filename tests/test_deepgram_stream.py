@@ -163,6 +163,38 @@ def test_message_handler_writes_pending_interim_once_throttle_window_passes(
     assert state.last_interim_written_text == "hello world"
 
 
+
+def test_message_handler_pushes_every_interim_to_channel_subscribers(
+    monkeypatch,
+) -> None:
+    from utils.interim_channel import get_interim_channel
+
+    state = deepgram_stream.StreamState()
+    handler = deepgram_stream._create_message_handler(state, "sess")
+    write_calls: list[tuple[str, str]] = []
+
+    class _FakeInterimFile:
+        def write_text(self, text: str, *, encoding: str) -> None:
+            write_calls.append((text, encoding))
+
+    monkeypatch.setattr(deepgram_stream, "INTERIM_FILE", _FakeInterimFile())
+    monkeypatch.setattr(deepgram_stream.time, "perf_counter", lambda: 1.0)
+    received = []
+    unsubscribe = get_interim_channel().subscribe(received.append)
+    try:
+        # Innerhalb des Throttle-Fensters: Push trotzdem sofort
+        handler(_response("hello"))
+        handler(_response("hello world"))
+    finally:
+        unsubscribe()
+
+    assert [(u.text, u.session_id) for u in received] == [
+        ("hello", "sess"),
+        ("hello world", "sess"),
+    ]
+    assert write_calls == []
+    assert state.last_interim_written_text == "hello world"
+
 def test_message_handler_keeps_final_transcripts_out_of_interim_file(
     monkeypatch,
 ) -> None:
@@ -591,6 +623,241 @@ def test_pre_drain_forwards_all_pending_chunks() -> None:
     assert forwarded == [b"a", b"b", b"c"]
 
 
+# =============================================================================
+# Frame Coalescing
+# =============================================================================
+
+
+def _drain_sync_queue(out_queue: queue.Queue) -> list[bytes | None]:
+    items = []
+    while not out_queue.empty():
+        items.append(out_queue.get_nowait())
+    return items
+
+
+def test_frame_coalescer_batches_blocks_and_flushes_remainder() -> None:
+    out_queue: queue.Queue[bytes | None] = queue.Queue()
+    stats = deepgram_stream.StreamSendStats()
+    coalescer = deepgram_stream._FrameCoalescer(
+        loop=cast(Any, _ImmediateLoop()),
+        audio_queue=cast(Any, out_queue),
+        stats=stats,
+        frame_ms=80,
+    )
+    coalescer.configure(16000)  # 80ms = 2560 Bytes
+    block = b"\x01" * 640  # 20ms
+
+    for _ in range(5):
+        coalescer.push(block)
+    assert _drain_sync_queue(out_queue) == [block * 4]
+
+    coalescer.flush()
+    coalescer.flush()  # leer: keine weitere Übergabe
+    assert _drain_sync_queue(out_queue) == [block]
+    assert (stats.blocks_in, stats.handoffs) == (5, 2)
+
+
+def test_frame_coalescer_passes_blocks_through_until_configured() -> None:
+    out_queue: queue.Queue[bytes | None] = queue.Queue()
+    coalescer = deepgram_stream._FrameCoalescer(
+        loop=cast(Any, _ImmediateLoop()),
+        audio_queue=cast(Any, out_queue),
+        stats=deepgram_stream.StreamSendStats(),
+        frame_ms=80,
+    )
+
+    coalescer.push(b"early")
+
+    assert _drain_sync_queue(out_queue) == [b"early"]
+
+
+def test_send_audio_merges_queued_chunks_and_stops_at_sentinel() -> None:
+    class _RecordingConnection:
+        def __init__(self) -> None:
+            self.frames: list[bytes] = []
+
+        async def send_media(self, chunk: bytes) -> None:
+            self.frames.append(chunk)
+
+    async def _run() -> tuple[list[bytes], deepgram_stream.StreamState]:
+        state = deepgram_stream.StreamState()
+        connection = _RecordingConnection()
+        audio_queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+        for chunk in (b"aa", b"bb", b"cc", b"dd", None):
+            audio_queue.put_nowait(chunk)
+
+        await deepgram_stream._send_audio_to_deepgram(
+            connection=cast(Any, connection),
+            state=state,
+            audio_queue=audio_queue,
+            session_id="sess",
+            max_frame_bytes=4,
+        )
+        return connection.frames, state
+
+    frames, state = asyncio.run(_run())
+
+    assert frames == [b"aabb", b"ccdd"]
+    assert state.send_stats.frames_sent == 2
+    assert state.send_stats.bytes_sent == 8
+    assert state.send_stats.max_queue_depth == 5
+
+
+# =============================================================================
+# Audio Channel (Backpressure)
+# =============================================================================
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _make_channel(policy: str, **kwargs) -> deepgram_stream._AudioChannel:
+    # 1s Kapazität bei 8 kHz = 16000 Bytes
+    kwargs.setdefault("stats", deepgram_stream.StreamSendStats())
+    return deepgram_stream._AudioChannel(
+        max_seconds=1,
+        policy=policy,
+        sample_rate=8000,
+        **kwargs,
+    )
+
+
+def _drain_channel(channel: deepgram_stream._AudioChannel) -> list[bytes | None]:
+    items = []
+    while not channel.empty():
+        items.append(channel.get_nowait())
+    return items
+
+
+def test_audio_channel_drop_oldest_accounts_for_dropped_audio() -> None:
+    channel = _make_channel("drop-oldest")
+    block = 4000 * b"\x00"
+
+    for marker in b"abcde":
+        channel.put_nowait(bytes([marker]) + block[1:])
+
+    assert channel.queued_bytes == 16000
+    assert [item[:1] for item in _drain_channel(channel)] == [b"b", b"c", b"d", b"e"]
+    assert channel._stats.dropped_chunks == 1
+    assert channel._stats.dropped_bytes == 4000
+    assert channel._stats.max_queue_bytes == 16000
+
+
+def test_audio_channel_merge_is_lossless_up_to_twice_the_capacity() -> None:
+    channel = _make_channel("merge")
+    block = 4000 * b"\x01"
+
+    for _ in range(6):
+        channel.put_nowait(block)
+    channel.put_nowait(None)
+
+    items = _drain_channel(channel)
+    assert [len(item) for item in items if item is not None] == [4000] * 3 + [12000]
+    assert items[-1] is None
+    assert channel._stats.merged_chunks == 2
+    assert channel._stats.dropped_chunks == 0
+
+    for _ in range(9):
+        channel.put_nowait(block)
+    assert channel.queued_bytes <= 32000
+    assert channel._stats.dropped_chunks > 0
+
+
+def test_audio_channel_block_waits_for_space_then_gives_up(monkeypatch) -> None:
+    monkeypatch.setattr(deepgram_stream, "_QUEUE_BLOCK_TIMEOUT", 0.05)
+    channel = _make_channel("block")
+    channel.put_nowait(16000 * b"\x00")
+
+    producer = threading.Thread(target=channel.wait_for_space, args=(4000,))
+    start = time.perf_counter()
+    producer.start()
+    producer.join(timeout=1)
+
+    assert time.perf_counter() - start >= 0.04
+    assert channel._stats.blocked_ms > 0
+    # Stall erkannt: kein erneutes Warten, bis die Queue sich geleert hat
+    producer = threading.Thread(target=channel.wait_for_space, args=(4000,))
+    start = time.perf_counter()
+    producer.start()
+    producer.join(timeout=1)
+    assert time.perf_counter() - start < 0.04
+
+
+def test_audio_callback_handoff_never_waits_for_space(monkeypatch) -> None:
+    monkeypatch.setattr(deepgram_stream, "_QUEUE_BLOCK_TIMEOUT", 0.5)
+    channel = _make_channel("block")
+    channel.put_nowait(16000 * b"\x00")
+
+    # Wie der PortAudio-Callback: eigener Thread, nicht der Event-Loop
+    callback = threading.Thread(
+        target=deepgram_stream._enqueue_audio,
+        args=(4000 * b"\x00",),
+        kwargs={
+            "loop": _ImmediateLoop(),
+            "audio_queue": channel,
+            "coalescer": None,
+        },
+    )
+    start = time.perf_counter()
+    callback.start()
+    callback.join(timeout=1)
+
+    assert time.perf_counter() - start < 0.1
+    assert channel._stats.blocked_ms == 0
+    # Stattdessen wie drop-oldest: Kapazität bleibt eingehalten
+    assert channel.queued_bytes == 4000
+    assert channel._stats.dropped_chunks == 1
+
+
+def test_send_audio_samples_backlog_age_while_send_stalls(monkeypatch) -> None:
+    monkeypatch.setattr(deepgram_stream, "SEND_MEDIA_TIMEOUT", 0.01)
+    monkeypatch.setattr(deepgram_stream, "FINALIZE_TIMEOUT", 0.0)
+    clock = _FakeClock()
+
+    class _StalledConnection:
+        async def send_media(self, chunk: bytes) -> None:
+            clock.now += 2.5
+            await asyncio.sleep(1)
+
+    async def _run() -> deepgram_stream.StreamState:
+        state = deepgram_stream.StreamState()
+        state.stop_event.set()
+        channel = _make_channel("merge", clock=clock, stats=state.send_stats)
+        channel.put_nowait(b"sent")
+        channel.put_nowait(b"waiting")
+        await deepgram_stream._send_audio_to_deepgram(
+            connection=cast(Any, _StalledConnection()),
+            state=state,
+            audio_queue=channel,
+            session_id="sess",
+        )
+        return state
+
+    state = asyncio.run(_run())
+
+    assert state.send_stats.max_queue_age_ms == pytest.approx(2500.0)
+
+
+def test_audio_channel_tracks_age_of_oldest_unsent_chunk() -> None:
+    clock = _FakeClock()
+    channel = _make_channel("merge", clock=clock)
+    assert channel.oldest_age_s() == 0.0
+
+    channel.put_nowait(b"old")
+    clock.now += 1.5
+    channel.put_nowait(b"new")
+
+    assert channel.oldest_age_s() == pytest.approx(1.5)
+    channel.get_nowait()
+    assert channel._stats.max_queue_age_ms == pytest.approx(1500.0)
+    assert channel.oldest_age_s() == pytest.approx(0.0)
+
+
 # =============================================================================
 # Deepgram Warm-WebSocket
 # =============================================================================
@@ -761,7 +1028,7 @@ def test_warm_connection_manager_claims_once_and_replenishes(monkeypatch) -> Non
     used_connections: list[_FakeWarmConnection] = []
     _install_fake_stream_core(monkeypatch, used_connections)
     latency_events: list[str] = []
-    manager = deepgram_stream.DeepgramWarmConnectionManager()
+    manager = deepgram_stream.DeepgramWarmConnectionManager(pool_size=1)
 
     try:
         assert manager.prewarm(model="nova-3", language="de", sample_rate=16000)
@@ -792,7 +1059,7 @@ def test_warm_connection_manager_falls_back_after_prewarm_failure(monkeypatch) -
     used_connections: list[_FakeWarmConnection] = []
     _install_fake_stream_core(monkeypatch, used_connections)
     latency_events: list[str] = []
-    manager = deepgram_stream.DeepgramWarmConnectionManager()
+    manager = deepgram_stream.DeepgramWarmConnectionManager(pool_size=1)
 
     try:
         assert manager.prewarm(model="nova-3", language="de", sample_rate=16000)
@@ -822,7 +1089,7 @@ def test_warm_connection_manager_discards_stale_socket_before_claim(
     contexts = _install_fake_connection_factory(monkeypatch)
     used_connections: list[_FakeWarmConnection] = []
     _install_fake_stream_core(monkeypatch, used_connections)
-    manager = deepgram_stream.DeepgramWarmConnectionManager()
+    manager = deepgram_stream.DeepgramWarmConnectionManager(pool_size=1)
 
     try:
         assert manager.prewarm(model="nova-3", language="de", sample_rate=16000)
@@ -842,7 +1109,7 @@ def test_warm_connection_manager_replaces_socket_when_config_changes(
 ) -> None:
     monkeypatch.setenv("DEEPGRAM_API_KEY", "test-key")
     contexts = _install_fake_connection_factory(monkeypatch)
-    manager = deepgram_stream.DeepgramWarmConnectionManager()
+    manager = deepgram_stream.DeepgramWarmConnectionManager(pool_size=1)
 
     try:
         assert manager.prewarm(model="nova-3", language="de", sample_rate=16000)
@@ -881,7 +1148,7 @@ def test_cancelled_prewarm_still_closes_previous_socket(monkeypatch) -> None:
         return context
 
     monkeypatch.setattr(deepgram_stream, "_create_deepgram_connection", fake_create)
-    manager = deepgram_stream.DeepgramWarmConnectionManager()
+    manager = deepgram_stream.DeepgramWarmConnectionManager(pool_size=1)
 
     try:
         assert manager.prewarm(model="nova-3", language="de", sample_rate=16000)
@@ -905,7 +1172,7 @@ def test_warm_connection_manager_invalidate_disables_replenishment(monkeypatch)
     used_connections: list[_FakeWarmConnection] = []
     _install_fake_stream_core(monkeypatch, used_connections)
     latency_events: list[str] = []
-    manager = deepgram_stream.DeepgramWarmConnectionManager()
+    manager = deepgram_stream.DeepgramWarmConnectionManager(pool_size=1)
 
     try:
         assert manager.prewarm(model="nova-3", language="de", sample_rate=16000)
@@ -933,6 +1200,114 @@ def test_warm_connection_manager_invalidate_disables_replenishment(monkeypatch)
         manager.shutdown(timeout=1.0)
 
 
+def test_warm_connection_pool_serves_back_to_back_dictations(monkeypatch) -> None:
+    monkeypatch.setenv("DEEPGRAM_API_KEY", "test-key")
+    contexts = _install_fake_connection_factory(monkeypatch)
+    used_connections: list[_FakeWarmConnection] = []
+    _install_fake_stream_core(monkeypatch, used_connections)
+    latency_events: list[str] = []
+    manager = deepgram_stream.DeepgramWarmConnectionManager(pool_size=2)
+
+    def record(name, _fields=None) -> None:
+        latency_events.append(name)
+
+    try:
+        assert manager.prewarm(model="nova-3", language="de", sample_rate=16000)
+        assert manager.wait_until_ready(timeout=1.0)
+        assert len(contexts) == 2
+
+        for _ in range(3):
+            manager.transcribe("nova-3", "de", latency_event_callback=record)
+
+        assert latency_events == ["deepgram_warm_ws_claimed"] * 3
+        assert len(set(map(id, used_connections))) == 3
+        assert manager.wait_until_ready(timeout=1.0)
+        stats = manager.pool_stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (3, 0, 1.0)
+        assert stats["idle"] == 2
+    finally:
+        manager.shutdown(timeout=1.0)
+
+
+def test_warm_connection_pool_only_claims_matching_config(monkeypatch) -> None:
+    monkeypatch.setenv("DEEPGRAM_API_KEY", "test-key")
+    contexts = _install_fake_connection_factory(monkeypatch)
+    used_connections: list[_FakeWarmConnection] = []
+    _install_fake_stream_core(monkeypatch, used_connections)
+    latency_events: list[str] = []
+    manager = deepgram_stream.DeepgramWarmConnectionManager(pool_size=2)
+
+    try:
+        assert manager.prewarm(model="nova-3", language="de", sample_rate=16000)
+        assert manager.wait_until_ready(timeout=1.0)
+
+        manager.transcribe(
+            "nova-3",
+            "en",
+            latency_event_callback=lambda name, _fields=None: latency_events.append(
+                name
+            ),
+        )
+
+        assert latency_events == ["deepgram_warm_ws_fallback"]
+        assert used_connections[0] not in {ctx.connection for ctx in contexts[:2]}
+        # Der Bucket der neuen Sprache verdrängt die deutschen Sockets
+        assert manager.wait_until_ready(timeout=1.0)
+        assert _wait_until(lambda: contexts[0].exit_calls == contexts[1].exit_calls == 1)
+        assert manager.pool_stats()["evicted"] == 2
+    finally:
+        manager.shutdown(timeout=1.0)
+
+
+def test_warm_connection_pool_rewarms_expired_socket_only_on_next_use(
+    monkeypatch,
+) -> None:
+    monkeypatch.setenv("DEEPGRAM_API_KEY", "test-key")
+    contexts = _install_fake_connection_factory(monkeypatch)
+    manager = deepgram_stream.DeepgramWarmConnectionManager(
+        keepalive_interval=0.01, pool_size=1, idle_expiry=0.05
+    )
+
+    try:
+        assert manager.prewarm(model="nova-3", language="de", sample_rate=16000)
+        assert manager.wait_until_ready(timeout=1.0)
+
+        assert _wait_until(lambda: contexts[0].exit_calls == 1)
+        assert manager.pool_stats()["expired"] == 1
+        # Kein Reconnect im Leerlauf
+        time.sleep(0.1)
+        assert len(contexts) == 1
+        assert manager.pool_stats()["idle"] == 0
+
+        assert manager.prewarm(model="nova-3", language="de", sample_rate=16000)
+        assert manager.wait_until_ready(timeout=1.0)
+        assert len(contexts) == 2
+    finally:
+        manager.shutdown(timeout=1.0)
+
+
+def test_warm_connection_pool_reconnects_after_keepalive_failure(monkeypatch) -> None:
+    monkeypatch.setenv("DEEPGRAM_API_KEY", "test-key")
+    contexts = _install_fake_connection_factory(monkeypatch)
+    manager = deepgram_stream.DeepgramWarmConnectionManager(
+        keepalive_interval=0.01, pool_size=1
+    )
+
+    async def broken_keepalive(_message) -> None:
+        raise OSError("connection reset")
+
+    try:
+        assert manager.prewarm(model="nova-3", language="de", sample_rate=16000)
+        assert manager.wait_until_ready(timeout=1.0)
+        contexts[0].connection.send_control = broken_keepalive
+
+        assert _wait_until(lambda: len(contexts) >= 2)
+        assert manager.wait_until_ready(timeout=1.0)
+        assert manager.pool_stats()["expired"] == 0
+    finally:
+        manager.shutdown(timeout=1.0)
+
+
 def test_warm_connection_manager_sends_keepalive_while_idle(monkeypatch) -> None:
     monkeypatch.setenv("DEEPGRAM_API_KEY", "test-key")
     contexts = _install_fake_connection_factory(monkeypatch)
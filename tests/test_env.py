@@ -280,3 +280,20 @@ def test_collect_env_values_prefers_user_env_over_local_env(tmp_path) -> None:
         "LOCAL_ONLY": "yes",
         "USER_ONLY": "yes",
     }
+
+
+def test_env_overrides_replace_prefix_only_in_current_context(monkeypatch) -> None:
+    monkeypatch.setenv("PULSESCRIBE_LOCAL_MODEL", "turbo")
+    monkeypatch.setenv("PULSESCRIBE_DEVICE", "cpu")
+    monkeypatch.setenv("HOME_TEST_VALUE", "kept")
+
+    with env_module.env_overrides(
+        {"PULSESCRIBE_LOCAL_MODEL": "large"}, prefix="PULSESCRIBE_"
+    ):
+        assert env_module.getenv("PULSESCRIBE_LOCAL_MODEL") == "large"
+        assert env_module.getenv("PULSESCRIBE_DEVICE") is None
+        assert env_module.get_env_int("PULSESCRIBE_LOCAL_BEAM_SIZE") is None
+        assert env_module.getenv("HOME_TEST_VALUE") == "kept"
+        assert os.environ["PULSESCRIBE_LOCAL_MODEL"] == "turbo"
+
+    assert env_module.getenv("PULSESCRIBE_DEVICE") == "cpu"
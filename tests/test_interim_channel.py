@@ -0,0 +1,100 @@
+"""Tests für den Interim-Push-Kanal (utils/interim_channel.py)."""
+
+import sys
+import threading
+
+import pytest
+
+from utils.interim_channel import (
+    InterimBroadcastServer,
+    InterimChannel,
+    get_interim_channel,
+    iter_interim_updates,
+    publish_interim,
+)
+
+
+def test_publish_delivers_in_order_with_increasing_seq() -> None:
+    channel = InterimChannel()
+    received = []
+    unsubscribe = channel.subscribe(received.append)
+
+    channel.publish("Hallo", session_id="s1")
+    channel.publish("Hallo Welt", session_id="s1")
+    unsubscribe()
+    channel.publish("nicht mehr")
+
+    assert [update.text for update in received] == ["Hallo", "Hallo Welt"]
+    assert received[0].seq < received[1].seq
+    assert received[1].session_id == "s1"
+    assert channel.latest().text == "nicht mehr"
+
+
+def test_replay_and_failing_subscriber() -> None:
+    channel = InterimChannel()
+    channel.publish("bisher")
+
+    def broken(_update) -> None:
+        raise RuntimeError("kaputt")
+
+    received = []
+    channel.subscribe(broken)
+    channel.subscribe(received.append, replay=True)
+    channel.publish("neu")
+
+    assert [update.text for update in received] == ["bisher", "neu"]
+
+    channel.clear()
+    late = []
+    channel.subscribe(late.append, replay=True)
+    assert late == []
+
+
+def test_publish_interim_falls_back_to_file_without_subscribers(tmp_path) -> None:
+    channel = get_interim_channel()
+    interim_file = tmp_path / "interim.txt"
+
+    publish_interim("ohne Abonnent", fallback_file=interim_file)
+    assert interim_file.read_text() == "ohne Abonnent"
+
+    received = []
+    unsubscribe = channel.subscribe(received.append)
+    try:
+        publish_interim("mit Abonnent", fallback_file=interim_file)
+    finally:
+        unsubscribe()
+
+    assert [update.text for update in received] == ["mit Abonnent"]
+    assert interim_file.read_text() == "ohne Abonnent"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix-Socket")
+def test_broadcast_server_roundtrip(tmp_path) -> None:
+    channel = InterimChannel()
+    channel.publish("vor dem Verbinden")
+    address = str(tmp_path / "interim.sock")
+    authkey = b"test-key"
+    server = InterimBroadcastServer(channel, address=address, authkey=authkey)
+    server.start()
+    received = []
+    connected = threading.Event()
+
+    def client() -> None:
+        for update in iter_interim_updates(address, authkey=authkey):
+            received.append(update.text)
+            connected.set()
+            if len(received) == 2:
+                return
+
+    thread = threading.Thread(target=client, daemon=True)
+    thread.start()
+    try:
+        # Erst publizieren, wenn der Client den Startzustand erhalten hat
+        assert connected.wait(5)
+        channel.publish("danach")
+        thread.join(5)
+    finally:
+        server.stop()
+
+    assert received == ["vor dem Verbinden", "danach"]
+    assert not channel.has_subscribers()
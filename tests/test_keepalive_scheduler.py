@@ -0,0 +1,171 @@
+"""Tests für den nutzungsadaptiven Keep-Alive (utils/keepalive_scheduler.py)."""
+
+import json
+
+import pytest
+
+from utils.keepalive_scheduler import KeepaliveScheduler, SystemPressure
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_700_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def make_scheduler(clock, *, pressure=SystemPressure(), **kwargs) -> KeepaliveScheduler:
+    return KeepaliveScheduler(
+        interval_s=60.0,
+        pressure=lambda: pressure,
+        clock=clock,
+        **kwargs,
+    )
+
+
+def train_gaps(scheduler: KeepaliveScheduler, clock: FakeClock, gaps: list[float]) -> None:
+    scheduler.record_dictation()
+    for gap in gaps:
+        clock.advance(gap)
+        scheduler.record_dictation()
+
+
+def test_bootstrap_keeps_model_hot_shortly_after_activity() -> None:
+    clock = FakeClock()
+    scheduler = make_scheduler(clock)
+    scheduler.record_dictation()
+
+    clock.advance(120)
+    assert scheduler.decide().warm is True
+
+    clock.advance(60 * 60)
+    decision = scheduler.decide()
+    assert decision.warm is False
+    assert decision.next_check_s > 60.0
+
+
+def test_learned_gaps_predict_next_dictation() -> None:
+    clock = FakeClock()
+    scheduler = make_scheduler(clock)
+    # Diktate im ~3-Minuten-Takt
+    train_gaps(scheduler, clock, [170, 180, 175, 185, 190, 180])
+
+    clock.advance(150)
+    assert scheduler.probability() == pytest.approx(1.0)
+    assert scheduler.decide().warm is True
+
+    # Deutlich länger als jede gelernte Pause: kein Diktat mehr erwartet
+    clock.advance(2 * 60 * 60)
+    assert scheduler.decide().warm is False
+
+
+def test_battery_raises_the_bar() -> None:
+    clock = FakeClock()
+    # 1 von 10 langen Pausen endet im nächsten Intervall → P=0.1
+    gaps = [600.0] + [5000.0] * 9
+    plugged = make_scheduler(clock)
+    train_gaps(plugged, clock, gaps)
+    clock.advance(570)
+    assert plugged.decide().warm is True
+
+    clock = FakeClock()
+    battery = make_scheduler(clock, pressure=SystemPressure(on_battery=True))
+    train_gaps(battery, clock, gaps)
+    clock.advance(570)
+    decision = battery.decide()
+    assert decision.warm is False
+    assert decision.reason == "Akku"
+
+
+def test_memory_pressure_skips_keepalive() -> None:
+    clock = FakeClock()
+    scheduler = make_scheduler(clock, pressure=SystemPressure(memory_pressure=True))
+    scheduler.record_dictation()
+    clock.advance(60)
+
+    decision = scheduler.decide()
+
+    assert decision.warm is False
+    assert decision.reason == "Speicherdruck"
+
+
+def test_rewarm_after_cold_phase_uses_longer_warmup() -> None:
+    clock = FakeClock()
+    scheduler = make_scheduler(clock, warmup_s=0.1, rewarm_s=0.5)
+    scheduler.record_dictation()
+    clock.advance(60 * 60)
+    assert scheduler.decide().warm is False
+
+    # Aufnahmestart im kalten Zustand: sofort mit Preload-Dauer wärmen
+    scheduler.record_dictation()
+    wake = scheduler.wake_decision()
+    assert wake is not None and wake.rewarm and wake.warmup_s == 0.5
+    scheduler.record_keepalive(900.0, rewarm=True)
+    assert scheduler.wake_decision() is None
+
+    clock.advance(60)
+    decision = scheduler.decide()
+    assert decision.warm is True
+    assert decision.rewarm is False
+    assert decision.warmup_s == 0.1
+
+
+def test_stats_separate_wasted_and_useful_warmups() -> None:
+    clock = FakeClock()
+    scheduler = make_scheduler(clock)
+    scheduler.record_dictation()
+
+    clock.advance(60)
+    assert scheduler.decide().warm
+    scheduler.record_keepalive(100.0)
+    clock.advance(30)
+    scheduler.record_dictation()  # warm: Kaltstart vermieden
+
+    clock.advance(60)
+    scheduler.record_keepalive(100.0)
+    clock.advance(60 * 60)
+    assert scheduler.decide().warm is False  # Warmup ohne folgendes Diktat
+
+    stats = scheduler.stats()
+    assert stats["keepalives"] == 2
+    assert stats["warmup_ms"] == 200.0
+    assert stats["wasted_ms"] == 100.0
+    assert stats["warm_dictations"] == 2
+    assert stats["avoided_ms"] > 0
+    assert "Kaltstart vermieden" in scheduler.describe()
+
+
+def test_cold_penalty_is_learned_from_rewarms() -> None:
+    clock = FakeClock()
+    scheduler = make_scheduler(clock)
+    scheduler.record_keepalive(100.0)
+    scheduler.record_keepalive(700.0, rewarm=True)
+
+    assert scheduler.stats()["cold_penalty_ms"] == pytest.approx(600.0)
+
+
+def test_state_roundtrip(tmp_path) -> None:
+    path = tmp_path / "keepalive_stats.json"
+    clock = FakeClock()
+    scheduler = make_scheduler(clock, state_path=path)
+    train_gaps(scheduler, clock, [120, 130, 140, 150, 160])
+    scheduler.save_state()
+
+    restored = make_scheduler(clock, state_path=path)
+
+    assert restored.stats()["learned_gaps"] == 5
+    assert restored.probability() == pytest.approx(scheduler.probability(), rel=1e-3)
+    assert json.loads(path.read_text())["last_dictation"] == clock.now
+
+
+def test_corrupt_state_file_is_ignored(tmp_path) -> None:
+    path = tmp_path / "keepalive_stats.json"
+    path.write_text("{not json")
+
+    scheduler = make_scheduler(FakeClock(), state_path=path)
+
+    assert scheduler.stats()["learned_gaps"] == 0
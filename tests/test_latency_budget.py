@@ -0,0 +1,92 @@
+"""Tests für das Latenzbudget nach dem Aufnahme-Stopp (utils/latency_budget.py)."""
+
+import pytest
+
+from utils.latency_budget import LatencyBudget, get_budget_stats, start_latency_budget
+from utils.refine_latency import RefineLatencyStats
+
+
+class FakeClock:
+    def __init__(self, now: float = 100.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def make_budget(clock, latencies: dict[str, float], total_s: float = 2.5) -> LatencyBudget:
+    stats = RefineLatencyStats()
+    for model, latency_ms in latencies.items():
+        for _ in range(10):
+            stats.record("groq", model, latency_ms)
+    return LatencyBudget(total_s, clock=clock, latency_stats=stats)
+
+
+def test_enough_time_gives_llm_with_remaining_deadline() -> None:
+    clock = FakeClock()
+    budget = make_budget(clock, {"gross": 800.0})
+    clock.advance(0.5)  # Transkription
+
+    plan = budget.plan_refine("groq", "gross")
+
+    assert plan.action == "llm"
+    assert plan.timeout_s == pytest.approx(2.5 - 0.5 - 0.3)
+
+
+def test_unknown_latency_still_tries_llm() -> None:
+    budget = make_budget(FakeClock(), {})
+
+    assert budget.plan_refine("groq", "neu").action == "llm"
+
+
+def test_slow_transcription_downgrades_then_goes_local() -> None:
+    clock = FakeClock()
+    budget = make_budget(clock, {"gross": 1500.0, "klein": 400.0})
+    clock.advance(1.2)  # Rest nach Reserve: 1,0 s
+
+    plan = budget.plan_refine("groq", "gross", fallback_model="klein")
+    assert plan.action == "downgrade"
+    assert plan.model == "klein"
+
+    assert budget.plan_refine("groq", "gross").action == "local"
+
+    clock.advance(0.9)  # Rest nach Reserve: 0,1 s
+    plan = budget.plan_refine("groq", "gross", fallback_model="klein")
+    assert plan.action == "local"
+    assert "erschöpft" in plan.reason
+
+    stats = get_budget_stats().stats()
+    assert stats["downgrades"] == 1
+    assert stats["local"] == 2
+
+
+def test_finish_records_misses_once() -> None:
+    clock = FakeClock()
+    on_time = LatencyBudget(2.5, clock=clock)
+    late = LatencyBudget(2.5, clock=clock)
+    clock.advance(3.0)
+    late_started = LatencyBudget(2.5, clock=clock)
+    clock.advance(1.0)
+
+    assert late.finish() is True
+    assert late.finish() is False  # nur einmal gezählt
+    assert late_started.finish() is False
+    assert on_time.elapsed() == pytest.approx(4.0)
+
+    stats = get_budget_stats().stats()
+    assert stats["dictations"] == 2
+    assert stats["misses"] == 1
+    assert "1/2 Budgets verfehlt" in get_budget_stats().describe()
+
+
+def test_start_latency_budget_reads_env(clean_env, monkeypatch) -> None:
+    assert start_latency_budget() is None
+
+    monkeypatch.setenv("PULSESCRIBE_LATENCY_BUDGET_MS", "2500")
+    budget = start_latency_budget()
+
+    assert budget is not None
+    assert budget.total_s == pytest.approx(2.5)
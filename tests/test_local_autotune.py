@@ -0,0 +1,183 @@
+"""Tests for the local autotuner (cli/autotune.py) and its persisted profile."""
+
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pytest
+
+from cli.autotune import (
+    AutotuneCandidate,
+    AutotuneTrial,
+    candidate_configs,
+    profile_from_trial,
+    run_autotune,
+    select_winner,
+)
+from utils.local_profile import (
+    LocalRuntimeProfile,
+    load_local_profile,
+    machine_fingerprint,
+    save_local_profile,
+)
+
+
+def _trial(compute: str, threads: int, rtf: float | None, peak: float | None = None, error=None):
+    candidate = AutotuneCandidate("faster", "cpu", compute, threads, num_workers=1)
+    return AutotuneTrial(candidate, rtf=rtf, peak_memory_mb=peak, error=error)
+
+
+def test_candidate_configs_cover_installed_backends():
+    cpu = candidate_configs(["faster", "whisper"], device="cpu", cpu_count=8)
+    labels = [candidate.label for candidate in cpu]
+
+    assert "faster/cpu int8 threads=auto" in labels
+    assert "faster/cpu float32 threads=8" in labels
+    assert "faster/cpu int8 threads=4" in labels
+    assert labels[-1] == "whisper/cpu"
+    assert all(candidate.num_workers == 1 for candidate in cpu if candidate.backend == "faster")
+
+    cuda = candidate_configs(["faster"], device="cuda", cpu_count=2)
+    assert [c.compute_type for c in cuda if c.device == "cuda"] == [
+        "float16",
+        "int8_float16",
+        "int8",
+    ]
+    # MLX-Backends nur auf Apple Silicon (mps)
+    assert candidate_configs(["mlx"], device="cpu") == []
+    assert candidate_configs(["mlx"], device="mps") == [AutotuneCandidate("mlx", "mps")]
+
+
+def test_candidate_env_selects_exact_configuration():
+    env = AutotuneCandidate("faster", "cpu", "int8", 0, num_workers=1).env()
+
+    assert env == {
+        "PULSESCRIBE_LOCAL_BACKEND": "faster",
+        "PULSESCRIBE_DEVICE": "cpu",
+        "PULSESCRIBE_LOCAL_COMPUTE_TYPE": "int8",
+        "PULSESCRIBE_LOCAL_CPU_THREADS": "0",
+        "PULSESCRIBE_LOCAL_NUM_WORKERS": "1",
+    }
+
+
+def test_select_winner_prefers_less_memory_among_equally_fast():
+    trials = [
+        _trial("float32", 8, rtf=0.200, peak=3000),
+        _trial("int8", 8, rtf=0.205, peak=1200),
+        _trial("int8", 4, rtf=0.300, peak=1100),
+        _trial("int8", 0, rtf=None, error="kaputt"),
+    ]
+
+    assert select_winner(trials).candidate.compute_type == "int8"
+    assert select_winner(trials).candidate.cpu_threads == 8
+    assert select_winner(trials, tolerance=0.0).candidate.compute_type == "float32"
+    assert select_winner(trials, max_memory_mb=1150).candidate.cpu_threads == 4
+    assert select_winner([trials[-1]]) is None
+
+
+def test_run_autotune_measures_each_candidate_in_order():
+    candidates = candidate_configs(["faster"], device="cpu", cpu_count=2)
+    rtfs = {("int8", 0): 0.3, ("int8", 1): 0.25, ("int8", 2): 0.2}
+    seen = []
+
+    def measure(candidate, *, model, language, fixture, repeats):
+        assert (model, language, repeats) == ("turbo", "de", 2)
+        key = (candidate.compute_type, candidate.cpu_threads)
+        return AutotuneTrial(candidate, rtf=rtfs.get(key, 0.5), peak_memory_mb=1000)
+
+    result = run_autotune(
+        "turbo",
+        fixture=np.zeros(16_000, dtype=np.float32),
+        candidates=candidates,
+        language="de",
+        measure=measure,
+        on_trial=seen.append,
+    )
+
+    assert len(seen) == len(candidates) == 6
+    assert result.winner is not None
+    profile = profile_from_trial(result.winner, "turbo")
+    assert (profile.compute_type, profile.cpu_threads, profile.rtf) == ("int8", 2, 0.2)
+
+
+def test_profile_round_trip_per_model_and_machine(tmp_path):
+    path = tmp_path / "local_profile.json"
+    save_local_profile(LocalRuntimeProfile("turbo", "faster", "cpu", "int8", 4, 1), path=path)
+    save_local_profile(LocalRuntimeProfile("large", "faster", "cpu", "float32", 8, 1), path=path)
+
+    assert load_local_profile("turbo", path=path).cpu_threads == 4
+    # Unbekanntes Modell: zuletzt gemessenes Profil
+    assert load_local_profile("small", path=path).model == "large"
+    assert load_local_profile("turbo", path=path).tuned_at > 0
+
+    data = json.loads(path.read_text())
+    data["machine"] = "other-" + machine_fingerprint()
+    path.write_text(json.dumps(data))
+    assert load_local_profile("turbo", path=path) is None
+
+
+def test_corrupt_profile_is_ignored(tmp_path):
+    path = tmp_path / "local_profile.json"
+    path.write_text("{kaputt")
+
+    assert load_local_profile("turbo", path=path) is None
+
+
+class TestLocalProviderProfile:
+    @pytest.fixture
+    def provider(self, monkeypatch):
+        from providers.local import LocalProvider
+
+        for key in (
+            "PULSESCRIBE_LOCAL_BACKEND",
+            "PULSESCRIBE_DEVICE",
+            "PULSESCRIBE_LOCAL_COMPUTE_TYPE",
+            "PULSESCRIBE_LOCAL_CPU_THREADS",
+            "PULSESCRIBE_LOCAL_NUM_WORKERS",
+            "PULSESCRIBE_LOCAL_MODEL",
+            "PULSESCRIBE_LOCAL_PROFILE",
+        ):
+            monkeypatch.delenv(key, raising=False)
+        save_local_profile(
+            LocalRuntimeProfile("turbo", "faster", "cpu", "float32", cpu_threads=6, num_workers=2)
+        )
+        return LocalProvider()
+
+    def test_profile_fills_unset_settings(self, provider):
+        provider._ensure_runtime_config()
+
+        assert (provider._backend, provider._device, provider._compute_type) == (
+            "faster",
+            "cpu",
+            "float32",
+        )
+        assert provider._faster_thread_settings() == (6, 2)
+
+    def test_explicit_env_wins_over_profile(self, provider, monkeypatch):
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_COMPUTE_TYPE", "int8")
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_CPU_THREADS", "0")
+
+        provider._ensure_runtime_config()
+
+        assert provider._compute_type == "int8"
+        assert provider._faster_thread_settings() == (0, 2)
+
+    def test_profile_can_be_disabled(self, provider, monkeypatch):
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_PROFILE", "false")
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_BACKEND", "faster")
+        monkeypatch.setenv("PULSESCRIBE_DEVICE", "cpu")
+
+        provider._ensure_runtime_config()
+
+        assert provider._compute_type is None
+        assert provider._faster_thread_settings() == (0, 1)
+
+    def test_profile_for_other_backend_keeps_its_settings_out(self, provider, monkeypatch):
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_BACKEND", "whisper")
+        monkeypatch.setenv("PULSESCRIBE_DEVICE", "cpu")
+
+        provider._ensure_runtime_config()
+
+        assert provider._backend == "whisper"
+        assert provider._compute_type is None
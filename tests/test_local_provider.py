@@ -756,6 +756,39 @@ class TestTranscribeFileDispatch:
             assert result == "Whisper Result"
             assert mock_model.transcribe.call_args.args[0] == str(audio_file)
 
+    def test_transcribe_with_batch_size_uses_batched_faster_pipeline(
+        self, monkeypatch, tmp_path
+    ):
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_BACKEND", "faster")
+        audio_file = tmp_path / "sample.wav"
+        audio_file.write_bytes(b"audio")
+        model = MagicMock()
+        pipeline = MagicMock()
+        pipeline.transcribe.return_value = (
+            iter([MagicMock(text=" Hallo"), MagicMock(text=" Welt")]),
+            None,
+        )
+        batched = MagicMock(return_value=pipeline)
+        monkeypatch.setitem(
+            sys.modules,
+            "faster_whisper",
+            MagicMock(BatchedInferencePipeline=batched),
+        )
+
+        with patch(
+            "providers.local.LocalProvider._get_faster_model",
+            return_value=model,
+        ):
+            from providers.local import LocalProvider
+
+            provider = LocalProvider()
+            result = provider.transcribe(audio_file, language="de", batch_size=8)
+
+        assert result == " Hallo Welt"
+        batched.assert_called_once_with(model=model)
+        assert pipeline.transcribe.call_args.kwargs["batch_size"] == 8
+        model.transcribe.assert_not_called()
+
 
 class TestLightningEnvOptions:
     """Tests für Lightning-spezifische ENV-Optionen."""
@@ -0,0 +1,110 @@
+"""Tests für die lokale Regel-Engine (refine/local_rules.py)."""
+
+from unittest.mock import patch
+
+import pytest
+
+from refine.local_rules import build_local_rules, local_refine
+
+
+@pytest.fixture
+def prompts_file(tmp_path, monkeypatch):
+    """Isolierte prompts.toml statt ~/.pulsescribe/prompts.toml."""
+    import utils.custom_prompts as cp
+
+    prompts_path = tmp_path / "prompts.toml"
+    monkeypatch.setattr(cp, "PROMPTS_FILE", prompts_path)
+    cp._clear_cache()
+    return prompts_path
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("Hallo Komma wie geht's Fragezeichen", "Hallo, wie geht's?"),
+        ("Hallo, Komma, wie geht's?", "Hallo, wie geht's?"),
+        ("thanks comma see you tomorrow period", "thanks, see you tomorrow."),
+        ("Satz eins. Neuer Absatz. weiter geht es", "Satz eins.\n\nWeiter geht es"),
+        ("Liste Doppelpunkt neue Zeile Milch neue Zeile Eier", "Liste:\nMilch\nEier"),
+    ],
+)
+def test_voice_commands(raw, expected) -> None:
+    assert build_local_rules().apply(raw) == expected
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "Der Punkt ist, dass wir warten",
+        "Wir treffen uns um Punkt drei Uhr",
+        "Die Rate liegt bei drei Komma fünf Prozent",
+        "over a period of time",
+        "Ich habe den Colon gesehen",
+        "Punkt eins der Agenda",
+    ],
+)
+def test_single_word_commands_stay_nouns(raw) -> None:
+    assert build_local_rules().apply(raw) == raw
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("Ähm, ich komme morgen", "Ich komme morgen"),
+        ("ich komme, äh, etwas später", "ich komme etwas später"),
+        ("Ja, äh.", "Ja."),
+        ("Gut. Öhm, weiter", "Gut. Weiter"),
+        # "um" ist im Deutschen ein Wort und kein Default-Füllwort
+        ("Wir treffen uns um acht", "Wir treffen uns um acht"),
+        ("Das Ähmchen bleibt", "Das Ähmchen bleibt"),
+    ],
+)
+def test_filler_removal(raw, expected) -> None:
+    assert build_local_rules().apply(raw) == expected
+
+
+def test_overrides_extend_and_disable_commands() -> None:
+    rules = build_local_rules(
+        {"Spiegelstrich": "\n- ", "punkt": ""},
+        {"en": ["um"]},
+    )
+
+    assert rules.apply("Einkauf Spiegelstrich Milch") == "Einkauf\n- Milch"
+    assert rules.apply("der springende Punkt") == "der springende Punkt"
+    assert rules.apply("so um yes") == "so yes"
+
+
+def test_local_refine_respects_word_limit(clean_env, monkeypatch, prompts_file) -> None:
+    assert local_refine("ähm danke Punkt") is None  # Default: aus
+
+    monkeypatch.setenv("PULSESCRIBE_LOCAL_REFINE_MAX_WORDS", "3")
+    assert local_refine("ähm danke Punkt") == "Danke."
+    assert local_refine("das sind deutlich mehr als drei Wörter") is None
+
+
+def test_local_refine_reads_prompts_toml(clean_env, prompts_file) -> None:
+    prompts_file.write_text(
+        '[local_rules.commands]\n"smiley" = ":)"\n', encoding="utf-8"
+    )
+
+    assert local_refine("danke smiley", max_words=5) == "danke :)"
+
+
+def test_short_dictation_skips_llm(clean_env, monkeypatch, prompts_file) -> None:
+    from refine.llm import maybe_refine_transcript, maybe_refine_transcript_streaming
+
+    monkeypatch.setenv("PULSESCRIBE_LOCAL_REFINE_MAX_WORDS", "10")
+    with patch("refine.llm.refine_transcript") as mock_refine, patch(
+        "refine.llm.stream_refine_transcript"
+    ) as mock_stream:
+        text = maybe_refine_transcript("bin gleich da Punkt", refine=True)
+        only_filler = maybe_refine_transcript("ähm", refine=True)
+        streamed = maybe_refine_transcript_streaming(
+            "bin gleich da Punkt", on_sentences=lambda _text: None
+        )
+
+    assert text == "bin gleich da."
+    assert only_filler == "ähm"
+    assert streamed.text == "bin gleich da." and streamed.refined
+    mock_refine.assert_not_called()
+    mock_stream.assert_not_called()
@@ -0,0 +1,253 @@
+"""Tests für den lokalen Model-Server (providers/local_server.py)."""
+
+from __future__ import annotations
+
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from providers.local_server import (
+    ModelServer,
+    ModelServerClient,
+    ModelServerError,
+    ModelServerUnavailable,
+)
+from utils.env import getenv
+
+AUTHKEY = b"test-authkey"
+
+
+class FakeLocalProvider:
+    def __init__(self) -> None:
+        self._model_cache: dict = {}
+        self.invalidations = 0
+        self.calls: list[tuple] = []
+
+    def invalidate_runtime_config(self) -> None:
+        self.invalidations += 1
+
+    def preload(self, model=None) -> None:
+        self._model_cache[f"{model}:cpu"] = object()
+
+    def keepalive(self, model=None) -> None:
+        self.calls.append(("keepalive", model))
+
+    def get_runtime_info(self):
+        return {"backend": getenv("PULSESCRIBE_LOCAL_BACKEND") or "faster", "device": "cpu"}
+
+    def clear_model_cache(self) -> int:
+        cleared = len(self._model_cache)
+        self._model_cache.clear()
+        return cleared
+
+    def transcribe(self, audio_path, model=None, language=None) -> str:
+        self.calls.append(("transcribe", str(audio_path), model, language))
+        return "aus datei"
+
+    def transcribe_audio(self, audio, model=None, language=None) -> str:
+        if model == "kaputt":
+            raise ValueError("Modell nicht gefunden")
+        self.calls.append(("transcribe_audio", audio.copy(), model, language))
+        return f"{audio.size} samples"
+
+
+@pytest.fixture
+def socket_dir():
+    # Kurzer Pfad: AF_UNIX-Adressen sind auf ~104 Zeichen begrenzt
+    path = Path(tempfile.mkdtemp(prefix="psms", dir="/tmp"))
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture
+def running_server(socket_dir):
+    provider = FakeLocalProvider()
+    server = ModelServer(provider, address=str(socket_dir / "s.sock"), authkey=AUTHKEY)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    assert server.ready.wait(5.0)
+    client = ModelServerClient(server.address, authkey=AUTHKEY)
+    yield server, provider, client
+    client.close()
+    server.stop()
+    thread.join(5.0)
+
+
+def test_transcribe_audio_hands_samples_over_shared_memory(running_server):
+    _server, provider, client = running_server
+    audio = np.linspace(-0.5, 0.5, 16000, dtype=np.float32)
+
+    text = client.transcribe_audio(audio, model="turbo", language="de")
+
+    assert text == "16000 samples"
+    _name, received, model, language = provider.calls[-1]
+    np.testing.assert_array_equal(received, audio)
+    assert (model, language) == ("turbo", "de")
+
+
+def test_models_stay_cached_across_client_reconnects(running_server):
+    server, provider, client = running_server
+
+    client.request("preload", model="turbo")
+    client.close()
+    other_daemon = ModelServerClient(server.address, authkey=AUTHKEY)
+    status = other_daemon.request("ping", spawn=False)
+    other_daemon.close()
+
+    assert status["models"] == ["turbo:cpu"]
+
+
+def test_env_changes_invalidate_server_runtime_config(running_server, monkeypatch):
+    _server, provider, client = running_server
+
+    client.request("ping")
+    before = provider.invalidations
+    monkeypatch.setenv("PULSESCRIBE_LOCAL_BACKEND", "faster")
+    client.request("ping")
+    client.request("ping")
+
+    assert provider.invalidations == before + 1
+
+
+def test_client_env_applies_per_request_without_touching_os_environ(monkeypatch):
+    monkeypatch.setenv("PULSESCRIBE_LOCAL_BACKEND", "whisper")
+    server = ModelServer(FakeLocalProvider(), address="unused", authkey=AUTHKEY)
+
+    reply = server.handle(
+        {"command": "runtime_info", "env": {"PULSESCRIBE_LOCAL_BACKEND": "mlx"}}
+    )
+    unset = server.handle({"command": "runtime_info", "env": {}})
+
+    assert reply["result"]["backend"] == "mlx"
+    # Beim Client nicht gesetzt = im Server nicht gesetzt
+    assert unset["result"]["backend"] == "faster"
+    assert getenv("PULSESCRIBE_LOCAL_BACKEND") == "whisper"
+
+
+def test_settings_change_waits_for_running_request(monkeypatch):
+    monkeypatch.delenv("PULSESCRIBE_LOCAL_BACKEND", raising=False)
+    provider = FakeLocalProvider()
+    server = ModelServer(provider, address="unused", authkey=AUTHKEY)
+    started = threading.Event()
+    release = threading.Event()
+    seen: list[str | None] = []
+
+    def slow_transcribe(_request):
+        started.set()
+        release.wait(5.0)
+        seen.append(getenv("PULSESCRIBE_LOCAL_BACKEND"))
+        return "ok"
+
+    server._cmd_slow = slow_transcribe  # type: ignore[attr-defined]
+    first = threading.Thread(
+        target=server.handle,
+        args=({"command": "slow", "env": {"PULSESCRIBE_LOCAL_BACKEND": "faster"}},),
+    )
+    first.start()
+    assert started.wait(5.0)
+    invalidations = provider.invalidations
+    second = threading.Thread(
+        target=server.handle,
+        args=({"command": "ping", "env": {"PULSESCRIBE_LOCAL_BACKEND": "mlx"}},),
+    )
+    second.start()
+    second.join(0.2)
+
+    assert second.is_alive()
+    assert provider.invalidations == invalidations
+    release.set()
+    first.join(5.0)
+    second.join(5.0)
+    assert seen == ["faster"]
+    assert provider.invalidations == invalidations + 1
+
+
+def test_server_errors_are_raised_on_client(running_server):
+    _server, _provider, client = running_server
+
+    with pytest.raises(ModelServerError, match="Modell nicht gefunden"):
+        client.transcribe_audio(np.zeros(10, dtype=np.float32), model="kaputt", language=None)
+    # Verbindung bleibt nutzbar
+    assert client.request("clear_model_cache") == 0
+
+
+def test_client_without_server_raises_unavailable(socket_dir):
+    client = ModelServerClient(str(socket_dir / "missing.sock"), authkey=AUTHKEY)
+
+    with pytest.raises(ModelServerUnavailable):
+        client.request("ping", spawn=False)
+
+
+def test_stale_socket_is_replaced(socket_dir):
+    address = socket_dir / "s.sock"
+    address.write_text("")
+    server = ModelServer(FakeLocalProvider(), address=str(address), authkey=AUTHKEY)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        assert server.ready.wait(5.0)
+        client = ModelServerClient(str(address), authkey=AUTHKEY)
+        assert client.request("ping", spawn=False)["models"] == []
+        client.close()
+    finally:
+        server.stop()
+        thread.join(5.0)
+    assert not thread.is_alive()
+
+
+class TestLocalProviderWithModelServer:
+    @pytest.fixture
+    def provider(self, monkeypatch):
+        from providers.local import LocalProvider
+
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_MODEL_SERVER", "true")
+        return LocalProvider()
+
+    def test_transcribe_audio_uses_server(self, provider):
+        client = MagicMock()
+        client.transcribe_audio.return_value = "vom server"
+        provider._server_client = client
+        provider._transcribe_with_backend = MagicMock()
+
+        text = provider.transcribe_audio(np.zeros(100, dtype=np.float32), model="turbo")
+
+        assert text == "vom server"
+        provider._transcribe_with_backend.assert_not_called()
+
+    def test_unreachable_server_falls_back_in_process(self, provider):
+        client = MagicMock()
+        client.transcribe_audio.side_effect = ModelServerUnavailable("weg")
+        provider._server_client = client
+        provider._log_transcription_start = MagicMock()
+        provider._build_options = MagicMock(return_value={})
+        provider._transcribe_with_backend = MagicMock(return_value="lokal")
+
+        assert provider.transcribe_audio(np.zeros(100, dtype=np.float32)) == "lokal"
+        # Während des Retry-Fensters kein weiterer Verbindungsversuch
+        assert provider.transcribe_audio(np.zeros(100, dtype=np.float32)) == "lokal"
+        assert client.transcribe_audio.call_count == 1
+
+    def test_cleanup_keeps_server_models_warm(self, provider):
+        client = MagicMock()
+        provider._server_client = client
+
+        provider.cleanup()
+
+        client.close.assert_called_once()
+        client.request.assert_not_called()
+
+    def test_keepalive_without_running_server_is_noop(self, provider):
+        client = MagicMock()
+        client.request.side_effect = ModelServerUnavailable("läuft nicht")
+        provider._server_client = client
+        provider._ensure_runtime_config = MagicMock()
+
+        provider.keepalive("turbo")
+
+        assert client.request.call_args.kwargs["spawn"] is False
+        provider._ensure_runtime_config.assert_not_called()
@@ -0,0 +1,201 @@
+"""Tests for streaming local transcription (providers/_local_streaming.py)."""
+
+from __future__ import annotations
+
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from audio.buffer import SampleBuffer
+from providers._local_streaming import LocalAgreement, LocalStreamingSession, TimedWord
+
+RATE = 1000  # kleine Rate: Sekunden bleiben überschaubar
+
+# Gesprochener Text mit absoluten Zeiten (Sekunden)
+SPEECH = [
+    TimedWord(0.2, 0.6, " Das"),
+    TimedWord(0.7, 1.1, " ist"),
+    TimedWord(1.2, 1.8, " ein"),
+    TimedWord(1.9, 2.6, " langes"),
+    TimedWord(2.7, 3.5, " Diktat"),
+    TimedWord(3.6, 4.2, " mit"),
+    TimedWord(4.3, 5.0, " vielen"),
+    TimedWord(5.1, 5.9, " Wörtern."),
+]
+
+
+def _words(*spec):
+    return [TimedWord(start, start + 0.3, text) for start, text in spec]
+
+
+def _audio(seconds: float):
+    # Samplewert = absolute Zeit → der Fake-Decoder kennt den Fensterstart
+    return (np.arange(int(seconds * RATE), dtype=np.float32) / RATE).astype(np.float32)
+
+
+class FakeDecoder:
+    def __init__(self, fail_on_call: int | None = None) -> None:
+        self.windows: list[tuple[float, float]] = []
+        self.prompts: list[str | None] = []
+        self.fail_on_call = fail_on_call
+
+    def __call__(self, audio, prompt):
+        start = float(audio[0])
+        end = start + audio.shape[0] / RATE
+        self.windows.append((start, end))
+        self.prompts.append(prompt)
+        if self.fail_on_call == len(self.windows):
+            raise RuntimeError("decoder kaputt")
+        # Nur vollständig gehörte Wörter, Zeiten relativ zum Fenster
+        return [
+            TimedWord(word.start - start, word.end - start, word.text)
+            for word in SPEECH
+            if word.start >= start - 0.05 and word.end <= end
+        ]
+
+
+def _record(session: LocalStreamingSession, audio, *, step: float = 0.5):
+    buffer = SampleBuffer(sample_rate=RATE)
+    frames = int(step * RATE)
+    for offset in range(0, audio.shape[0], frames):
+        buffer.append(audio[offset : offset + frames])
+        if session.poll(buffer) and session._pending is not None:
+            session._pending.result(timeout=5)
+    return buffer
+
+
+def test_agreement_commits_prefix_confirmed_twice():
+    agreement = LocalAgreement()
+
+    assert agreement.insert(_words((0.0, " Hallo"), (0.5, " Welt"))) == []
+    newly = agreement.insert(_words((0.0, " hallo,"), (0.5, " Welt"), (1.0, " wie")))
+
+    assert [word.text for word in newly] == [" hallo,", " Welt"]
+    assert [word.text for word in agreement.tentative] == [" wie"]
+
+
+def test_agreement_stops_at_first_disagreement():
+    agreement = LocalAgreement()
+    agreement.insert(_words((0.0, " Eins"), (0.5, " zwei"), (1.0, " drei")))
+
+    newly = agreement.insert(_words((0.0, " Eins"), (0.5, " zwo"), (1.0, " drei")))
+
+    assert [word.text for word in newly] == [" Eins"]
+
+
+def test_agreement_strips_redecoded_context_words():
+    agreement = LocalAgreement()
+    agreement.insert(_words((0.0, " Eins"), (0.5, " zwei")))
+    agreement.insert(_words((0.0, " Eins"), (0.5, " zwei")))
+
+    # Fenster beginnt mitten im letzten bestätigten Wort: "zwei" kommt erneut
+    agreement.insert(_words((0.75, " zwei"), (1.0, " drei")))
+    final = agreement.finish(_words((0.75, " zwei"), (1.0, " drei"), (1.5, " vier")))
+
+    assert [word.text for word in final] == [" Eins", " zwei", " drei", " vier"]
+
+
+def test_session_emits_interim_text_and_decodes_only_tail():
+    interims: list[str] = []
+    decoder = FakeDecoder()
+    session = LocalStreamingSession(
+        decoder, sample_rate=RATE, interval_seconds=1.0, on_interim=interims.append
+    )
+    audio = _audio(12.0)
+
+    buffer = _record(session, audio)
+    transcript = session.finish(buffer.take())
+
+    assert transcript == "Das ist ein langes Diktat mit vielen Wörtern."
+    assert interims and interims[-1].startswith("Das ist ein")
+    # Fenster wurde hinter bestätigte Wörter verschoben: beim Stop nur der Rest
+    final_start, final_end = decoder.windows[-1]
+    assert final_start > 0
+    assert final_end - final_start < 12.0
+    # Bestätigter Text dient als Prompt für folgende Fenster
+    assert any(prompt and prompt.startswith("Das ist") for prompt in decoder.prompts)
+
+
+def test_trimmed_window_keeps_committed_context():
+    from providers._local_streaming import _CONTEXT_SECONDS
+
+    decoder = FakeDecoder()
+    session = LocalStreamingSession(decoder, sample_rate=RATE, interval_seconds=1.0)
+
+    buffer = _record(session, _audio(12.0))
+    committed_end = session._agreement.committed_end
+
+    # Getrimmt, aber mindestens _CONTEXT_SECONDS bestätigtes Audio bleibt im Fenster
+    assert 0 < session.window_frame / RATE <= committed_end - _CONTEXT_SECONDS + 1 / RATE
+    assert session.finish(buffer.take()) == "Das ist ein langes Diktat mit vielen Wörtern."
+
+
+def test_failed_interim_decode_is_recovered_at_finish():
+    decoder = FakeDecoder(fail_on_call=2)
+    session = LocalStreamingSession(decoder, sample_rate=RATE, interval_seconds=1.0)
+
+    buffer = _record(session, _audio(7.0))
+
+    assert session.finish(buffer.take()) == "Das ist ein langes Diktat mit vielen Wörtern."
+
+
+def test_poll_waits_for_running_decode_and_interval():
+    session = LocalStreamingSession(FakeDecoder(), sample_rate=RATE, interval_seconds=1.0)
+    buffer = SampleBuffer(sample_rate=RATE)
+
+    buffer.append(_audio(0.5))
+    assert session.poll(buffer) is False
+    buffer.append(_audio(1.1)[500:])
+    assert session.poll(buffer) is True
+    session.close()
+
+
+class TestLocalProviderStreaming:
+    @pytest.fixture
+    def provider(self, monkeypatch):
+        from providers.local import LocalProvider
+
+        monkeypatch.delenv("PULSESCRIBE_LOCAL_MODEL_SERVER", raising=False)
+        provider = LocalProvider()
+        provider._backend = "faster"
+        provider._device = "cpu"
+        provider._fp16_override = False
+        provider._fast_mode = True
+        provider._compute_type = "int8"
+        return provider
+
+    def test_transcribe_audio_words_requests_word_timestamps(self, provider, monkeypatch):
+        calls = []
+
+        class FakeModel:
+            def transcribe(self, audio, **options):
+                calls.append(options)
+                word = SimpleNamespace(start=0.5, end=0.9, word=" Hallo")
+                return iter([SimpleNamespace(text=" Hallo", words=[word])]), None
+
+        monkeypatch.setitem(
+            sys.modules,
+            "faster_whisper",
+            SimpleNamespace(WhisperModel=lambda *_args, **_kwargs: FakeModel()),
+        )
+
+        words = provider.transcribe_audio_words(
+            np.zeros(1600, dtype=np.float32), model="turbo", language="de", prompt="Vorher"
+        )
+
+        assert words == [TimedWord(0.5, 0.9, " Hallo")]
+        assert calls[0]["word_timestamps"] is True
+        assert calls[0]["without_timestamps"] is False
+        assert calls[0]["initial_prompt"].endswith("Vorher")
+
+    def test_streaming_requires_faster_backend_in_process(self, provider, monkeypatch):
+        assert provider.supports_local_streaming() is True
+
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_MODEL_SERVER", "true")
+        assert provider.supports_local_streaming() is False
+
+        monkeypatch.delenv("PULSESCRIBE_LOCAL_MODEL_SERVER")
+        provider._backend = "whisper"
+        assert provider.supports_local_streaming() is False
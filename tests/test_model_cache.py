@@ -0,0 +1,125 @@
+"""Tests for the memory-budgeted local model cache."""
+
+from __future__ import annotations
+
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from providers._model_cache import ModelCache, estimate_model_bytes
+
+GB = 2**30
+
+
+def _cache(budget_gb: float, on_evict=None) -> ModelCache:
+    sizes = {"a": 1 * GB, "b": 1 * GB, "c": 1 * GB, "big": 3 * GB}
+    return ModelCache(
+        lambda: int(budget_gb * GB), estimate=lambda key: sizes[key], on_evict=on_evict
+    )
+
+
+def test_estimate_depends_on_model_and_precision():
+    whisper_turbo = estimate_model_bytes("whisper:turbo:cpu")
+    faster_turbo_int8 = estimate_model_bytes("faster:large-v3-turbo:cpu:int8:0:1")
+    faster_large_fp16 = estimate_model_bytes("faster:large-v3:cuda:float16:0:1")
+    lightning_4bit = estimate_model_bytes("lightning:large-v3:12:4bit")
+
+    assert faster_turbo_int8 * 4 == whisper_turbo
+    assert faster_large_fp16 > faster_turbo_int8
+    assert lightning_4bit < faster_large_fp16
+    assert estimate_model_bytes("faster:distil-large-v3:cpu:int8:0:1") < (
+        estimate_model_bytes("faster:large-v3:cpu:int8:0:1")
+    )
+    # Unbekannte Modelle: konservativ wie large
+    assert estimate_model_bytes("whisper:custom:cpu") == estimate_model_bytes(
+        "whisper:large:cpu"
+    )
+
+
+def test_least_recently_used_model_is_evicted():
+    on_evict = MagicMock()
+    cache = _cache(2, on_evict=on_evict)
+    cache["a"] = "A"
+    cache["b"] = "B"
+    assert cache["a"] == "A"  # a wieder zuletzt benutzt
+
+    cache["c"] = "C"
+
+    assert list(cache) == ["a", "c"]
+    on_evict.assert_called_once_with()
+    assert cache.stats()["evictions"] == 1
+
+
+def test_active_model_is_pinned_even_over_budget():
+    cache = _cache(2)
+    cache["a"] = "A"
+
+    cache["big"] = "BIG"
+
+    assert list(cache) == ["big"]
+    assert cache.active_key == "big"
+    assert cache.bytes_resident == 3 * GB
+
+
+def test_reserve_evicts_before_loading():
+    cache = _cache(2)
+    cache["a"] = "A"
+    cache["b"] = "B"
+
+    cache.reserve("c")
+
+    assert list(cache) == ["b"]
+    assert cache.bytes_resident == 1 * GB
+
+
+def test_zero_budget_keeps_everything():
+    cache = _cache(0)
+    for key in ("a", "b", "c", "big"):
+        cache[key] = key.upper()
+
+    assert len(cache) == 4
+
+
+def test_stats_count_hits_and_loads():
+    cache = _cache(10)
+    cache["a"] = "A"
+    cache["a"]  # Lookup direkt nach dem Load
+    cache["a"]
+    cache["a"]
+
+    stats = cache.stats()
+
+    assert stats["loads"] == 1
+    assert stats["hits"] == 2
+    assert stats["bytes_resident"] == 1 * GB
+    assert stats["budget_bytes"] == 10 * GB
+
+
+def test_local_provider_switching_models_unloads_previous(monkeypatch):
+    from providers.local import LocalProvider
+
+    loaded = []
+
+    def whisper_model(name, **kwargs):
+        loaded.append(name)
+        return SimpleNamespace(name=name)
+
+    monkeypatch.setitem(
+        sys.modules, "faster_whisper", SimpleNamespace(WhisperModel=whisper_model)
+    )
+    monkeypatch.setenv("PULSESCRIBE_LOCAL_MODEL_CACHE_MB", "2500")
+    provider = LocalProvider()
+    provider._backend = "faster"
+    provider._device = "cpu"
+    provider._fp16_override = False
+    provider._fast_mode = True
+    provider._compute_type = "int8"
+
+    provider._get_faster_model("large")
+    provider._get_faster_model("turbo")
+    provider._get_faster_model("turbo")
+
+    assert loaded == ["large-v3", "large-v3-turbo"]
+    assert list(provider._model_cache) == ["faster:large-v3-turbo:cpu:int8:0:1"]
+    stats = provider.get_model_cache_stats()
+    assert (stats["loads"], stats["hits"], stats["evictions"]) == (2, 1, 1)
@@ -178,3 +178,27 @@ def test_apply_local_preset_to_env_returns_false_without_writing_for_unknown_pre
     )
 
     assert presets.apply_local_preset_to_env("missing preset") is False
+
+
+def test_onboarding_preset_leaves_tuned_settings_to_autotune_profile(
+    monkeypatch,
+) -> None:
+    from utils.local_profile import LocalRuntimeProfile, save_local_profile
+
+    updates = _capture_env_updates(monkeypatch)
+    assert presets.apply_local_preset_to_env(
+        presets.DEFAULT_CPU_LOCAL_PRESET_NAME, prefer_tuned_profile=True
+    )
+    assert updates["PULSESCRIBE_LOCAL_COMPUTE_TYPE"] == "int8"
+
+    save_local_profile(
+        LocalRuntimeProfile("turbo", "faster", "cpu", "float32", cpu_threads=8, num_workers=1)
+    )
+    updates.clear()
+    assert presets.apply_local_preset_to_env(
+        presets.DEFAULT_CPU_LOCAL_PRESET_NAME, prefer_tuned_profile=True
+    )
+
+    assert updates["PULSESCRIBE_LOCAL_MODEL"] == "turbo"
+    for key in presets.TUNED_PROFILE_ENV_KEYS:
+        assert updates[key] is None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 import logging
 from pathlib import Path
 from types import MappingProxyType, SimpleNamespace
@@ -15,11 +16,17 @@ from providers._response_utils import (
     require_text_response,
     serialize_openai_response,
 )
+from providers._audio_upload import EncodedAudio, encode_audio_for_upload
 from providers._transcription_request import (
     build_transcription_params,
     execute_audio_file_request,
     execute_audio_transcription_request,
+    maybe_transcribe_file_in_chunks,
+    plan_audio_chunks,
     resolve_transcription_request,
+    select_upload_codec,
+    stitch_transcripts,
+    transcribe_audio_in_chunks,
 )
 
 
@@ -329,3 +336,211 @@ def test_build_cached_env_client_getter_keeps_dependency_import_lazy(
 
     with pytest.raises(ValueError, match="TEST_API_KEY missing"):
         getter()
+
+
+def test_resolve_transcription_request_sizes_in_memory_payloads() -> None:
+    request = resolve_transcription_request(
+        EncodedAudio(data=b"x" * 4096),
+        model=None,
+        default_model="default-model",
+        language="auto",
+    )
+
+    assert request.audio_kb == 4
+
+
+def test_execute_audio_transcription_request_names_in_memory_payloads() -> None:
+    observed: dict[str, object] = {}
+    encoded = EncodedAudio(data=b"RIFF")
+
+    def fake_request(**kwargs):
+        filename, audio_file = cast(tuple, kwargs["file"])
+        observed.update(filename=filename, payload=audio_file.read())
+
+    execute_audio_transcription_request(
+        encoded,
+        request_callable=fake_request,
+        model="whisper-1",
+        language=None,
+    )
+
+    assert observed == {"filename": "audio.wav", "payload": b"RIFF"}
+
+
+def test_encode_audio_for_upload_writes_16bit_wav_without_disk() -> None:
+    import numpy as np
+
+    encoded = encode_audio_for_upload(np.zeros(160, dtype=np.float32), 16_000)
+
+    assert encoded.data[:4] == b"RIFF"
+    assert encoded.size == 44 + 160 * 2  # WAV-Header + PCM_16
+    assert encoded.encode_ms >= 0.0
+
+
+@pytest.mark.parametrize(
+    ("codec", "filename", "magic"),
+    [("wav", "audio.wav", b"RIFF"), ("flac", "audio.flac", b"fLaC"), ("opus", "audio.ogg", b"OggS")],
+)
+def test_encode_audio_for_upload_supports_all_codecs(codec, filename, magic) -> None:
+    import io
+
+    import numpy as np
+    import soundfile as sf
+
+    audio = np.sin(np.linspace(0, 200, 16_000)).astype(np.float32) * 0.3
+    encoded = encode_audio_for_upload(audio, 16_000, codec=codec)
+
+    assert encoded.codec == codec
+    assert encoded.name == filename
+    assert encoded.data[:4] == magic
+    assert encoded.wav_size == 44 + 16_000 * 2
+    decoded, sample_rate = sf.read(io.BytesIO(encoded.data), dtype="float32")
+    assert sample_rate == 16_000
+    assert abs(len(decoded) - len(audio)) < 1_000
+
+
+def test_encode_audio_for_upload_falls_back_to_flac_for_unsupported_opus_rate() -> None:
+    import numpy as np
+
+    encoded = encode_audio_for_upload(
+        np.zeros(4_410, dtype=np.float32), 44_100, codec="opus"
+    )
+
+    assert encoded.codec == "flac"
+    assert encoded.name == "audio.flac"
+
+
+def test_select_upload_codec_compresses_only_longer_recordings(monkeypatch) -> None:
+    monkeypatch.delenv("PULSESCRIBE_UPLOAD_CODEC", raising=False)
+    monkeypatch.delenv("PULSESCRIBE_DEEPGRAM_UPLOAD_CODEC", raising=False)
+    monkeypatch.setenv("PULSESCRIBE_UPLOAD_COMPRESS_MIN_SECONDS", "5")
+
+    assert select_upload_codec("deepgram", 1.0) == "wav"
+    assert select_upload_codec("deepgram", 30.0) == "flac"
+
+    monkeypatch.setenv("PULSESCRIBE_DEEPGRAM_UPLOAD_CODEC", "wav")
+    assert select_upload_codec("deepgram", 30.0) == "wav"
+
+
+def _speech_with_pauses(rate: int, seconds: int, pauses: list[float]):
+    """Tone with 0.5 s silent gaps starting at ``pauses`` (seconds)."""
+    import numpy as np
+
+    t = np.arange(rate * seconds, dtype=np.float32) / rate
+    audio = (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+    for pause in pauses:
+        audio[int(pause * rate) : int((pause + 0.5) * rate)] = 0.0
+    return audio
+
+
+def test_plan_audio_chunks_cuts_in_pauses_with_overlap() -> None:
+    rate = 16_000
+    audio = _speech_with_pauses(rate, 27, pauses=[8.6, 17.2])
+
+    bounds = plan_audio_chunks(audio, rate, chunk_s=10, overlap_s=1.0)
+
+    assert len(bounds) == 3
+    assert bounds[0][0] == 0 and bounds[-1][1] == len(audio)
+    for (_, end), (start, _) in zip(bounds, bounds[1:]):
+        cut = (start + end) / 2 / rate
+        assert end - start == rate  # 1 s Überlappung um den Schnitt
+        assert any(pause <= cut <= pause + 0.5 for pause in (8.6, 17.2))
+
+
+def test_plan_audio_chunks_keeps_slightly_long_audio_whole() -> None:
+    import numpy as np
+
+    audio = np.zeros(10_500, dtype=np.float32)
+
+    assert plan_audio_chunks(audio, 1_000, chunk_s=10, overlap_s=1.0) == [(0, 10_500)]
+
+
+def test_stitch_transcripts_drops_words_repeated_in_overlap() -> None:
+    parts = ["Das ist der erste Teil.", "erste Teil. Und das", "Und das Ende!"]
+
+    assert stitch_transcripts(parts, max_overlap_words=4) == (
+        "Das ist der erste Teil. Und das Ende!"
+    )
+    assert stitch_transcripts(["a b", "c d"], max_overlap_words=4) == "a b c d"
+
+
+def test_transcribe_audio_in_chunks_uploads_concurrently_in_order(monkeypatch) -> None:
+    import threading
+    import time
+
+    import soundfile as sf
+
+    rate = 16_000
+    monkeypatch.setenv("PULSESCRIBE_CHUNK_SECONDS", "10")
+    monkeypatch.setenv("PULSESCRIBE_CHUNK_WORKERS", "3")
+    monkeypatch.setenv("PULSESCRIBE_UPLOAD_CODEC", "wav")
+    audio = _speech_with_pauses(rate, 27, pauses=[8.6, 17.2])
+    bounds = plan_audio_chunks(audio, rate, chunk_s=10, overlap_s=1.0)
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def transcribe_chunk(chunk: EncodedAudio) -> str:
+        nonlocal active, peak
+        frames = sf.info(io.BytesIO(chunk.data)).frames
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        # Erster Chunk wird zuletzt fertig: Reihenfolge muss trotzdem stimmen
+        time.sleep(0.1 if frames == bounds[0][1] else 0.02)
+        with lock:
+            active -= 1
+        return f"c{frames}"
+
+    text = transcribe_audio_in_chunks(
+        audio, rate, provider_name="groq", transcribe_chunk=transcribe_chunk
+    )
+
+    assert text == " ".join(f"c{end - start}" for start, end in bounds)
+    assert peak > 1
+
+
+def test_maybe_transcribe_file_in_chunks_skips_short_files(tmp_path, monkeypatch) -> None:
+    import numpy as np
+    import soundfile as sf
+
+    monkeypatch.setenv("PULSESCRIBE_CHUNK_SECONDS", "10")
+    audio_path = tmp_path / "short.wav"
+    sf.write(audio_path, np.zeros(16_000, dtype=np.float32), 16_000)
+
+    def transcribe_chunk(_chunk: EncodedAudio) -> str:
+        raise AssertionError("kurze Dateien werden nicht geteilt")
+
+    assert (
+        maybe_transcribe_file_in_chunks(
+            audio_path, provider_name="groq", transcribe_chunk=transcribe_chunk
+        )
+        is None
+    )
+
+
+def test_maybe_transcribe_file_in_chunks_reads_long_files_as_16k_mono(
+    tmp_path, monkeypatch
+) -> None:
+    import numpy as np
+    import soundfile as sf
+
+    monkeypatch.setenv("PULSESCRIBE_CHUNK_SECONDS", "10")
+    monkeypatch.setenv("PULSESCRIBE_UPLOAD_CODEC", "wav")
+    stereo = np.stack([_speech_with_pauses(44_100, 19, pauses=[9.0])] * 2, axis=1)
+    audio_path = tmp_path / "long.flac"
+    sf.write(audio_path, stereo, 44_100)
+    chunks = []
+
+    def transcribe_chunk(chunk: EncodedAudio) -> str:
+        info = sf.info(io.BytesIO(chunk.data))
+        chunks.append((info.samplerate, info.channels, info.duration))
+        return f"teil{len(chunks)}"
+
+    text = maybe_transcribe_file_in_chunks(
+        audio_path, provider_name="openai", transcribe_chunk=transcribe_chunk
+    )
+
+    assert text is not None and len(text.split()) == 2
+    assert [(rate, channels) for rate, channels, _ in chunks] == [(16_000, 1)] * 2
+    assert 19.5 < sum(duration for *_, duration in chunks) < 20.5
@@ -1129,3 +1129,76 @@ def test_deepgram_stream_connection_omits_auto_language(monkeypatch):
     asyncio.run(_run())
 
     assert "language=" not in str(captured["url"])
+
+
+def _build_reading_test_client(observed: dict[str, object]) -> SimpleNamespace:
+    """Fake SDK client that reads the upload while the payload is still open."""
+
+    def fake_create(**kwargs):
+        filename, audio_file = kwargs["file"]
+        observed.update(filename=filename, payload=audio_file.read())
+        return SimpleNamespace(text="plain transcript")
+
+    def fake_transcribe_file(**kwargs):
+        observed.update(payload=kwargs["request"])
+        return SimpleNamespace(
+            results=SimpleNamespace(
+                channels=[SimpleNamespace(alternatives=[SimpleNamespace(transcript="plain transcript")])]
+            )
+        )
+
+    return SimpleNamespace(
+        audio=SimpleNamespace(transcriptions=SimpleNamespace(create=fake_create)),
+        listen=SimpleNamespace(
+            v1=SimpleNamespace(media=SimpleNamespace(transcribe_file=fake_transcribe_file))
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    ("module_path", "provider_class_name", "env_key"),
+    [
+        ("providers.openai", "OpenAIProvider", "OPENAI_API_KEY"),
+        ("providers.groq", "GroqProvider", "GROQ_API_KEY"),
+        ("providers.deepgram", "DeepgramProvider", "DEEPGRAM_API_KEY"),
+    ],
+    ids=["openai", "groq", "deepgram"],
+)
+def test_cloud_providers_transcribe_audio_uploads_from_memory(
+    monkeypatch,
+    module_path: str,
+    provider_class_name: str,
+    env_key: str,
+):
+    import io
+
+    import numpy as np
+    import soundfile as sf
+
+    module = __import__(module_path, fromlist=[provider_class_name])
+    provider_class = getattr(module, provider_class_name)
+    is_deepgram = module_path == "providers.deepgram"
+
+    observed: dict[str, object] = {}
+    monkeypatch.setattr(module, "_get_client", lambda: _build_reading_test_client(observed))
+    if is_deepgram:
+        monkeypatch.setattr(module, "load_vocabulary", lambda: {"keywords": []})
+    monkeypatch.setenv(env_key, "test-key")
+
+    def fail_mkstemp(*_args, **_kwargs):
+        raise AssertionError("transcribe_audio darf keine Temp-Datei anlegen")
+
+    monkeypatch.setattr("tempfile.mkstemp", fail_mkstemp)
+    monkeypatch.setattr(
+        "providers._audio_upload._disk_probe.ensure_started", lambda _payload: None
+    )
+
+    audio = np.full(800, 0.25, dtype=np.float32)
+    provider = provider_class()
+    assert provider.transcribe_audio(audio, sample_rate=8_000) == "plain transcript"
+
+    if not is_deepgram:
+        assert observed["filename"] == "audio.wav"
+    decoded, sample_rate = sf.read(io.BytesIO(observed["payload"]), dtype="float32")
+    assert sample_rate == 8_000
+    np.testing.assert_allclose(decoded, audio, atol=1 / 32_767)
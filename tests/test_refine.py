@@ -1,5 +1,6 @@
 """Tests für Refine-Logik – Provider/Model-Auswahl und Fallbacks."""
 
+import threading
 from types import SimpleNamespace
 from unittest.mock import Mock, call, patch
 
@@ -535,3 +536,403 @@ class TestRefineEdgeCases:
 
         assert result == "raw transcript"
         assert "Unbekannter Refine-Provider 'groqq'" in caplog.text
+
+
+# =============================================================================
+# Tests: Streaming-Refine
+# =============================================================================
+
+
+def _chat_chunks(*deltas):
+    return [
+        SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=d))])
+        for d in deltas
+    ] + [SimpleNamespace(choices=[])]  # Usage-Chunk ohne choices
+
+
+class TestRefineStreaming:
+    """Tests für stream_refine_transcript() und maybe_refine_transcript_streaming()."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("Hallo Welt. Wie geht", ("Hallo Welt. ", "Wie geht")),
+            ('Er sagte „Ja.“ Dann', ("Er sagte „Ja.“ ", "Dann")),
+            ("Version 3.5 ist", ("", "Version 3.5 ist")),
+            ("Liste:\n- eins", ("Liste:\n", "- eins")),
+            ("Fertig?", ("", "Fertig?")),
+        ],
+    )
+    def test_split_completed_sentences(self, text, expected):
+        from refine.llm import split_completed_sentences
+
+        assert split_completed_sentences(text) == expected
+
+    def test_groq_stream_emits_sentences_and_returns_full_text(self, clean_env):
+        from refine.llm import maybe_refine_transcript_streaming
+
+        emitted: list[str] = []
+        with patch("refine.llm._get_refine_client") as mock_client:
+            mock_client.return_value.chat.completions.create.return_value = iter(
+                _chat_chunks("\n Erster ", "Satz. Zwei", "ter Satz! Re", "st")
+            )
+
+            result = maybe_refine_transcript_streaming(
+                "roh",
+                on_sentences=emitted.append,
+                refine_provider="groq",
+                refine_model="openai/gpt-oss-120b",
+            )
+
+        call_kwargs = mock_client.return_value.chat.completions.create.call_args
+        assert call_kwargs[1]["stream"] is True
+        assert emitted == ["Erster Satz. ", "Zweiter Satz! "]
+        assert result.text == "Erster Satz. Zweiter Satz! Rest"
+        assert result.remainder == "Rest"
+        assert result.refined is True
+
+    def test_openai_stream_uses_output_text_deltas(self, clean_env):
+        from refine.llm import stream_refine_transcript
+
+        events = [
+            SimpleNamespace(type="response.created"),
+            SimpleNamespace(type="response.output_text.delta", delta="Hallo "),
+            SimpleNamespace(type="response.output_text.delta", delta="Welt."),
+            SimpleNamespace(type="response.completed"),
+        ]
+        with patch("refine.llm._get_refine_client") as mock_client:
+            mock_client.return_value.responses.create.return_value = iter(events)
+
+            deltas = list(
+                stream_refine_transcript("roh", provider="openai", model="gpt-5-mini")
+            )
+
+        call_kwargs = mock_client.return_value.responses.create.call_args
+        assert call_kwargs[1]["stream"] is True
+        assert call_kwargs[1]["reasoning"] == {"effort": "minimal"}
+        assert deltas == ["Hallo ", "Welt."]
+
+    def test_failure_before_first_sentence_returns_original(self, clean_env):
+        from refine.llm import maybe_refine_transcript_streaming
+
+        def broken_stream():
+            yield from _chat_chunks("Halber")
+            raise RuntimeError("Verbindung weg")
+
+        emitted: list[str] = []
+        with patch("refine.llm._get_refine_client") as mock_client:
+            mock_client.return_value.chat.completions.create.return_value = (
+                broken_stream()
+            )
+
+            result = maybe_refine_transcript_streaming(
+                "roh", on_sentences=emitted.append, refine_provider="groq"
+            )
+
+        assert emitted == []
+        assert result.text == "roh"
+        assert result.emitted == ""
+        assert result.refined is False
+
+    def test_failure_after_first_sentence_appends_raw_remainder(self, clean_env):
+        from refine.llm import maybe_refine_transcript_streaming
+
+        def broken_stream():
+            yield from _chat_chunks("Satz eins. Satz")
+            raise RuntimeError("Verbindung weg")
+
+        emitted: list[str] = []
+        with patch("refine.llm._get_refine_client") as mock_client:
+            mock_client.return_value.chat.completions.create.return_value = (
+                broken_stream()
+            )
+
+            result = maybe_refine_transcript_streaming(
+                "satz eins. satz zwei. satz drei",
+                on_sentences=emitted.append,
+                refine_provider="groq",
+            )
+
+        assert emitted == ["Satz eins. "]
+        assert result.text == "Satz eins. satz zwei. satz drei"
+        assert result.remainder == "satz zwei. satz drei"
+
+    @pytest.mark.parametrize(
+        "text,pasted,expected",
+        [
+            ("Eins. Zwei.", "", "Eins. Zwei."),
+            ("Eins. Zwei.", "Eins. ", "Zwei."),
+            # Endergebnis ist rechts getrimmt, der eingefügte Satz nicht
+            ("Eins.", "Eins. ", ""),
+            ("Anders.", "Eins. ", ""),
+        ],
+    )
+    def test_unpasted_remainder(self, text, pasted, expected):
+        from refine.llm import unpasted_remainder
+
+        assert unpasted_remainder(text, pasted) == expected
+
+    def test_missing_api_key_returns_original(self, monkeypatch, clean_env):
+        from refine.llm import maybe_refine_transcript_streaming
+
+        monkeypatch.delenv("GROQ_API_KEY", raising=False)
+        emitted: list[str] = []
+
+        result = maybe_refine_transcript_streaming(
+            "roh", on_sentences=emitted.append, refine_provider="groq"
+        )
+
+        assert emitted == []
+        assert result.text == "roh"
+
+
+class TestRefineCache:
+    """Refine-Cache in refine_transcript() und stream_refine_transcript()."""
+
+    def _groq_client(self, mock_client, text="Danke, bis bald!"):
+        mock_client.return_value.chat.completions.create.return_value = Mock(
+            choices=[Mock(message=Mock(content=text))]
+        )
+        return mock_client.return_value.chat.completions.create
+
+    def test_repeated_transcript_skips_llm_call(self, clean_env):
+        with patch("refine.llm._get_refine_client") as mock_client:
+            create = self._groq_client(mock_client)
+
+            first = refine_transcript("danke bis bald", provider="groq", prompt="P")
+            second = refine_transcript("danke  bis bald ", provider="groq", prompt="P")
+
+        assert first == second == "Danke, bis bald!"
+        assert create.call_count == 1
+
+    def test_prompt_change_and_use_cache_false_miss(self, clean_env):
+        with patch("refine.llm._get_refine_client") as mock_client:
+            create = self._groq_client(mock_client)
+
+            refine_transcript("danke bis bald", provider="groq", prompt="P")
+            refine_transcript("danke bis bald", provider="groq", prompt="P2")
+            refine_transcript(
+                "danke bis bald", provider="groq", prompt="P", use_cache=False
+            )
+
+        assert create.call_count == 3
+
+    def test_stream_populates_and_uses_cache(self, clean_env):
+        from refine.llm import stream_refine_transcript
+
+        with patch("refine.llm._get_refine_client") as mock_client:
+            create = mock_client.return_value.chat.completions.create
+            create.return_value = iter(_chat_chunks("Danke, ", "bis bald!"))
+
+            first = list(
+                stream_refine_transcript("danke bis bald", provider="groq", prompt="P")
+            )
+            second = list(
+                stream_refine_transcript("danke bis bald", provider="groq", prompt="P")
+            )
+
+        assert first == ["Danke, ", "bis bald!"]
+        assert second == ["Danke, bis bald!"]
+        assert create.call_count == 1
+
+
+class TestRefineHedging:
+    """Hedged Requests: zweiter Provider, wenn der erste zu lange braucht."""
+
+    @pytest.fixture
+    def hedge_env(self, clean_env, monkeypatch):
+        monkeypatch.setenv("PULSESCRIBE_REFINE_HEDGE_PROVIDER", "groq")
+        monkeypatch.setenv("PULSESCRIBE_REFINE_HEDGE_DELAY_MS", "100")
+        release = threading.Event()
+        yield release
+        release.set()
+
+    def _refine(self, primary, secondary):
+        executors = {
+            "openrouter": lambda *_args, **_kwargs: primary(),
+            "groq": lambda *_args, **_kwargs: secondary(),
+        }
+        with patch("refine.llm._get_refine_client"), patch.dict(
+            "refine.llm._REFINE_REQUEST_EXECUTORS", executors
+        ):
+            return refine_transcript(
+                "rohtext", provider="openrouter", prompt="P", use_cache=False
+            )
+
+    def test_slow_primary_is_hedged(self, hedge_env):
+        def slow():
+            hedge_env.wait(5)
+            return "langsam"
+
+        assert self._refine(slow, lambda: "schnell") == "schnell"
+
+    def test_fast_primary_does_not_hedge(self, hedge_env):
+        secondary = Mock(return_value="schnell")
+
+        assert self._refine(lambda: "primär", secondary) == "primär"
+        secondary.assert_not_called()
+
+    def test_primary_error_hedges_immediately(self, hedge_env, monkeypatch):
+        monkeypatch.setenv("PULSESCRIBE_REFINE_HEDGE_DELAY_MS", "30000")
+
+        def broken():
+            raise RuntimeError("503")
+
+        assert self._refine(broken, lambda: "ersatz") == "ersatz"
+
+    def test_both_failing_raises_primary_error(self, hedge_env):
+        def broken():
+            raise RuntimeError("primär kaputt")
+
+        def also_broken():
+            raise RuntimeError("sekundär kaputt")
+
+        with pytest.raises(RuntimeError, match="primär kaputt"):
+            self._refine(broken, also_broken)
+
+    def test_learned_p90_drives_hedge_delay(self, hedge_env, monkeypatch):
+        from refine.llm import _hedge_delay_seconds
+        from utils.refine_latency import get_refine_latency_stats
+
+        monkeypatch.setenv("PULSESCRIBE_REFINE_HEDGE_DELAY_MS", "2500")
+        assert _hedge_delay_seconds("openrouter", "m") == pytest.approx(2.5)
+
+        stats = get_refine_latency_stats()
+        for _ in range(10):
+            stats.record("openrouter", "m", 700.0)
+        assert 0.7 <= _hedge_delay_seconds("openrouter", "m") < 0.7 * 1.25
+
+    def test_same_target_disables_hedging(self, hedge_env, monkeypatch):
+        from refine.llm import _resolve_hedge_target
+
+        assert _resolve_hedge_target("groq", DEFAULT_REFINE_MODEL) is None
+        assert _resolve_hedge_target("openrouter", "x") == ("groq", DEFAULT_REFINE_MODEL)
+        monkeypatch.setenv("PULSESCRIBE_REFINE_HEDGE_PROVIDER", "unbekannt")
+        assert _resolve_hedge_target("openrouter", "x") is None
+
+
+class TestRefineLatencyBudget:
+    """maybe_refine_transcript(budget=...): Deadline, Downgrade, ohne LLM."""
+
+    def _budget(self, plan):
+        budget = Mock()
+        budget.plan_refine.return_value = plan
+        return budget
+
+    def test_local_plan_skips_llm(self, clean_env, monkeypatch):
+        from refine.llm import maybe_refine_transcript
+        from utils.latency_budget import RefinePlan
+
+        # Local Refine aktiv, Diktat aber zu lang für den reinen Lokal-Pfad
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_REFINE_MAX_WORDS", "1")
+        with patch("refine.llm.refine_transcript") as mock_refine:
+            result = maybe_refine_transcript(
+                "ähm bin gleich da Punkt",
+                refine=True,
+                budget=self._budget(RefinePlan("local", reason="Budget erschöpft")),
+            )
+
+        assert result == "Bin gleich da."
+        mock_refine.assert_not_called()
+
+    def test_local_plan_returns_raw_text_without_local_refine(self, clean_env):
+        from refine.llm import maybe_refine_transcript
+        from utils.latency_budget import RefinePlan
+
+        with patch("refine.llm.refine_transcript") as mock_refine:
+            result = maybe_refine_transcript(
+                "ähm bin gleich da Punkt",
+                refine=True,
+                budget=self._budget(RefinePlan("local", reason="Budget erschöpft")),
+            )
+
+        assert result == "ähm bin gleich da Punkt"
+        mock_refine.assert_not_called()
+
+    def test_downgrade_uses_fallback_model_and_deadline(self, clean_env, monkeypatch):
+        from refine.llm import maybe_refine_transcript
+        from utils.latency_budget import RefinePlan
+
+        monkeypatch.setenv("PULSESCRIBE_REFINE_FALLBACK_MODEL", "klein")
+        budget = self._budget(RefinePlan("downgrade", timeout_s=1.0, model="klein"))
+        with patch("refine.llm.refine_transcript", return_value="Fertig.") as mock_refine:
+            result = maybe_refine_transcript(
+                "fertig", refine=True, refine_provider="groq", budget=budget
+            )
+
+        assert result == "Fertig."
+        assert mock_refine.call_args.kwargs["model"] == "klein"
+        budget.plan_refine.assert_called_once_with(
+            "groq", DEFAULT_REFINE_MODEL, fallback_model="klein"
+        )
+
+    def test_missed_deadline_falls_back_to_local_cleanup(self, clean_env, monkeypatch):
+        from refine.llm import maybe_refine_transcript
+        from utils.latency_budget import RefinePlan
+
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_REFINE_MAX_WORDS", "1")
+
+        release = threading.Event()
+
+        def slow_refine(**_kwargs):
+            release.wait(5)
+            return "zu spät"
+
+        try:
+            with patch("refine.llm.refine_transcript", side_effect=slow_refine):
+                result = maybe_refine_transcript(
+                    "bin gleich da Punkt",
+                    refine=True,
+                    refine_provider="groq",
+                    budget=self._budget(RefinePlan("llm", timeout_s=0.05)),
+                )
+        finally:
+            release.set()
+
+        assert result == "bin gleich da."
+
+    def test_stream_paste_with_exhausted_budget_skips_llm(self, clean_env):
+        from refine.llm import maybe_refine_transcript_streaming
+        from utils.latency_budget import RefinePlan
+
+        emitted: list[str] = []
+        budget = self._budget(RefinePlan("local", reason="Budget erschöpft"))
+        with patch("refine.llm.stream_refine_transcript") as mock_stream:
+            result = maybe_refine_transcript_streaming(
+                "ähm bin gleich da Punkt",
+                on_sentences=emitted.append,
+                refine_provider="groq",
+                budget=budget,
+            )
+
+        assert result.text == "ähm bin gleich da Punkt"
+        assert not result.refined and emitted == []
+        mock_stream.assert_not_called()
+        budget.plan_refine.assert_called_once()
+
+    def test_stream_deadline_pastes_remainder_raw(self, clean_env):
+        from refine.llm import maybe_refine_transcript_streaming
+        from utils.latency_budget import RefinePlan
+
+        release = threading.Event()
+
+        def slow_stream(*_args, **_kwargs):
+            yield "Satz eins. "
+            release.wait(5)  # Provider hängt nach dem ersten Satz
+            yield "Satz zwei."
+
+        emitted: list[str] = []
+        try:
+            with patch("refine.llm.stream_refine_transcript", side_effect=slow_stream):
+                result = maybe_refine_transcript_streaming(
+                    "satz eins. satz zwei.",
+                    on_sentences=emitted.append,
+                    refine_provider="groq",
+                    budget=self._budget(RefinePlan("llm", timeout_s=0.2)),
+                )
+        finally:
+            release.set()
+
+        assert emitted == ["Satz eins. "]
+        assert result.text == "Satz eins. satz zwei."
+        assert result.remainder == "satz zwei."
@@ -0,0 +1,114 @@
+"""Tests für den Refine-Cache (utils/refine_cache.py)."""
+
+import json
+
+from utils.refine_cache import RefineCache, get_refine_cache, refine_cache_key
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_700_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_cache(tmp_path, clock=None, **kwargs) -> RefineCache:
+    return RefineCache(
+        tmp_path,
+        max_bytes=1 << 20,
+        ttl_seconds=3600.0,
+        clock=clock or FakeClock(),
+        **kwargs,
+    )
+
+
+def test_key_normalizes_whitespace_and_covers_prompt() -> None:
+    base = dict(prompt="Prompt A", provider="groq", model="openai/gpt-oss-120b")
+    key = refine_cache_key("Danke,  bis bald", **base)
+
+    assert refine_cache_key(" Danke, bis\nbald ", **base) == key
+    assert refine_cache_key("Danke, bis später", **base) != key
+    assert refine_cache_key("Danke,  bis bald", **{**base, "prompt": "Prompt B"}) != key
+    assert refine_cache_key("Danke,  bis bald", **{**base, "provider": "openai"}) != key
+    assert refine_cache_key("Danke,  bis bald", **{**base, "model": "gpt-5-mini"}) != key
+
+
+def test_memory_tier_then_disk_tier(tmp_path) -> None:
+    clock = FakeClock()
+    cache = make_cache(tmp_path, clock)
+
+    assert cache.get("k") is None
+    cache.put("k", "Danke, bis bald!")
+    assert cache.get("k") == "Danke, bis bald!"
+    assert cache.stats()["memory_hits"] == 1
+
+    # Neuer Prozess: RAM leer, Eintrag kommt von der Platte
+    restored = make_cache(tmp_path, clock)
+    assert restored.get("k") == "Danke, bis bald!"
+    assert restored.get("k") == "Danke, bis bald!"
+    stats = restored.stats()
+    assert stats["hits"] == 2
+    assert stats["memory_hits"] == 1
+    assert "Trefferquote 100%" in restored.describe()
+
+
+def test_ttl_expires_memory_and_disk_entries(tmp_path) -> None:
+    clock = FakeClock()
+    cache = make_cache(tmp_path, clock)
+    cache.put("k", "alt")
+
+    clock.now += 3601
+    assert cache.get("k") is None
+    assert not (tmp_path / "k.json").exists()
+    assert cache.hit_rate() == 0.0
+
+
+def test_memory_tier_is_bounded(tmp_path) -> None:
+    cache = make_cache(tmp_path, memory_entries=2)
+    for key in ("a", "b", "c"):
+        cache.put(key, key.upper())
+
+    assert cache.stats()["memory_entries"] == 2
+    assert cache.get("a") == "A"  # von der Platte nachgeladen
+    assert cache.stats()["memory_hits"] == 0
+
+
+def test_blank_results_and_corrupt_entries_are_ignored(tmp_path) -> None:
+    cache = make_cache(tmp_path)
+    cache.put("leer", "   ")
+    (tmp_path / "kaputt.json").write_text(json.dumps({"text": "x"}))
+
+    assert cache.get("leer") is None
+    assert cache.get("kaputt") is None
+
+
+def test_memory_only_cache_writes_nothing_to_disk(tmp_path) -> None:
+    cache = make_cache(tmp_path, persist=False)
+    cache.put("k", "Danke, bis bald!")
+
+    assert cache.get("k") == "Danke, bis bald!"
+    assert list(tmp_path.iterdir()) == []
+    assert make_cache(tmp_path, persist=False).get("k") is None
+
+
+def test_env_disables_cache(monkeypatch) -> None:
+    monkeypatch.setenv("PULSESCRIBE_REFINE_CACHE", "false")
+    assert get_refine_cache() is None
+
+    monkeypatch.setenv("PULSESCRIBE_REFINE_CACHE", "true")
+    monkeypatch.setenv("PULSESCRIBE_REFINE_CACHE_TTL_HOURS", "2")
+    cache = get_refine_cache()
+    assert cache is not None and cache.ttl_seconds == 7200.0
+    assert cache.persist
+
+
+def test_disk_tier_requires_explicit_opt_in(monkeypatch) -> None:
+    monkeypatch.delenv("PULSESCRIBE_REFINE_CACHE", raising=False)
+    cache = get_refine_cache()
+    assert cache is not None and not cache.persist
+
+    monkeypatch.setenv("PULSESCRIBE_REFINE_CACHE", "true")
+    monkeypatch.setenv("PULSESCRIBE_REFINE_CACHE_MB", "0")
+    cache = get_refine_cache()
+    assert cache is not None and not cache.persist
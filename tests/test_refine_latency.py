@@ -0,0 +1,55 @@
+"""Tests für die Refine-Latenz-Histogramme (utils/refine_latency.py)."""
+
+import pytest
+
+from utils.refine_latency import LatencyHistogram, RefineLatencyStats
+
+
+def test_quantile_needs_minimum_samples() -> None:
+    histogram = LatencyHistogram()
+    for _ in range(7):
+        histogram.record(500.0)
+    assert histogram.quantile(0.9) is None
+
+    histogram.record(500.0)
+    # Bucket-Obergrenze: höchstens Faktor 1,25 über der Messung
+    assert 500.0 <= histogram.quantile(0.9) < 500.0 * 1.25
+
+
+def test_p90_follows_tail_and_adapts() -> None:
+    histogram = LatencyHistogram()
+    for latency in [3000.0] + [400.0] * 9:
+        histogram.record(latency)
+    assert histogram.quantile(0.5) < 500.0
+    assert histogram.quantile(0.9) < 500.0
+    assert histogram.quantile(0.99) >= 3000.0
+
+    # Provider wird dauerhaft langsamer: alte Messungen verblassen
+    for _ in range(100):
+        histogram.record(2000.0)
+    assert histogram.quantile(0.9) == pytest.approx(2000.0, rel=0.25)
+
+
+def test_stats_roundtrip_per_provider_and_model(tmp_path) -> None:
+    path = tmp_path / "refine_latency.json"
+    stats = RefineLatencyStats(path)
+    for _ in range(10):
+        stats.record("groq", "m1", 300.0)
+        stats.record("openrouter", "m2", 1800.0)
+
+    restored = RefineLatencyStats(path)
+
+    assert restored.quantile("groq", "m1", 0.9) == stats.quantile("groq", "m1", 0.9)
+    assert restored.quantile("openrouter", "m2", 0.9) > 1500.0
+    assert restored.quantile("groq", "m2", 0.9) is None
+    assert "groq:m1" in restored.describe()
+
+
+def test_corrupt_file_is_ignored(tmp_path) -> None:
+    path = tmp_path / "refine_latency.json"
+    path.write_text("{not json")
+
+    stats = RefineLatencyStats(path)
+
+    assert stats.quantile("groq", "m1", 0.9) is None
+    assert stats.describe() == "Refine-Latenz p90: noch keine Daten"
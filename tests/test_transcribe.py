@@ -388,6 +388,7 @@ class TestTranscribeHelpers:
             "refine_model": "gpt-4.1-mini",
             "refine_provider": "groq",
             "context": "code",
+            "use_cache": True,
         }
 
     def test_maybe_refine_output_transcript_skips_non_text_output(self):
@@ -525,6 +526,7 @@ class TestTranscribeHelpers:
             refine_model="gpt-4.1-mini",
             refine_provider=RefineProvider.groq,
             context=Context.code,
+            use_cache=True,
         )
         mock_print.assert_called_once_with("fertig")
         mock_copy.assert_called_once_with("fertig")
@@ -0,0 +1,101 @@
+"""Tests für den Transkript-Cache (utils/transcript_cache.py)."""
+
+import os
+
+import numpy as np
+
+from utils.transcript_cache import (
+    TranscriptCache,
+    audio_array_digest,
+    file_digest,
+    get_transcript_cache,
+    transcript_cache_key,
+)
+
+
+def test_key_changes_with_every_input(tmp_path, monkeypatch) -> None:
+    import utils.transcript_cache as transcript_cache
+
+    monkeypatch.setattr(transcript_cache, "vocabulary_signature", lambda: "vocab-a")
+    base = dict(provider="groq", model="whisper-large-v3", language="de")
+    key = transcript_cache_key("audio", **base)
+
+    assert transcript_cache_key("audio", **base) == key
+    assert transcript_cache_key("other", **base) != key
+    assert transcript_cache_key("audio", **{**base, "provider": "openai"}) != key
+    assert transcript_cache_key("audio", **{**base, "model": "turbo"}) != key
+    assert transcript_cache_key("audio", **{**base, "language": "en"}) != key
+    assert transcript_cache_key("audio", **base, options={"response_format": "srt"}) != key
+
+    monkeypatch.setattr(transcript_cache, "vocabulary_signature", lambda: "vocab-b")
+    assert transcript_cache_key("audio", **base) != key
+
+
+def test_digests_depend_on_content(tmp_path) -> None:
+    first = tmp_path / "a.wav"
+    second = tmp_path / "b.wav"
+    first.write_bytes(b"same")
+    second.write_bytes(b"same")
+
+    assert file_digest(first) == file_digest(second)
+    second.write_bytes(b"diff")
+    assert file_digest(first) != file_digest(second)
+
+    audio = np.linspace(-1, 1, 1600, dtype=np.float32)
+    assert audio_array_digest(audio, 16000) == audio_array_digest(audio.copy(), 16000)
+    assert audio_array_digest(audio, 16000) != audio_array_digest(audio, 48000)
+
+
+def test_get_put_counts_hits_and_misses(tmp_path) -> None:
+    cache = TranscriptCache(tmp_path, max_bytes=1 << 20)
+
+    assert cache.get("k") is None
+    cache.put("k", "Hallo Welt")
+    assert cache.get("k") == "Hallo Welt"
+
+    assert cache.stats() == {"hits": 1, "misses": 1}
+    assert "1 Treffer" in cache.describe()
+
+
+def test_eviction_drops_least_recently_used(tmp_path) -> None:
+    cache = TranscriptCache(tmp_path, max_bytes=250)
+    for index, key in enumerate(("old", "used", "new")):
+        cache.put(key, "x" * 50)
+        os.utime(tmp_path / f"{key}.json", (1000 + index, 1000 + index))
+    os.utime(tmp_path / "used.json", (2000, 2000))  # wie nach cache.get()
+
+    cache.put("newest", "x" * 50)
+
+    assert cache.get("old") is None
+    assert cache.get("used") is not None
+    assert cache.get("newest") is not None
+
+
+def test_corrupt_entry_is_a_miss(tmp_path) -> None:
+    cache = TranscriptCache(tmp_path, max_bytes=1 << 20)
+    (tmp_path / "k.json").write_text("{kaputt")
+
+    assert cache.get("k") is None
+
+
+def test_env_disables_cache(monkeypatch) -> None:
+    monkeypatch.setenv("PULSESCRIBE_TRANSCRIPT_CACHE", "false")
+    assert get_transcript_cache() is None
+
+    monkeypatch.setenv("PULSESCRIBE_TRANSCRIPT_CACHE", "true")
+    monkeypatch.setenv("PULSESCRIBE_TRANSCRIPT_CACHE_MB", "0")
+    assert get_transcript_cache() is None
+
+    monkeypatch.setenv("PULSESCRIBE_TRANSCRIPT_CACHE_MB", "8")
+    cache = get_transcript_cache()
+    assert cache is not None and cache.max_bytes == 8 * 1024 * 1024
+
+
+def test_live_dictations_are_cached_only_on_explicit_opt_in(monkeypatch) -> None:
+    monkeypatch.delenv("PULSESCRIBE_TRANSCRIPT_CACHE", raising=False)
+    monkeypatch.setenv("PULSESCRIBE_TRANSCRIPT_CACHE_MB", "8")
+    assert get_transcript_cache() is not None
+    assert get_transcript_cache(live_dictation=True) is None
+
+    monkeypatch.setenv("PULSESCRIBE_TRANSCRIPT_CACHE", "true")
+    assert get_transcript_cache(live_dictation=True) is not None
@@ -618,12 +618,174 @@ def test_recording_loop_warm_collects_audio_during_stop_grace(monkeypatch):
 
     assert not worker.is_alive()
     with daemon._audio_lock:
-        audio_data = np.concatenate(daemon._audio_buffer)
+        audio_data = daemon._audio_buffer.read().reshape(-1)
 
     assert audio_data.shape[0] >= 2
     assert np.isclose(audio_data[-1], 2000 / 32767)
 
 
+def test_transcribe_rest_skips_silent_recording_without_provider_call():
+    import numpy as np
+
+    windows_module = _load_windows_module()
+    daemon = windows_module.PulseScribeWindows(
+        mode="openai",
+        streaming=False,
+        overlay=False,
+    )
+    daemon._reset_rest_audio_capture(16000)
+    silence = np.zeros(1600, dtype=np.int16).tobytes()
+    for _ in range(5):
+        daemon._append_warm_stream_chunk(silence, np, 32767)
+
+    no_speech: list[str] = []
+    daemon._handle_no_speech_result = lambda message="": no_speech.append(message)
+
+    def fail_transcribe(*_args, **_kwargs):
+        raise AssertionError("stille Aufnahme darf nicht transkribiert werden")
+
+    daemon._get_transcription_config = lambda _mode: (None, None)
+    daemon._get_provider = lambda _mode: types.SimpleNamespace(
+        transcribe=fail_transcribe, transcribe_audio=fail_transcribe
+    )
+
+    daemon._transcribe_rest()
+
+    assert len(no_speech) == 1
+    assert "Keine Sprache" in no_speech[0]
+    assert len(daemon._audio_buffer) == 0
+
+
+def test_silent_rest_capture_closes_local_streaming_session():
+    import numpy as np
+
+    windows_module = _load_windows_module()
+    daemon = windows_module.PulseScribeWindows(
+        mode="local",
+        streaming=False,
+        overlay=False,
+    )
+    daemon._reset_rest_audio_capture(16000)
+    silence = np.zeros(1600, dtype=np.int16).tobytes()
+    for _ in range(5):
+        daemon._append_warm_stream_chunk(silence, np, 32767)
+    session = types.SimpleNamespace(closed=0)
+    session.close = lambda: setattr(session, "closed", session.closed + 1)
+    daemon._audio_local_streaming = session
+    daemon._handle_no_speech_result = lambda message="": None
+    daemon._get_transcription_config = lambda _mode: (None, None)
+    daemon._get_provider = lambda _mode: types.SimpleNamespace(transcribe_audio=None)
+
+    daemon._transcribe_rest()
+
+    assert session.closed == 1
+    assert daemon._audio_local_streaming is None
+
+
+def test_local_warm_capture_resamples_to_whisper_rate_during_capture():
+    import numpy as np
+
+    windows_module = _load_windows_module()
+    daemon = windows_module.PulseScribeWindows(
+        mode="local",
+        streaming=False,
+        overlay=False,
+    )
+    daemon._reset_rest_audio_capture(48000)
+    t = np.arange(48000) / 48000
+    tone = (0.3 * np.sin(2 * np.pi * 440 * t) * 32767).astype(np.int16)
+    for block in np.array_split(tone, 50):
+        daemon._append_warm_stream_chunk(block.tobytes(), np, 32767)
+
+    # Während der Aufnahme liegt der Puffer schon in 16 kHz vor
+    assert daemon._audio_buffer.sample_rate == 16000
+    assert 15000 < len(daemon._audio_buffer) < 16000
+
+    received = []
+    daemon._get_transcription_config = lambda _mode: (None, None)
+    daemon._get_provider = lambda _mode: types.SimpleNamespace(
+        transcribe_audio=lambda audio, **_kwargs: received.append(audio) or "ok"
+    )
+    daemon._handle_result = lambda _text: None
+    daemon._maybe_refine = lambda text: text
+
+    daemon._transcribe_rest()
+
+    tail = int(16000 * windows_module._TAIL_PADDING_SEC)
+    assert len(received) == 1
+    assert received[0].shape == (16000 + tail,)
+    assert np.isclose(np.abs(received[0][:16000]).max(), 0.3, atol=0.01)
+
+
+def test_progressive_rest_capture_transcribes_segments_while_recording(
+    monkeypatch,
+):
+    import numpy as np
+
+    monkeypatch.setenv("PULSESCRIBE_PROGRESSIVE_TRANSCRIPTION", "true")
+    monkeypatch.setenv("PULSESCRIBE_PROGRESSIVE_MIN_SEGMENT_SECONDS", "2")
+    windows_module = _load_windows_module()
+    daemon = windows_module.PulseScribeWindows(
+        mode="openai",
+        streaming=False,
+        overlay=False,
+    )
+    uploads: list[float] = []
+
+    def transcribe_audio(audio, *, sample_rate, **_kwargs):
+        uploads.append(audio.shape[0] / sample_rate)
+        return f"segment{len(uploads)}"
+
+    daemon._get_transcription_config = lambda _mode: (None, None)
+    daemon._get_provider = lambda _mode: types.SimpleNamespace(
+        transcribe_audio=transcribe_audio
+    )
+    results: list[str] = []
+    daemon._handle_result = results.append
+    daemon._maybe_refine = lambda text: text
+
+    daemon._reset_rest_audio_capture(16000)
+    t = np.arange(16000 * 3) / 16000
+    speech = (0.2 * np.sin(2 * np.pi * 220 * t) * 32767).astype(np.int16)
+    pause = np.zeros(8000, dtype=np.int16)
+    for part in (speech, pause):
+        for block in np.array_split(part, len(part) // 320):
+            daemon._append_warm_stream_chunk(block.tobytes(), np, 32767)
+            daemon._poll_progressive_transcription()
+
+    # Erstes Segment läuft schon vor dem Stop
+    assert daemon._audio_progressive.segment_count == 1
+    for block in np.array_split(speech[:16000], 50):
+        daemon._append_warm_stream_chunk(block.tobytes(), np, 32767)
+
+    daemon._transcribe_rest()
+
+    assert results == ["segment1 segment2"]
+    assert len(uploads) == 2
+    assert uploads[1] < 1.5  # nach dem Stop nur noch der Rest
+
+
+def test_progressive_poll_runs_outside_audio_lock():
+    windows_module = _load_windows_module()
+    daemon = windows_module.PulseScribeWindows(
+        mode="openai",
+        streaming=False,
+        overlay=False,
+    )
+    lock_held: list[bool] = []
+
+    def poll(*_args):
+        # audio_callback darf während der Segment-/Fensterkopie nicht warten
+        lock_held.append(daemon._audio_lock.locked())
+
+    daemon._audio_progressive = types.SimpleNamespace(poll=poll)
+    daemon._audio_local_streaming = types.SimpleNamespace(poll=poll)
+
+    daemon._poll_progressive_transcription()
+
+    assert lock_held == [False, False]
+
+
 def test_rest_cold_capture_error_finishes_latency_run(monkeypatch):
     import builtins
 
@@ -1040,6 +1202,85 @@ def test_save_to_history_uses_actual_refinement_status(monkeypatch):
     assert saved_entries[1]["refined"] is True
 
 
+def test_stream_refine_pastes_sentences_before_result(monkeypatch):
+    monkeypatch.setenv("PULSESCRIBE_REFINE_STREAM_PASTE", "true")
+    windows_module = _load_windows_module()
+    daemon = windows_module.PulseScribeWindows(
+        mode="openai",
+        streaming=False,
+        overlay=False,
+        refine=True,
+    )
+    daemon._play_sound = lambda _name: None
+    daemon._save_to_history = lambda _transcript, **_kwargs: None
+    _patch_daemon_stdlib(monkeypatch, windows_module, "threading", Timer=_CapturedTimer)
+
+    import refine.llm as refine_llm
+
+    def fake_stream(transcript, **_kwargs):
+        assert transcript == "raw transcript"
+        yield from ("Erster Satz. ", "Zweiter ", "Satz. Rest")
+
+    monkeypatch.setattr(refine_llm, "stream_refine_transcript", fake_stream)
+    pasted: list[tuple[str, AppState]] = []
+    monkeypatch.setattr(
+        windows_module,
+        "paste_transcript",
+        lambda text: pasted.append((text, daemon.state)) or True,
+    )
+
+    refined = daemon._maybe_refine("raw transcript")
+    daemon._handle_result(refined)
+
+    assert refined == "Erster Satz. Zweiter Satz. Rest"
+    assert daemon._last_was_refined is True
+    assert pasted == [
+        ("Erster Satz. ", AppState.REFINING),
+        ("Zweiter Satz. ", AppState.REFINING),
+        ("Rest", AppState.DONE),
+    ]
+    assert daemon._stream_pasted_text == ""
+
+
+def test_stream_refine_respects_exhausted_latency_budget(monkeypatch):
+    from utils.latency_budget import LatencyBudget
+
+    monkeypatch.setenv("PULSESCRIBE_REFINE_STREAM_PASTE", "true")
+    windows_module = _load_windows_module()
+    daemon = windows_module.PulseScribeWindows(
+        mode="openai",
+        streaming=False,
+        overlay=False,
+        refine=True,
+    )
+    daemon._play_sound = lambda _name: None
+    daemon._save_to_history = lambda _transcript, **_kwargs: None
+    _patch_daemon_stdlib(monkeypatch, windows_module, "threading", Timer=_CapturedTimer)
+
+    import refine.llm as refine_llm
+
+    stream_calls: list[str] = []
+
+    def fake_stream(transcript, **_kwargs):
+        stream_calls.append(transcript)
+        yield "Verfeinert."
+
+    monkeypatch.setattr(refine_llm, "stream_refine_transcript", fake_stream)
+    pasted: list[str] = []
+    monkeypatch.setattr(
+        windows_module, "paste_transcript", lambda text: pasted.append(text) or True
+    )
+    daemon._latency_budget = LatencyBudget(0.0)
+
+    refined = daemon._maybe_refine("raw transcript")
+    daemon._handle_result(refined)
+
+    assert stream_calls == []
+    assert refined == "raw transcript"
+    assert daemon._last_was_refined is False
+    assert pasted == ["raw transcript"]
+
+
 def test_stop_recording_uses_run_snapshot_when_settings_change():
     windows_module = _load_windows_module()
     daemon = windows_module.PulseScribeWindows(
@@ -2150,3 +2391,55 @@ def test_ipc_snapshot_waits_for_ipc_state_lock():
 
     assert responses == [("old-cmd", "done")]
     assert daemon._ipc_test_cmd_id is None
+
+
+def test_warm_stream_start_trigger_uses_streaming_vad(monkeypatch):
+    import asyncio
+
+    import numpy as np
+
+    monkeypatch.setattr(
+        asyncio,
+        "WindowsSelectorEventLoopPolicy",
+        asyncio.DefaultEventLoopPolicy,
+        raising=False,
+    )
+    windows_module = _load_windows_module()
+    daemon = windows_module.PulseScribeWindows(
+        mode="deepgram",
+        streaming=True,
+        overlay=False,
+    )
+    captured = {}
+
+    class _FakeStream:
+        def start(self):
+            pass
+
+    def fake_create_stream(_sd, **kwargs):
+        captured["callback"] = kwargs["callback"]
+        return _FakeStream()
+
+    monkeypatch.setattr(windows_module, "get_sounddevice", lambda: object())
+    monkeypatch.setattr(windows_module, "get_input_device", lambda: (None, 16000))
+    monkeypatch.setattr(
+        windows_module, "create_low_latency_input_stream", fake_create_stream
+    )
+    entered = []
+    daemon._enter_recording_from_audio_callback = lambda: entered.append(True)
+    daemon._start_warm_stream()
+    callback = captured["callback"]
+
+    daemon._set_state(windows_module.AppState.LISTENING)
+    daemon._reset_warm_stream_vad()
+    daemon._warm_stream_armed.set()
+
+    # Zischen knapp über der RMS-Schwelle: hohe ZCR → keine Sprache
+    rng = np.random.default_rng(0)
+    hiss = (rng.standard_normal((320, 1)) * 0.004 * 32767).astype(np.int16)
+    callback(hiss, 320, None, None)
+    assert entered == []
+
+    tone = (np.sin(np.arange(320) * 2 * np.pi * 200 / 16000) * 0.05 * 32767)
+    callback(tone.astype(np.int16).reshape(-1, 1), 320, None, None)
+    assert entered == [True]
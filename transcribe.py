@@ -17,6 +17,7 @@ Usage:
     python transcribe.py audio.mp3
     python transcribe.py audio.mp3 --mode local
     python transcribe.py --record --copy
+    python transcribe.py meetings/ "extra/*.m4a" --mode groq   # Batch, JSON Lines
 """
 
 # Startup-Timing: Zeit erfassen BEVOR andere Imports laden
@@ -25,7 +26,7 @@ import time as _time_module  # noqa: E402 - muss vor anderen Imports sein
 _PROCESS_START = _time_module.perf_counter()
 
 import typer  # noqa: E402
-from typing import Annotated, NoReturn, TYPE_CHECKING  # noqa: E402
+from typing import Annotated, Any, NoReturn, TYPE_CHECKING  # noqa: E402
 import logging  # noqa: E402
 import os  # noqa: E402
 from dataclasses import dataclass  # noqa: E402
@@ -48,6 +49,8 @@ time = _time_module  # Alias für restlichen Code
 from config import (  # noqa: E402
     DEFAULT_REFINE_MODEL,
     VOCABULARY_FILE,
+    get_batch_workers,
+    get_local_batch_size,
 )
 
 from cli.types import (  # noqa: E402
@@ -56,6 +59,13 @@ from cli.types import (  # noqa: E402
     RefineProvider,
     ResponseFormat,
 )
+from cli.batch import (  # noqa: E402
+    BatchItemResult,
+    BatchSummary,
+    expand_audio_inputs,
+    is_batch_request,
+    run_batch,
+)
 from providers import DEFAULT_MODELS as _PROVIDER_DEFAULT_MODELS  # noqa: E402
 
 # Typer-App
@@ -79,6 +89,13 @@ from utils.logging import (  # noqa: E402
 from utils.env import load_environment, parse_bool  # noqa: E402
 from utils.timing import format_duration as _format_duration  # noqa: E402
 from utils.vocabulary import load_vocabulary as _load_vocabulary_shared  # noqa: E402
+from utils.transcript_cache import (  # noqa: E402
+    TranscriptCache,
+    file_digest,
+    get_transcript_cache,
+    transcript_cache_key,
+)
+from utils.refine_cache import get_refine_cache  # noqa: E402
 
 
 def copy_to_clipboard(text: str) -> bool:
@@ -424,6 +441,39 @@ def _package_for_import_error(exc: ImportError) -> str:
     return "openai-whisper"
 
 
+def _transcript_cache_entry(
+    audio_path: Path,
+    *,
+    mode: str,
+    model: str | None,
+    language: str | None,
+    response_format: str,
+) -> tuple[TranscriptCache, str] | None:
+    """Cache und Schlüssel für eine Datei (None = Cache aus oder Datei unlesbar)."""
+    cache = get_transcript_cache()
+    if cache is None:
+        return None
+    try:
+        audio_digest = file_digest(audio_path)
+    except OSError:
+        return None
+    options: dict[str, str | None] = {}
+    if mode == "openai":
+        options["response_format"] = response_format
+    elif mode == "local":
+        # Backend und lokales Modell ändern das Ergebnis, ohne im CLI-Modell aufzutauchen
+        options["backend"] = os.getenv("PULSESCRIBE_LOCAL_BACKEND")
+        options["local_model"] = os.getenv("PULSESCRIBE_LOCAL_MODEL")
+    key = transcript_cache_key(
+        audio_digest,
+        provider=mode,
+        model=model or _PROVIDER_DEFAULT_MODELS.get(mode),
+        language=language,
+        options=options,
+    )
+    return cache, key
+
+
 def _transcribe_with_cli_error_handling(
     audio_path: Path,
     *,
@@ -431,10 +481,32 @@ def _transcribe_with_cli_error_handling(
     model: str | None,
     language: str | None,
     response_format: str,
+    use_cache: bool = True,
 ) -> str:
-    """Run transcription and translate exceptions into user-facing CLI errors."""
+    """Run transcription and translate exceptions into user-facing CLI errors.
+
+    Bereits transkribierte Audiodaten kommen aus dem Transkript-Cache
+    (``--no-cache`` überspringt das Nachschlagen).
+    """
+    cache_entry = (
+        _transcript_cache_entry(
+            audio_path,
+            mode=mode,
+            model=model,
+            language=language,
+            response_format=response_format,
+        )
+        if use_cache
+        else None
+    )
+    if cache_entry is not None:
+        cache, key = cache_entry
+        cached = cache.get(key)
+        if cached is not None:
+            log("♻️  Transkript aus Cache (--no-cache für neue Transkription)")
+            return cached
     try:
-        return transcribe(
+        transcript = transcribe(
             audio_path,
             mode=mode,
             model=model,
@@ -447,6 +519,10 @@ def _transcribe_with_cli_error_handling(
         )
     except Exception as exc:
         _raise_cli_error(str(exc))
+    if cache_entry is not None:
+        cache, key = cache_entry
+        cache.put(key, transcript)
+    return transcript
 
 
 def _maybe_refine_output_transcript(
@@ -458,6 +534,7 @@ def _maybe_refine_output_transcript(
     refine_model: str | None,
     refine_provider: RefineProvider | None,
     context: Context | None,
+    use_cache: bool = True,
 ) -> str:
     """Apply refine only for plain-text output and keep skip logging in one place."""
     if response_format == ResponseFormat.text:
@@ -468,6 +545,7 @@ def _maybe_refine_output_transcript(
             refine_model=refine_model,
             refine_provider=refine_provider.value if refine_provider else None,
             context=context.value if context else None,
+            use_cache=use_cache,
         )
 
     if refine and not no_refine:
@@ -490,6 +568,7 @@ def _transcribe_and_maybe_refine(
     refine_model: str | None,
     refine_provider: RefineProvider | None,
     context: Context | None,
+    use_cache: bool = True,
 ) -> str:
     """Run the core CLI transcription pipeline with guaranteed temp cleanup."""
     try:
@@ -499,6 +578,7 @@ def _transcribe_and_maybe_refine(
             model=model,
             language=language,
             response_format=response_format.value,
+            use_cache=use_cache,
         )
     finally:
         _cleanup_temp_audio_file(temp_file)
@@ -511,6 +591,7 @@ def _transcribe_and_maybe_refine(
         refine_model=refine_model,
         refine_provider=refine_provider,
         context=context,
+        use_cache=use_cache,
     )
 
 
@@ -581,6 +662,7 @@ def _run_cli_pipeline(
     response_format: ResponseFormat,
     no_refine: bool,
     context: Context | None,
+    use_cache: bool = True,
 ) -> str:
     """Execute the resolved CLI request and return the final transcript."""
     audio_path, temp_file = _resolve_audio_source(audio, record=record)
@@ -596,6 +678,7 @@ def _run_cli_pipeline(
         refine_model=resolved.refine_model,
         refine_provider=resolved.refine_provider,
         context=context,
+        use_cache=use_cache,
     )
     print(transcript)
     _copy_transcript_to_clipboard_if_requested(
@@ -606,20 +689,161 @@ def _run_cli_pipeline(
 
 
 
+def _resolve_batch_workers(mode: str, workers: int | None) -> int:
+    """CLI > PULSESCRIBE_BATCH_WORKERS > Provider-Default; lokal immer seriell."""
+    if mode == "local":
+        if workers and workers > 1:
+            log("Hinweis: --workers wird im local-Modus ignoriert (ein Modell, gebatchte Inferenz)")
+        return 1
+    return workers or get_batch_workers(mode)
+
+
+def _emit_batch_result(result: BatchItemResult) -> None:
+    """JSON-Lines-Ergebnis auf stdout, Fehler zusätzlich auf stderr."""
+    print(result.to_json(), flush=True)
+    if not result.ok:
+        log(f"⚠️  {result.path}: {result.error}")
+
+
+def _run_batch_pipeline(
+    *,
+    inputs: list[Path],
+    copy_requested: bool,
+    resolved: _ResolvedCliOptions,
+    response_format: ResponseFormat,
+    no_refine: bool,
+    context: Context | None,
+    workers: int | None,
+) -> BatchSummary:
+    """Transkribiert mehrere Dateien mit einem gemeinsamen Provider."""
+    from providers import get_provider
+
+    if copy_requested:
+        raise typer.BadParameter("--copy ist im Batch-Modus nicht verfügbar")
+    try:
+        files = expand_audio_inputs(inputs)
+    except FileNotFoundError as exc:
+        _raise_cli_error(str(exc))
+    if not files:
+        _raise_cli_error("Keine Audiodateien gefunden")
+
+    mode = resolved.mode.value
+    try:
+        _validate_transcription_mode(mode)
+        # Ein Provider für alle Dateien: Client bzw. Modell nur einmal laden
+        provider = get_provider(mode)
+    except ImportError as exc:
+        _raise_cli_error(
+            f"Modul nicht installiert: pip install {_package_for_import_error(exc)}"
+        )
+    except Exception as exc:
+        _raise_cli_error(str(exc))
+    # dict[str, Any]: batch_size (int) kommt nur im Batch-Modus dazu
+    kwargs: dict[str, Any] = dict(
+        _build_provider_transcribe_kwargs(
+            mode,
+            provider,
+            model=resolved.model,
+            language=resolved.language,
+            response_format=response_format.value,
+        )
+    )
+    if mode == "local":
+        kwargs["batch_size"] = get_local_batch_size()
+    effective_workers = _resolve_batch_workers(mode, workers)
+
+    def transcribe_file(path: Path) -> str:
+        transcript = provider.transcribe(path, **kwargs)
+        return _maybe_refine_output_transcript(
+            transcript,
+            response_format=response_format,
+            refine=resolved.refine,
+            no_refine=no_refine,
+            refine_model=resolved.refine_model,
+            refine_provider=resolved.refine_provider,
+            context=context,
+        )
+
+    log(f"Batch: {len(files)} Dateien, mode={mode}, workers={effective_workers}")
+    summary = run_batch(
+        files,
+        transcribe_file,
+        workers=effective_workers,
+        on_result=_emit_batch_result,
+    )
+    log(f"Batch fertig: {summary.describe()}")
+    logger.info(f"[{_get_session_id()}] ✓ Batch: {summary.describe()}")
+    return summary
+
+
+def _run_local_autotune(
+    *,
+    model: str | None,
+    language: str | None,
+    fixture_path: Path | None,
+) -> None:
+    """Misst lokale Backend-Kombinationen und speichert das schnellste Profil."""
+    from cli.autotune import (
+        available_backends,
+        candidate_configs,
+        detect_device,
+        load_autotune_fixture,
+        profile_from_trial,
+        resolve_autotune_model,
+        run_autotune,
+    )
+    from utils.local_profile import save_local_profile
+
+    backends = available_backends()
+    if not backends:
+        _raise_cli_error("Kein lokales Backend installiert: pip install faster-whisper")
+    model_name = resolve_autotune_model(model)
+    candidates = candidate_configs(backends, device=detect_device())
+    try:
+        fixture = load_autotune_fixture(fixture_path)
+    except Exception as exc:
+        _raise_cli_error(f"Fixture nicht lesbar: {exc}")
+
+    log(
+        f"Autotune: Modell {model_name}, {len(candidates)} Kandidaten, "
+        f"Fixture {fixture_path or 'synthetisch'}"
+    )
+    result = run_autotune(
+        model_name,
+        fixture=fixture,
+        candidates=candidates,
+        language=language,
+        on_trial=lambda trial: log(f"  {trial.describe()}"),
+    )
+    if result.winner is None:
+        _raise_cli_error("Autotune: kein Kandidat lief erfolgreich")
+    profile = profile_from_trial(result.winner, model_name)
+    path = save_local_profile(profile)
+    log(f"Autotune: {profile.describe()} (RTF {profile.rtf:.3f}) → {path}")
+    print(path)
+
+
 def _log_cli_summary(transcript: str) -> None:
     """Emit a consistent end-of-run timing summary for the CLI."""
     total_ms = (time.perf_counter() - _PROCESS_START) * 1000
+    cache_summary = "".join(
+        f", {cache.describe()}"
+        for cache in (get_transcript_cache(), get_refine_cache())
+        if cache is not None and (cache.hits or cache.misses)
+    )
     logger.info(
         f"[{_get_session_id()}] ✓ Pipeline: {_format_duration(total_ms)}, "
-        f"{len(transcript)} Zeichen"
+        f"{len(transcript)} Zeichen{cache_summary}"
     )
 
 
 @app.command()
 def main(
     audio: Annotated[
-        Path | None,
-        typer.Argument(help="Pfad zur Audiodatei"),
+        list[Path] | None,
+        typer.Argument(
+            help="Audiodatei(en), Ordner oder Glob-Muster (mehrere → Batch mit JSON Lines)"
+        ),
     ] = None,
     record: Annotated[
         bool,
@@ -687,6 +911,31 @@ def main(
         Context | None,
         typer.Option(help="Kontext fuer LLM-Nachbearbeitung"),
     ] = None,
+    workers: Annotated[
+        int | None,
+        typer.Option(
+            "-j",
+            "--workers",
+            min=1,
+            max=64,
+            help="Parallele Dateien im Batch-Modus (default: je Provider)",
+        ),
+    ] = None,
+    no_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-cache",
+            help="Transkript- und Refine-Cache ignorieren und neu anfragen",
+        ),
+    ] = False,
+    autotune: Annotated[
+        bool,
+        typer.Option(
+            "--autotune",
+            help="Lokales Backend/Compute-Type/Threads messen und als Profil speichern "
+            "(optional: Audiodatei als Mess-Fixture)",
+        ),
+    ] = False,
 ) -> None:
     """Audio transkribieren mit Whisper, Deepgram oder Groq.
 
@@ -694,6 +943,8 @@ def main(
         transcribe.py audio.mp3
         transcribe.py audio.mp3 --mode local --model large
         transcribe.py --record --copy --language de
+        transcribe.py meetings/ --mode groq -j 2 > meetings.jsonl
+        transcribe.py --autotune --model turbo
     """
     load_environment()
     setup_logging(debug=_resolve_debug_logging_enabled(debug))
@@ -708,14 +959,37 @@ def main(
     )
 
     _log_cli_startup(resolved=resolved, record=record)
+    # Direkter Aufruf mit einem Pfad (statt Typer-Liste) bleibt möglich
+    inputs: list[Path] = [audio] if isinstance(audio, Path) else list(audio or [])
+    if autotune:
+        _run_local_autotune(
+            model=model,
+            language=resolved.language,
+            fixture_path=inputs[0] if inputs else None,
+        )
+        return
+    if inputs and not record and is_batch_request(inputs):
+        summary = _run_batch_pipeline(
+            inputs=inputs,
+            copy_requested=copy,
+            resolved=resolved,
+            response_format=response_format,
+            no_refine=no_refine,
+            context=context,
+            workers=workers,
+        )
+        if summary.failed:
+            raise typer.Exit(1)
+        return
     transcript = _run_cli_pipeline(
-        audio=audio,
+        audio=inputs[0] if inputs else None,
         record=record,
         copy_requested=copy,
         resolved=resolved,
         response_format=response_format,
         no_refine=no_refine,
         context=context,
+        use_cache=not no_cache,
     )
     _log_cli_summary(transcript)
 
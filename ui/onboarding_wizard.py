@@ -1621,7 +1621,9 @@ class OnboardingWizardController:
 
     @staticmethod
     def _apply_private_goal_choice() -> None:
-        apply_local_preset_to_env(default_local_preset_private())
+        apply_local_preset_to_env(
+            default_local_preset_private(), prefer_tuned_profile=True
+        )
 
     def _persist_selected_language(self) -> None:
         if not self._lang_popup:
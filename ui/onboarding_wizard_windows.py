@@ -1879,7 +1879,9 @@ class OnboardingWizardWindows(QDialog):
     def _apply_private_choice_preset(self) -> bool:
         from utils.presets import apply_local_preset_to_env, default_local_preset_private
 
-        changed = apply_local_preset_to_env(default_local_preset_private())
+        changed = apply_local_preset_to_env(
+            default_local_preset_private(), prefer_tuned_profile=True
+        )
         self._refresh_env_settings_cache()
         return changed
 
@@ -12,11 +12,18 @@ Dateiformat:
 
     [app_contexts]
     Mail = "email"
+
+    [local_rules.commands]
+    "neuer Punkt" = "\\n- "
+
+    [local_rules.fillers]
+    de = ["ähm", "äh"]
 """
 
 from __future__ import annotations
 
 from copy import deepcopy
+import json
 import logging
 import tomllib
 from pathlib import Path
@@ -221,6 +228,8 @@ def get_defaults() -> dict:
         "voice_commands": {"instruction": VOICE_COMMANDS_INSTRUCTION},
         "prompts": {ctx: {"prompt": text} for ctx, text in CONTEXT_PROMPTS.items()},
         "app_contexts": dict(DEFAULT_APP_CONTEXTS),
+        # Nur User-Overrides; die Default-Regeln liegen in refine.local_rules
+        "local_rules": {"commands": {}, "fillers": {}},
     }
 
 
@@ -285,6 +294,7 @@ def _merge_user_with_defaults(user_config: dict) -> dict:
         "voice_commands": _merge_voice_commands(user_config, defaults),
         "prompts": _merge_prompts(user_config, defaults),
         "app_contexts": _merge_app_contexts(user_config, defaults),
+        "local_rules": _merge_local_rules(user_config),
     }
 
 
@@ -322,6 +332,24 @@ def _merge_app_contexts(user: dict, defaults: dict) -> dict:
     return merged
 
 
+def _merge_local_rules(user: dict) -> dict:
+    """Lokale Regeln: gültige User-Einträge, Defaults ergänzt refine.local_rules."""
+    section = _get_section_mapping(user, "local_rules")
+    commands = {
+        str(phrase).strip(): replacement
+        for phrase, replacement in _coerce_mapping(section.get("commands")).items()
+        if str(phrase).strip() and isinstance(replacement, str)
+    }
+    fillers = {
+        str(language).strip().lower(): [
+            word.strip() for word in words if isinstance(word, str) and word.strip()
+        ]
+        for language, words in _coerce_mapping(section.get("fillers")).items()
+        if str(language).strip() and isinstance(words, list)
+    }
+    return {"commands": commands, "fillers": fillers}
+
+
 # =============================================================================
 # Getter (Public API)
 # =============================================================================
@@ -360,6 +388,11 @@ def get_app_contexts() -> dict[str, str]:
 get_custom_app_contexts = get_app_contexts
 
 
+def get_local_rule_overrides() -> dict:
+    """Gibt die User-Overrides für die lokale Regel-Engine zurück."""
+    return load_custom_prompts()["local_rules"]
+
+
 def get_prompt_editor_text(
     context: str,
     *,
@@ -568,6 +601,10 @@ def filter_overrides_for_storage(
     if app_contexts_result:
         result["app_contexts"] = app_contexts_result
 
+    local_rules = _merge_local_rules(data)
+    if local_rules["commands"] or local_rules["fillers"]:
+        result["local_rules"] = {key: value for key, value in local_rules.items() if value}
+
     return result
 
 
@@ -583,6 +620,7 @@ def _serialize_prompt_sections(data: dict) -> list[str]:
         ("voice_commands", _serialize_voice_commands),
         ("prompts", _serialize_prompts),
         ("app_contexts", _serialize_app_contexts),
+        ("local_rules", _serialize_local_rules),
     ):
         if section_name not in data:
             continue
@@ -658,6 +696,29 @@ def _serialize_app_contexts(app_contexts: dict) -> list[str]:
     return lines
 
 
+def _serialize_local_rules(local_rules: dict) -> list[str]:
+    """Serialisiert Local-Rules Sektion zu TOML-Zeilen."""
+    normalized = _merge_local_rules({"local_rules": local_rules})
+    lines = []
+    # JSON-Strings sind gültige TOML Basic Strings (gleiche Escapes)
+    if normalized["commands"]:
+        lines.append("[local_rules.commands]")
+        for phrase, replacement in sorted(normalized["commands"].items()):
+            lines.append(f"{_toml_string(phrase)} = {_toml_string(replacement)}")
+        lines.append("")
+    if normalized["fillers"]:
+        lines.append("[local_rules.fillers]")
+        for language, words in sorted(normalized["fillers"].items()):
+            items = ", ".join(_toml_string(word) for word in words)
+            lines.append(f"{_toml_string(language)} = [{items}]")
+        lines.append("")
+    return lines
+
+
+def _toml_string(text: str) -> str:
+    return json.dumps(text, ensure_ascii=False)
+
+
 def _escape_toml_multiline(text: str) -> str:
     """Escaped Text für TOML Multi-Line Strings.
 
@@ -698,6 +759,7 @@ __all__ = [
     "get_prompt_for_context",
     "get_voice_commands",
     "get_app_contexts",
+    "get_local_rule_overrides",
     # Getter (Aliase für Rückwärtskompatibilität)
     "get_custom_prompt_for_context",
     "get_custom_voice_commands",
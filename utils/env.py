@@ -3,6 +3,10 @@
 We use `.env` files (python-dotenv) plus runtime `os.environ` overrides.
 These helpers standardize parsing and avoid duplicated ad-hoc logic across modules.
 
+`getenv` additionally honours `env_overrides`: a context-local view that
+replaces all variables under a prefix without touching `os.environ` (used by
+the local model server to apply each client's settings per request).
+
 Precedence for load_environment (default `override_existing=False`):
 1) Process environment (`os.environ`)
 2) User config `.env` (`~/.pulsescribe/.env`)
@@ -14,14 +18,21 @@ from __future__ import annotations
 import logging
 import os
 from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
 from io import StringIO
 from pathlib import Path
+from typing import overload
 
 logger = logging.getLogger("pulsescribe")
 
 _TRUE_VALUES = {"1", "true", "yes", "on"}
 _FALSE_VALUES = {"0", "false", "no", "off"}
 _loaded_env_values: dict[str, str] = {}
+# (prefix, values): Variablen unter `prefix` kommen ausschließlich aus `values`
+_env_override: ContextVar[tuple[str, Mapping[str, str]] | None] = ContextVar(
+    "pulsescribe_env_override", default=None
+)
 
 
 def _remember_loaded_env_values(values: dict[str, str]) -> None:
@@ -270,9 +281,40 @@ def parse_bool(value: str | None) -> bool | None:
     return None
 
 
+@overload
+def getenv(name: str) -> str | None: ...
+
+
+@overload
+def getenv(name: str, default: str) -> str: ...
+
+
+def getenv(name: str, default: str | None = None) -> str | None:
+    """Like `os.getenv`, but honours an active `env_overrides` context."""
+    override = _env_override.get()
+    if override is not None and name.startswith(override[0]):
+        return override[1].get(name, default)
+    return os.getenv(name, default)
+
+
+@contextmanager
+def env_overrides(values: Mapping[str, str], *, prefix: str) -> Iterator[None]:
+    """Reads all `prefix` variables from `values` in the current context.
+
+    Variables under `prefix` that are missing from `values` count as unset,
+    even if `os.environ` has them. Other variables and other threads are not
+    affected; nothing is written to `os.environ`.
+    """
+    token = _env_override.set((prefix, dict(values)))
+    try:
+        yield
+    finally:
+        _env_override.reset(token)
+
+
 def get_env_bool(name: str) -> bool | None:
     """Returns bool from env or None if unset/invalid (with warning)."""
-    raw = os.getenv(name)
+    raw = getenv(name)
     if raw is None:
         return None
     parsed = parse_bool(raw)
@@ -289,7 +331,7 @@ def get_env_bool_default(name: str, default: bool) -> bool:
 
 def get_env_int(name: str) -> int | None:
     """Returns int from env or None if unset/invalid (with warning)."""
-    raw = os.getenv(name)
+    raw = getenv(name)
     if raw is None:
         return None
     try:
@@ -341,9 +383,11 @@ def load_environment(*, override_existing: bool = False) -> None:
 
 
 __all__ = [
+    "env_overrides",
     "get_env_bool",
     "get_env_bool_default",
     "get_env_int",
+    "getenv",
     "load_environment",
     "parse_env_line",
     "parse_env_line_with_dotenv",
@@ -0,0 +1,337 @@
+"""Push-Kanal für Interim-Transkripte.
+
+Bisher schrieben Deepgram-Streaming und Local-Streaming jedes Interim-Update
+in ``INTERIM_FILE`` (tmp + rename, gedrosselt auf ``INTERIM_THROTTLE_MS``),
+und Menübar/Overlay pollten die Datei per Timer. Die Anzeige hing damit
+Poll-Intervall + Throttle hinterher.
+
+``InterimChannel`` ist ein In-Process-Pub/Sub: Producer rufen ``publish()``,
+Abonnenten erhalten jedes Update sofort mit fortlaufender Sequenznummer
+(``InterimUpdate.seq``) und können veraltete Updates daran verwerfen. Die
+Interim-Datei bleibt nur als Fallback, solange niemand abonniert hat (CLI,
+externe Skripte).
+
+Für UIs in anderen Prozessen verteilt ``InterimBroadcastServer`` die Updates
+über einen lokalen Socket (Unix-Socket bzw. Named Pipe via
+``multiprocessing.connection``, Authkey in ``~/.pulsescribe``);
+``iter_interim_updates()`` ist die passende Client-Seite.
+
+Usage:
+    channel = get_interim_channel()
+    unsubscribe = channel.subscribe(lambda update: show(update.text))
+    channel.publish("Hallo Wel", session_id="a1b2")
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from config import USER_CONFIG_DIR
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Listener
+
+logger = logging.getLogger("pulsescribe.interim")
+
+_SOCKET_FILENAME = "interim.sock"
+_AUTHKEY_FILE = USER_CONFIG_DIR / "interim.key"
+
+
+@dataclass(frozen=True)
+class InterimUpdate:
+    """Ein Interim-Stand mit prozessweit fortlaufender Sequenznummer."""
+
+    seq: int
+    text: str
+    session_id: str = ""
+    timestamp: float = 0.0
+
+
+InterimSubscriber = Callable[[InterimUpdate], None]
+
+
+class InterimChannel:
+    """Thread-sicherer Pub/Sub für Interim-Text.
+
+    Abonnenten werden synchron im Thread des Producers aufgerufen (Deepgram-
+    Event-Loop, Local-Streaming-Worker) und müssen daher schnell zurückkehren
+    bzw. selbst an ihren UI-Thread übergeben. Fehler eines Abonnenten werden
+    geloggt und betreffen die anderen nicht.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscribers: dict[int, InterimSubscriber] = {}
+        self._next_token = 0
+        self._seq = 0
+        self._latest: InterimUpdate | None = None
+
+    def subscribe(
+        self, callback: InterimSubscriber, *, replay: bool = False
+    ) -> Callable[[], None]:
+        """Registriert ``callback``; liefert eine Funktion zum Abmelden.
+
+        Mit ``replay=True`` erhält der Abonnent sofort den letzten Stand.
+        """
+        with self._lock:
+            token = self._next_token
+            self._next_token += 1
+            self._subscribers[token] = callback
+            latest = self._latest
+        if replay and latest is not None:
+            self._deliver(callback, latest)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                self._subscribers.pop(token, None)
+
+        return unsubscribe
+
+    def has_subscribers(self) -> bool:
+        with self._lock:
+            return bool(self._subscribers)
+
+    def publish(self, text: str, *, session_id: str = "") -> InterimUpdate:
+        with self._lock:
+            self._seq += 1
+            update = InterimUpdate(
+                seq=self._seq,
+                text=text,
+                session_id=session_id,
+                timestamp=time.time(),
+            )
+            self._latest = update
+            subscribers = list(self._subscribers.values())
+        for callback in subscribers:
+            self._deliver(callback, update)
+        return update
+
+    def latest(self) -> InterimUpdate | None:
+        with self._lock:
+            return self._latest
+
+    def clear(self) -> None:
+        """Verwirft den letzten Stand (neue Aufnahme)."""
+        with self._lock:
+            self._latest = None
+
+    @staticmethod
+    def _deliver(callback: InterimSubscriber, update: InterimUpdate) -> None:
+        try:
+            callback(update)
+        except Exception as e:
+            logger.debug(f"Interim-Abonnent fehlgeschlagen: {e}")
+
+
+_channel = InterimChannel()
+
+
+def get_interim_channel() -> InterimChannel:
+    """Prozessweiter Interim-Channel."""
+    return _channel
+
+
+def publish_interim(
+    text: str,
+    *,
+    session_id: str = "",
+    fallback_file: Path | None = None,
+) -> None:
+    """Pusht ``text`` an Abonnenten; ohne Abonnenten in ``fallback_file``."""
+    channel = get_interim_channel()
+    if channel.has_subscribers() or fallback_file is None:
+        channel.publish(text, session_id=session_id)
+        return
+    from utils.atomic_io import write_text_atomic
+
+    write_text_atomic(fallback_file, text)
+
+
+# =============================================================================
+# Lokaler Socket für UIs außerhalb des Prozesses
+# =============================================================================
+
+
+def default_interim_address() -> str:
+    """Socket-Pfad (POSIX) bzw. Named-Pipe-Name (Windows)."""
+    if sys.platform == "win32":
+        user = os.getenv("USERNAME") or "user"
+        return rf"\\.\pipe\pulsescribe-interim-{user}"
+    return str(USER_CONFIG_DIR / _SOCKET_FILENAME)
+
+
+def _address_family(address: str) -> str:
+    return "AF_PIPE" if address.startswith("\\\\.\\pipe\\") else "AF_UNIX"
+
+
+def _load_authkey() -> bytes:
+    from providers.local_server import load_authkey
+
+    return load_authkey(_AUTHKEY_FILE)
+
+
+class InterimBroadcastServer:
+    """Verteilt Interim-Updates an verbundene Clients (ein Dict pro Update).
+
+    Ein Accept-Thread nimmt Clients an und schickt ihnen den letzten Stand;
+    ein Writer-Thread sendet neue Updates. Der Producer legt Updates nur in
+    eine Queue und wird von langsamen Clients nie blockiert.
+    """
+
+    def __init__(
+        self,
+        channel: InterimChannel | None = None,
+        *,
+        address: str | None = None,
+        authkey: bytes | None = None,
+    ) -> None:
+        self._channel = channel or get_interim_channel()
+        self.address = address or default_interim_address()
+        self._authkey = authkey if authkey is not None else _load_authkey()
+        # Verbindung -> zuletzt gesendete Sequenznummer
+        self._clients: dict = {}
+        self._clients_lock = threading.Lock()
+        self._updates: queue.SimpleQueue[InterimUpdate | None] = queue.SimpleQueue()
+        self._stop_event = threading.Event()
+        self._listener: Listener | None = None
+        self._unsubscribe: Callable[[], None] | None = None
+
+    def start(self) -> None:
+        from multiprocessing.connection import Listener
+
+        family = _address_family(self.address)
+        if family == "AF_UNIX":
+            Path(self.address).unlink(missing_ok=True)  # verwaister Socket
+        listener = Listener(self.address, family=family, authkey=self._authkey)
+        self._listener = listener
+        self._unsubscribe = self._channel.subscribe(self._updates.put)
+        threading.Thread(
+            target=self._accept_loop,
+            args=(listener,),
+            daemon=True,
+            name="InterimAccept",
+        ).start()
+        threading.Thread(
+            target=self._writer_loop, daemon=True, name="InterimWriter"
+        ).start()
+        logger.info(f"Interim-Socket bereit ({self.address})")
+
+    def stop(self) -> None:
+        if self._stop_event.is_set():
+            return
+        self._stop_event.set()
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+        self._updates.put(None)
+        from multiprocessing.connection import Client
+
+        try:  # accept() per Selbst-Verbindung wecken
+            Client(
+                self.address, family=_address_family(self.address), authkey=self._authkey
+            ).close()
+        except Exception:
+            pass
+        with self._clients_lock:
+            clients, self._clients = self._clients, {}
+        for conn in clients:
+            conn.close()
+
+    def client_count(self) -> int:
+        with self._clients_lock:
+            return len(self._clients)
+
+    def _accept_loop(self, listener: Listener) -> None:
+        from multiprocessing import AuthenticationError
+
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    conn = listener.accept()
+                except (OSError, EOFError, AuthenticationError) as e:
+                    if self._stop_event.is_set():
+                        break
+                    logger.debug(f"Interim-Socket: Verbindung abgelehnt: {e}")
+                    continue
+                if self._stop_event.is_set():
+                    conn.close()
+                    break
+                # Startzustand und Registrierung atomar zum Writer, damit
+                # kein Update dazwischen verloren geht
+                with self._clients_lock:
+                    latest = self._channel.latest()
+                    try:
+                        if latest is not None:
+                            conn.send(asdict(latest))
+                    except OSError:
+                        conn.close()
+                        continue
+                    self._clients[conn] = latest.seq if latest is not None else 0
+        finally:
+            listener.close()
+
+    def _writer_loop(self) -> None:
+        while True:
+            update = self._updates.get()
+            if update is None:
+                return
+            payload = asdict(update)
+            with self._clients_lock:
+                clients = [
+                    conn
+                    for conn, last_seq in self._clients.items()
+                    if update.seq > last_seq  # Startzustand war schon neuer
+                ]
+            for conn in clients:
+                try:
+                    conn.send(payload)
+                except OSError:
+                    with self._clients_lock:
+                        self._clients.pop(conn, None)
+                    conn.close()
+                    continue
+                with self._clients_lock:
+                    if conn in self._clients:
+                        self._clients[conn] = update.seq
+
+
+def iter_interim_updates(
+    address: str | None = None,
+    *,
+    authkey: bytes | None = None,
+) -> Iterator[InterimUpdate]:
+    """Client für ``InterimBroadcastServer``: liefert Updates bis zum Serverende."""
+    from multiprocessing.connection import Client
+
+    address = address or default_interim_address()
+    conn = Client(
+        address,
+        family=_address_family(address),
+        authkey=authkey if authkey is not None else _load_authkey(),
+    )
+    with conn:
+        while True:
+            try:
+                payload = conn.recv()
+            except (EOFError, OSError):
+                return
+            yield InterimUpdate(**payload)
+
+
+__all__ = [
+    "InterimBroadcastServer",
+    "InterimChannel",
+    "InterimUpdate",
+    "default_interim_address",
+    "get_interim_channel",
+    "iter_interim_updates",
+    "publish_interim",
+]
@@ -0,0 +1,427 @@
+"""Nutzungsadaptiver Keep-Alive für lokale Metal-Modelle (MLX/Lightning).
+
+Der feste Keep-Alive-Timer dekodierte alle ``LOCAL_KEEPALIVE_INTERVAL``
+Sekunden Stille – auch nachts und im Akkubetrieb. ``KeepaliveScheduler``
+lernt stattdessen den Diktat-Rhythmus und hält das Modell nur warm, wenn sich
+das lohnt:
+
+- **Pausen**: empirische Verteilung der Abstände zwischen Diktaten. Nach
+  ``idle`` Sekunden Ruhe: Anteil der längeren Pausen, die innerhalb des
+  nächsten Intervalls enden.
+- **Tageszeit**: Diktate pro Stunde (24 Bins, Halbwertszeit 14 Tage).
+- **Kosten/Nutzen**: warm halten, wenn ``P(Diktat) × Kaltstart-Aufpreis``
+  die Keep-Alive-Kosten übersteigt. Im Akkubetrieb zählen die Kosten
+  dreifach, bei Speicherdruck wird nicht gewärmt.
+
+Nach einer kalten Phase wird mit der längeren Preload-Dauer neu gewärmt
+(Shader-Cache ist dann vermutlich verworfen) – auch direkt beim
+Aufnahmestart, damit das Kompilieren parallel zur Aufnahme läuft.
+``stats()``/``describe()`` berichten verbrauchte Warmup-Zeit, davon
+verschwendete (kein Diktat folgte) und vermiedene Kaltstart-Latenz.
+
+Usage:
+    scheduler = KeepaliveScheduler(interval_s=60.0)
+    scheduler.record_dictation()               # bei jedem Aufnahmestart
+    decision = scheduler.decide()
+    if decision.warm:
+        ...keepalive(duration_s=decision.warmup_s)...
+        scheduler.record_keepalive(elapsed_ms, rewarm=decision.rewarm)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from utils.atomic_io import write_text_atomic
+
+logger = logging.getLogger("pulsescribe.keepalive")
+
+# Gelernte Pausen (die letzten N) und Mindestanzahl für die Schätzung
+_MAX_GAPS = 200
+_MIN_GAPS = 5
+# Ohne genug Historie: so lange nach der letzten Aktivität warm halten
+_BOOTSTRAP_HOT_SECONDS = 15 * 60
+_HOUR_HALF_LIFE_DAYS = 14.0
+# Pausen unter dieser Länge gehören zu einer Diktat-Serie, nicht zum Rhythmus
+_MIN_GAP_SECONDS = 5.0
+# Annahme bis zur ersten Messung: Kaltstart kostet ~1 s (Metal-Compilation)
+_DEFAULT_COLD_PENALTY_MS = 1000.0
+_DEFAULT_KEEPALIVE_MS = 100.0
+_EMA_ALPHA = 0.3
+_BATTERY_COST_FACTOR = 3.0
+# Kalt: nur gelegentlich neu bewerten (Tageszeit kann sich ändern)
+_COLD_CHECK_FACTOR = 5
+_PRESSURE_CACHE_SECONDS = 60.0
+_STATE_SAVE_INTERVAL_SECONDS = 300.0
+
+
+@dataclass(frozen=True)
+class SystemPressure:
+    """Energie- und Speicherzustand des Rechners."""
+
+    on_battery: bool = False
+    memory_pressure: bool = False
+
+
+@dataclass(frozen=True)
+class KeepaliveDecision:
+    """Ergebnis einer Bewertung: jetzt wärmen und wann erneut prüfen."""
+
+    warm: bool
+    rewarm: bool
+    probability: float
+    next_check_s: float
+    reason: str
+    warmup_s: float = 0.0
+
+
+def _run_quiet(cmd: list[str]) -> str:
+    try:
+        return subprocess.run(
+            cmd, capture_output=True, text=True, timeout=2.0, check=False
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def detect_system_pressure() -> SystemPressure:
+    """Akku-/Speicherdruck best-effort (macOS: pmset/sysctl, sonst psutil)."""
+    if sys.platform == "darwin":
+        on_battery = "Battery Power" in _run_quiet(["pmset", "-g", "batt"])
+        # 1 = normal, 2 = warn, 4 = critical
+        level = _run_quiet(["sysctl", "-n", "kern.memorystatus_vm_pressure_level"]).strip()
+        return SystemPressure(on_battery, level in ("2", "4"))
+    try:
+        import psutil
+
+        battery = psutil.sensors_battery()
+        return SystemPressure(
+            on_battery=bool(battery is not None and not battery.power_plugged),
+            memory_pressure=psutil.virtual_memory().percent >= 90,
+        )
+    except Exception:
+        return SystemPressure()
+
+
+class KeepaliveScheduler:
+    """Entscheidet, ob ein Keep-Alive gerade lohnt, und zählt Kosten/Nutzen.
+
+    Thread-safe: ``record_dictation`` kommt aus dem Hotkey-Pfad, ``decide``
+    und ``record_keepalive`` aus dem Keep-Alive-Thread.
+    """
+
+    def __init__(
+        self,
+        *,
+        interval_s: float,
+        state_path: Path | None = None,
+        min_probability: float = 0.0,
+        warmup_s: float = 0.1,
+        rewarm_s: float = 0.5,
+        pressure: Callable[[], SystemPressure] = detect_system_pressure,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Args:
+            interval_s: Abstand der Keep-Alives in der warmen Phase.
+            state_path: JSON-Datei für gelernte Pausen/Tageszeiten.
+            min_probability: Feste Schwelle; 0 = aus Kosten/Nutzen ableiten.
+            warmup_s: Audio-Dauer eines normalen Keep-Alive.
+            rewarm_s: Audio-Dauer nach einer kalten Phase (volle Compilation).
+        """
+        self.interval_s = interval_s
+        self._state_path = state_path
+        self._min_probability = min_probability
+        self._warmup_s = warmup_s
+        self._rewarm_s = rewarm_s
+        self._pressure_source = pressure
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._gaps: deque[float] = deque(maxlen=_MAX_GAPS)
+        self._hour_counts = [0.0] * 24
+        self._hour_decay_at = clock()
+        self._first_seen = clock()
+        self._last_dictation: float | None = None
+        self._last_warm: float | None = None
+        self._hot = True  # nach Preload ist das Modell warm
+        self._needs_rewarm = False
+        self._pressure: SystemPressure = SystemPressure()
+        self._pressure_at = -math.inf
+        self._saved_at = -math.inf
+        self._keepalive_ms_ema: float | None = None
+        self._cold_penalty_ms: float | None = None
+        self._pending_waste_ms = 0.0
+        # Zähler für stats()
+        self.keepalives = 0
+        self.rewarms = 0
+        self.skipped = 0
+        self.warmup_ms = 0.0
+        self.wasted_ms = 0.0
+        self.warm_dictations = 0
+        self.cold_dictations = 0
+        self.avoided_ms = 0.0
+        self._load_state()
+
+    # Lernen ------------------------------------------------------------------
+
+    def record_dictation(self, now: float | None = None) -> None:
+        """Aufnahmestart: Pause und Tageszeit lernen, Nutzen verbuchen."""
+        now = self._clock() if now is None else now
+        with self._lock:
+            if self._last_dictation is not None:
+                gap = now - self._last_dictation
+                if gap >= _MIN_GAP_SECONDS:
+                    self._gaps.append(gap)
+            if self._is_warm(now):
+                self.warm_dictations += 1
+                self.avoided_ms += self._penalty_ms()
+            else:
+                self.cold_dictations += 1
+                self._needs_rewarm = True
+            self._last_dictation = now
+            self._hot = True
+            self._decay_hours(now)
+            self._hour_counts[time.localtime(now).tm_hour] += 1.0
+            # Warmups seit dem letzten Diktat waren nicht umsonst
+            self._pending_waste_ms = 0.0
+            save = now - self._saved_at >= _STATE_SAVE_INTERVAL_SECONDS
+        if save:
+            self.save_state(now)
+
+    def record_keepalive(self, elapsed_ms: float, *, rewarm: bool = False) -> None:
+        """Gemessene Dauer eines Keep-Alive (rewarm = nach kalter Phase)."""
+        now = self._clock()
+        with self._lock:
+            self.keepalives += 1
+            self.warmup_ms += elapsed_ms
+            self._pending_waste_ms += elapsed_ms
+            self._last_warm = now
+            self._hot = True
+            self._needs_rewarm = False
+            if rewarm:
+                self.rewarms += 1
+                # Kaltstart-Aufpreis = Rewarm minus normaler Keep-Alive
+                baseline = self._keepalive_ms_ema or _DEFAULT_KEEPALIVE_MS
+                penalty = max(0.0, elapsed_ms - baseline)
+                self._cold_penalty_ms = (
+                    penalty
+                    if self._cold_penalty_ms is None
+                    else (1 - _EMA_ALPHA) * self._cold_penalty_ms + _EMA_ALPHA * penalty
+                )
+            else:
+                self._keepalive_ms_ema = (
+                    elapsed_ms
+                    if self._keepalive_ms_ema is None
+                    else (1 - _EMA_ALPHA) * self._keepalive_ms_ema + _EMA_ALPHA * elapsed_ms
+                )
+
+    # Entscheidung ------------------------------------------------------------
+
+    def decide(self, now: float | None = None) -> KeepaliveDecision:
+        """Bewertet, ob jetzt ein Keep-Alive laufen soll."""
+        now = self._clock() if now is None else now
+        pressure = self._current_pressure(now)
+        with self._lock:
+            probability = self._probability(now)
+            cost = self._keepalive_ms_ema or _DEFAULT_KEEPALIVE_MS
+            if pressure.on_battery:
+                cost *= _BATTERY_COST_FACTOR
+            threshold = self._min_probability or min(1.0, cost / max(1.0, self._penalty_ms()))
+            cold_check = self.interval_s * _COLD_CHECK_FACTOR
+
+            if pressure.memory_pressure:
+                decision = KeepaliveDecision(
+                    False, False, probability, cold_check, "Speicherdruck"
+                )
+            elif probability >= threshold:
+                rewarm = not self._is_warm(now)
+                decision = KeepaliveDecision(
+                    True,
+                    rewarm,
+                    probability,
+                    self.interval_s,
+                    "Diktat wahrscheinlich",
+                    warmup_s=self._rewarm_s if rewarm else self._warmup_s,
+                )
+            else:
+                decision = KeepaliveDecision(
+                    False,
+                    False,
+                    probability,
+                    cold_check,
+                    "Akku" if pressure.on_battery else "Diktat unwahrscheinlich",
+                )
+
+            if not decision.warm:
+                self.skipped += 1
+                if self._hot:
+                    # Übergang zu kalt: Warmups ohne folgendes Diktat = Verschwendung
+                    self._hot = False
+                    self.wasted_ms += self._pending_waste_ms
+                    self._pending_waste_ms = 0.0
+                    logger.info(
+                        f"Keep-Alive pausiert ({decision.reason}, "
+                        f"P={probability:.2f} < {threshold:.2f}); {self._describe_locked()}"
+                    )
+            elif decision.rewarm:
+                logger.info(f"Keep-Alive reaktiviert (P={probability:.2f})")
+        return decision
+
+    def wake_decision(self) -> KeepaliveDecision | None:
+        """Nach ``record_dictation``: sofort neu wärmen, wenn das Modell kalt war."""
+        with self._lock:
+            if not self._needs_rewarm or self._pressure.memory_pressure:
+                return None
+        return KeepaliveDecision(
+            True, True, 1.0, self.interval_s, "Aufnahmestart", warmup_s=self._rewarm_s
+        )
+
+    def probability(self, now: float | None = None) -> float:
+        """P(Diktat innerhalb des nächsten Intervalls)."""
+        now = self._clock() if now is None else now
+        with self._lock:
+            return self._probability(now)
+
+    def _probability(self, now: float) -> float:
+        if self._last_dictation is None:
+            idle = now - self._first_seen
+        else:
+            idle = now - self._last_dictation
+        if len(self._gaps) < _MIN_GAPS:
+            return 1.0 if idle < _BOOTSTRAP_HOT_SECONDS else 0.0
+        return max(self._gap_probability(idle), self._hour_probability(now))
+
+    def _gap_probability(self, idle: float) -> float:
+        """P(Pause endet in (idle, idle + Intervall] | Pause > idle)."""
+        longer = [gap for gap in self._gaps if gap > idle]
+        if not longer:
+            return 0.0
+        ending = sum(1 for gap in longer if gap <= idle + self.interval_s)
+        return ending / len(longer)
+
+    def _hour_probability(self, now: float) -> float:
+        """Poisson-Schätzung aus den Diktaten pro Tag in dieser Stunde."""
+        self._decay_hours(now)
+        days = max(1.0, min((now - self._first_seen) / 86400, _HOUR_HALF_LIFE_DAYS * 1.44))
+        rate_per_s = self._hour_counts[time.localtime(now).tm_hour] / days / 3600
+        return 1.0 - math.exp(-rate_per_s * self.interval_s)
+
+    def _decay_hours(self, now: float) -> None:
+        elapsed_days = (now - self._hour_decay_at) / 86400
+        if elapsed_days <= 0:
+            return
+        factor = 0.5 ** (elapsed_days / _HOUR_HALF_LIFE_DAYS)
+        self._hour_counts = [count * factor for count in self._hour_counts]
+        self._hour_decay_at = now
+
+    def _is_warm(self, now: float) -> bool:
+        last_use = max(
+            value for value in (self._last_warm, self._last_dictation, self._first_seen)
+            if value is not None
+        )
+        return self._hot and now - last_use <= self.interval_s * 1.5
+
+    def _penalty_ms(self) -> float:
+        return self._cold_penalty_ms if self._cold_penalty_ms is not None else _DEFAULT_COLD_PENALTY_MS
+
+    def _current_pressure(self, now: float) -> SystemPressure:
+        if now - self._pressure_at >= _PRESSURE_CACHE_SECONDS:
+            try:
+                self._pressure = self._pressure_source()
+            except Exception as e:
+                logger.debug(f"Systemzustand nicht ermittelbar: {e}")
+                self._pressure = SystemPressure()
+            self._pressure_at = now
+        return self._pressure
+
+    # Bericht & Persistenz ----------------------------------------------------
+
+    def stats(self) -> dict[str, float | int]:
+        with self._lock:
+            return {
+                "keepalives": self.keepalives,
+                "rewarms": self.rewarms,
+                "skipped": self.skipped,
+                "warmup_ms": round(self.warmup_ms, 1),
+                "wasted_ms": round(self.wasted_ms + self._pending_waste_ms, 1),
+                "warm_dictations": self.warm_dictations,
+                "cold_dictations": self.cold_dictations,
+                "avoided_ms": round(self.avoided_ms, 1),
+                "cold_penalty_ms": round(self._penalty_ms(), 1),
+                "learned_gaps": len(self._gaps),
+            }
+
+    def describe(self) -> str:
+        with self._lock:
+            return self._describe_locked()
+
+    def _describe_locked(self) -> str:
+        wasted = self.wasted_ms + self._pending_waste_ms
+        return (
+            f"Warmup {self.warmup_ms / 1000:.1f}s ({self.keepalives}x, davon "
+            f"{wasted / 1000:.1f}s ohne folgendes Diktat), Kaltstart vermieden "
+            f"{self.warm_dictations}x ≈ {self.avoided_ms / 1000:.1f}s, "
+            f"kalt gestartet {self.cold_dictations}x"
+        )
+
+    def _load_state(self) -> None:
+        if self._state_path is None:
+            return
+        try:
+            data = json.loads(self._state_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.debug(f"Keep-Alive-Statistik unlesbar, starte neu: {e}")
+            return
+        try:
+            self._gaps.extend(float(gap) for gap in data.get("gaps", []))
+            hours = [float(count) for count in data.get("hour_counts", [])]
+            if len(hours) == 24:
+                self._hour_counts = hours
+            self._hour_decay_at = float(data.get("hour_decay_at", self._hour_decay_at))
+            self._first_seen = min(self._first_seen, float(data.get("first_seen", self._first_seen)))
+            last = data.get("last_dictation")
+            self._last_dictation = float(last) if last is not None else None
+            penalty = data.get("cold_penalty_ms")
+            self._cold_penalty_ms = float(penalty) if penalty is not None else None
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Keep-Alive-Statistik ungültig, starte neu: {e}")
+
+    def save_state(self, now: float | None = None) -> None:
+        """Gelerntes Nutzungsprofil speichern (Fehler nur loggen)."""
+        if self._state_path is None:
+            return
+        now = self._clock() if now is None else now
+        with self._lock:
+            self._saved_at = now
+            data = {
+                "gaps": [round(gap, 1) for gap in self._gaps],
+                "hour_counts": [round(count, 4) for count in self._hour_counts],
+                "hour_decay_at": self._hour_decay_at,
+                "first_seen": self._first_seen,
+                "last_dictation": self._last_dictation,
+                "cold_penalty_ms": self._cold_penalty_ms,
+            }
+        try:
+            write_text_atomic(self._state_path, json.dumps(data) + "\n")
+        except OSError as e:
+            logger.debug(f"Keep-Alive-Statistik nicht gespeichert: {e}")
+
+
+__all__ = [
+    "KeepaliveDecision",
+    "KeepaliveScheduler",
+    "SystemPressure",
+    "detect_system_pressure",
+]
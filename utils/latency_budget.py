@@ -0,0 +1,211 @@
+"""Ende-zu-Ende-Latenzbudget für die Verarbeitung nach dem Aufnahme-Stopp.
+
+Nach dem Stopp laufen Transkription → Refine → Paste → History strikt
+nacheinander mit unabhängigen Timeouts (``TRANSCRIBING_TIMEOUT``,
+``LLM_REFINE_TIMEOUT``); im schlimmsten Fall greift erst der 45-s-Watchdog.
+``LatencyBudget`` gibt stattdessen eine Gesamtzeit vor
+(``PULSESCRIBE_LATENCY_BUDGET_MS``, z.B. "Text nach 2,5 s") und teilt dem
+Refine den Rest zu:
+
+- **LLM**: genug Zeit für die gelernte p90-Latenz des Modells
+  (``utils.refine_latency``) → Refine mit dem Restbudget als Deadline.
+- **Downgrade**: sonst das kleinere ``PULSESCRIBE_REFINE_FALLBACK_MODEL``,
+  falls dessen p90 noch passt.
+- **Lokal**: sonst nur die lokale Regel-Engine (Mikrosekunden).
+
+Überschreitet ein Diktat das Budget trotzdem (langsame Transkription,
+Paste), zählt ``finish()`` das als Budget-Verfehlung.
+
+Usage:
+    budget = start_latency_budget()           # beim Aufnahme-Stopp, None = aus
+    plan = budget.plan_refine("groq", model)  # im Worker vor dem Refine
+    ...
+    budget.finish()                           # nach dem Paste
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from utils.refine_latency import RefineLatencyStats, get_refine_latency_stats
+
+logger = logging.getLogger("pulsescribe.latency_budget")
+
+# Reserve für Paste und UI-Flush nach dem Refine
+_OUTPUT_RESERVE_S = 0.3
+# Darunter lohnt kein LLM-Aufruf mehr (Verbindungsaufbau allein)
+_MIN_REFINE_S = 0.2
+
+
+@dataclass(frozen=True)
+class RefinePlan:
+    """Entscheidung für das Refine eines Diktats.
+
+    ``action`` ist ``"llm"``, ``"downgrade"`` (mit ``model``) oder ``"local"``;
+    ``timeout_s`` ist die Deadline für den LLM-Aufruf.
+    """
+
+    action: str
+    timeout_s: float | None = None
+    model: str | None = None
+    reason: str = ""
+
+
+class LatencyBudget:
+    """Zeitbudget eines Diktats ab dem Aufnahme-Stopp (monotone Uhr)."""
+
+    def __init__(
+        self,
+        total_s: float,
+        *,
+        started_at: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        latency_stats: RefineLatencyStats | None = None,
+    ) -> None:
+        self.total_s = total_s
+        self._clock = clock
+        self.started_at = clock() if started_at is None else started_at
+        self._latency_stats = latency_stats
+        self._finished = False
+
+    def elapsed(self) -> float:
+        return self._clock() - self.started_at
+
+    def remaining(self) -> float:
+        return self.total_s - self.elapsed()
+
+    def _expected_s(self, provider: str, model: str) -> float | None:
+        stats = self._latency_stats or get_refine_latency_stats()
+        p90_ms = stats.quantile(provider, model, 0.9)
+        return p90_ms / 1000 if p90_ms is not None else None
+
+    def plan_refine(
+        self,
+        provider: str,
+        model: str,
+        *,
+        fallback_model: str | None = None,
+    ) -> RefinePlan:
+        """Teilt dem Refine das Restbudget zu (nach Abzug der Paste-Reserve)."""
+        plan = self._plan_refine(provider, model, fallback_model=fallback_model)
+        _stats.record_plan(plan)
+        return plan
+
+    def _plan_refine(
+        self,
+        provider: str,
+        model: str,
+        *,
+        fallback_model: str | None,
+    ) -> RefinePlan:
+        available = self.remaining() - _OUTPUT_RESERVE_S
+        if available < _MIN_REFINE_S:
+            return RefinePlan(
+                "local", reason=f"Budget erschöpft nach {self.elapsed():.2f}s"
+            )
+
+        expected = self._expected_s(provider, model)
+        if expected is None or expected <= available:
+            return RefinePlan("llm", timeout_s=available)
+
+        if fallback_model and fallback_model != model:
+            expected_fallback = self._expected_s(provider, fallback_model)
+            if expected_fallback is None or expected_fallback <= available:
+                return RefinePlan(
+                    "downgrade",
+                    timeout_s=available,
+                    model=fallback_model,
+                    reason=f"p90 {expected:.2f}s > Rest {available:.2f}s",
+                )
+
+        return RefinePlan(
+            "local", reason=f"p90 {expected:.2f}s > Rest {available:.2f}s"
+        )
+
+    def finish(self) -> bool:
+        """Schließt das Budget ab (einmalig); True bei Überschreitung."""
+        if self._finished:
+            return False
+        self._finished = True
+        elapsed = self.elapsed()
+        missed = elapsed > self.total_s
+        _stats.record(missed=missed)
+        if missed:
+            logger.warning(
+                f"Latenzbudget überschritten: {elapsed:.2f}s > {self.total_s:.2f}s "
+                f"({_stats.describe()})"
+            )
+        else:
+            logger.debug(f"Latenzbudget eingehalten: {elapsed:.2f}s ({_stats.describe()})")
+        return missed
+
+
+class BudgetStats:
+    """Prozessweite Zähler für eingehaltene und verfehlte Budgets."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.dictations = 0
+        self.misses = 0
+        self.downgrades = 0
+        self.local = 0
+
+    def record(self, *, missed: bool) -> None:
+        with self._lock:
+            self.dictations += 1
+            if missed:
+                self.misses += 1
+
+    def record_plan(self, plan: RefinePlan) -> None:
+        with self._lock:
+            if plan.action == "downgrade":
+                self.downgrades += 1
+            elif plan.action == "local":
+                self.local += 1
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "dictations": self.dictations,
+                "misses": self.misses,
+                "downgrades": self.downgrades,
+                "local": self.local,
+            }
+
+    def describe(self) -> str:
+        stats = self.stats()
+        return (
+            f"{stats['misses']}/{stats['dictations']} Budgets verfehlt, "
+            f"{stats['downgrades']}× kleineres Modell, {stats['local']}× nur lokal"
+        )
+
+
+_stats = BudgetStats()
+
+
+def get_budget_stats() -> BudgetStats:
+    """Prozessweite Budget-Statistik."""
+    return _stats
+
+
+def start_latency_budget(started_at: float | None = None) -> LatencyBudget | None:
+    """Budget ab jetzt (bzw. ``started_at``), None wenn nicht konfiguriert."""
+    from config import get_latency_budget_ms
+
+    budget_ms = get_latency_budget_ms()
+    if budget_ms <= 0:
+        return None
+    return LatencyBudget(budget_ms / 1000, started_at=started_at)
+
+
+__all__ = [
+    "BudgetStats",
+    "LatencyBudget",
+    "RefinePlan",
+    "get_budget_stats",
+    "start_latency_budget",
+]
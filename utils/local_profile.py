@@ -0,0 +1,135 @@
+"""Persisted per-machine runtime profile for local transcription.
+
+``transcribe.py --autotune`` measures backend/compute-type/thread combinations
+and stores the winner per model in ``~/.pulsescribe/local_profile.json``.
+``LocalProvider`` applies it for settings that are not set explicitly via env.
+A profile recorded on different hardware (synced config directory) is ignored.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import platform
+import time
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Any
+
+from utils.atomic_io import write_text_atomic
+
+logger = logging.getLogger("pulsescribe.local_profile")
+
+LOCAL_PROFILE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class LocalRuntimeProfile:
+    """Winning autotune configuration for one model on this machine."""
+
+    model: str
+    backend: str
+    device: str
+    compute_type: str | None = None
+    cpu_threads: int | None = None
+    num_workers: int | None = None
+    rtf: float | None = None
+    peak_memory_mb: float | None = None
+    tuned_at: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> LocalRuntimeProfile:
+        known = {field.name for field in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in known})
+
+    def describe(self) -> str:
+        parts = [f"{self.backend}/{self.device}"]
+        if self.compute_type:
+            parts.append(self.compute_type)
+        if self.cpu_threads is not None:
+            parts.append(f"threads={self.cpu_threads or 'auto'}")
+        if self.num_workers is not None:
+            parts.append(f"workers={self.num_workers}")
+        return ", ".join(parts)
+
+
+def machine_fingerprint() -> str:
+    """Identify the hardware a profile was measured on."""
+    return f"{platform.system()}-{platform.machine()}-{os.cpu_count() or 0}cpu"
+
+
+def default_local_profile_path() -> Path:
+    from config import LOCAL_PROFILE_FILE
+
+    return LOCAL_PROFILE_FILE
+
+
+def _read_profile_file(path: Path) -> dict[str, Any] | None:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Lokales Profil {path} unlesbar, ignoriere: {e}")
+        return None
+    if not isinstance(data, dict) or data.get("version") != LOCAL_PROFILE_VERSION:
+        return None
+    return data
+
+
+def load_local_profile(
+    model: str | None = None,
+    *,
+    path: Path | None = None,
+) -> LocalRuntimeProfile | None:
+    """Return the profile for ``model`` (or the latest tuned one) on this machine."""
+    path = path or default_local_profile_path()
+    data = _read_profile_file(path)
+    if data is None:
+        return None
+    if data.get("machine") != machine_fingerprint():
+        logger.debug(f"Lokales Profil {path} stammt von anderer Hardware, ignoriere")
+        return None
+    profiles = data.get("profiles") or {}
+    entry = profiles.get(model) if model else None
+    if entry is None:
+        entry = profiles.get(data.get("latest") or "")
+    if not isinstance(entry, dict):
+        return None
+    try:
+        return LocalRuntimeProfile.from_dict(entry)
+    except TypeError as e:
+        logger.warning(f"Lokales Profil {path} ungültig, ignoriere: {e}")
+        return None
+
+
+def save_local_profile(
+    profile: LocalRuntimeProfile,
+    *,
+    path: Path | None = None,
+) -> Path:
+    """Store ``profile`` next to profiles of other models measured on this machine."""
+    path = path or default_local_profile_path()
+    data = _read_profile_file(path)
+    if data is None or data.get("machine") != machine_fingerprint():
+        data = {"version": LOCAL_PROFILE_VERSION, "machine": machine_fingerprint(), "profiles": {}}
+    if not profile.tuned_at:
+        profile = LocalRuntimeProfile.from_dict({**profile.to_dict(), "tuned_at": time.time()})
+    data["profiles"][profile.model] = profile.to_dict()
+    data["latest"] = profile.model
+    write_text_atomic(path, json.dumps(data, indent=2, ensure_ascii=False) + "\n")
+    return path
+
+
+__all__ = [
+    "LOCAL_PROFILE_VERSION",
+    "LocalRuntimeProfile",
+    "default_local_profile_path",
+    "load_local_profile",
+    "machine_fingerprint",
+    "save_local_profile",
+]
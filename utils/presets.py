@@ -271,11 +271,42 @@ def _merge_local_preset_values(preset_values: dict[str, str]) -> dict[str, str]:
     return values
 
 
-def apply_local_preset_to_env(preset_name: str) -> bool:
-    """Applies a local preset directly to `.env` via preferences helpers."""
+# Settings covered by an autotune profile (see utils.local_profile)
+TUNED_PROFILE_ENV_KEYS = (
+    "PULSESCRIBE_LOCAL_BACKEND",
+    "PULSESCRIBE_DEVICE",
+    "PULSESCRIBE_LOCAL_COMPUTE_TYPE",
+    "PULSESCRIBE_LOCAL_CPU_THREADS",
+    "PULSESCRIBE_LOCAL_NUM_WORKERS",
+)
+
+
+def _has_tuned_local_profile(preset_values: dict[str, str]) -> bool:
+    from utils.local_profile import load_local_profile
+
+    try:
+        return load_local_profile(preset_values.get("local_model")) is not None
+    except Exception:
+        return False
+
+
+def apply_local_preset_to_env(
+    preset_name: str,
+    *,
+    prefer_tuned_profile: bool = False,
+) -> bool:
+    """Applies a local preset directly to `.env` via preferences helpers.
+
+    With ``prefer_tuned_profile`` (onboarding) the preset leaves backend,
+    device, compute type and thread settings unset when this machine has an
+    autotune profile, so the measured values apply instead of static ones.
+    """
     preset_values = LOCAL_PRESETS.get(preset_name)
     if not preset_values:
         return False
 
-    update_env_settings(_build_local_preset_env_updates(preset_values))
+    env_updates = _build_local_preset_env_updates(preset_values)
+    if prefer_tuned_profile and _has_tuned_local_profile(preset_values):
+        env_updates.update(dict.fromkeys(TUNED_PROFILE_ENV_KEYS))
+    update_env_settings(env_updates)
     return True
@@ -0,0 +1,235 @@
+"""Two-tier cache for LLM refine results.
+
+Short, recurring dictations ("Thanks, talk soon", sign-offs, standard
+replies) otherwise cost a full LLM round-trip every time. Results are kept
+in a small in-memory LRU and, only when ``PULSESCRIBE_REFINE_CACHE=true`` is
+set explicitly, as plaintext JSON files under ``~/.pulsescribe/cache/refine``
+(size-bounded like the transcript cache).
+
+The key covers the whitespace-normalized transcript, the fully resolved
+prompt, provider and model. The resolved prompt already contains the
+context prompt and voice commands from ``~/.pulsescribe/prompts.toml``, so
+editing a prompt misses the cache for exactly the affected contexts. A TTL
+additionally retires entries produced by older model revisions.
+
+Usage:
+    cache = get_refine_cache()
+    if cache is not None:
+        key = refine_cache_key(transcript, prompt=p, provider="groq", model=m)
+        text = cache.get(key)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+
+from utils.atomic_io import write_text_atomic
+from utils.transcript_cache import TranscriptCache
+
+logger = logging.getLogger("pulsescribe.refine_cache")
+
+# Erhöhen, wenn sich Schlüssel- oder Eintragsformat ändert
+REFINE_CACHE_VERSION = 1
+_MEMORY_ENTRIES = 128
+
+
+def normalize_refine_input(transcript: str) -> str:
+    """Collapse whitespace so re-dictations with different spacing share a key."""
+    return " ".join(transcript.split())
+
+
+def refine_cache_key(
+    transcript: str,
+    *,
+    prompt: str,
+    provider: str,
+    model: str,
+) -> str:
+    """Combine everything that can change a refine result into one key."""
+    payload = json.dumps(
+        {
+            "version": REFINE_CACHE_VERSION,
+            "transcript": normalize_refine_input(transcript),
+            "prompt": hashlib.sha256(prompt.encode()).hexdigest(),
+            "provider": provider,
+            "model": model,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class RefineCache(TranscriptCache):
+    """In-memory LRU in front of a size-bounded on-disk cache, with TTL.
+
+    Disk layout and LRU eviction by mtime are shared with
+    :class:`~utils.transcript_cache.TranscriptCache`. With ``persist=False``
+    only the memory tier is used.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        max_bytes: int,
+        ttl_seconds: float,
+        memory_entries: int = _MEMORY_ENTRIES,
+        persist: bool = True,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        super().__init__(directory, max_bytes=max_bytes)
+        self.ttl_seconds = ttl_seconds
+        self.persist = persist
+        self.memory_entries = memory_entries
+        self.memory_hits = 0
+        self._clock = clock
+        self._memory: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    def _expired(self, created: float) -> bool:
+        return self._clock() - created > self.ttl_seconds
+
+    def _remember(self, key: str, created: float, text: str) -> None:
+        self._memory[key] = (created, text)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if not self._expired(entry[0]):
+                    self._memory.move_to_end(key)
+                    self.memory_hits += 1
+                    self.hits += 1
+                    return entry[1]
+                del self._memory[key]
+            if not self.persist:
+                self.misses += 1
+                return None
+
+        path = self._entry_path(key)
+        text: str | None = None
+        created = 0.0
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            text = data["text"]
+            created = float(data["created"])
+            if not isinstance(text, str):
+                raise ValueError("text is not a string")
+        except FileNotFoundError:
+            text = None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Refine-Cache-Eintrag {path.name} unlesbar, ignoriere: {e}")
+            text = None
+        if text is not None and self._expired(created):
+            path.unlink(missing_ok=True)  # veraltet (TTL)
+            text = None
+
+        with self._lock:
+            if text is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, created, text)
+        try:
+            os.utime(path)  # LRU auf der Platte: Zugriff zählt als Nutzung
+        except OSError:
+            pass
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        if not isinstance(text, str) or not text.strip():
+            return
+        created = self._clock()
+        with self._lock:
+            self._remember(key, created, text)
+        if not self.persist:
+            return
+        payload = json.dumps({"text": text, "created": created}, ensure_ascii=False)
+        try:
+            write_text_atomic(self._entry_path(key), payload + "\n")
+        except OSError as e:
+            logger.debug(f"Refine-Ergebnis nicht gecacht: {e}")
+            return
+        self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+        super().clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "memory_hits": self.memory_hits,
+                "misses": self.misses,
+                "memory_entries": len(self._memory),
+            }
+
+    def hit_rate(self) -> float:
+        stats = self.stats()
+        total = stats["hits"] + stats["misses"]
+        return stats["hits"] / total if total else 0.0
+
+    def describe(self) -> str:
+        stats = self.stats()
+        return (
+            f"Refine-Cache: {stats['hits']} Treffer "
+            f"({stats['memory_hits']} aus RAM), {stats['misses']} neu, "
+            f"Trefferquote {self.hit_rate():.0%}"
+        )
+
+
+_cache_lock = threading.Lock()
+_cache_instance: RefineCache | None = None
+
+
+def get_refine_cache() -> RefineCache | None:
+    """Shared cache for this process, or None when disabled via env.
+
+    The disk tier is only used with an explicit ``PULSESCRIBE_REFINE_CACHE=true``
+    and a non-zero ``PULSESCRIBE_REFINE_CACHE_MB``.
+    """
+    global _cache_instance
+    import config
+
+    if not config.get_refine_cache_enabled():
+        return None
+    max_mb = config.get_refine_cache_max_mb()
+    persist = config.get_refine_cache_persistent() and max_mb > 0
+    directory = config.REFINE_CACHE_DIR
+    ttl_seconds = config.get_refine_cache_ttl_hours() * 3600.0
+    with _cache_lock:
+        instance = _cache_instance
+        if instance is None or instance.directory != directory:
+            instance = RefineCache(
+                directory,
+                max_bytes=max_mb * 1024 * 1024,
+                ttl_seconds=ttl_seconds,
+                persist=persist,
+            )
+            _cache_instance = instance
+        else:
+            instance.max_bytes = max_mb * 1024 * 1024
+            instance.ttl_seconds = ttl_seconds
+            instance.persist = persist
+        return instance
+
+
+__all__ = [
+    "REFINE_CACHE_VERSION",
+    "RefineCache",
+    "get_refine_cache",
+    "normalize_refine_input",
+    "refine_cache_key",
+]
@@ -0,0 +1,181 @@
+"""Latenz-Histogramme pro Refine-Provider und -Modell.
+
+Grundlage für Hedged Requests (``refine.llm``): Antwortet der primäre
+Provider nicht innerhalb seiner üblichen p90-Latenz, lohnt sich eine zweite
+Anfrage an einen anderen Provider. ``LatencyHistogram`` zählt Antwortzeiten
+in logarithmischen Buckets (50 ms bis 60 s, Faktor 1,25); ältere Messungen
+verlieren mit jeder neuen an Gewicht, damit sich die Schätzung an
+Tagesform und Modellwechsel der Provider anpasst.
+
+Die Histogramme liegen in ``~/.pulsescribe/refine_latency.json``, damit
+auch kurzlebige CLI-Aufrufe von früheren Messungen profitieren.
+
+Usage:
+    stats = get_refine_latency_stats()
+    stats.record("groq", "openai/gpt-oss-120b", 820.0)
+    delay_ms = stats.quantile("groq", "openai/gpt-oss-120b", 0.9)  # None = zu wenig Daten
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import threading
+from pathlib import Path
+
+from utils.atomic_io import write_text_atomic
+
+logger = logging.getLogger("pulsescribe.refine_latency")
+
+# Erhöhen, wenn sich Bucket-Grenzen oder Dateiformat ändern
+REFINE_LATENCY_VERSION = 1
+_MIN_MS = 50.0
+_MAX_MS = 60_000.0
+_BUCKET_FACTOR = 1.25
+# Gewicht alter Messungen pro neuer Messung (~35 Messungen Gedächtnis)
+_DECAY = 0.97
+# Mindestanzahl Messungen, bevor ein Quantil als gelernt gilt
+_MIN_SAMPLES = 8
+
+
+def _bucket_edges() -> tuple[float, ...]:
+    edges = [_MIN_MS]
+    while edges[-1] < _MAX_MS:
+        edges.append(edges[-1] * _BUCKET_FACTOR)
+    return tuple(edges)
+
+
+_EDGES = _bucket_edges()
+
+
+class LatencyHistogram:
+    """Abklingendes Histogramm über logarithmische Latenz-Buckets.
+
+    ``counts[i]`` zählt Messungen bis ``_EDGES[i]`` ms; das letzte Bucket
+    nimmt alles darüber auf. Quantile liefern die Obergrenze des Buckets,
+    sind also höchstens um den Bucket-Faktor zu pessimistisch.
+    """
+
+    def __init__(self, counts: list[float] | None = None, samples: int = 0) -> None:
+        if counts is None or len(counts) != len(_EDGES):
+            counts, samples = [0.0] * len(_EDGES), 0
+        self.counts = counts
+        self.samples = samples
+
+    def record(self, latency_ms: float) -> None:
+        self.counts = [count * _DECAY for count in self.counts]
+        index = min(bisect.bisect_left(_EDGES, latency_ms), len(_EDGES) - 1)
+        self.counts[index] += 1.0
+        self.samples += 1
+
+    def quantile(self, q: float) -> float | None:
+        """Latenz in ms, unter der ``q`` der (gewichteten) Messungen liegen."""
+        if self.samples < _MIN_SAMPLES:
+            return None
+        target = q * sum(self.counts)
+        cumulative = 0.0
+        for edge, count in zip(_EDGES, self.counts):
+            cumulative += count
+            if cumulative >= target:
+                return edge
+        return _EDGES[-1]
+
+
+def _stats_key(provider: str, model: str) -> str:
+    return f"{provider}:{model}"
+
+
+class RefineLatencyStats:
+    """Thread-sichere Sammlung von Histogrammen pro Provider und Modell."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._load()
+
+    def record(self, provider: str, model: str, latency_ms: float) -> None:
+        with self._lock:
+            histogram = self._histograms.setdefault(
+                _stats_key(provider, model), LatencyHistogram()
+            )
+            histogram.record(latency_ms)
+            payload = self._serialize_locked()
+        self._save(payload)
+
+    def quantile(self, provider: str, model: str, q: float) -> float | None:
+        with self._lock:
+            histogram = self._histograms.get(_stats_key(provider, model))
+            return histogram.quantile(q) if histogram is not None else None
+
+    def describe(self) -> str:
+        with self._lock:
+            parts = [
+                f"{key} {p90:.0f} ms"
+                for key, histogram in sorted(self._histograms.items())
+                if (p90 := histogram.quantile(0.9)) is not None
+            ]
+        return "Refine-Latenz p90: " + (", ".join(parts) if parts else "noch keine Daten")
+
+    def _serialize_locked(self) -> str:
+        return json.dumps(
+            {
+                "version": REFINE_LATENCY_VERSION,
+                "histograms": {
+                    key: {
+                        "counts": [round(count, 4) for count in histogram.counts],
+                        "samples": histogram.samples,
+                    }
+                    for key, histogram in self._histograms.items()
+                },
+            }
+        )
+
+    def _save(self, payload: str) -> None:
+        if self.path is None:
+            return
+        try:
+            write_text_atomic(self.path, payload + "\n")
+        except OSError as e:
+            logger.debug(f"Refine-Latenzen nicht gespeichert: {e}")
+
+    def _load(self) -> None:
+        if self.path is None:
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") != REFINE_LATENCY_VERSION:
+                return
+            for key, entry in data["histograms"].items():
+                counts = [float(count) for count in entry["counts"]]
+                self._histograms[key] = LatencyHistogram(counts, int(entry["samples"]))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.debug(f"Refine-Latenzen unlesbar, starte neu: {e}")
+            self._histograms.clear()
+
+
+_stats_lock = threading.Lock()
+_stats_instance: RefineLatencyStats | None = None
+
+
+def get_refine_latency_stats() -> RefineLatencyStats:
+    """Prozessweite Latenz-Statistik (persistiert in REFINE_LATENCY_FILE)."""
+    global _stats_instance
+    import config
+
+    path = config.REFINE_LATENCY_FILE
+    with _stats_lock:
+        if _stats_instance is None or _stats_instance.path != path:
+            _stats_instance = RefineLatencyStats(path)
+        return _stats_instance
+
+
+__all__ = [
+    "LatencyHistogram",
+    "REFINE_LATENCY_VERSION",
+    "RefineLatencyStats",
+    "get_refine_latency_stats",
+]
@@ -18,6 +18,7 @@ class AppState(Enum):
 class MessageType(Enum):
     STATUS_UPDATE = auto()
     TRANSCRIPT_RESULT = auto()
+    TRANSCRIPT_CHUNK = auto()  # Vorab einzufügender Teil (Streaming-Refine)
     AUDIO_LEVEL = auto()
     ERROR = auto()
 
@@ -0,0 +1,216 @@
+"""Content-addressed on-disk cache for transcription results.
+
+Re-running the CLI on the same file (e.g. while iterating on refine prompts)
+returns the cached raw transcript instead of uploading or decoding again.
+The daemons only use it for live dictations when the user opts in.
+The key covers the audio content, provider, model, language, the custom
+vocabulary and provider-specific options, so any change that could alter
+the transcript misses the cache. Entries are single JSON files under
+``~/.pulsescribe/cache/transcripts``; when the directory exceeds its size
+budget the least recently used entries (by mtime, refreshed on hit) are
+deleted.
+
+Usage:
+    cache = get_transcript_cache()
+    if cache is not None:
+        key = transcript_cache_key(file_digest(path), provider="groq", model=m, language="de")
+        text = cache.get(key)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+from utils.atomic_io import write_text_atomic
+
+logger = logging.getLogger("pulsescribe.transcript_cache")
+
+# Erhöhen, wenn sich Schlüssel- oder Eintragsformat ändert
+TRANSCRIPT_CACHE_VERSION = 1
+_HASH_BLOCK_BYTES = 1 << 20
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 of the file content (streamed, constant memory)."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(_HASH_BLOCK_BYTES), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def audio_array_digest(audio: Any, sample_rate: int) -> str:
+    """SHA-256 of a float32 sample array plus its sample rate."""
+    import numpy as np
+
+    samples = np.ascontiguousarray(audio, dtype=np.float32)
+    digest = hashlib.sha256(f"pcm-f32:{sample_rate}:".encode())
+    digest.update(samples.tobytes())
+    return digest.hexdigest()
+
+
+def vocabulary_signature() -> str:
+    """Short hash of the custom vocabulary providers send as keywords/prompt."""
+    from utils.vocabulary import load_vocabulary
+
+    keywords = load_vocabulary().get("keywords", [])
+    payload = json.dumps(keywords, ensure_ascii=False)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def transcript_cache_key(
+    audio_digest: str,
+    *,
+    provider: str,
+    model: str | None,
+    language: str | None,
+    options: Mapping[str, Any] | None = None,
+) -> str:
+    """Combine everything that can change a transcript into one key."""
+    payload = json.dumps(
+        {
+            "version": TRANSCRIPT_CACHE_VERSION,
+            "audio": audio_digest,
+            "provider": provider,
+            "model": model,
+            "language": language,
+            "vocabulary": vocabulary_signature(),
+            "options": dict(options or {}),
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class TranscriptCache:
+    """Size-bounded LRU cache of transcripts, one JSON file per key.
+
+    Thread-safe within a process; concurrent processes only race on
+    eviction, which at worst deletes an entry that is then recomputed.
+    """
+
+    def __init__(self, directory: Path, *, max_bytes: int) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> str | None:
+        path = self._entry_path(key)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            text = data["text"]
+            if not isinstance(text, str):
+                raise ValueError("text is not a string")
+        except FileNotFoundError:
+            text = None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Cache-Eintrag {path.name} unlesbar, ignoriere: {e}")
+            text = None
+        with self._lock:
+            if text is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        try:
+            os.utime(path)  # LRU: Zugriff zählt als Nutzung
+        except OSError:
+            pass
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        if not isinstance(text, str):
+            return
+        payload = json.dumps({"text": text, "created": time.time()}, ensure_ascii=False)
+        try:
+            write_text_atomic(self._entry_path(key), payload + "\n")
+        except OSError as e:
+            logger.debug(f"Transkript nicht gecacht: {e}")
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        entries: list[tuple[float, int, Path]] = []
+        for entry in self.directory.glob("*.json"):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue  # parallel von anderem Prozess entfernt
+            entries.append((stat.st_mtime, stat.st_size, entry))
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+        removed = 0
+        for _, size, entry in sorted(entries, key=lambda item: item[0]):
+            if total <= self.max_bytes:
+                break
+            try:
+                entry.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        logger.debug(f"Transkript-Cache: {removed} alte Einträge entfernt")
+
+    def clear(self) -> None:
+        for entry in self.directory.glob("*.json"):
+            entry.unlink(missing_ok=True)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+    def describe(self) -> str:
+        stats = self.stats()
+        return f"Transkript-Cache: {stats['hits']} Treffer, {stats['misses']} neu"
+
+
+_cache_lock = threading.Lock()
+_cache_instance: TranscriptCache | None = None
+
+
+def get_transcript_cache(*, live_dictation: bool = False) -> TranscriptCache | None:
+    """Shared cache for this process, or None when disabled via env.
+
+    Daemons pass ``live_dictation=True``: their recordings are cached only
+    after an explicit opt-in (see `config.get_transcript_cache_enabled`).
+    """
+    global _cache_instance
+    import config
+
+    max_mb = config.get_transcript_cache_max_mb()
+    if not config.get_transcript_cache_enabled(live_dictation=live_dictation) or max_mb <= 0:
+        return None
+    directory = config.TRANSCRIPT_CACHE_DIR
+    with _cache_lock:
+        instance = _cache_instance
+        if instance is None or instance.directory != directory:
+            instance = TranscriptCache(directory, max_bytes=max_mb * 1024 * 1024)
+            _cache_instance = instance
+        else:
+            instance.max_bytes = max_mb * 1024 * 1024
+        return instance
+
+
+__all__ = [
+    "TRANSCRIPT_CACHE_VERSION",
+    "TranscriptCache",
+    "audio_array_digest",
+    "file_digest",
+    "get_transcript_cache",
+    "transcript_cache_key",
+    "vocabulary_signature",
+]